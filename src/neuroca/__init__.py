@@ -3,6 +3,38 @@ NeuroCognitive Architecture (NCA) - A biologically-inspired cognitive framework.
 
 This package enhances Large Language Models with cognitive capabilities through
 a three-tiered memory system, health dynamics, and adaptive neurological processes.
+
+Subpackages are imported on first attribute access (``neuroca.memory``,
+``neuroca.integration``, ...), so ``import neuroca`` stays cheap for the CLI,
+workers and tooling that only need part of the system.
 """
 
-__version__ = "0.1.0" 
\ No newline at end of file
+import importlib
+from typing import Any
+
+__version__ = "0.1.0"
+
+_SUBPACKAGES = frozenset({
+    "api",
+    "cli",
+    "config",
+    "core",
+    "db",
+    "infrastructure",
+    "integration",
+    "memory",
+    "monitoring",
+    "tools",
+    "utils",
+})
+
+
+def __getattr__(name: str) -> Any:
+    """Import a subpackage on first access."""
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBPACKAGES)
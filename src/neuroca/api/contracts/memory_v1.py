@@ -235,6 +235,7 @@ class MemoryListParamsV1(BaseModel):
     tags: List[str] = Field(default_factory=list)
     limit: int = Field(default=50, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
+    cursor: Optional[str] = Field(default=None, max_length=512)
     tenant_id: Optional[str] = Field(default=None)
  
     model_config = ConfigDict(extra="forbid")
@@ -12,6 +12,7 @@ The middleware supports:
 - Rate limiting protection
 - Detailed security logging
 - Session management
+- Caching of verified tokens and API-key principals
 
 Usage:
     from neuroca.api.middleware.authentication import (
@@ -39,7 +40,9 @@ import hashlib
 import hmac
 import logging
 import os
+import threading
 import time
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional
@@ -49,6 +52,7 @@ from fastapi import Depends, FastAPI, HTTPException, Request, Security, status
 from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, ValidationError
 
+from neuroca.api.middleware.credential_cache import APIKeyCache, VerifiedTokenCache
 from neuroca.config.settings import get_settings
 from neuroca.core.models.user import User
 from neuroca.db.repositories.user_repository import UserRepository
@@ -87,6 +91,20 @@ class AuthenticationError(Exception):
         super().__init__(self.message)
 
 
+# Process-wide caches; sizes may be tuned through settings
+token_cache = VerifiedTokenCache(
+    max_entries=getattr(settings, "auth_token_cache_size", 10_000),
+    user_ttl=getattr(settings, "auth_user_cache_ttl_seconds", 30.0),
+    revalidate_interval=getattr(settings, "auth_revocation_sweep_seconds", 5.0),
+    revocation_lookup=lambda token_ids: revoked_token_ids(token_ids),
+)
+api_key_cache = APIKeyCache(lambda: getattr(settings, "api_keys", None))
+
+# Revoked token ids mapped to their expiry (POSIX seconds)
+_revoked_tokens: dict[str, float] = {}
+_revoked_lock = threading.Lock()
+
+
 class JWTAuth(HTTPBearer):
     """JWT Authentication handler for FastAPI."""
     
@@ -268,6 +286,10 @@ def decode_jwt_token(token: str) -> JWTPayload:
     Raises:
         AuthenticationError: If token validation fails.
     """
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached
+    
     try:
         # Decode the token
         payload = jwt.decode(
@@ -291,6 +313,7 @@ def decode_jwt_token(token: str) -> JWTPayload:
         if is_token_revoked(jwt_payload.jti):
             raise AuthenticationError("Token has been revoked")
         
+        token_cache.put(token, jwt_payload)
         return jwt_payload
         
     except jwt.PyJWTError as e:
@@ -311,9 +334,25 @@ def is_token_revoked(token_id: str) -> bool:
     Returns:
         bool: True if the token has been revoked, False otherwise.
     """
-    # In a real implementation, this would check a database or cache
-    # For now, we'll assume no tokens are revoked
-    return False
+    return token_id in revoked_token_ids([token_id])
+
+
+def revoked_token_ids(token_ids: Iterable[str]) -> set[str]:
+    """
+    Return which of *token_ids* have been revoked, in a single lookup.
+    
+    Args:
+        token_ids: Token identifiers to check.
+        
+    Returns:
+        set[str]: The revoked subset of *token_ids*.
+    """
+    now = time.time()
+    with _revoked_lock:
+        expired = [jti for jti, expires in _revoked_tokens.items() if expires < now]
+        for jti in expired:
+            del _revoked_tokens[jti]
+        return {token_id for token_id in token_ids if token_id in _revoked_tokens}
 
 
 def validate_api_key(api_key: str) -> Optional[str]:
@@ -326,17 +365,15 @@ def validate_api_key(api_key: str) -> Optional[str]:
     Returns:
         Optional[str]: The service name if valid, None otherwise.
     """
-    # In a real implementation, this would check against stored API keys
-    # For now, we'll check against the configured API keys
-    for service, key in settings.api_keys.items():
-        if hmac.compare_digest(api_key, key):
-            return service
-    return None
+    if not api_key:
+        return None
+    return api_key_cache.lookup(api_key)
 
 
 async def authenticate_request(
     request: Request,
-    token_payload: JWTPayload = Depends(JWTAuth())
+    token_payload: JWTPayload = Depends(JWTAuth()),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
 ) -> User:
     """
     Authenticate a request and return the user.
@@ -352,9 +389,13 @@ async def authenticate_request(
         HTTPException: If authentication fails.
     """
     try:
-        # Get user from database
-        user_repo = UserRepository()
-        user = await user_repo.get_by_id(token_payload.sub)
+        token = credentials.credentials if credentials is not None else None
+        user = token_cache.get_user(token) if token else None
+        user_repo = None
+        if user is None:
+            # Get user from database
+            user_repo = UserRepository()
+            user = await user_repo.get_by_id(token_payload.sub)
         
         if not user:
             logger.warning(f"User not found: {token_payload.sub}")
@@ -373,8 +414,11 @@ async def authenticate_request(
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # Update last activity timestamp
-        await user_repo.update_last_activity(user.id)
+        # Update last activity timestamp when the user was (re)loaded
+        if user_repo is not None:
+            await user_repo.update_last_activity(user.id)
+            if token:
+                token_cache.attach_user(token, user)
         
         # Add request tracking for security monitoring
         request.state.user_id = user.id
@@ -439,8 +483,13 @@ def revoke_token(token_id: str, reason: str = "User logout") -> bool:
     Returns:
         bool: True if the token was successfully revoked, False otherwise.
     """
-    # In a real implementation, this would add the token to a blacklist
-    # For now, we'll just log the revocation
+    # Keep the id until the longest-lived token it could belong to expires
+    expires = time.time() + timedelta(
+        days=getattr(settings, "jwt_refresh_token_expire_days", 30)
+    ).total_seconds()
+    with _revoked_lock:
+        _revoked_tokens[token_id] = expires
+    token_cache.invalidate_token_id(token_id)
     logger.info(f"Token {token_id} revoked: {reason}")
     return True
 
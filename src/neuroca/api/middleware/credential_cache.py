@@ -0,0 +1,221 @@
+"""
+Credential caches used by the authentication middleware.
+
+This module holds the in-process caches that let the authentication
+middleware skip repeated work on hot paths:
+
+- VerifiedTokenCache: verified JWT payloads keyed by the token's digest
+- APIKeyCache: API key to service name lookup keyed by key digest
+
+The caches only depend on the standard library; token payloads are treated
+as opaque objects exposing ``sub``, ``exp`` and ``jti``.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+def _fingerprint(secret: str) -> str:
+    """Return the SHA-256 hex digest used to key cached credentials."""
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()
+
+
+def _no_revocations(token_ids: Iterable[str]) -> set[str]:
+    """Default revocation lookup that reports nothing as revoked."""
+    return set()
+
+
+@dataclass
+class _CachedToken:
+    """A verified token payload and, once loaded, its user."""
+    payload: Any
+    user: Any = None
+    user_loaded_at: float = 0.0
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified JWTs keyed by the SHA-256 of the raw token.
+
+    A hit skips signature verification and payload validation. Entries are
+    never served past the token's ``exp`` and are dropped as soon as
+    :meth:`invalidate_token_id` is called for their ``jti``. Every
+    ``revalidate_interval`` seconds the cached ids are also checked against
+    ``revocation_lookup`` in a single batch, so a revocation this process did
+    not make itself keeps being accepted for up to ``revalidate_interval``
+    seconds, and only if ``revocation_lookup`` can see it. The authentication
+    middleware's default store is in-process, so tokens revoked by another
+    process stay usable here until they expire.
+
+    The authenticated user may be attached to an entry and is reused for
+    ``user_ttl`` seconds. A user who is deactivated or changed therefore
+    keeps authenticating with an existing token for up to ``user_ttl``
+    seconds; keep it short.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        *,
+        user_ttl: float = 30.0,
+        revalidate_interval: float = 5.0,
+        revocation_lookup: Callable[[Iterable[str]], set[str]] = _no_revocations,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of tokens kept; least recently used are evicted.
+            user_ttl: Seconds a cached user object may be reused.
+            revalidate_interval: Seconds between batched revocation sweeps.
+            revocation_lookup: Callable returning the revoked subset of token ids.
+            clock: Time source returning POSIX seconds.
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.user_ttl = user_ttl
+        self.revalidate_interval = revalidate_interval
+        self._revocation_lookup = revocation_lookup
+        self._clock = clock
+        self._entries: OrderedDict[str, _CachedToken] = OrderedDict()
+        self._by_jti: dict[str, str] = {}
+        self._last_sweep = clock()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> Any:
+        """Return the cached payload for *token* if it is still valid."""
+        entry = self._lookup(token)
+        return entry.payload if entry is not None else None
+
+    def get_user(self, token: str) -> Any:
+        """Return the cached user for *token* if it is still fresh."""
+        entry = self._lookup(token, count=False)
+        if entry is None or entry.user is None:
+            return None
+        if self._clock() - entry.user_loaded_at > self.user_ttl:
+            return None
+        return entry.user
+
+    def put(self, token: str, payload: Any) -> None:
+        """Cache a payload that has just been fully verified."""
+        key = _fingerprint(token)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = _CachedToken(payload)
+            self._by_jti[payload.jti] = key
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+
+    def attach_user(self, token: str, user: Any) -> None:
+        """Remember the user loaded for a cached token."""
+        key = _fingerprint(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.user = user
+                entry.user_loaded_at = self._clock()
+
+    def invalidate_token_id(self, token_id: str) -> None:
+        """Drop the entry for a revoked token id."""
+        with self._lock:
+            key = self._by_jti.get(token_id)
+            if key is not None:
+                self._discard(key)
+
+    def clear(self) -> None:
+        """Remove all cached tokens."""
+        with self._lock:
+            self._entries.clear()
+            self._by_jti.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, token: str, count: bool = True) -> Optional[_CachedToken]:
+        """Find a live entry, evicting it if expired."""
+        self._maybe_revalidate()
+        key = _fingerprint(token)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.payload.exp < int(now):
+                self._discard(key)
+                entry = None
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if count:
+                self.hits += 1
+            return entry
+
+    def _maybe_revalidate(self) -> None:
+        """Sweep cached token ids against the revocation store in one batch."""
+        now = self._clock()
+        if now - self._last_sweep < self.revalidate_interval:
+            return
+        with self._lock:
+            self._last_sweep = now
+            token_ids = list(self._by_jti)
+        if not token_ids:
+            return
+        for token_id in self._revocation_lookup(token_ids):
+            self.invalidate_token_id(token_id)
+
+    def _discard(self, key: str) -> None:
+        """Remove an entry and its index reference (lock held)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None and self._by_jti.get(entry.payload.jti) == key:
+            del self._by_jti[entry.payload.jti]
+
+
+class APIKeyCache:
+    """
+    Constant-time API key lookup keyed by key digest.
+
+    The configured keys are indexed by their SHA-256 digest so validation is a
+    single dictionary lookup instead of a comparison against every key. The
+    index is rebuilt when the source returns a different mapping object, so
+    replacing the configured mapping (the way settings are reloaded) rotates
+    keys automatically. Code that mutates the mapping in place must call
+    :meth:`invalidate`.
+    """
+
+    def __init__(self, source: Callable[[], dict[str, str]]):
+        """
+        Initialize the cache.
+
+        Args:
+            source: Callable returning the current ``{service: api_key}`` mapping.
+        """
+        self._source = source
+        self._indexed: Optional[dict[str, str]] = None
+        self._index: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, api_key: str) -> Optional[str]:
+        """Return the service name for *api_key*, or None if unknown."""
+        return self._current_index().get(_fingerprint(api_key))
+
+    def invalidate(self) -> None:
+        """Force the index to be rebuilt on the next lookup."""
+        with self._lock:
+            self._indexed = None
+
+    def _current_index(self) -> dict[str, str]:
+        keys = self._source()
+        if keys is None or keys is not self._indexed:
+            with self._lock:
+                self._index = {
+                    _fingerprint(key): service for service, key in (keys or {}).items() if key
+                }
+                self._indexed = keys
+        return self._index
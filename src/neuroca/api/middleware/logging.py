@@ -71,19 +71,23 @@ _helpers = _import_module("logging_helpers")
 _route = _import_module("logging_route")
 _middleware = _import_module("request_logging_middleware")
 
+BodyRenderingFilter = _helpers.BodyRenderingFilter
 DEFAULT_EXCLUDE_PATHS = _helpers.DEFAULT_EXCLUDE_PATHS
+LazyBody = _helpers.LazyBody
 SENSITIVE_FIELDS = _helpers.SENSITIVE_FIELDS
 SENSITIVE_HEADERS = _helpers.SENSITIVE_HEADERS
 correlation_id_context = _helpers.correlation_id_context
 format_placeholder = _helpers.format_placeholder
 get_correlation_id = _helpers.get_correlation_id
 get_request_logger = _helpers.get_request_logger
+redact_text = _helpers.redact_text
 sanitize_body = _helpers.sanitize_body
 sanitize_headers = _helpers.sanitize_headers
 set_correlation_id = _helpers.set_correlation_id
 
 LoggingRoute = _route.LoggingRoute
 RequestLoggingMiddleware = _middleware.RequestLoggingMiddleware
+enable_async_emission = _middleware.enable_async_emission
 setup_request_logging = _middleware.setup_request_logging
 
 # Historical name retained for backwards compatibility with tests importing the
@@ -95,17 +99,21 @@ _format_placeholder = format_placeholder
 LoggingMiddleware = RequestLoggingMiddleware
 
 __all__ = [
+    "BodyRenderingFilter",
     "DEFAULT_EXCLUDE_PATHS",
+    "LazyBody",
     "LoggingMiddleware",
     "LoggingRoute",
     "RequestLoggingMiddleware",
     "SENSITIVE_FIELDS",
     "SENSITIVE_HEADERS",
     "correlation_id_context",
+    "enable_async_emission",
     "format_placeholder",
     "_format_placeholder",
     "get_correlation_id",
     "get_request_logger",
+    "redact_text",
     "sanitize_body",
     "sanitize_headers",
     "set_correlation_id",
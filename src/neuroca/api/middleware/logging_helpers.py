@@ -4,6 +4,10 @@ This module centralizes the shared helpers used by the logging middleware and
 route instrumentation so they can be reused without duplicating logic. The
 helpers provide correlation ID management, logging adapters, and sanitization
 utilities that protect sensitive information from being written to logs.
+
+Captured bodies are wrapped in :class:`LazyBody` so decoding, JSON parsing and
+redaction happen only when a record is actually emitted, which lets the work
+run on a background logging thread instead of the request path.
 """
 
 from __future__ import annotations
@@ -11,6 +15,7 @@ from __future__ import annotations
 import html
 import json
 import logging
+import re
 import uuid
 from contextvars import ContextVar
 from typing import Any, Optional, Union
@@ -91,6 +96,18 @@ def set_correlation_id(correlation_id: Optional[str] = None) -> str:
     return correlation_id
 
 
+class _RequestLoggerAdapter(logging.LoggerAdapter):
+    """Logger adapter that merges call-site ``extra`` with the adapter context.
+
+    The standard adapter replaces per-call ``extra`` mappings, which would
+    drop the structured request and response details attached by callers.
+    """
+
+    def process(self, msg: Any, kwargs: Any) -> tuple[Any, Any]:
+        kwargs["extra"] = {**self.extra, **(kwargs.get("extra") or {})}
+        return msg, kwargs
+
+
 def get_request_logger() -> logging.LoggerAdapter:
     """Create a logger adapter enriched with the correlation identifier.
 
@@ -100,7 +117,7 @@ def get_request_logger() -> logging.LoggerAdapter:
     """
 
     correlation_id = get_correlation_id()
-    return logging.LoggerAdapter(logging.getLogger("neuroca.api.middleware.logging"), {"correlation_id": correlation_id})
+    return _RequestLoggerAdapter(logging.getLogger("neuroca.api.middleware.logging"), {"correlation_id": correlation_id})
 
 
 def sanitize_headers(headers: dict[str, str]) -> dict[str, str]:
@@ -178,14 +195,148 @@ def sanitize_body(body: Union[dict[str, Any], list[Any], str, None]) -> Union[di
     return body
 
 
+# Matches ``"field": value`` pairs for sensitive fields in raw (possibly truncated) JSON text.
+_SENSITIVE_PAIR = re.compile(
+    r'("(?:' + "|".join(re.escape(field) for field in sorted(SENSITIVE_FIELDS)) + r')"\s*:\s*)'
+    r'("(?:[^"\\]|\\.)*"?|[^,}\]\s]+)',
+    re.IGNORECASE,
+)
+
+
+def redact_text(text: str) -> str:
+    """Redact sensitive ``"field": value`` pairs in raw JSON-like text.
+
+    Unlike :func:`sanitize_body` this does not parse the text, so it also
+    works on truncated payloads.
+
+    Args:
+        text: Raw payload text.
+
+    Returns:
+        str: Text with sensitive values replaced by placeholder text.
+    """
+
+    return _SENSITIVE_PAIR.sub(r'\1"[REDACTED]"', text)
+
+
+class LazyBody:
+    """Captured request or response payload that is sanitized on demand.
+
+    Only the first ``limit`` bytes are retained. Payloads within the limit are
+    parsed and passed through :func:`sanitize_body` when rendered; larger
+    payloads are never parsed and are instead truncated and redacted with
+    :func:`redact_text`. The rendered value is computed once and cached.
+    """
+
+    __slots__ = ("_raw", "_size", "_content_type", "_label", "_rendered", "_done")
+
+    def __init__(
+        self,
+        raw: bytes,
+        content_type: Optional[str],
+        limit: int,
+        label: str = "binary or non-JSON data",
+    ) -> None:
+        """Capture a payload.
+
+        Args:
+            raw: Payload bytes.
+            content_type: ``Content-Type`` header value, if any.
+            limit: Maximum number of bytes retained for logging.
+            label: Placeholder label used for payloads that are not text.
+        """
+
+        self._size = len(raw)
+        self._raw = raw[: max(limit, 0)]
+        self._content_type = content_type
+        self._label = label
+        self._rendered: Union[dict[str, Any], list[Any], str, None] = None
+        self._done = False
+
+    @property
+    def size(self) -> int:
+        """Return the original payload size in bytes."""
+
+        return self._size
+
+    @property
+    def truncated(self) -> bool:
+        """Return whether the payload exceeded the capture limit."""
+
+        return len(self._raw) < self._size
+
+    def render(self) -> Union[dict[str, Any], list[Any], str, None]:
+        """Return the sanitized payload, computing it on first use.
+
+        Returns:
+            Union[dict[str, Any], list[Any], str, None]: Sanitized payload,
+            ``None`` for empty bodies.
+        """
+
+        if not self._done:
+            self._rendered = self._render()
+            self._done = True
+        return self._rendered
+
+    def _render(self) -> Union[dict[str, Any], list[Any], str, None]:
+        if not self._size:
+            return None
+
+        content_type = self._content_type or ""
+        if self.truncated:
+            if "json" not in content_type and not content_type.startswith("text/"):
+                return format_placeholder(f"{self._label}, {self._size} bytes", content_type or None)
+            text = self._raw.decode("utf-8", errors="replace")
+            return f"{redact_text(text)}... <truncated, {self._size} bytes>"
+
+        try:
+            text = self._raw.decode("utf-8")
+        except UnicodeDecodeError:
+            return format_placeholder(self._label, content_type or None)
+        try:
+            return sanitize_body(json.loads(text))
+        except json.JSONDecodeError:
+            pass
+        if content_type.startswith("text/"):
+            return redact_text(text)
+        return format_placeholder(self._label, content_type or None)
+
+    def __str__(self) -> str:
+        rendered = self.render()
+        return rendered if isinstance(rendered, str) else json.dumps(rendered)
+
+    def __repr__(self) -> str:
+        return f"LazyBody(size={self._size}, truncated={self.truncated})"
+
+
+class BodyRenderingFilter(logging.Filter):
+    """Resolve :class:`LazyBody` payloads attached to request logging records.
+
+    Attach to the handler that formats records so rendering happens wherever
+    that handler runs, for example on an ``AsyncHandler`` worker thread.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Replace lazy bodies with their sanitized values; never drops records."""
+
+        for attribute in ("request", "response"):
+            info = record.__dict__.get(attribute)
+            if isinstance(info, dict) and isinstance(info.get("body"), LazyBody):
+                record.__dict__[attribute] = {**info, "body": info["body"].render()}
+        return True
+
+
 __all__ = [
+    "BodyRenderingFilter",
     "DEFAULT_EXCLUDE_PATHS",
+    "LazyBody",
     "SENSITIVE_HEADERS",
     "SENSITIVE_FIELDS",
     "correlation_id_context",
     "format_placeholder",
     "get_correlation_id",
     "get_request_logger",
+    "redact_text",
     "sanitize_body",
     "sanitize_headers",
     "set_correlation_id",
@@ -3,12 +3,18 @@
 The middleware enriches HTTP requests and responses with correlation IDs,
 structured logging, and payload sanitization so operational teams can trace
 interactions without leaking sensitive information.
+
+Body logging is sampled per route and capped in size. Captured bodies are
+sanitized lazily by the handler that emits the record, and with
+``async_emit`` enabled the handlers of the request logger are wrapped in
+:class:`~neuroca.monitoring.logging.handlers.AsyncHandler` so serialization
+and emission happen off the request path.
 """
 
 from __future__ import annotations
 
-import json
 import logging
+import random
 import time
 from typing import Any, Optional
 
@@ -17,18 +23,56 @@ from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoin
 from starlette.types import ASGIApp
 
 from neuroca.monitoring.logging import clear_context, set_request_logging_context
+from neuroca.monitoring.logging.handlers import AsyncHandler
 
 from .logging_helpers import (
     DEFAULT_EXCLUDE_PATHS,
+    BodyRenderingFilter,
+    LazyBody,
     format_placeholder,
     get_request_logger,
-    sanitize_body,
     sanitize_headers,
     set_correlation_id,
 )
 
 logger = logging.getLogger("neuroca.api.middleware.logging")
 
+# Default number of body bytes retained per request or response.
+DEFAULT_MAX_BODY_BYTES = 8192
+
+
+def enable_async_emission(target_logger: logging.Logger, queue_size: int = 10000) -> bool:
+    """Route records of *target_logger* through background ``AsyncHandler`` queues.
+
+    Each handler on the logger (or, when it has none, each root handler) is
+    wrapped in an :class:`AsyncHandler` and given a :class:`BodyRenderingFilter`
+    so lazy bodies are rendered on the worker thread. The logger stops
+    propagating so records are emitted exactly once. Calling this again is a
+    no-op.
+
+    Args:
+        target_logger: Logger whose emission should be offloaded.
+        queue_size: Capacity of each background queue.
+
+    Returns:
+        bool: ``True`` when emission is asynchronous after the call.
+    """
+
+    if any(isinstance(handler, AsyncHandler) for handler in target_logger.handlers):
+        return True
+
+    targets = list(target_logger.handlers) or list(logging.getLogger().handlers)
+    if not targets:
+        return False
+
+    for handler in list(target_logger.handlers):
+        target_logger.removeHandler(handler)
+    for handler in targets:
+        handler.addFilter(BodyRenderingFilter())
+        target_logger.addHandler(AsyncHandler(handler, queue_size=queue_size))
+    target_logger.propagate = False
+    return True
+
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Middleware that logs incoming requests and outgoing responses."""
@@ -41,6 +85,10 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         log_response_body: bool = True,
         log_level: int = logging.INFO,
         correlation_id_header: str = "X-Correlation-ID",
+        body_sample_rate: float = 1.0,
+        route_sample_rates: Optional[dict[str, float]] = None,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        async_emit: bool = False,
     ) -> None:
         """Initialize the middleware with optional overrides.
 
@@ -51,6 +99,13 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             log_response_body: Flag indicating whether to log response payloads.
             log_level: Base logging level for successful responses.
             correlation_id_header: Header used for propagating correlation IDs.
+            body_sample_rate: Fraction of requests whose bodies are logged.
+            route_sample_rates: Per-route overrides keyed by path prefix; the
+                longest matching prefix wins.
+            max_body_bytes: Bodies larger than this are truncated and logged
+                without being parsed.
+            async_emit: Offload formatting and emission to ``AsyncHandler``
+                background queues.
         """
 
         super().__init__(app)
@@ -59,6 +114,17 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         self.log_response_body = log_response_body
         self.log_level = log_level
         self.correlation_id_header = correlation_id_header
+        self.body_sample_rate = body_sample_rate
+        self.route_sample_rates = sorted(
+            (route_sample_rates or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.max_body_bytes = max_body_bytes
+        self._random = random.Random()
+
+        if not (async_emit and enable_async_emission(logger)):
+            # Render lazily at emission time on the request path
+            if not any(isinstance(existing, BodyRenderingFilter) for existing in logger.filters):
+                logger.addFilter(BodyRenderingFilter())
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         """Process the request while recording lifecycle events.
@@ -80,8 +146,9 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         set_request_logging_context(request_id=correlation_id)
         request_logger = get_request_logger()
         start_time = time.time()
+        log_bodies = self._should_log_bodies(request.url.path, request_logger)
 
-        await self._log_request(request, request_logger)
+        await self._log_request(request, request_logger, log_bodies)
 
         try:
             response = await call_next(request)
@@ -92,7 +159,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             raise
 
         process_time = time.time() - start_time
-        self._finalize_response(response, process_time, correlation_id, request_logger)
+        self._finalize_response(response, process_time, correlation_id, request_logger, log_bodies)
         clear_context()
         return response
 
@@ -108,6 +175,42 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
         return path in self.exclude_paths
 
+    def _sample_rate(self, path: str) -> float:
+        """Return the body sampling rate configured for *path*.
+
+        Args:
+            path: The HTTP path extracted from the incoming request.
+
+        Returns:
+            float: Sampling rate of the longest matching route prefix, or the
+            default rate when none match.
+        """
+
+        for prefix, rate in self.route_sample_rates:
+            if path.startswith(prefix):
+                return rate
+        return self.body_sample_rate
+
+    def _should_log_bodies(self, path: str, request_logger: logging.LoggerAdapter) -> bool:
+        """Decide once per request whether its bodies are captured.
+
+        Args:
+            path: The HTTP path extracted from the incoming request.
+            request_logger: Logger adapter used to check the enabled level.
+
+        Returns:
+            bool: ``True`` when bodies should be captured for this request.
+        """
+
+        if not (self.log_request_body or self.log_response_body):
+            return False
+        if not request_logger.isEnabledFor(self.log_level):
+            return False
+        rate = self._sample_rate(path)
+        if rate >= 1.0:
+            return True
+        return rate > 0.0 and self._random.random() < rate
+
     def _ensure_correlation_id(self, provided_id: Optional[str]) -> str:
         """Store and return the correlation identifier for the current request.
 
@@ -120,15 +223,18 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
         return set_correlation_id(provided_id)
 
-    async def _log_request(self, request: Request, request_logger: logging.LoggerAdapter) -> None:
+    async def _log_request(
+        self, request: Request, request_logger: logging.LoggerAdapter, log_body: bool = True
+    ) -> None:
         """Log incoming request metadata and payload.
 
         Args:
             request: The current HTTP request.
             request_logger: Logger adapter enriched with the correlation ID.
+            log_body: Whether this request was sampled for body logging.
         """
 
-        request_info = await self._build_request_info(request, request_logger)
+        request_info = await self._build_request_info(request, request_logger, log_body)
         request_logger.log(
             self.log_level,
             "Incoming request: %s %s",
@@ -138,13 +244,14 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         )
 
     async def _build_request_info(
-        self, request: Request, request_logger: logging.LoggerAdapter
+        self, request: Request, request_logger: logging.LoggerAdapter, log_body: bool = True
     ) -> dict[str, Any]:
         """Collect metadata used for logging the incoming request.
 
         Args:
             request: The current HTTP request.
             request_logger: Logger adapter used for warning messages.
+            log_body: Whether this request was sampled for body logging.
 
         Returns:
             dict[str, Any]: Structured metadata describing the request.
@@ -159,34 +266,29 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             "path_params": request.path_params,
         }
 
-        if self.log_request_body:
+        if self.log_request_body and log_body:
             request_info["body"] = await self._capture_request_body(request, request_logger)
 
         return request_info
 
     async def _capture_request_body(
         self, request: Request, request_logger: logging.LoggerAdapter
-    ) -> str | dict[str, Any] | list[Any] | None:
-        """Safely capture and sanitize the request payload.
+    ) -> LazyBody | str:
+        """Capture the request payload for lazy sanitization.
 
         Args:
             request: The current HTTP request.
             request_logger: Logger adapter used to report capture failures.
 
         Returns:
-            Union[str, dict[str, Any], list[Any], None]: Sanitized payload ready
-            for logging. ``None`` is returned when the request has no body.
+            Union[LazyBody, str]: Captured payload, rendered when the record
+            is emitted, or a placeholder when the body could not be read.
         """
 
         try:
             body_bytes = await request.body()
             request.scope["_body"] = body_bytes
-            try:
-                body = json.loads(body_bytes.decode("utf-8"))
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                content_type = request.headers.get("content-type")
-                return format_placeholder("binary or non-JSON data", content_type)
-            return sanitize_body(body)
+            return LazyBody(body_bytes, request.headers.get("content-type"), self.max_body_bytes)
         except Exception as exc:  # pragma: no cover - defensive logging path
             request_logger.warning("Failed to capture request body: %s", exc)
             return "<error reading body>"
@@ -215,6 +317,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         process_time: float,
         correlation_id: str,
         response_logger: logging.LoggerAdapter,
+        log_body: bool = True,
     ) -> None:
         """Attach correlation information and log the outgoing response.
 
@@ -223,9 +326,10 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             process_time: Duration spent processing the request.
             correlation_id: Correlation identifier associated with the request.
             response_logger: Logger adapter enriched with correlation metadata.
+            log_body: Whether this request was sampled for body logging.
         """
 
-        response_info = self._build_response_info(response, process_time)
+        response_info = self._build_response_info(response, process_time, log_body)
         log_level = self._determine_log_level(response.status_code)
         response_logger.log(
             log_level,
@@ -236,12 +340,15 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         )
         response.headers[self.correlation_id_header] = correlation_id
 
-    def _build_response_info(self, response: Response, process_time: float) -> dict[str, Any]:
+    def _build_response_info(
+        self, response: Response, process_time: float, log_body: bool = True
+    ) -> dict[str, Any]:
         """Collect metadata used when logging a response.
 
         Args:
             response: HTTP response generated by downstream handlers.
             process_time: Duration spent processing the request.
+            log_body: Whether this request was sampled for body logging.
 
         Returns:
             dict[str, Any]: Structured metadata describing the response.
@@ -253,38 +360,28 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             "process_time": f"{process_time:.4f}s",
         }
 
-        if self.log_response_body:
+        if self.log_response_body and log_body:
             response_info["body"] = self._capture_response_body(response)
 
         return response_info
 
-    def _capture_response_body(self, response: Response) -> str | dict[str, Any] | list[Any] | None:
-        """Sanitize the response payload for safe logging.
+    def _capture_response_body(self, response: Response) -> LazyBody | str:
+        """Capture the response payload for lazy sanitization.
 
         Args:
             response: HTTP response generated by downstream handlers.
 
         Returns:
-            Union[str, dict[str, Any], list[Any], None]: Sanitized payload ready
-            for logging. ``None`` is returned when the response does not include
-            a body that should be logged.
+            Union[LazyBody, str]: Captured payload, rendered when the record
+            is emitted, or a placeholder for streamed responses whose body is
+            not buffered.
         """
 
         content_type = response.headers.get("content-type", "")
-        if "application/json" in content_type:
-            try:
-                body = json.loads(response.body.decode("utf-8"))
-            except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
-                return "<error decoding JSON body>"
-            return sanitize_body(body)
-
-        if "text/" in content_type:
-            try:
-                return response.body.decode("utf-8")
-            except (UnicodeDecodeError, AttributeError):
-                return "<error decoding text body>"
-
-        return format_placeholder("binary data", content_type)
+        body = getattr(response, "body", None)
+        if not isinstance(body, (bytes, bytearray)):
+            return format_placeholder("streamed body", content_type)
+        return LazyBody(bytes(body), content_type, self.max_body_bytes, label="binary data")
 
     def _determine_log_level(self, status_code: int) -> int:
         """Return the logging level appropriate for the status code.
@@ -310,6 +407,10 @@ def setup_request_logging(
     log_response_body: bool = True,
     log_level: int = logging.INFO,
     correlation_id_header: str = "X-Correlation-ID",
+    body_sample_rate: float = 1.0,
+    route_sample_rates: Optional[dict[str, float]] = None,
+    max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    async_emit: bool = False,
 ) -> None:
     """Install the request logging middleware on a FastAPI application.
 
@@ -320,6 +421,10 @@ def setup_request_logging(
         log_response_body: Whether to log response payloads.
         log_level: Base log level for successful requests.
         correlation_id_header: Header name to propagate correlation IDs.
+        body_sample_rate: Fraction of requests whose bodies are logged.
+        route_sample_rates: Per-route sampling overrides keyed by path prefix.
+        max_body_bytes: Size cap above which bodies are truncated unparsed.
+        async_emit: Offload log emission to background ``AsyncHandler`` queues.
     """
 
     app.add_middleware(
@@ -329,8 +434,12 @@ def setup_request_logging(
         log_response_body=log_response_body,
         log_level=log_level,
         correlation_id_header=correlation_id_header,
+        body_sample_rate=body_sample_rate,
+        route_sample_rates=route_sample_rates,
+        max_body_bytes=max_body_bytes,
+        async_emit=async_emit,
     )
     logger.info("Request logging middleware configured")
 
 
-__all__ = ["RequestLoggingMiddleware", "setup_request_logging"]
+__all__ = ["DEFAULT_MAX_BODY_BYTES", "RequestLoggingMiddleware", "enable_async_emission", "setup_request_logging"]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, List
+from typing import Any, AsyncIterator, List
 from uuid import UUID
 
 from fastapi import (
@@ -15,6 +15,7 @@ from fastapi import (
     Response,
     status,
 )
+from fastapi.responses import StreamingResponse
 
 from neuroca.api.contracts.memory_v1 import (
     MemoryContentPayloadV1,
@@ -42,6 +43,7 @@ from neuroca.core.exceptions import (
     MemoryTierFullError,
     RateLimitExceededError,
 )
+from neuroca.memory.exceptions import InvalidCursorError
 from neuroca.memory.service import (
     MemoryResponse,
     MemorySearchParams,
@@ -51,6 +53,10 @@ from neuroca.memory.service import (
 
 logger = logging.getLogger(__name__)
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+NDJSON_PAGE_SIZE = 500
+
 router = APIRouter(
     prefix="/v1/memory",
     tags=["memory"],
@@ -312,10 +318,22 @@ def _list_params_dependency(
     query: str | None = Query(None, description="Search query for memory content"),
     tags: List[str] | None = Query(None, description="Filter by tags"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of memories"),
-    offset: int = Query(0, ge=0, description="Number of memories to skip"),
+    offset: int = Query(0, ge=0, description="Number of memories to skip (search queries only)"),
+    cursor: str | None = Query(
+        None,
+        max_length=512,
+        description="Opaque cursor from the X-Next-Cursor header of the previous page",
+    ),
 ) -> MemoryListParamsV1:
     tag_values = tags or []
-    return MemoryListParamsV1(tier=tier, query=query, tags=tag_values, limit=limit, offset=offset)
+    return MemoryListParamsV1(
+        tier=tier,
+        query=query,
+        tags=tag_values,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+    )
 
 
 @router.post(
@@ -436,12 +454,29 @@ async def get_memory(
     "",
     response_model=List[MemoryRecordV1],
     summary="List memories",
+    responses={
+        status.HTTP_200_OK: {
+            "content": {NDJSON_MEDIA_TYPE: {}},
+            "description": (
+                "A page of memories. Without a text query the next page is "
+                "addressed by the X-Next-Cursor header; format=ndjson streams "
+                "every matching memory instead."
+            ),
+        }
+    },
 )
 async def list_memories(
+    response: Response,
     params: MemoryListParamsV1 = Depends(_list_params_dependency),
+    output_format: str = Query(
+        "json",
+        alias="format",
+        pattern="^(json|ndjson)$",
+        description="json for a single page, ndjson to stream all matching memories",
+    ),
     current_user: User = Depends(authenticate_request),
     memory_service: MemoryService = Depends(get_memory_service),
-) -> List[MemoryRecordV1]:
+) -> Any:
     logger.debug(
         "User %s listing memories (tier=%s, query=%s, tags=%s)",
         getattr(current_user, "id", "<unknown>"),
@@ -449,20 +484,53 @@ async def list_memories(
         params.query,
         params.tags,
     )
-    try:
-        search_params = MemorySearchParams(
-            **params.with_user(
-                str(getattr(current_user, "id", "")),
-                tenant_id=str(getattr(current_user, "tenant_id", "")).strip() or None,
-            )
+    keyset = not params.query
+    if not keyset and (params.cursor or output_format == "ndjson"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor pagination and streaming are not available for text queries",
         )
-        results = await memory_service.list_memories(
-            search_params,
-            user=current_user,
-            roles=getattr(current_user, "roles", []),
-            allow_admin=getattr(current_user, "is_admin", False),
+    if params.cursor and params.offset:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either cursor or offset, not both",
+        )
+
+    search_params = MemorySearchParams(
+        **params.with_user(
+            str(getattr(current_user, "id", "")),
+            tenant_id=str(getattr(current_user, "tenant_id", "")).strip() or None,
         )
+    )
+    access = {
+        "user": current_user,
+        "roles": getattr(current_user, "roles", []),
+        "allow_admin": getattr(current_user, "is_admin", False),
+    }
+
+    if output_format == "ndjson":
+        return StreamingResponse(
+            _stream_memory_records(memory_service, search_params, access),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+
+    try:
+        if keyset and not params.offset:
+            results, next_cursor = await memory_service.list_memories_page(
+                search_params,
+                cursor=params.cursor,
+                **access,
+            )
+            if next_cursor is not None:
+                response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        else:
+            results = await memory_service.list_memories(search_params, **access)
         return [_to_memory_record(result) for result in results]
+    except InvalidCursorError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
     except Exception as exc:  # noqa: BLE001
         logger.exception("Error listing memories")
         raise HTTPException(
@@ -471,6 +539,30 @@ async def list_memories(
         ) from exc
 
 
+async def _stream_memory_records(
+    memory_service: MemoryService,
+    search_params: MemorySearchParams,
+    access: dict[str, Any],
+) -> AsyncIterator[bytes]:
+    """Yield NDJSON lines for every memory matched by ``search_params``.
+
+    Records are fetched a page at a time with keyset cursors, so the API
+    process never buffers the full result set.
+    """
+
+    try:
+        async for memory in memory_service.iter_memories(
+            search_params,
+            page_size=NDJSON_PAGE_SIZE,
+            **access,
+        ):
+            yield (_to_memory_record(memory).model_dump_json() + "\n").encode("utf-8")
+    except Exception:  # noqa: BLE001
+        # Headers are already sent; terminate the stream with an error record.
+        logger.exception("Error streaming memories")
+        yield b'{"error":"An error occurred while streaming memories"}\n'
+
+
 @router.put(
     "/{memory_id}",
     response_model=MemoryRecordV1,
@@ -11,6 +11,13 @@ The websocket API enables:
 - Event-driven notifications
 - Bidirectional communication for dynamic system interaction
 
+Outgoing messages never block the sender: every connection owns a bounded
+outbox drained by its own writer task, so a slow client only delays itself.
+Broadcast payloads are serialized once and the same frame is queued for every
+subscriber. When an outbox fills up its overflow policy decides whether to
+drop the oldest frame, coalesce frames of the same event type, or disconnect
+the client.
+
 Usage:
     from neuroca.api.websockets import setup_websockets
     
@@ -31,6 +38,7 @@ import jwt
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, status
 from pydantic import BaseModel, ValidationError
 
+from neuroca.api.websockets.outbox import ConnectionOutbox, OverflowPolicy
 from neuroca.config import settings
 from neuroca.core.auth import verify_token
 from neuroca.core.models import User
@@ -74,8 +82,23 @@ class ConnectionManager:
     and broadcasting capabilities.
     """
     
-    def __init__(self):
-        """Initialize the connection manager."""
+    def __init__(
+        self,
+        *,
+        max_queue_size: int = 256,
+        overflow_policy: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+    ):
+        """
+        Initialize the connection manager.
+
+        Args:
+            max_queue_size: Maximum number of outgoing frames queued per connection
+            overflow_policy: Policy applied when a connection's queue is full
+        """
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = OverflowPolicy(overflow_policy)
         self.active_connections: dict[str, dict[str, Any]] = {}
         self.message_handlers: dict[MessageType, Callable] = {
             MessageType.CONNECT: self._handle_connect,
@@ -87,6 +110,7 @@ class ConnectionManager:
             MessageType.HEARTBEAT: self._handle_heartbeat,
         }
         self._heartbeat_task = None
+        self._evictions: set[asyncio.Task] = set()
         
     async def connect(self, websocket: WebSocket, user: User) -> str:
         """
@@ -101,14 +125,19 @@ class ConnectionManager:
         """
         await websocket.accept()
         connection_id = str(uuid.uuid4())
+        outbox = ConnectionOutbox(self.max_queue_size, self.overflow_policy)
         
         self.active_connections[connection_id] = {
             "websocket": websocket,
             "user": user,
             "connected_at": datetime.utcnow(),
             "subscriptions": set(),
-            "last_activity": datetime.utcnow()
+            "last_activity": datetime.utcnow(),
+            "outbox": outbox,
         }
+        self.active_connections[connection_id]["writer"] = asyncio.create_task(
+            self._write_loop(connection_id, websocket, outbox)
+        )
         
         logger.info(f"New websocket connection established: {connection_id} (User: {user.username})")
         
@@ -145,41 +174,47 @@ class ConnectionManager:
                 if not event_subscribers[event_type]:
                     del event_subscribers[event_type]
         
-        # Remove from active connections
+        # Remove from active connections, drop pending frames and stop the writer
         del self.active_connections[connection_id]
+        connection["outbox"].close()
+        writer = connection.get("writer")
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
         logger.info(f"Websocket connection closed: {connection_id} (User: {user.username})")
     
     async def send_message(self, connection_id: str, message: WebSocketMessage) -> None:
         """
-        Send a message to a specific connection.
+        Queue a message for a specific connection.
+        
+        The message is written by the connection's writer task; this call
+        returns as soon as it has been queued.
         
         Args:
             connection_id: The connection ID to send to
             message: The message to send
         """
-        if connection_id not in self.active_connections:
+        connection = self.active_connections.get(connection_id)
+        if connection is None:
             logger.warning(f"Attempted to send message to unknown connection: {connection_id}")
             return
             
-        try:
-            websocket = self.active_connections[connection_id]["websocket"]
-            await websocket.send_json(message.dict())
-            self.active_connections[connection_id]["last_activity"] = datetime.utcnow()
-            logger.debug(f"Message sent to {connection_id}: {message.type}")
-        except Exception as e:
-            logger.error(f"Error sending message to {connection_id}: {str(e)}")
-            # Connection might be broken, disconnect it
-            await self.disconnect(connection_id)
+        self._enqueue(connection_id, connection, message.model_dump_json())
+        logger.debug(f"Message queued for {connection_id}: {message.type}")
     
     async def broadcast(self, event_type: str, payload: dict[str, Any]) -> None:
         """
         Broadcast a message to all subscribers of an event type.
         
+        The message is serialized once and the same frame is queued for every
+        subscriber, so the cost per recipient is a queue append regardless of
+        how slowly any individual client reads.
+        
         Args:
             event_type: The event type to broadcast
             payload: The message payload
         """
-        if event_type not in event_subscribers or not event_subscribers[event_type]:
+        subscribers = event_subscribers.get(event_type)
+        if not subscribers:
             logger.debug(f"No subscribers for event type: {event_type}")
             return
             
@@ -188,19 +223,107 @@ class ConnectionManager:
             id=str(uuid.uuid4()),
             payload={"event_type": event_type, "data": payload}
         )
-        
-        # Get subscribers for this event type
-        subscribers = event_subscribers.get(event_type, set())
+        frame = message.model_dump_json()
         logger.debug(f"Broadcasting {event_type} to {len(subscribers)} subscribers")
         
-        # Send to each subscriber
-        for connection_id in list(subscribers):
-            if connection_id in self.active_connections:
-                await self.send_message(connection_id, message)
-            else:
-                # Clean up stale subscription
-                if connection_id in subscribers:
-                    subscribers.remove(connection_id)
+        stale = []
+        for connection_id in subscribers:
+            connection = self.active_connections.get(connection_id)
+            if connection is None:
+                stale.append(connection_id)
+                continue
+            self._enqueue(connection_id, connection, frame, event_type)
+        
+        # Clean up stale subscriptions
+        for connection_id in stale:
+            subscribers.discard(connection_id)
+    
+    def connection_metrics(self) -> dict[str, dict[str, Any]]:
+        """
+        Return outgoing queue metrics for every active connection.
+        
+        Returns:
+            dict[str, dict[str, Any]]: Queue depth, delivery counters and lag
+            in seconds keyed by connection ID
+        """
+        return {
+            connection_id: connection["outbox"].metrics()
+            for connection_id, connection in self.active_connections.items()
+        }
+    
+    def _enqueue(
+        self,
+        connection_id: str,
+        connection: dict[str, Any],
+        frame: str,
+        key: Optional[str] = None,
+    ) -> None:
+        """
+        Queue a frame for a connection, evicting it if its outbox overflowed.
+        
+        Args:
+            connection_id: The connection ID to send to
+            connection: The connection record
+            frame: The serialized message
+            key: Optional coalescing key
+        """
+        if connection["outbox"].offer(frame, key) or connection.get("evicting"):
+            return
+        # The writer may be stuck on the slow socket, so close it from here
+        connection["evicting"] = True
+        task = asyncio.create_task(self._evict(connection_id, connection["websocket"]))
+        self._evictions.add(task)
+        task.add_done_callback(self._evictions.discard)
+    
+    async def _evict(self, connection_id: str, websocket: WebSocket) -> None:
+        """
+        Disconnect a client whose outgoing queue overflowed.
+        
+        Args:
+            connection_id: The connection ID to disconnect
+            websocket: The websocket connection
+        """
+        logger.warning(
+            f"Disconnecting {connection_id}: outgoing queue overflowed "
+            f"({self.max_queue_size} frames pending)"
+        )
+        await self.disconnect(connection_id)
+        with contextlib.suppress(Exception):
+            await websocket.close(
+                code=status.WS_1013_TRY_AGAIN_LATER,
+                reason="Outgoing queue overflowed",
+            )
+    
+    async def _write_loop(
+        self,
+        connection_id: str,
+        websocket: WebSocket,
+        outbox: ConnectionOutbox,
+    ) -> None:
+        """
+        Drain a connection's outbox into its websocket.
+        
+        Args:
+            connection_id: The connection ID being served
+            websocket: The websocket connection
+            outbox: The connection's outgoing queue
+        """
+        try:
+            while True:
+                frame = await outbox.get()
+                if frame is None:
+                    # Overflowed or closed; disconnect/eviction handles the socket
+                    return
+                text, enqueued_at = frame
+                await websocket.send_text(text)
+                outbox.record_sent(enqueued_at)
+                connection = self.active_connections.get(connection_id)
+                if connection is not None:
+                    connection["last_activity"] = datetime.utcnow()
+        except Exception as e:
+            logger.error(f"Error sending message to {connection_id}: {str(e)}")
+            # Connection might be broken, disconnect it
+            await self.disconnect(connection_id)
     
     async def process_message(self, connection_id: str, data: str) -> None:
         """
@@ -470,7 +593,10 @@ class ConnectionManager:
 
 
 # Create a global connection manager instance
-connection_manager = ConnectionManager()
+connection_manager = ConnectionManager(
+    max_queue_size=getattr(settings, "WEBSOCKET_SEND_QUEUE_SIZE", 256),
+    overflow_policy=getattr(settings, "WEBSOCKET_OVERFLOW_POLICY", OverflowPolicy.DROP_OLDEST),
+)
 
 
 async def get_token_from_websocket(websocket: WebSocket) -> Optional[str]:
@@ -602,4 +728,6 @@ __all__ = [
     "WebSocketMessage",
     "MessageType",
     "ConnectionManager",
+    "ConnectionOutbox",
+    "OverflowPolicy",
 ]
@@ -0,0 +1,171 @@
+"""
+Outgoing Message Queue for the NCA Websocket API
+
+This module holds the per-connection outbox used by the websocket connection
+manager. Producers append serialized frames without blocking and a writer task
+per connection drains them, so a slow client only delays itself.
+"""
+
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Optional
+
+
+class OverflowPolicy(str, Enum):
+    """What happens when a connection's outgoing queue is full."""
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    DISCONNECT = "disconnect"
+
+
+class ConnectionOutbox:
+    """
+    Bounded queue of serialized frames waiting to be written to one connection.
+
+    Producers only append to the outbox, which never blocks; the connection's
+    writer task drains it. When the queue is full the overflow policy applies:
+
+    * ``drop_oldest`` discards the oldest pending frame.
+    * ``coalesce`` replaces the newest pending frame with the same key (the
+      event type for broadcasts) so the client receives only the latest
+      payload, and falls back to dropping the oldest frame.
+    * ``disconnect`` rejects the frame and marks the outbox as overflowed so
+      the connection can be closed.
+
+    Closing the outbox discards pending frames, rejects further offers and
+    releases a waiting writer.
+
+    Lag is tracked per frame from the moment it was queued until it has been
+    written to the socket.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        policy: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the outbox.
+
+        Args:
+            max_size: Maximum number of frames waiting to be sent
+            policy: Overflow policy applied when the queue is full
+            clock: Monotonic clock used for lag measurements
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.policy = OverflowPolicy(policy)
+        self._clock = clock
+        # Frames are mutable ``[key, text, enqueued_at]`` lists so coalescing
+        # can swap the payload without moving the frame in the queue
+        self._frames: deque[list[Any]] = deque()
+        self._keyed: dict[str, list[Any]] = {}
+        self._ready = asyncio.Event()
+        self.overflowed = False
+        self.closed = False
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def offer(self, text: str, key: Optional[str] = None) -> bool:
+        """
+        Queue a serialized frame for delivery.
+
+        Args:
+            text: The serialized frame
+            key: Optional coalescing key
+
+        Returns:
+            bool: False if the outbox is closed, or the connection overflowed
+            and must be disconnected
+        """
+        if self.overflowed or self.closed:
+            return False
+
+        if len(self._frames) >= self.max_size:
+            if self.policy is OverflowPolicy.DISCONNECT:
+                self.overflowed = True
+                # Release a waiting writer so it can stop
+                self._ready.set()
+                return False
+            if self.policy is OverflowPolicy.COALESCE and key is not None:
+                pending = self._keyed.get(key)
+                if pending is not None:
+                    pending[1] = text
+                    self.coalesced += 1
+                    return True
+            self._discard(self._frames.popleft())
+            self.dropped += 1
+
+        frame = [key, text, self._clock()]
+        self._frames.append(frame)
+        if key is not None:
+            self._keyed[key] = frame
+        self._ready.set()
+        return True
+
+    async def get(self) -> Optional[tuple[str, float]]:
+        """
+        Wait for the next frame.
+
+        Returns:
+            Optional[tuple[str, float]]: The frame text and the time it was
+            queued, or None once the outbox has overflowed or been closed
+        """
+        while not self._frames and not self.overflowed and not self.closed:
+            self._ready.clear()
+            await self._ready.wait()
+        if self.overflowed or self.closed:
+            return None
+        frame = self._frames.popleft()
+        self._discard(frame)
+        return frame[1], frame[2]
+
+    def close(self) -> None:
+        """Discard pending frames and stop accepting new ones."""
+        self.closed = True
+        self._frames.clear()
+        self._keyed.clear()
+        # Release a waiting writer so it can stop
+        self._ready.set()
+
+    def record_sent(self, enqueued_at: float) -> None:
+        """Record that a frame queued at *enqueued_at* has been written."""
+        lag = self._clock() - enqueued_at
+        self.sent += 1
+        self.last_lag = lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+
+    def metrics(self) -> dict[str, Any]:
+        """Return queue depth, delivery counters and lag in seconds."""
+        pending_lag = self._clock() - self._frames[0][2] if self._frames else 0.0
+        return {
+            "queued": len(self._frames),
+            "capacity": self.max_size,
+            "policy": self.policy.value,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "overflowed": self.overflowed,
+            "closed": self.closed,
+            "pending_lag_seconds": pending_lag,
+            "last_lag_seconds": self.last_lag,
+            "max_lag_seconds": self.max_lag,
+        }
+
+    def _discard(self, frame: list[Any]) -> None:
+        """Forget the coalescing slot of a frame leaving the queue."""
+        key = frame[0]
+        if key is not None and self._keyed.get(key) is frame:
+            del self._keyed[key]
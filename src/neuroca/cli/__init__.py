@@ -51,20 +51,21 @@ class ConfigurationError(CLIError):
     """Exception raised for configuration-related errors."""
     pass
 
-# Import CLI components to make them available at the package level
-# F401 Fix: Removed unused imports that were only intended to expose submodules
-try:
-    # Import submodules directly if needed for package structure,
-    # but avoid importing specific unused names here.
-    from . import (
-        commands,  # Example if commands module itself is needed
-        utils,  # Example if utils module itself is needed
-    )
-    pass # Keep try-except structure if needed for graceful handling
-except ImportError as e:
-    # During early development or testing, some modules might not exist yet
-    # This graceful handling allows for incremental development
-    logger.debug(f"Some CLI components are not yet implemented: {e}")
+# Submodules exposed at the package level. They are imported on first
+# attribute access so that `neuroca --help` does not load every command's
+# dependencies.
+_LAZY_SUBMODULES = ("commands", "utils")
+
+
+def __getattr__(name: str) -> Any:
+    """Import CLI submodules on first access."""
+    if name not in _LAZY_SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    
+    module = importlib.import_module(f"{__name__}.{name}")
+    globals()[name] = module
+    return module
 
 
 def setup_cli_environment() -> None:
@@ -20,6 +20,10 @@ Usage:
     from neuroca.cli.commands import ALL_COMMANDS
     ```
 
+    Command modules are discovered the first time the registry is read
+    (ALL_COMMANDS, COMMAND_GROUPS, get_command, ...), not when the package is
+    imported, so importing a single command module stays cheap.
+
 Note:
     This module serves as the entry point for all CLI commands and should maintain
     backward compatibility when adding or modifying commands.
@@ -42,16 +46,26 @@ logger = logging.getLogger(__name__)
 CommandFunction = Callable[..., Any]
 
 # Dictionary to store all registered commands
-ALL_COMMANDS: dict[str, CommandFunction] = {}
+_ALL_COMMANDS: dict[str, CommandFunction] = {}
 
 # Dictionary to store command groups
-COMMAND_GROUPS: dict[str, dict[str, CommandFunction]] = {}
+_COMMAND_GROUPS: dict[str, dict[str, CommandFunction]] = {}
 
 # Dictionary to store command help information
-COMMAND_HELP: dict[str, str] = {}
+_COMMAND_HELP: dict[str, str] = {}
 
 # Dictionary to store command examples
-COMMAND_EXAMPLES: dict[str, list[str]] = {}
+_COMMAND_EXAMPLES: dict[str, list[str]] = {}
+
+# Registries exposed as module attributes once discovery has run
+_REGISTRIES = {
+    "ALL_COMMANDS": _ALL_COMMANDS,
+    "COMMAND_GROUPS": _COMMAND_GROUPS,
+    "COMMAND_HELP": _COMMAND_HELP,
+    "COMMAND_EXAMPLES": _COMMAND_EXAMPLES,
+}
+
+_commands_discovered = False
 
 
 def register_command(
@@ -90,22 +104,22 @@ def register_command(
         ```
     """
     def decorator(func: CommandFunction) -> CommandFunction:
-        if name in ALL_COMMANDS:
+        if name in _ALL_COMMANDS:
             logger.warning(f"Command '{name}' is being overridden")
             
-        ALL_COMMANDS[name] = func
+        _ALL_COMMANDS[name] = func
         
         # Initialize the group if it doesn't exist
-        if group not in COMMAND_GROUPS:
-            COMMAND_GROUPS[group] = {}
+        if group not in _COMMAND_GROUPS:
+            _COMMAND_GROUPS[group] = {}
             
-        COMMAND_GROUPS[group][name] = func
-        COMMAND_HELP[name] = help_text
+        _COMMAND_GROUPS[group][name] = func
+        _COMMAND_HELP[name] = help_text
         
         if examples:
-            COMMAND_EXAMPLES[name] = examples
+            _COMMAND_EXAMPLES[name] = examples
         else:
-            COMMAND_EXAMPLES[name] = []
+            _COMMAND_EXAMPLES[name] = []
             
         logger.debug(f"Registered command '{name}' in group '{group}'")
         return func
@@ -130,7 +144,8 @@ def get_command(name: str) -> Optional[CommandFunction]:
             cmd(config_path="custom_config.yaml")
         ```
     """
-    return ALL_COMMANDS.get(name)
+    _ensure_commands_discovered()
+    return _ALL_COMMANDS.get(name)
 
 
 def get_commands_in_group(group: str) -> dict[str, CommandFunction]:
@@ -150,7 +165,8 @@ def get_commands_in_group(group: str) -> dict[str, CommandFunction]:
             print(f"Memory command: {name}")
         ```
     """
-    return COMMAND_GROUPS.get(group, {})
+    _ensure_commands_discovered()
+    return _COMMAND_GROUPS.get(group, {})
 
 
 def get_command_help(name: str) -> str:
@@ -169,7 +185,8 @@ def get_command_help(name: str) -> str:
         print(help_text)
         ```
     """
-    return COMMAND_HELP.get(name, "")
+    _ensure_commands_discovered()
+    return _COMMAND_HELP.get(name, "")
 
 
 def get_command_examples(name: str) -> list[str]:
@@ -189,7 +206,8 @@ def get_command_examples(name: str) -> list[str]:
             print(f"Example: {example}")
         ```
     """
-    return COMMAND_EXAMPLES.get(name, [])
+    _ensure_commands_discovered()
+    return _COMMAND_EXAMPLES.get(name, [])
 
 
 def list_all_commands() -> dict[str, dict[str, str]]:
@@ -208,12 +226,13 @@ def list_all_commands() -> dict[str, dict[str, str]]:
                 print(f"  {name}: {help_text}")
         ```
     """
+    _ensure_commands_discovered()
     result: dict[str, dict[str, str]] = {}
     
-    for group, commands in COMMAND_GROUPS.items():
+    for group, commands in _COMMAND_GROUPS.items():
         result[group] = {}
         for name in commands:
-            result[group][name] = COMMAND_HELP.get(name, "")
+            result[group][name] = _COMMAND_HELP.get(name, "")
             
     return result
 
@@ -222,8 +241,9 @@ def _discover_and_load_commands() -> None:
     """
     Automatically discover and load command modules in the commands package.
     
-    This function is called during package initialization to discover and import
-    all command modules in the package, ensuring that their commands are registered.
+    This function is called on first access to the command registry to discover
+    and import all command modules in the package, ensuring that their commands
+    are registered.
     
     Note:
         This is an internal function and should not be called directly.
@@ -245,21 +265,38 @@ def _discover_and_load_commands() -> None:
         except ImportError as e:
             logger.error(f"Failed to import command module {module_name}: {str(e)}")
             
-    logger.info(f"Discovered {len(ALL_COMMANDS)} commands in {len(COMMAND_GROUPS)} groups")
+    logger.info(f"Discovered {len(_ALL_COMMANDS)} commands in {len(_COMMAND_GROUPS)} groups")
+
+
+def _ensure_commands_discovered() -> None:
+    """Discover command modules once, on first use of the registry."""
+    global _commands_discovered
+    if _commands_discovered:
+        return
+    _commands_discovered = True
+    try:
+        _discover_and_load_commands()
+    except Exception as e:
+        logger.error(f"Error during command discovery: {str(e)}")
+        # Don't re-raise the exception to avoid breaking callers,
+        # but log it for debugging purposes
+
 
+def __getattr__(name: str) -> Any:
+    """Expose the command registries, discovering command modules on first access."""
+    registry = _REGISTRIES.get(name)
+    if registry is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _ensure_commands_discovered()
+    return registry
 
-# Automatically discover and load command modules when the package is imported
-try:
-    _discover_and_load_commands()
-except Exception as e:
-    logger.error(f"Error during command discovery: {str(e)}")
-    # Don't re-raise the exception to avoid breaking imports,
-    # but log it for debugging purposes
 
 # Export public API
 __all__ = [
     'ALL_COMMANDS',
     'COMMAND_GROUPS',
+    'COMMAND_HELP',
+    'COMMAND_EXAMPLES',
     'register_command',
     'get_command',
     'get_commands_in_group',
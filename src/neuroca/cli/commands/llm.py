@@ -12,6 +12,7 @@ Commands:
 """
 
 import asyncio
+import importlib
 import json
 import logging
 import os
@@ -77,29 +78,36 @@ _SAFE_EDITOR_POLICIES: dict[str, EditorPolicy] = {
     ),
 }
 
-# Import dependencies with graceful fallback for missing components
-try:
-    from neuroca.core.cognitive_control.goal_manager import GoalManager
-except ImportError:
-    GoalManager = None
-
-try:
-    from neuroca.core.health.dynamics import HealthDynamicsManager
-except ImportError:
-    HealthDynamicsManager = None
-
-try:
-    from neuroca.integration.exceptions import LLMIntegrationError, ProviderNotFoundError
-    from neuroca.integration.manager import LLMIntegrationManager
-except ImportError:
-    LLMIntegrationError = Exception
-    ProviderNotFoundError = Exception
-    LLMIntegrationManager = None
-
-try:
-    from neuroca.memory.factory import create_memory_system
-except ImportError:
-    create_memory_system = None
+# Dependencies are imported on first use with graceful fallback for missing
+# components, so that loading this command group (e.g. for `--help`) does not
+# pull in the integration and memory stacks. name -> (module, fallback)
+_OPTIONAL_DEPENDENCIES: dict[str, tuple[str, Any]] = {
+    "GoalManager": ("neuroca.core.cognitive_control.goal_manager", None),
+    "HealthDynamicsManager": ("neuroca.core.health.dynamics", None),
+    "LLMIntegrationError": ("neuroca.integration.exceptions", Exception),
+    "ProviderNotFoundError": ("neuroca.integration.exceptions", Exception),
+    "LLMIntegrationManager": ("neuroca.integration.manager", None),
+    "create_memory_system": ("neuroca.memory.factory", None),
+}
+
+
+def _dependency(name: str) -> Any:
+    """Return an optional dependency, importing it on first use."""
+    if name in globals():
+        return globals()[name]
+    module_name, fallback = _OPTIONAL_DEPENDENCIES[name]
+    try:
+        value = getattr(importlib.import_module(module_name), name)
+    except ImportError:
+        value = fallback
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name in _OPTIONAL_DEPENDENCIES:
+        return _dependency(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -306,7 +314,8 @@ async def get_managers(config: dict) -> tuple:
         Tuple of (llm_manager, additional_context)
     """
     # Check if core dependencies are available
-    if not LLMIntegrationManager:
+    manager_class = _dependency("LLMIntegrationManager")
+    if not manager_class:
         console.print("[red]LLM integration components not available. Please check installation.[/red]")
         return None, {}
     
@@ -316,24 +325,24 @@ async def get_managers(config: dict) -> tuple:
     try:
         # Initialize memory manager if enabled and available
         memory_manager = None
-        if config.get("memory_integration", True) and create_memory_system:
-            memory_manager = create_memory_system("manager")
+        if config.get("memory_integration", True) and _dependency("create_memory_system"):
+            memory_manager = _dependency("create_memory_system")("manager")
             
         # Initialize health manager if enabled and available
         health_manager = None
-        if config.get("health_awareness", True) and HealthDynamicsManager:
-            health_manager = HealthDynamicsManager()
+        if config.get("health_awareness", True) and _dependency("HealthDynamicsManager"):
+            health_manager = _dependency("HealthDynamicsManager")()
             
         # Initialize goal manager if enabled and available
         goal_manager = None
-        if config.get("goal_directed", True) and GoalManager:
-            goal_manager = GoalManager(
+        if config.get("goal_directed", True) and _dependency("GoalManager"):
+            goal_manager = _dependency("GoalManager")(
                 health_manager=health_manager,
                 memory_manager=memory_manager
             )
         
         # Initialize LLM integration manager
-        llm_manager = LLMIntegrationManager(
+        llm_manager = manager_class(
             config=config,
             memory_manager=memory_manager,
             health_manager=health_manager,
@@ -387,7 +396,7 @@ def query_llm(
         neuroca llm query --format json "Generate a list of 5 cognitive biases"
     """
     # Check if LLM integration is available
-    if not LLMIntegrationManager:
+    if not _dependency("LLMIntegrationManager"):
         console.print("[red]LLM integration not available. Please install missing dependencies.[/red]")
         console.print("Missing components may include: neuroca.integration, neuroca.core modules")
         raise typer.Exit(code=1)
@@ -709,7 +718,7 @@ def bench_llm(
     async def _execute_bench():
         # Minimal manager config for stable benchmarking (no templates, no memory/health/goals)
         cfg = bench_util.build_manager_config(provider=provider, model=model, template_dirs=[])
-        mgr = LLMIntegrationManager(config=cfg)
+        mgr = _dependency("LLMIntegrationManager")(config=cfg)
         try:
             results: dict[str, Any] = {}
             if "latency" in suites:
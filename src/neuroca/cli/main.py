@@ -26,6 +26,7 @@ Environment Variables:
     NEUROCA_API_KEY: API key for LLM service integration
 """
 
+import importlib
 import json
 import logging
 import os
@@ -34,10 +35,12 @@ from pathlib import Path
 from typing import Annotated, Any, Optional  # Added Annotated for Typer options
 
 # import click # Remove click
+import click
 import typer
 import yaml
 from rich.console import Console
 from rich.logging import RichHandler
+from typer.core import TyperGroup
 
 # Package version - Consider moving to __init__.py or a central place
 try:
@@ -180,9 +183,60 @@ class NCAConfig:
 
 # --- Typer App Definition ---
 
+# Sub-apps from the commands directory, imported only when invoked:
+# name -> (module, attribute, help shown in `neuroca --help`)
+LAZY_SUBCOMMANDS: dict[str, tuple[str, str, str]] = {
+    "health": ("neuroca.cli.commands.health", "health_app", "Monitor and manage system health dynamics."),
+    "llm": ("neuroca.cli.commands.llm", "llm_app", "Commands for interacting with LLMs through the NCA."),
+    "memory": ("neuroca.cli.commands.memory", "memory_app", "Inspect and operate on the memory tiers."),
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    Root command group that imports sub-apps on first use.
+    
+    Help listings use the help text from LAZY_SUBCOMMANDS, so `neuroca --help`
+    and top-level commands never import the memory, LLM or health stacks.
+    """
+    
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in LAZY_SUBCOMMANDS if name not in names]
+    
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in LAZY_SUBCOMMANDS:
+            # Placeholder for help listings; resolve_command loads the real group
+            help_text = LAZY_SUBCOMMANDS[cmd_name][2]
+            command = click.Command(cmd_name, help=help_text, short_help=help_text)
+        return command
+    
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[Optional[str], Optional[click.Command], list[str]]:
+        cmd_name, command, remaining = super().resolve_command(ctx, args)
+        if cmd_name in LAZY_SUBCOMMANDS and cmd_name not in self.commands:
+            command = self._load_subcommand(cmd_name)
+        return cmd_name, command, remaining
+    
+    def _load_subcommand(self, cmd_name: str) -> click.Command:
+        module_name, attribute, _help = LAZY_SUBCOMMANDS[cmd_name]
+        try:
+            sub_app = getattr(importlib.import_module(module_name), attribute)
+        except ImportError as e:
+            logger.debug(f"{cmd_name.capitalize()} commands not available: {e}")
+            raise click.UsageError(f"The '{cmd_name}' commands are not available: {e}") from e
+        command = typer.main.get_group(sub_app)
+        command.name = cmd_name
+        self.add_command(command, cmd_name)
+        return command
+
+
 # Create the main Typer app
 app = typer.Typer(
     name="neuroca",
+    cls=LazyTyperGroup,
     help="NeuroCognitive Architecture (NCA) command line interface",
     add_completion=False,
     context_settings={"help_option_names": ["-h", "--help"]}
@@ -343,27 +397,6 @@ def init(
         # if verbose: logger.exception("Detailed error information:") # Not needed
         raise typer.Exit(code=1)
 
-# --- Import Command Modules ---
-# Import sub-apps from the commands directory with graceful fallback
-try:
-    from neuroca.cli.commands.health import health_app
-    app.add_typer(health_app)
-except ImportError as e:
-    logger.debug(f"Health commands not available: {e}")
-
-try:
-    from neuroca.cli.commands.llm import llm_app
-    app.add_typer(llm_app)
-except ImportError as e:
-    logger.debug(f"LLM commands not available: {e}")
-
-try:
-    from neuroca.cli.commands.memory import memory_app
-    app.add_typer(memory_app)
-except ImportError as e:
-    logger.debug(f"Memory commands not available: {e}")
-
-
 # --- Run Command ---
 # (Keep run command here as it's a top-level command)
 @app.command()
@@ -41,6 +41,12 @@ class ContextInjectionConfig:
             may be considered per invocation.
         max_history_turns (int): Limit on how many conversational turns are
             revisited when preparing history context.
+        tokenizer (str): Token counter used for budgeting: ``"auto"``,
+            ``"bpe"``, ``"approximate"`` or ``"whitespace"``.
+        tokenizer_path (str | None): ``.tiktoken`` rank file loaded with
+            ``tiktoken`` for the BPE tokenizer; ``"auto"`` uses it when set and
+            ``tiktoken`` is installed, and approximates otherwise.
+        token_count_cache_size (int): Number of per-text token counts cached.
     Returns:
         ContextInjectionConfig: Configured dataclass instance used by the
         context injection manager.
@@ -59,6 +65,9 @@ class ContextInjectionConfig:
     injection_strategy: str = "prepend"
     max_memory_elements: int = 16
     max_history_turns: int = 10
+    tokenizer: str = "auto"
+    tokenizer_path: str | None = None
+    token_count_cache_size: int = 4096
 
     def __post_init__(self) -> None:
         """Validate core invariants for the configuration payload.
@@ -71,7 +80,7 @@ class ContextInjectionConfig:
         Returns:
             None
         Raises:
-            ValueError: If numerical budgets are non-positive values.
+            ValueError: If numerical budgets or cache sizes are out of range.
         Side Effects:
             None. Validation relies on local comparisons only.
         Timeout/Retry Notes:
@@ -85,6 +94,8 @@ class ContextInjectionConfig:
             raise ValueError("max_memory_elements must be a positive integer")
         if self.max_history_turns <= 0:
             raise ValueError("max_history_turns must be a positive integer")
+        if self.token_count_cache_size < 0:
+            raise ValueError("token_count_cache_size cannot be negative")
 
 
 def get_default_context_injection_config() -> ContextInjectionConfig:
@@ -24,11 +24,15 @@ Usage:
     event_bus.subscribe(SystemShutdownEvent, handle_shutdown)
 """
 
+import asyncio
 import enum
+import inspect
 import logging
+import queue
 import threading
 import uuid
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Optional, TypeVar, Union
@@ -125,7 +129,7 @@ class SystemShutdownEvent(SystemEvent):
         return f"System {shutdown_type} shutdown initiated at {self.shutdown_time} due to: {self.reason}"
 
 
-@dataclass
+@dataclass(kw_only=True)
 class SystemErrorEvent(SystemEvent):
     """Event fired when a system-level error occurs."""
     error_message: str
@@ -144,7 +148,7 @@ class SystemErrorEvent(SystemEvent):
         return f"{recovery_str.capitalize()} error{component_str}: {self.error_type} - {self.error_message}"
 
 
-@dataclass
+@dataclass(kw_only=True)
 class ResourceAllocationEvent(SystemEvent):
     """Event fired when system resources are allocated or deallocated."""
     resource_type: str  # memory, cpu, gpu, etc.
@@ -163,7 +167,7 @@ class ResourceAllocationEvent(SystemEvent):
         return f"Resource {action}: {self.resource_type} {self.resource_id}{amount_str}"
 
 
-@dataclass
+@dataclass(kw_only=True)
 class ConfigurationChangeEvent(SystemEvent):
     """Event fired when system configuration changes."""
     config_key: str
@@ -179,7 +183,7 @@ class ConfigurationChangeEvent(SystemEvent):
         return f"Configuration changed: {self.config_key} from {self.old_value} to {self.new_value} by {self.source}"
 
 
-@dataclass
+@dataclass(kw_only=True)
 class PerformanceThresholdEvent(SystemEvent):
     """Event fired when a performance threshold is crossed."""
     metric_name: str
@@ -210,7 +214,8 @@ class EventHandler:
         callback: Callable[[SystemEvent], None],
         event_type: type[SystemEvent],
         handler_id: Optional[str] = None,
-        filter_fn: Optional[Callable[[SystemEvent], bool]] = None
+        filter_fn: Optional[Callable[[SystemEvent], bool]] = None,
+        asynchronous: Optional[bool] = None
     ):
         """
         Initialize a new event handler.
@@ -220,11 +225,15 @@ class EventHandler:
             event_type: Type of event this handler processes
             handler_id: Unique identifier for this handler (auto-generated if None)
             filter_fn: Optional function to filter events before processing
+            asynchronous: Whether the callback runs off the publishing thread;
+                defaults to True for coroutine functions
         """
         self.callback = callback
         self.event_type = event_type
         self.handler_id = handler_id or str(uuid.uuid4())
         self.filter_fn = filter_fn
+        self.is_coroutine = inspect.iscoroutinefunction(callback)
+        self.asynchronous = self.is_coroutine if asynchronous is None else asynchronous
         
     def can_handle(self, event: SystemEvent) -> bool:
         """
@@ -255,16 +264,130 @@ class EventHandler:
             return
             
         try:
-            self.callback(event)
+            result = self.callback(event)
+            if inspect.isawaitable(result):
+                asyncio.run(result)
         except Exception as e:
             logger.error(f"Error in event handler {self.handler_id}: {str(e)}", exc_info=True)
 
 
+class _AsyncDispatcher:
+    """
+    Background worker that runs asynchronous event handlers.
+    
+    Deliveries are queued on a bounded queue and processed in order by a
+    single daemon thread that owns an event loop for coroutine callbacks.
+    When the queue is full new deliveries are dropped and counted rather
+    than blocking the publisher.
+    """
+    
+    def __init__(self, queue_size: int = 10000):
+        """
+        Initialize the dispatcher.
+        
+        Args:
+            queue_size: Maximum number of pending deliveries
+        """
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+    
+    def submit(self, handler: EventHandler, event: 'SystemEvent') -> bool:
+        """
+        Queue a delivery without blocking.
+        
+        Args:
+            handler: Handler to invoke
+            event: Event to deliver
+            
+        Returns:
+            True if the delivery was queued, False if it was dropped
+        """
+        self._ensure_worker()
+        try:
+            self.queue.put_nowait((handler, event))
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+                dropped = self.dropped
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning(
+                    f"Async event queue full, dropped {dropped} deliveries so far"
+                )
+            return False
+        return True
+    
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued delivery has been processed.
+        
+        Args:
+            timeout: Maximum number of seconds to wait (None waits forever)
+            
+        Returns:
+            True if the queue drained before the timeout
+        """
+        if timeout is None:
+            self.queue.join()
+            return True
+        done = threading.Event()
+        waiter = threading.Thread(target=lambda: (self.queue.join(), done.set()), daemon=True)
+        waiter.start()
+        return done.wait(timeout)
+    
+    def close(self) -> None:
+        """Process the remaining deliveries and stop the worker thread."""
+        with self._start_lock:
+            worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        self.queue.put(None)
+        worker.join()
+    
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._start_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="SystemEventBusDispatcher", daemon=True
+                )
+                self._worker.start()
+    
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                break
+            handler, event = item
+            try:
+                if handler.can_handle(event):
+                    result = handler.callback(event)
+                    if inspect.isawaitable(result):
+                        loop.run_until_complete(result)
+            except Exception as e:
+                logger.error(f"Error in event handler {handler.handler_id}: {str(e)}", exc_info=True)
+            finally:
+                self.queue.task_done()
+        loop.close()
+
+
 class SystemEventBus:
     """
     Central event bus for publishing and subscribing to system events.
     
     This class implements the Singleton pattern to ensure a single event bus instance.
+    
+    Handlers for a concrete event type are resolved once and cached until the
+    next subscription change, so publishing does not scan every registered
+    type. Asynchronous handlers (coroutine functions, or callbacks subscribed
+    with ``asynchronous=True``) are delivered off-thread through a bounded
+    queue; synchronous handlers still run on the publishing thread.
     """
     _instance = None
     _lock = threading.Lock()
@@ -282,9 +405,11 @@ class SystemEventBus:
             
         self._handlers: dict[type[SystemEvent], list[EventHandler]] = {}
         self._global_handlers: list[EventHandler] = []
-        self._event_history: list[SystemEvent] = []
+        self._dispatch_cache: dict[type[SystemEvent], tuple[EventHandler, ...]] = {}
         self._max_history_size = 1000  # Default history size
+        self._event_history: deque[SystemEvent] = deque(maxlen=self._max_history_size)
         self._history_enabled = True
+        self._async_dispatcher = _AsyncDispatcher()
         self._lock = threading.RLock()
         self._initialized = True
         
@@ -305,7 +430,8 @@ class SystemEventBus:
         event_type: type[T],
         callback: Callable[[T], None],
         handler_id: Optional[str] = None,
-        filter_fn: Optional[Callable[[T], bool]] = None
+        filter_fn: Optional[Callable[[T], bool]] = None,
+        asynchronous: Optional[bool] = None
     ) -> str:
         """
         Subscribe to events of the specified type.
@@ -315,16 +441,19 @@ class SystemEventBus:
             callback: Function to call when an event is received
             handler_id: Optional unique identifier for this subscription
             filter_fn: Optional function to filter events
+            asynchronous: Deliver off the publishing thread; defaults to True
+                for coroutine functions
             
         Returns:
             Handler ID that can be used to unsubscribe
         """
-        handler = EventHandler(callback, event_type, handler_id, filter_fn)
+        handler = EventHandler(callback, event_type, handler_id, filter_fn, asynchronous)
         
         with self._lock:
             if event_type not in self._handlers:
                 self._handlers[event_type] = []
             self._handlers[event_type].append(handler)
+            self._dispatch_cache.clear()
             
         logger.debug(f"Subscribed handler {handler.handler_id} to {event_type.__name__}")
         return handler.handler_id
@@ -333,7 +462,8 @@ class SystemEventBus:
         self,
         callback: Callable[[SystemEvent], None],
         handler_id: Optional[str] = None,
-        filter_fn: Optional[Callable[[SystemEvent], bool]] = None
+        filter_fn: Optional[Callable[[SystemEvent], bool]] = None,
+        asynchronous: Optional[bool] = None
     ) -> str:
         """
         Subscribe to all system events.
@@ -342,14 +472,17 @@ class SystemEventBus:
             callback: Function to call when any event is received
             handler_id: Optional unique identifier for this subscription
             filter_fn: Optional function to filter events
+            asynchronous: Deliver off the publishing thread; defaults to True
+                for coroutine functions
             
         Returns:
             Handler ID that can be used to unsubscribe
         """
-        handler = EventHandler(callback, SystemEvent, handler_id, filter_fn)
+        handler = EventHandler(callback, SystemEvent, handler_id, filter_fn, asynchronous)
         
         with self._lock:
             self._global_handlers.append(handler)
+            self._dispatch_cache.clear()
             
         logger.debug(f"Subscribed global handler {handler.handler_id}")
         return handler.handler_id
@@ -369,6 +502,7 @@ class SystemEventBus:
             for i, handler in enumerate(self._global_handlers):
                 if handler.handler_id == handler_id:
                     self._global_handlers.pop(i)
+                    self._dispatch_cache.clear()
                     logger.debug(f"Unsubscribed global handler {handler_id}")
                     return True
             
@@ -377,6 +511,7 @@ class SystemEventBus:
                 for i, handler in enumerate(handlers):
                     if handler.handler_id == handler_id:
                         handlers.pop(i)
+                        self._dispatch_cache.clear()
                         logger.debug(f"Unsubscribed handler {handler_id} from {event_type.__name__}")
                         return True
         
@@ -393,37 +528,91 @@ class SystemEventBus:
         if not isinstance(event, SystemEvent):
             raise TypeError(f"Expected SystemEvent, got {type(event).__name__}")
         
-        # Store in history if enabled
+        # Store in history if enabled; the deque drops the oldest entry itself
         if self._history_enabled:
             with self._lock:
-                self._event_history.append(event)
-                # Trim history if needed
-                if len(self._event_history) > self._max_history_size:
-                    self._event_history = self._event_history[-self._max_history_size:]
+                if self._history_enabled:
+                    self._event_history.append(event)
         
-        # Get relevant handlers
-        handlers_to_call = []
-        
-        with self._lock:
-            # Add type-specific handlers
-            event_type = type(event)
-            for handler_type, handlers in self._handlers.items():
-                if issubclass(event_type, handler_type):
-                    handlers_to_call.extend(handlers)
-            
-            # Add global handlers
-            handlers_to_call.extend(self._global_handlers)
+        event_type = type(event)
+        handlers_to_call = self._dispatch_cache.get(event_type)
+        if handlers_to_call is None:
+            handlers_to_call = self._resolve_handlers(event_type)
         
         # Call handlers outside the lock to prevent deadlocks
         for handler in handlers_to_call:
+            if handler.asynchronous:
+                self._async_dispatcher.submit(handler, event)
+                continue
             try:
-                if handler.can_handle(event):
-                    handler.handle(event)
+                handler.handle(event)
             except Exception as e:
                 logger.error(f"Error dispatching event {event.id} to handler {handler.handler_id}: {str(e)}", 
                              exc_info=True)
         
-        logger.debug(f"Published event: {event}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Published event: {event}")
+    
+    def _resolve_handlers(self, event_type: type[SystemEvent]) -> tuple[EventHandler, ...]:
+        """
+        Resolve and cache the handlers for a concrete event type.
+        
+        Args:
+            event_type: The concrete type of a published event
+            
+        Returns:
+            Type-specific handlers in subscription order, followed by global handlers
+        """
+        with self._lock:
+            cached = self._dispatch_cache.get(event_type)
+            if cached is not None:
+                return cached
+            
+            # Walk the MRO so only the event's own ancestors are looked up
+            ancestors = set(event_type.__mro__)
+            resolved = tuple(
+                handler
+                for handler_type, handlers in self._handlers.items()
+                if handler_type in ancestors
+                for handler in handlers
+            ) + tuple(self._global_handlers)
+            self._dispatch_cache[event_type] = resolved
+            return resolved
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued asynchronous deliveries to finish.
+        
+        Args:
+            timeout: Maximum number of seconds to wait (None waits forever)
+            
+        Returns:
+            True if all queued deliveries completed before the timeout
+        """
+        return self._async_dispatcher.join(timeout)
+    
+    def set_async_queue_size(self, max_size: int) -> None:
+        """
+        Set the capacity of the asynchronous delivery queue.
+        
+        Deliveries already queued are processed by the previous worker
+        before it stops.
+        
+        Args:
+            max_size: Maximum number of pending asynchronous deliveries
+        """
+        if max_size < 1:
+            raise ValueError("Async queue size must be at least 1")
+        
+        with self._lock:
+            previous = self._async_dispatcher
+            self._async_dispatcher = _AsyncDispatcher(max_size)
+        previous.close()
+    
+    @property
+    def dropped_async_events(self) -> int:
+        """Number of asynchronous deliveries dropped because the queue was full."""
+        return self._async_dispatcher.dropped
     
     def get_history(self, limit: Optional[int] = None) -> list[SystemEvent]:
         """
@@ -436,9 +625,10 @@ class SystemEventBus:
             List of historical events, newest first
         """
         with self._lock:
-            if not limit:
-                return list(self._event_history)
-            return list(self._event_history[-limit:])
+            history = list(self._event_history)
+        if not limit:
+            return history
+        return history[-limit:]
     
     def clear_history(self) -> None:
         """Clear the event history."""
@@ -458,9 +648,10 @@ class SystemEventBus:
             
         with self._lock:
             self._max_history_size = max_size
-            # Trim history if needed
-            if len(self._event_history) > max_size:
-                self._event_history = self._event_history[-max_size:]
+            # A deque's maxlen is fixed, so rebuild the ring buffer (keeping the
+            # newest events). Publishers append under the same lock, so no
+            # event is lost to the swap.
+            self._event_history = deque(self._event_history, maxlen=max_size)
         
         logger.debug(f"Event history size set to {max_size}")
     
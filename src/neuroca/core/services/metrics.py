@@ -22,10 +22,13 @@ External Dependencies
 This module only depends on:
 
 * `neuroca.core.models.metrics` for API-facing DTOs.
+* `neuroca.core.services.timeseries` for the columnar sample store.
 * A generic `settings` object passed from `neuroca.config.settings.get_settings`.
 
 It does **not** talk to external databases or monitoring backends. All data is
-kept in memory, which is sufficient for:
+kept in memory in NumPy columns (one series per metric name and label set,
+with pre-aggregated one-minute and one-hour rollup tiers), which is sufficient
+for:
 
 * Local development.
 * CI.
@@ -50,8 +53,8 @@ request paths while still providing meaningful information when available.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Iterable, List, Optional
 
 from neuroca.core.models.metrics import (
@@ -63,34 +66,15 @@ from neuroca.core.models.metrics import (
     PerformanceMetrics,
     SystemHealthMetrics,
 )
+from neuroca.core.services.timeseries import AGGREGATIONS, TimeSeriesStore
 
 # ---------------------------------------------------------------------------
 # Internal data structures
 # ---------------------------------------------------------------------------
 
-
-@dataclass
-class _MetricSample:
-    """In-memory representation of a single metric sample.
-
-    Attributes
-    ----------
-    timestamp:
-        UTC timestamp when the sample was recorded.
-    value:
-        Numeric value of the sample (counter increment, gauge value, etc.).
-    labels:
-        Immutable dictionary of label key/value pairs attached to the sample.
-    """
-
-    timestamp: datetime
-    value: float
-    labels: Dict[str, str]
-
-
-# Global, in-process time-series ledger for metrics.
-# Keys are metric names; values are ordered lists of samples.
-_SAMPLES: Dict[str, List[_MetricSample]] = {}
+# Global, in-process time-series store for metrics, keyed by metric name and
+# interned label set.
+_STORE = TimeSeriesStore()
 
 # Global registry of definitions keyed by metric name.
 _DEFINITIONS: Dict[str, MetricDefinition] = {}
@@ -98,6 +82,18 @@ _DEFINITIONS: Dict[str, MetricDefinition] = {}
 # Default retention window (in days) when a definition does not specify it.
 _DEFAULT_RETENTION_DAYS = 30
 
+# Minimum number of seconds between retention passes for a metric.
+_RETENTION_CHECK_INTERVAL = 1.0
+
+# Monotonic time of the last retention pass per metric name.
+_LAST_RETENTION_CHECK: Dict[str, float] = {}
+
+# Naive UTC epoch used to convert timestamps to integer microseconds.
+_EPOCH = datetime(1970, 1, 1)
+
+# Accepted spellings for aggregation methods.
+_AGGREGATION_ALIASES = {"mean": "avg", "average": "avg", "total": "sum"}
+
 
 def _now_utc() -> datetime:
     """Return the current UTC time without timezone info.
@@ -108,27 +104,17 @@ def _now_utc() -> datetime:
     return datetime.utcnow()
 
 
-def _labels_match(sample_labels: Dict[str, str], required: Optional[Dict[str, str]]) -> bool:
-    """Return True if ``sample_labels`` contains all key/value pairs in ``required``.
+def _to_micros(value: datetime) -> int:
+    """Convert a naive-UTC or aware ``datetime`` to epoch microseconds."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
 
-    Parameters
-    ----------
-    sample_labels:
-        Labels attached to a recorded sample.
-    required:
-        Optional filter labels. When ``None`` or empty, all samples match.
 
-    Returns
-    -------
-    bool
-        ``True`` if the sample should be included for the given filter.
-    """
-    if not required:
-        return True
-    for key, expected in required.items():
-        if sample_labels.get(key) != expected:
-            return False
-    return True
+def _from_micros(value: int) -> datetime:
+    """Convert epoch microseconds back to a naive UTC ``datetime``."""
+    return _EPOCH + timedelta(microseconds=int(value))
 
 
 def _ensure_retention(name: str) -> None:
@@ -136,18 +122,57 @@ def _ensure_retention(name: str) -> None:
 
     Retention is applied using the metric definition's ``retention_days``
     field. If no definition exists, a default window is used. Samples older
-    than ``now - retention_window`` are removed in-place.
+    than ``now - retention_window`` are dropped from the front of each
+    series, which is a binary search rather than a rebuild. Passes are
+    rate-limited per metric because each one visits every series.
     """
-    if name not in _SAMPLES:
+    now = time.monotonic()
+    if now - _LAST_RETENTION_CHECK.get(name, float("-inf")) < _RETENTION_CHECK_INTERVAL:
         return
+    _LAST_RETENTION_CHECK[name] = now
 
     definition = _DEFINITIONS.get(name)
     retention_days = definition.retention_days if definition else _DEFAULT_RETENTION_DAYS
     cutoff = _now_utc() - timedelta(days=retention_days)
+    _STORE.trim(name, _to_micros(cutoff))
+
 
-    samples = _SAMPLES[name]
-    # Keep only samples newer than the cutoff.
-    _SAMPLES[name] = [s for s in samples if s.timestamp >= cutoff]
+def _parse_interval(interval: Optional[str]) -> Optional[int]:
+    """Parse an aggregation interval such as ``"30s"``, ``"5m"`` or ``"1h"``.
+
+    Returns
+    -------
+    Optional[int]
+        Interval length in microseconds, or ``None`` when *interval* is empty.
+
+    Raises
+    ------
+    ValueError
+        If the interval is malformed or not positive.
+    """
+    if not interval:
+        return None
+    text = interval.strip().lower()
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86_400}
+    try:
+        amount = int(text[:-1])
+        seconds = amount * units[text[-1]]
+    except (KeyError, ValueError, IndexError) as exc:
+        raise ValueError(f"Invalid interval: {interval!r}") from exc
+    if seconds <= 0:
+        raise ValueError(f"Invalid interval: {interval!r}")
+    return seconds * 1_000_000
+
+
+def _normalise_aggregation(aggregation: str) -> str:
+    """Return the canonical aggregation name or raise ``ValueError``."""
+    key = aggregation.strip().lower()
+    key = _AGGREGATION_ALIASES.get(key, key)
+    if key not in AGGREGATIONS:
+        raise ValueError(
+            f"Unsupported aggregation: {aggregation!r} (expected one of {', '.join(AGGREGATIONS)})"
+        )
+    return key
 
 
 def _parse_period(period: str) -> timedelta:
@@ -363,7 +388,8 @@ class MetricsService:
     async def delete_metric_definition(self, name: str) -> None:
         """Delete a metric definition and all of its samples."""
         _DEFINITIONS.pop(name, None)
-        _SAMPLES.pop(name, None)
+        _LAST_RETENTION_CHECK.pop(name, None)
+        _STORE.drop(name)
 
     async def record_metric(
         self,
@@ -404,13 +430,7 @@ class MetricsService:
                 unit="count",
             )
 
-        labels_safe = dict(labels or {})
-        sample = _MetricSample(
-            timestamp=timestamp or _now_utc(),
-            value=numeric_value,
-            labels=labels_safe,
-        )
-        _SAMPLES.setdefault(name, []).append(sample)
+        _STORE.append(name, _to_micros(timestamp or _now_utc()), numeric_value, labels)
         _ensure_retention(name)
 
     async def record_metrics_batch(
@@ -448,34 +468,40 @@ class MetricsService:
     ) -> MetricTimeseriesData:
         """Return time-series data for a metric.
 
-        The current implementation returns raw samples filtered by time window
-        and labels. The ``interval`` and ``aggregation`` parameters are
-        accepted for API compatibility but do not yet change behaviour.
+        Without an ``aggregation`` the raw samples matching the time window
+        and labels are returned. With one, samples are rolled up into
+        epoch-aligned buckets of ``interval`` (``avg``, ``sum``, ``min``,
+        ``max``, ``count``, ``last`` or ``p95``) and each point is stamped
+        with its bucket start. ``limit`` keeps the most recent points.
 
         Raises
         ------
         KeyError
             If the metric is unknown.
+        ValueError
+            If ``interval`` or ``aggregation`` is invalid.
         """
         if name not in _DEFINITIONS:
             raise KeyError(f"Unknown metric: {name}")
 
-        series = _SAMPLES.get(name, [])
-        filtered: List[Dict[str, Any]] = []
-        for sample in series:
-            if sample.timestamp < start_time or sample.timestamp > end_time:
-                continue
-            if not _labels_match(sample.labels, labels):
-                continue
-            filtered.append(
-                {
-                    "timestamp": sample.timestamp,
-                    "value": sample.value,
-                }
+        start_us, end_us = _to_micros(start_time), _to_micros(end_time)
+        if aggregation:
+            stamps, values = _STORE.rollup(
+                name,
+                start_us,
+                end_us,
+                _parse_interval(interval),
+                _normalise_aggregation(aggregation),
+                labels=labels,
+                limit=limit,
             )
+        else:
+            stamps, values = _STORE.points(name, start_us, end_us, labels=labels, limit=limit)
 
-        if limit > 0 and len(filtered) > limit:
-            filtered = filtered[-limit:]
+        filtered: List[Dict[str, Any]] = [
+            {"timestamp": _from_micros(stamp), "value": float(value)}
+            for stamp, value in zip(stamps.tolist(), values.tolist())
+        ]
 
         definition = _DEFINITIONS[name]
         return MetricTimeseriesData(
@@ -500,25 +526,20 @@ class MetricsService:
             raise KeyError(f"Unknown metric: {name}")
 
         window = _parse_period(period)
-        end_time = _now_utc()
-        start_time = end_time - window
-
-        series = _SAMPLES.get(name, [])
-        values: List[float] = [
-            sample.value
-            for sample in series
-            if start_time <= sample.timestamp <= end_time
-        ]
-
-        if not values:
-            values = [0.0]
-
-        total = float(sum(values))
-        count = len(values)
-        minimum = float(min(values))
-        maximum = float(max(values))
+        end_us = _to_micros(_now_utc())
+        start_us = end_us - window // timedelta(microseconds=1)
+
+        stats = _STORE.summarize(name, start_us, end_us)
+        if stats is None:
+            # Preserve the historical single zero-valued sample for empty windows.
+            stats = {"count": 1, "sum": 0.0, "min": 0.0, "max": 0.0, "last": 0.0}
+
+        count = int(stats["count"])
+        total = float(stats["sum"])
+        minimum = float(stats["min"])
+        maximum = float(stats["max"])
+        latest = float(stats["last"])
         average = total / count if count else 0.0
-        latest = float(values[-1])
 
         definition = _DEFINITIONS[name]
         return MetricSummary(
@@ -650,7 +671,7 @@ class MetricsService:
             Dictionary containing a list of definitions and basic usage
             statistics. The `/metrics` route attaches additional metadata.
         """
-        total_samples = sum(len(series) for series in _SAMPLES.values())
+        total_samples = _STORE.sample_count()
         return {
             "definitions": [d.name for d in _DEFINITIONS.values()],
             "counts": {
@@ -841,12 +862,7 @@ class MetricsService:
                 delta = -delta
 
             # Retrieve the latest value so we can adjust the gauge.
-            series = _SAMPLES.get("usage.memory.storage.bytes", [])
-            current_value = 0.0
-            for sample in reversed(series):
-                if _labels_match(sample.labels, storage_labels):
-                    current_value = sample.value
-                    break
+            current_value = _STORE.latest("usage.memory.storage.bytes", storage_labels) or 0.0
 
             new_value = max(0.0, current_value + delta)
             await self.record_metric(
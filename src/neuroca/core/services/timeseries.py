@@ -0,0 +1,471 @@
+"""Columnar in-process time-series store backing :mod:`neuroca.core.services.metrics`.
+
+Purpose
+-------
+Samples are kept per series (a metric name plus one interned label set) in
+NumPy columns of integer microsecond timestamps and float values, ordered by
+time. Range queries locate their window with binary search, and label filters
+are evaluated once per series instead of once per sample.
+
+Each series also maintains pre-aggregated rollup tiers (one minute and one
+hour by default) holding count/sum/min/max/last per bucket. Long-window
+rollups read whole buckets from the coarsest compatible tier and only touch
+raw samples for the partial buckets at either edge of the window.
+
+Supported aggregations are ``avg``, ``sum``, ``min``, ``max``, ``count``,
+``last`` and ``p95``. Percentiles are exact and computed from raw samples.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+AGGREGATIONS = ("avg", "sum", "min", "max", "count", "last", "p95")
+
+# Default rollup tier widths in microseconds: one minute and one hour.
+DEFAULT_TIERS_US = (60 * 1_000_000, 3600 * 1_000_000)
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+_RAW_COLUMNS = {"ts": np.int64, "value": np.float64}
+_TIER_COLUMNS = {
+    "bucket": np.int64,
+    "count": np.int64,
+    "sum": np.float64,
+    "min": np.float64,
+    "max": np.float64,
+    "last": np.float64,
+    "last_ts": np.int64,
+}
+
+
+class _Columns:
+    """Contiguous window over preallocated NumPy columns.
+
+    Rows live in ``[start, end)`` of each backing array. Appends write at
+    ``end``; dropping old rows only advances ``start``. When the arrays fill
+    up the live window is compacted to the front, or the arrays are doubled
+    when more than half of them is live, so both operations are amortised
+    O(1) and every column is always available as a zero-copy slice.
+    """
+
+    __slots__ = ("_data", "_start", "_end")
+
+    def __init__(self, dtypes: Mapping[str, type], capacity: int = 64) -> None:
+        self._data = {name: np.empty(capacity, dtype=dtype) for name, dtype in dtypes.items()}
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a view of the live rows of column *name*."""
+        return self._data[name][self._start:self._end]
+
+    def get(self, index: int, name: str):
+        """Return a single cell by live-row index."""
+        return self._data[name][self._start + index]
+
+    def set(self, index: int, name: str, value) -> None:
+        """Overwrite a single cell by live-row index."""
+        self._data[name][self._start + index] = value
+
+    def append(self, row: Mapping[str, object]) -> None:
+        """Append one row."""
+        self._reserve()
+        for name, array in self._data.items():
+            array[self._end] = row[name]
+        self._end += 1
+
+    def insert(self, index: int, row: Mapping[str, object]) -> None:
+        """Insert one row before live-row *index*, shifting later rows."""
+        self._reserve()
+        position = self._start + index
+        for name, array in self._data.items():
+            array[position + 1:self._end + 1] = array[position:self._end]
+            array[position] = row[name]
+        self._end += 1
+
+    def drop_front(self, count: int) -> None:
+        """Discard the oldest *count* rows."""
+        self._start = min(self._start + count, self._end)
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    def _reserve(self) -> None:
+        capacity = len(next(iter(self._data.values())))
+        if self._end < capacity:
+            return
+        live = len(self)
+        new_capacity = capacity * 2 if live * 2 > capacity else capacity
+        for name, array in self._data.items():
+            target = array if new_capacity == capacity else np.empty(new_capacity, dtype=array.dtype)
+            target[:live] = array[self._start:self._end]
+            self._data[name] = target
+        self._start, self._end = 0, live
+
+
+class _Tier:
+    """Fixed-width buckets of mergeable statistics for one series."""
+
+    __slots__ = ("width", "rows")
+
+    def __init__(self, width: int) -> None:
+        self.width = width
+        self.rows = _Columns(_TIER_COLUMNS, capacity=16)
+
+    def add(self, ts: int, value: float) -> None:
+        bucket = ts - ts % self.width
+        rows = self.rows
+        size = len(rows)
+        if size and rows.get(size - 1, "bucket") == bucket:
+            index = size - 1
+        elif not size or bucket > rows.get(size - 1, "bucket"):
+            rows.append({"bucket": bucket, "count": 1, "sum": value, "min": value,
+                         "max": value, "last": value, "last_ts": ts})
+            return
+        else:
+            index = int(np.searchsorted(rows.column("bucket"), bucket))
+            if index == size or rows.get(index, "bucket") != bucket:
+                rows.insert(index, {"bucket": bucket, "count": 1, "sum": value, "min": value,
+                                    "max": value, "last": value, "last_ts": ts})
+                return
+
+        rows.set(index, "count", rows.get(index, "count") + 1)
+        rows.set(index, "sum", rows.get(index, "sum") + value)
+        if value < rows.get(index, "min"):
+            rows.set(index, "min", value)
+        if value > rows.get(index, "max"):
+            rows.set(index, "max", value)
+        if ts >= rows.get(index, "last_ts"):
+            rows.set(index, "last", value)
+            rows.set(index, "last_ts", ts)
+
+    def trim(self, cutoff: int) -> None:
+        # Buckets starting before the cutoff may hold expired samples
+        self.rows.drop_front(int(np.searchsorted(self.rows.column("bucket"), cutoff, side="left")))
+
+
+class _Series:
+    """Raw samples and rollup tiers for one interned label set."""
+
+    __slots__ = ("labels", "raw", "tiers")
+
+    def __init__(self, labels: Dict[str, str], tier_widths: Sequence[int]) -> None:
+        self.labels = labels
+        self.raw = _Columns(_RAW_COLUMNS)
+        self.tiers = [_Tier(width) for width in tier_widths]
+
+    def add(self, ts: int, value: float) -> None:
+        raw = self.raw
+        size = len(raw)
+        if not size or ts >= raw.get(size - 1, "ts"):
+            raw.append({"ts": ts, "value": value})
+        else:
+            raw.insert(int(np.searchsorted(raw.column("ts"), ts, side="right")), {"ts": ts, "value": value})
+        for tier in self.tiers:
+            tier.add(ts, value)
+
+    def trim(self, cutoff: int) -> None:
+        self.raw.drop_front(int(np.searchsorted(self.raw.column("ts"), cutoff, side="left")))
+        for tier in self.tiers:
+            tier.trim(cutoff)
+
+    def window(self, start: int, end: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return raw timestamps and values within ``[start, end]``."""
+        ts = self.raw.column("ts")
+        lo = int(np.searchsorted(ts, start, side="left"))
+        hi = int(np.searchsorted(ts, end, side="right"))
+        return ts[lo:hi], self.raw.column("value")[lo:hi]
+
+    def matches(self, required: Optional[Mapping[str, str]]) -> bool:
+        if not required:
+            return True
+        return all(self.labels.get(key) == expected for key, expected in required.items())
+
+
+class TimeSeriesStore:
+    """Thread-safe columnar store of metric samples keyed by name and labels.
+
+    Timestamps are integer microseconds since the Unix epoch. The store does
+    not know about retention policies; callers trim series explicitly.
+    """
+
+    def __init__(self, tier_widths: Sequence[int] = DEFAULT_TIERS_US) -> None:
+        self._tier_widths = tuple(sorted(int(width) for width in tier_widths))
+        self._series: Dict[str, Dict[_LabelKey, _Series]] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------ #
+    # Mutation
+    # ------------------------------------------------------------------ #
+
+    def append(self, name: str, ts: int, value: float, labels: Optional[Mapping[str, str]] = None) -> None:
+        """Record a sample for the series identified by *name* and *labels*."""
+        key: _LabelKey = tuple(sorted((labels or {}).items()))
+        with self._lock:
+            by_labels = self._series.setdefault(name, {})
+            series = by_labels.get(key)
+            if series is None:
+                series = by_labels[key] = _Series(dict(key), self._tier_widths)
+            series.add(int(ts), float(value))
+
+    def trim(self, name: str, cutoff: int) -> None:
+        """Drop samples of *name* older than *cutoff*."""
+        with self._lock:
+            for series in self._series.get(name, {}).values():
+                series.trim(int(cutoff))
+
+    def drop(self, name: str) -> None:
+        """Remove every series recorded under *name*."""
+        with self._lock:
+            self._series.pop(name, None)
+
+    def clear(self) -> None:
+        """Remove all series."""
+        with self._lock:
+            self._series.clear()
+
+    # ------------------------------------------------------------------ #
+    # Queries
+    # ------------------------------------------------------------------ #
+
+    def sample_count(self, name: Optional[str] = None) -> int:
+        """Return the number of raw samples held for *name*, or in total."""
+        with self._lock:
+            names = [name] if name is not None else list(self._series)
+            return sum(len(series.raw) for metric in names for series in self._series.get(metric, {}).values())
+
+    def points(
+        self,
+        name: str,
+        start: int,
+        end: int,
+        labels: Optional[Mapping[str, str]] = None,
+        limit: int = 0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return raw timestamps and values in ``[start, end]`` ordered by time.
+
+        When *limit* is positive only the most recent *limit* samples are kept.
+        """
+        with self._lock:
+            parts = [series.window(start, end) for series in self._matching(name, labels)]
+            if not parts:
+                return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+            # Concatenate under the lock: windows are views into live buffers
+            ts = np.concatenate([part[0] for part in parts])
+            values = np.concatenate([part[1] for part in parts])
+        if len(parts) > 1:
+            order = np.argsort(ts, kind="stable")
+            ts, values = ts[order], values[order]
+        if limit > 0 and len(ts) > limit:
+            ts, values = ts[-limit:], values[-limit:]
+        return ts, values
+
+    def latest(self, name: str, labels: Optional[Mapping[str, str]] = None) -> Optional[float]:
+        """Return the most recent value among series matching *labels*."""
+        best_ts: Optional[int] = None
+        best_value: Optional[float] = None
+        with self._lock:
+            for series in self._matching(name, labels):
+                size = len(series.raw)
+                if not size:
+                    continue
+                ts = int(series.raw.get(size - 1, "ts"))
+                if best_ts is None or ts >= best_ts:
+                    best_ts, best_value = ts, float(series.raw.get(size - 1, "value"))
+        return best_value
+
+    def rollup(
+        self,
+        name: str,
+        start: int,
+        end: int,
+        interval: Optional[int],
+        aggregation: str,
+        labels: Optional[Mapping[str, str]] = None,
+        limit: int = 0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Aggregate samples in ``[start, end]`` into buckets of *interval* microseconds.
+
+        Buckets are aligned to the epoch. When *interval* is ``None`` the
+        whole window forms a single bucket keyed by *start*. Returns bucket
+        start timestamps and aggregated values; when *limit* is positive only
+        the most recent *limit* buckets are kept.
+
+        Raises:
+            ValueError: If *aggregation* or *interval* is not supported.
+        """
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(f"Unsupported aggregation {aggregation!r}; expected one of {', '.join(AGGREGATIONS)}")
+        if interval is not None and interval <= 0:
+            raise ValueError("interval must be positive")
+
+        # Hold the lock while reducing: raw windows are views into live buffers
+        with self._lock:
+            matching = list(self._matching(name, labels))
+            if aggregation == "p95":
+                parts = [series.window(start, end) for series in matching]
+                return self._percentile(parts, start, interval, 0.95, limit)
+            rows = [self._stat_rows(series, start, end, interval) for series in matching]
+            return self._reduce(rows, start, interval, aggregation, limit)
+
+    def summarize(
+        self,
+        name: str,
+        start: int,
+        end: int,
+        labels: Optional[Mapping[str, str]] = None,
+    ) -> Optional[Dict[str, float]]:
+        """Return count, sum, min, max and last over ``[start, end]`` in one pass.
+
+        Returns ``None`` when no samples fall inside the window.
+        """
+        with self._lock:
+            parts = [self._stat_rows(series, start, end, None) for series in self._matching(name, labels)]
+            parts = [part for part in parts if len(part["bucket"])]
+            if not parts:
+                return None
+            rows = {column: np.concatenate([part[column] for part in parts]) for column in _TIER_COLUMNS}
+        return {
+            "count": int(rows["count"].sum()),
+            "sum": float(rows["sum"].sum()),
+            "min": float(rows["min"].min()),
+            "max": float(rows["max"].max()),
+            "last": float(rows["last"][int(np.argmax(rows["last_ts"]))]),
+        }
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+
+    def _matching(self, name: str, labels: Optional[Mapping[str, str]]):
+        for series in self._series.get(name, {}).values():
+            if series.matches(labels):
+                yield series
+
+    def _pick_tier(self, series: _Series, interval: Optional[int]) -> Optional[_Tier]:
+        """Return the coarsest tier whose buckets nest inside *interval* buckets."""
+        for tier in reversed(series.tiers):
+            if interval is None or (tier.width <= interval and interval % tier.width == 0):
+                return tier
+        return None
+
+    def _stat_rows(
+        self, series: _Series, start: int, end: int, interval: Optional[int]
+    ) -> Dict[str, np.ndarray]:
+        """Return mergeable stat rows covering ``[start, end]`` for one series.
+
+        Whole tier buckets inside the window are used as-is; raw samples in
+        the partial buckets at either edge become single-sample rows.
+        """
+        tier = self._pick_tier(series, interval)
+        if tier is None or not len(tier.rows):
+            ts, values = series.window(start, end)
+            return _sample_rows(ts, values)
+
+        width = tier.width
+        buckets = tier.rows.column("bucket")
+        first_full = max(-(-start // width) * width, int(buckets[0]))
+        end_full = (end + 1) // width * width
+        if first_full >= end_full:
+            ts, values = series.window(start, end)
+            return _sample_rows(ts, values)
+
+        lo = int(np.searchsorted(buckets, first_full, side="left"))
+        hi = int(np.searchsorted(buckets, end_full, side="left"))
+        head = _sample_rows(*series.window(start, first_full - 1))
+        tail = _sample_rows(*series.window(end_full, end))
+        middle = {column: tier.rows.column(column)[lo:hi] for column in _TIER_COLUMNS}
+        return {column: np.concatenate([head[column], middle[column], tail[column]]) for column in _TIER_COLUMNS}
+
+    @staticmethod
+    def _bucket_keys(stamps: np.ndarray, start: int, interval: Optional[int]) -> np.ndarray:
+        if interval is None:
+            return np.full(len(stamps), start, dtype=np.int64)
+        return stamps - stamps % interval
+
+    def _reduce(
+        self,
+        parts: List[Dict[str, np.ndarray]],
+        start: int,
+        interval: Optional[int],
+        aggregation: str,
+        limit: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        parts = [part for part in parts if len(part["bucket"])]
+        if not parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        rows = {column: np.concatenate([part[column] for part in parts]) for column in _TIER_COLUMNS}
+        keys = self._bucket_keys(rows["bucket"], start, interval)
+
+        # Order by bucket, then by time of the last sample so "last" is the group tail
+        order = np.lexsort((rows["last_ts"], keys))
+        keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        bucket_keys = keys[starts]
+
+        if aggregation == "count":
+            result = np.add.reduceat(rows["count"][order], starts).astype(np.float64)
+        elif aggregation == "sum":
+            result = np.add.reduceat(rows["sum"][order], starts)
+        elif aggregation == "avg":
+            result = np.add.reduceat(rows["sum"][order], starts) / np.add.reduceat(rows["count"][order], starts)
+        elif aggregation == "min":
+            result = np.minimum.reduceat(rows["min"][order], starts)
+        elif aggregation == "max":
+            result = np.maximum.reduceat(rows["max"][order], starts)
+        else:  # last
+            ends = np.r_[starts[1:], len(keys)] - 1
+            result = rows["last"][order][ends]
+
+        if limit > 0 and len(bucket_keys) > limit:
+            bucket_keys, result = bucket_keys[-limit:], result[-limit:]
+        return bucket_keys, result
+
+    def _percentile(
+        self,
+        parts: List[Tuple[np.ndarray, np.ndarray]],
+        start: int,
+        interval: Optional[int],
+        quantile: float,
+        limit: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact nearest-rank percentile per bucket over raw samples."""
+        parts = [part for part in parts if len(part[0])]
+        if not parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        stamps = np.concatenate([part[0] for part in parts])
+        values = np.concatenate([part[1] for part in parts])
+        keys = self._bucket_keys(stamps, start, interval)
+
+        order = np.lexsort((values, keys))
+        keys, values = keys[order], values[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        counts = np.diff(np.r_[starts, len(keys)])
+        ranks = np.ceil(quantile * counts).astype(np.int64) - 1
+        bucket_keys, result = keys[starts], values[starts + np.maximum(ranks, 0)]
+
+        if limit > 0 and len(bucket_keys) > limit:
+            bucket_keys, result = bucket_keys[-limit:], result[-limit:]
+        return bucket_keys, result
+
+
+def _sample_rows(ts: np.ndarray, values: np.ndarray) -> Dict[str, np.ndarray]:
+    """Express raw samples as single-sample stat rows."""
+    return {
+        "bucket": ts,
+        "count": np.ones(len(ts), dtype=np.int64),
+        "sum": values,
+        "min": values,
+        "max": values,
+        "last": values,
+        "last_ts": ts,
+    }
+
+
+__all__ = ["AGGREGATIONS", "DEFAULT_TIERS_US", "TimeSeriesStore"]
@@ -24,9 +24,14 @@ Usage Examples:
     # Versioned serialization for backward compatibility
     serialized = serialize_versioned(data, version="1.2")
     deserialized = deserialize_versioned(serialized)
+    
+    # Compact binary encoding (no envelope, no extra dependencies)
+    payload = encode_binary({"embedding": np.zeros(768, dtype=np.float32)})
+    restored = decode_binary(payload)
 """
 
 import base64
+import dataclasses
 import gzip
 import hashlib
 import io
@@ -34,14 +39,21 @@ import json
 import logging
 import os
 import pickle
+import struct
+import sys
 import zlib
+from array import array
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
 
-import msgpack
 import numpy as np
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
 from cryptography.fernet import Fernet
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
@@ -56,6 +68,7 @@ class SerializationFormat(Enum):
     JSON = "json"
     PICKLE = "pickle"
     MSGPACK = "msgpack"
+    BINARY = "binary"
     CUSTOM = "custom"
 
 
@@ -268,6 +281,116 @@ def _deserialize_datetime(data: dict[str, Any]) -> datetime:
     return datetime.fromisoformat(data["data"])
 
 
+class TypeRegistry:
+    """
+    Allow-list of enums, dataclasses and pydantic models for typed payloads.
+    
+    Classes are written as ``module.qualname`` unless registered under another
+    name. Decoding only instantiates classes that were registered explicitly;
+    any other name decodes to its plain value. A registry created with
+    ``allow_loaded_modules=True`` also resolves names to enum, dataclass or
+    model classes from already imported modules, which is only appropriate
+    for trusted payloads. Decoding never imports code.
+    """
+    
+    def __init__(self, allow_loaded_modules: bool = False):
+        """
+        Initialize the registry.
+        
+        Args:
+            allow_loaded_modules: Resolve unregistered names through ``sys.modules``
+        """
+        self.allow_loaded_modules = allow_loaded_modules
+        self._by_class: dict[type, str] = {}
+        self._by_name: dict[str, type] = {}
+        self._enums_by_short_name: dict[str, type] = {}
+    
+    def register(self, cls: type, name: Optional[str] = None) -> type:
+        """
+        Register a class under ``name`` (defaults to ``module.qualname``).
+        
+        Usable as a decorator. Returns the class unchanged.
+        """
+        name = name or f"{cls.__module__}.{cls.__qualname__}"
+        self._by_class[cls] = name
+        self._by_name[name] = cls
+        if isinstance(cls, type) and issubclass(cls, Enum):
+            self._enums_by_short_name.setdefault(cls.__name__, cls)
+        return cls
+    
+    def name_for(self, cls: type) -> str:
+        """Return the name ``cls`` is written under; encoding does not register it."""
+        name = self._by_class.get(cls)
+        if name is None:
+            name = f"{cls.__module__}.{cls.__qualname__}"
+            self._by_class[cls] = name
+        return name
+    
+    def resolve(self, name: str) -> Optional[type]:
+        """Return the class registered as ``name``, or None if it is not allowed."""
+        cls = self._by_name.get(name)
+        if cls is not None or not self.allow_loaded_modules:
+            return cls
+        
+        module_name, _, qualname = name.rpartition(".")
+        while module_name and module_name not in sys.modules:
+            module_name, _, head = module_name.rpartition(".")
+            qualname = f"{head}.{qualname}"
+        module = sys.modules.get(module_name)
+        if module is None:
+            return None
+        
+        candidate: Any = module
+        for part in qualname.split("."):
+            candidate = getattr(candidate, part, None)
+        if isinstance(candidate, type) and (
+            issubclass(candidate, Enum)
+            or dataclasses.is_dataclass(candidate)
+            or hasattr(candidate, "model_validate")
+        ):
+            self._by_name[name] = candidate
+            return candidate
+        return None
+    
+    def resolve_enum(self, short_name: str) -> Optional[type]:
+        """
+        Resolve an enum class by its ``__name__`` (the legacy JSON encoding).
+        
+        The index of all loaded enum classes is rebuilt only on a miss.
+        """
+        cls = self._enums_by_short_name.get(short_name)
+        if cls is not None:
+            return cls
+        
+        pending = list(Enum.__subclasses__())
+        while pending:
+            enum_class = pending.pop()
+            self._enums_by_short_name.setdefault(enum_class.__name__, enum_class)
+            pending.extend(enum_class.__subclasses__())
+        return self._enums_by_short_name.get(short_name)
+
+
+TYPE_REGISTRY = TypeRegistry()
+
+
+def register_type(cls: type, name: Optional[str] = None) -> type:
+    """
+    Register an enum, dataclass or pydantic model with the default registry.
+    
+    Binary payloads decode to a class only once it is registered. Registering
+    under an explicit name keeps payloads decodable after the class is moved
+    or renamed.
+    
+    Args:
+        cls: Class to register
+        name: Stable name to use in payloads
+        
+    Returns:
+        The class, so this can be used as a decorator
+    """
+    return TYPE_REGISTRY.register(cls, name)
+
+
 class NCAJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder for NCA-specific types."""
     
@@ -314,11 +437,9 @@ def _json_object_hook(data: dict[str, Any]) -> Any:
     elif "__datetime__" in data:
         return _deserialize_datetime(data)
     elif "__enum__" in data:
-        # This is a simplified approach; in production, you'd need a registry
-        # of enum classes or a more sophisticated mechanism
-        for enum_class in Enum.__subclasses__():
-            if enum_class.__name__ == data["name"]:
-                return enum_class(data["value"])
+        enum_class = TYPE_REGISTRY.resolve_enum(data["name"])
+        if enum_class is not None:
+            return enum_class(data["value"])
         logger.warning(f"Could not find enum class {data['name']}")
         return data
     elif "__set__" in data:
@@ -331,6 +452,385 @@ def _json_object_hook(data: dict[str, Any]) -> Any:
     return data
 
 
+# ---------------------------------------------------------------------------
+# Binary codec
+# ---------------------------------------------------------------------------
+#
+# Payloads start with BINARY_MAGIC followed by one encoded value. Every value
+# is a one-byte tag followed by a fixed-size or length-prefixed body (all
+# integers little-endian), in the spirit of MessagePack:
+#
+#   N / T / F           None, True, False
+#   i <int64>           integer; I <u32 len><signed bytes> for larger ints
+#   d <float64>         float
+#   s <u32 len><utf-8>  str            b <u32 len><bytes>  bytes
+#   l / t / S / Z <u32 count><values>  list, tuple, set, frozenset
+#   m <u32 count><key><value>...       dict
+#   v <u32 count><float64...>          list made only of floats
+#   A <u8 len><dtype><u8 ndim><u64 dims...><u64 nbytes><raw buffer>
+#   g <u8 len><dtype><raw bytes>       NumPy scalar
+#   D <u32 len><isoformat>             datetime     P <u32 len><path>  Path
+#   E <name><value>                    enum member by registered name
+#   C <name><u32 count><field><value>... dataclass by registered name
+#   M <name><dict>                     pydantic model by registered name
+#
+# Arrays are written straight from their buffer (C order) and decoded as
+# views over the input, so embeddings are never base64'd or re-parsed.
+# Structured dtypes are rejected rather than flattened to raw void bytes.
+
+BINARY_MAGIC = b"NCB\x01"
+
+_U8 = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_INT64_MIN, _INT64_MAX = -(2 ** 63), 2 ** 63 - 1
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _pack_text(out: bytearray, text: str) -> None:
+    raw = text.encode("utf-8")
+    out += _U32.pack(len(raw))
+    out += raw
+
+
+def _pack_dtype(out: bytearray, dtype: np.dtype) -> None:
+    # dtype.str of a structured or subarray dtype is a bare void ("|V16"), which
+    # would silently drop the field names and layout on decode
+    if dtype.fields is not None or dtype.subdtype is not None:
+        raise SerializationError(f"Structured dtype {dtype} cannot be encoded")
+    descriptor = dtype.str.encode("ascii")
+    out += _U8.pack(len(descriptor))
+    out += descriptor
+
+
+def _pack_value(out: bytearray, obj: Any, registry: TypeRegistry) -> None:
+    """Append the binary encoding of ``obj`` to ``out``."""
+    kind = type(obj)
+    
+    if kind is str:
+        out += b"s"
+        _pack_text(out, obj)
+    elif kind is float:
+        out += b"d"
+        out += _F64.pack(obj)
+    elif kind is int:
+        if _INT64_MIN <= obj <= _INT64_MAX:
+            out += b"i"
+            out += _I64.pack(obj)
+        else:
+            raw = obj.to_bytes((obj.bit_length() + 8) // 8, "little", signed=True)
+            out += b"I"
+            out += _U32.pack(len(raw))
+            out += raw
+    elif obj is None:
+        out += b"N"
+    elif kind is bool:
+        out += b"T" if obj else b"F"
+    elif kind is dict:
+        out += b"m"
+        out += _U32.pack(len(obj))
+        for key, value in obj.items():
+            _pack_value(out, key, registry)
+            _pack_value(out, value, registry)
+    elif kind is list:
+        if obj and all(type(item) is float for item in obj):
+            values = array("d", obj)
+            if not _LITTLE_ENDIAN:
+                values.byteswap()
+            out += b"v"
+            out += _U32.pack(len(obj))
+            out += values.tobytes()
+        else:
+            out += b"l"
+            out += _U32.pack(len(obj))
+            for item in obj:
+                _pack_value(out, item, registry)
+    elif isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            raise SerializationError("Arrays of Python objects cannot be encoded")
+        out += b"A"
+        _pack_dtype(out, obj.dtype)
+        out += _U8.pack(obj.ndim)
+        for dim in obj.shape:
+            out += _U64.pack(dim)
+        out += _U64.pack(obj.nbytes)
+        # A uint8 view exposes the buffer for every dtype; memoryview.cast
+        # rejects the buffer formats of datetime64, timedelta64 and str arrays
+        out += np.ascontiguousarray(obj).reshape(-1).view(np.uint8).data if obj.size else b""
+    elif isinstance(obj, np.generic):
+        if obj.dtype.hasobject:
+            raise SerializationError("NumPy object scalars cannot be encoded")
+        out += b"g"
+        _pack_dtype(out, obj.dtype)
+        out += obj.tobytes()
+    elif isinstance(obj, Enum):
+        out += b"E"
+        _pack_text(out, registry.name_for(kind))
+        _pack_value(out, obj.value, registry)
+    elif isinstance(obj, (tuple, set, frozenset)):
+        if isinstance(obj, tuple):
+            out += b"t"
+        else:
+            out += b"Z" if isinstance(obj, frozenset) else b"S"
+        out += _U32.pack(len(obj))
+        for item in obj:
+            _pack_value(out, item, registry)
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        raw = memoryview(obj).cast("B")
+        out += b"b"
+        out += _U32.pack(raw.nbytes)
+        out += raw
+    elif isinstance(obj, datetime):
+        out += b"D"
+        _pack_text(out, obj.isoformat())
+    elif isinstance(obj, Path):
+        out += b"P"
+        _pack_text(out, str(obj))
+    elif isinstance(obj, (bool, int, float, str, dict, list)):
+        # Subclasses of builtin types are encoded as their base type
+        for base in (bool, int, float, str, dict, list):
+            if isinstance(obj, base):
+                _pack_value(out, base(obj), registry)
+                break
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        fields = dataclasses.fields(obj)
+        out += b"C"
+        _pack_text(out, registry.name_for(kind))
+        out += _U32.pack(len(fields))
+        for field in fields:
+            _pack_value(out, field.name, registry)
+            _pack_value(out, getattr(obj, field.name), registry)
+    elif hasattr(obj, "model_dump") and hasattr(kind, "model_validate"):
+        out += b"M"
+        _pack_text(out, registry.name_for(kind))
+        _pack_value(out, obj.model_dump(), registry)
+    elif hasattr(obj, "__serialize__") and callable(obj.__serialize__):
+        _pack_value(out, obj.__serialize__(), registry)
+    else:
+        raise SerializationError(f"Object of type {kind.__name__} cannot be encoded")
+
+
+class _BinaryReader:
+    """Cursor over an encoded payload."""
+    
+    def __init__(self, data: memoryview, registry: TypeRegistry, copy_arrays: bool):
+        self.data = data
+        self.offset = 0
+        self.registry = registry
+        self.copy_arrays = copy_arrays
+    
+    def take(self, size: int) -> memoryview:
+        start = self.offset
+        end = start + size
+        if end > len(self.data):
+            raise DeserializationError("Truncated binary payload")
+        self.offset = end
+        return self.data[start:end]
+    
+    def unpack(self, layout: struct.Struct) -> Any:
+        value = layout.unpack_from(self.data, self.offset)[0]
+        self.offset += layout.size
+        return value
+    
+    def text(self) -> str:
+        return str(self.take(self.unpack(_U32)), "utf-8")
+    
+    def dtype(self) -> np.dtype:
+        dtype = np.dtype(str(self.take(self.unpack(_U8)), "ascii"))
+        if dtype.hasobject:
+            raise DeserializationError("Object dtypes are not allowed in binary payloads")
+        return dtype
+    
+    def value(self) -> Any:
+        tag = self.data[self.offset]
+        self.offset += 1
+        reader = _BINARY_READERS.get(tag)
+        if reader is None:
+            raise DeserializationError(f"Unknown binary tag {chr(tag)!r} at offset {self.offset - 1}")
+        return reader(self)
+    
+    def items(self) -> list[Any]:
+        return [self.value() for _ in range(self.unpack(_U32))]
+
+
+def _read_float_list(reader: _BinaryReader) -> list[float]:
+    count = reader.unpack(_U32)
+    values = array("d")
+    values.frombytes(reader.take(count * 8))
+    if not _LITTLE_ENDIAN:
+        values.byteswap()
+    return values.tolist()
+
+
+def _read_array(reader: _BinaryReader) -> np.ndarray:
+    dtype = reader.dtype()
+    shape = tuple(reader.unpack(_U64) for _ in range(reader.unpack(_U8)))
+    nbytes = reader.unpack(_U64)
+    if nbytes != int(np.prod(shape, dtype=np.int64)) * dtype.itemsize:
+        raise DeserializationError("Array size does not match its shape")
+    result = np.frombuffer(reader.take(nbytes), dtype=dtype).reshape(shape)
+    return result.copy() if reader.copy_arrays else result
+
+
+def _read_scalar(reader: _BinaryReader) -> np.generic:
+    dtype = reader.dtype()
+    return np.frombuffer(reader.take(dtype.itemsize), dtype=dtype)[0]
+
+
+def _read_dict(reader: _BinaryReader) -> dict[Any, Any]:
+    count = reader.unpack(_U32)
+    value = reader.value
+    return {value(): value() for _ in range(count)}
+
+
+def _read_enum(reader: _BinaryReader) -> Any:
+    name = reader.text()
+    value = reader.value()
+    enum_class = reader.registry.resolve(name)
+    if enum_class is None:
+        logger.warning(f"Could not find enum class {name}")
+        return value
+    return enum_class(value)
+
+
+def _read_dataclass(reader: _BinaryReader) -> Any:
+    name = reader.text()
+    count = reader.unpack(_U32)
+    fields = {reader.value(): reader.value() for _ in range(count)}
+    cls = reader.registry.resolve(name)
+    if cls is None or not dataclasses.is_dataclass(cls):
+        logger.warning(f"Could not find dataclass {name}")
+        return fields
+    declared = {field.name: field for field in dataclasses.fields(cls)}
+    instance = cls(**{key: value for key, value in fields.items() if key in declared and declared[key].init})
+    # Non-init fields are restored through normal assignment, so frozen
+    # dataclasses keep the values their own __init__/__post_init__ set
+    if not cls.__dataclass_params__.frozen:
+        for key, value in fields.items():
+            if key in declared and not declared[key].init:
+                setattr(instance, key, value)
+    return instance
+
+
+def _read_model(reader: _BinaryReader) -> Any:
+    name = reader.text()
+    payload = reader.value()
+    cls = reader.registry.resolve(name)
+    if cls is None or not hasattr(cls, "model_validate"):
+        logger.warning(f"Could not find model class {name}")
+        return payload
+    return cls.model_validate(payload)
+
+
+_BINARY_READERS: dict[int, Callable[[_BinaryReader], Any]] = {
+    ord("N"): lambda reader: None,
+    ord("T"): lambda reader: True,
+    ord("F"): lambda reader: False,
+    ord("i"): lambda reader: reader.unpack(_I64),
+    ord("I"): lambda reader: int.from_bytes(reader.take(reader.unpack(_U32)), "little", signed=True),
+    ord("d"): lambda reader: reader.unpack(_F64),
+    ord("s"): lambda reader: reader.text(),
+    ord("b"): lambda reader: bytes(reader.take(reader.unpack(_U32))),
+    ord("l"): lambda reader: reader.items(),
+    ord("t"): lambda reader: tuple(reader.items()),
+    ord("S"): lambda reader: set(reader.items()),
+    ord("Z"): lambda reader: frozenset(reader.items()),
+    ord("m"): _read_dict,
+    ord("v"): _read_float_list,
+    ord("A"): _read_array,
+    ord("g"): _read_scalar,
+    ord("D"): lambda reader: datetime.fromisoformat(reader.text()),
+    ord("P"): lambda reader: Path(reader.text()),
+    ord("E"): _read_enum,
+    ord("C"): _read_dataclass,
+    ord("M"): _read_model,
+}
+
+
+def encode_binary(obj: Any, registry: Optional[TypeRegistry] = None) -> bytes:
+    """
+    Encode an object with the compact binary codec.
+    
+    Supports None, bool, int, float, str, bytes, list, tuple, set, frozenset,
+    dict, datetime, Path, NumPy arrays and scalars, enums, dataclasses and
+    pydantic models. Objects exposing ``__serialize__`` are encoded as the
+    value it returns. Arrays are written as a dtype/shape header followed by
+    their raw buffer.
+    
+    Args:
+        obj: Object to encode
+        registry: Type registry used to name enums, dataclasses and models
+        
+    Returns:
+        Encoded bytes, starting with ``BINARY_MAGIC``
+        
+    Raises:
+        SerializationError: If the object contains an unsupported type
+    """
+    out = bytearray(BINARY_MAGIC)
+    _pack_value(out, obj, registry or TYPE_REGISTRY)
+    return bytes(out)
+
+
+def decode_binary(
+    data: Union[bytes, bytearray, memoryview],
+    registry: Optional[TypeRegistry] = None,
+    copy_arrays: bool = False,
+) -> Any:
+    """
+    Decode bytes produced by ``encode_binary``.
+    
+    No code is imported while decoding: enums, dataclasses and models
+    resolve only to classes registered with ``registry`` (or, if it allows
+    it, classes from modules that are already loaded) and fall back to their
+    plain values otherwise.
+    
+    Args:
+        data: Encoded bytes
+        registry: Type registry used to resolve enums, dataclasses and models
+        copy_arrays: If False, arrays are read-only views over ``data``;
+            if True, each array gets its own writable buffer
+        
+    Returns:
+        Decoded object
+        
+    Raises:
+        DeserializationError: If the payload is malformed
+    """
+    view = memoryview(data).cast("B")
+    if view[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+        raise DeserializationError("Not a binary payload: missing header")
+    reader = _BinaryReader(view, registry or TYPE_REGISTRY, copy_arrays)
+    reader.offset = len(BINARY_MAGIC)
+    try:
+        result = reader.value()
+    except (DeserializationError, SecurityError):
+        raise
+    except (struct.error, IndexError, ValueError, TypeError, RecursionError) as e:
+        raise DeserializationError(f"Malformed binary payload: {str(e)}") from e
+    if reader.offset != len(view):
+        raise DeserializationError("Unexpected trailing data after binary payload")
+    return result
+
+
+def _pack_envelope(package: dict[str, Any]) -> bytes:
+    """Pack the metadata envelope, with msgpack when it is installed."""
+    if msgpack is None:
+        return encode_binary(package)
+    return msgpack.packb(package)
+
+
+def _unpack_envelope(data: bytes) -> dict[str, Any]:
+    """Unpack an envelope written by ``_pack_envelope``."""
+    if bytes(data[:len(BINARY_MAGIC)]) == BINARY_MAGIC:
+        return decode_binary(data)
+    if msgpack is None:
+        raise UnsupportedFormatError("msgpack is required to read this payload")
+    return msgpack.unpackb(data)
+
+
 def serialize(
     obj: Any,
     format: Union[str, SerializationFormat] = SerializationFormat.JSON,
@@ -376,7 +876,11 @@ def serialize(
         elif format == SerializationFormat.PICKLE:
             serialized = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL, **kwargs)
         elif format == SerializationFormat.MSGPACK:
+            if msgpack is None:
+                raise UnsupportedFormatError("msgpack is not installed")
             serialized = msgpack.packb(obj, use_bin_type=True, **kwargs)
+        elif format == SerializationFormat.BINARY:
+            serialized = encode_binary(obj, **kwargs)
         elif format == SerializationFormat.CUSTOM:
             if not hasattr(obj, "__serialize__") or not callable(obj.__serialize__):
                 raise SerializationError("Object does not support custom serialization")
@@ -400,12 +904,12 @@ def serialize(
         
         if encrypt:
             encrypted_package = _encrypt_data(serialized, password)
-            serialized = msgpack.packb({
+            serialized = _pack_envelope({
                 "metadata": metadata,
                 "encrypted_data": encrypted_package
             })
         else:
-            serialized = msgpack.packb({
+            serialized = _pack_envelope({
                 "metadata": metadata,
                 "data": serialized
             })
@@ -441,7 +945,7 @@ def deserialize(
     """
     try:
         # Unpack the serialized data
-        package = msgpack.unpackb(data)
+        package = _unpack_envelope(data)
         metadata = package.get("metadata", {})
         
         format_name = metadata.get("format", "json")
@@ -460,18 +964,18 @@ def deserialize(
         else:
             serialized = package.get("data", b"")
         
-        # Verify checksum
-        if "checksum" in metadata:
-            calculated_checksum = hashlib.sha256(serialized).hexdigest()
-            if calculated_checksum != metadata["checksum"]:
-                raise SecurityError("Data integrity check failed: checksum mismatch")
-        
         # Handle compression
         if metadata.get("compressed", False):
             compression_method_name = metadata.get("compression_method", "gzip")
             compression_method = CompressionMethod(compression_method_name)
             serialized = _decompress_data(serialized, compression_method)
         
+        # Verify checksum (computed over the uncompressed payload)
+        if "checksum" in metadata:
+            calculated_checksum = hashlib.sha256(serialized).hexdigest()
+            if calculated_checksum != metadata["checksum"]:
+                raise SecurityError("Data integrity check failed: checksum mismatch")
+        
         # Deserialize based on format
         if format == SerializationFormat.JSON:
             result = json.loads(serialized.decode('utf-8'), object_hook=_json_object_hook, **kwargs)
@@ -480,7 +984,11 @@ def deserialize(
                 raise SecurityError("Pickle deserialization not allowed in safe mode")
             result = pickle.loads(serialized, **kwargs)
         elif format == SerializationFormat.MSGPACK:
+            if msgpack is None:
+                raise UnsupportedFormatError("msgpack is not installed")
             result = msgpack.unpackb(serialized, raw=False, **kwargs)
+        elif format == SerializationFormat.BINARY:
+            result = decode_binary(serialized, **kwargs)
         elif format == SerializationFormat.CUSTOM:
             # Custom deserialization would typically require a registry of deserializers
             # This is a simplified approach
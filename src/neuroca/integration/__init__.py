@@ -52,6 +52,7 @@ SUPPORTED_PROVIDERS = ["openai", "anthropic", "cohere", "huggingface", "local"]
 
 # Import all provider modules dynamically
 _provider_modules = {}
+_providers_imported = False
 
 def _import_providers():
     """
@@ -88,13 +89,9 @@ try:
         ProviderNotFoundError,
         RateLimitError,
     )
-    from .manager import LLMIntegrationManager
     from .models import LLMError, LLMProvider, LLMRequest, LLMResponse, ProviderConfig, TokenUsage
     from .utils import count_tokens, create_embedding, format_prompt, parse_response, sanitize_input
     
-    # Initialize provider modules
-    _import_providers()
-    
     # Export public API
     __all__ = [
         # Main classes
@@ -136,6 +133,20 @@ except ImportError as e:
     __all__ = []
 
 # Provide version information
+def __getattr__(name: str) -> Any:
+    """
+    Import the integration manager on first access.
+    
+    The manager pulls in prompt templates, context management and cognitive
+    control, so it is only loaded when it is used.
+    """
+    if name == "LLMIntegrationManager":
+        from .manager import LLMIntegrationManager
+        
+        globals()[name] = LLMIntegrationManager
+        return LLMIntegrationManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def get_version() -> str:
     """
     Returns the current version of the integration module.
@@ -172,6 +183,11 @@ def get_provider_info(provider_name: str) -> dict[str, Any]:
         from .exceptions import ProviderNotFoundError
         raise ProviderNotFoundError(f"Provider '{provider_name}' is not supported")
     
+    global _providers_imported
+    if not _providers_imported:
+        _providers_imported = True
+        _import_providers()
+    
     if provider_name in _provider_modules:
         provider_module = _provider_modules[provider_name]
         if hasattr(provider_module, "get_provider_info"):
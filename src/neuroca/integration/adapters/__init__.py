@@ -24,40 +24,39 @@ Usage:
     # AdapterRegistry.register_adapter_class("my_custom_llm", MyCustomAdapter)
 """
 
+import importlib
 import logging
 from enum import Enum
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
-# --- Import concrete adapter implementations ---
-# Attempt to import adapters, handle potential ImportError if dependencies aren't installed
-try:
-    from .openai import OpenAIAdapter
-except ImportError:
-    OpenAIAdapter = None
-    logger.debug("OpenAI adapter not available (openai package likely not installed)")
-
-try:
-    from .anthropic import AnthropicAdapter
-except ImportError:
-    AnthropicAdapter = None
-    logger.debug("Anthropic adapter not available (anthropic package likely not installed)")
+# --- Concrete adapter implementations ---
+# Provider adapters are imported on first access (attribute lookup or
+# AdapterRegistry.get_adapter_class) so that importing this package does not
+# load every provider SDK. class name -> (registry name, module, missing dependency)
+_PROVIDER_ADAPTERS = {
+    "OpenAIAdapter": ("openai", ".openai", "openai package likely not installed"),
+    "AnthropicAdapter": ("anthropic", ".anthropic", "anthropic package likely not installed"),
+    "VertexAIAdapter": ("vertexai", ".vertexai", "google-cloud-aiplatform package likely not installed"),
+    "OllamaAdapter": ("ollama", ".ollama", "aiohttp package likely not installed"),
+}
+
+
+def __getattr__(name: str):
+    """Import a provider adapter on first access; None if it is unavailable."""
+    if name not in _PROVIDER_ADAPTERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    provider, module, missing = _PROVIDER_ADAPTERS[name]
+    try:
+        adapter_cls = getattr(importlib.import_module(module, __name__), name)
+    except ImportError:
+        adapter_cls = None
+        logger.debug(f"{provider} adapter not available ({missing})")
+    globals()[name] = adapter_cls
+    return adapter_cls
 
-try:
-    from .vertexai import VertexAIAdapter
-except ImportError:
-    VertexAIAdapter = None
-    logger.debug("VertexAI adapter not available (google-cloud-aiplatform package likely not installed)")
-
-try:
-    from .ollama import OllamaAdapter
-except ImportError:
-    OllamaAdapter = None
-    logger.debug("Ollama adapter not available (aiohttp package likely not installed)")
 
-# --- Import Base Class, Registry, and Core Exceptions/Enums from base.py ---
-# This centralizes the core definitions.
 try:
     from .base import (
         AdapterConfigurationError,
@@ -125,17 +124,12 @@ except ImportError as exc:
 
         GENERIC = "generic"
 
-# --- Automatically register available built-in adapters ---
-# Ensure AdapterRegistry was imported successfully before trying to use it
-if 'AdapterRegistry' in globals():
-    if OpenAIAdapter:
-        AdapterRegistry.register("openai")(OpenAIAdapter)
-    if AnthropicAdapter:
-        AdapterRegistry.register("anthropic")(AnthropicAdapter)
-    if VertexAIAdapter:
-        AdapterRegistry.register("vertexai")(VertexAIAdapter)
-    if OllamaAdapter:
-        AdapterRegistry.register("ollama")(OllamaAdapter)
+# --- Automatically register built-in adapters ---
+# Ensure AdapterRegistry was imported successfully before trying to use it;
+# each adapter is imported when it is first looked up
+if hasattr(AdapterRegistry, "register_lazy"):
+    for _class_name, (_provider, _module, _missing) in _PROVIDER_ADAPTERS.items():
+        AdapterRegistry.register_lazy(_provider, f"{__name__}{_module}", _class_name)
 else:
     logger.error("AdapterRegistry not available for automatic registration.")
 
@@ -149,15 +143,8 @@ __all__ = [
     "AdapterConfigurationError",
     "LLMResponse",
     "ResponseType",
-    # Export available adapter classes if they were imported successfully
 ]
 
-# Dynamically add imported adapters to __all__
-if OpenAIAdapter:
-    __all__.append("OpenAIAdapter")
-if AnthropicAdapter:
-    __all__.append("AnthropicAdapter")
-if VertexAIAdapter:
-    __all__.append("VertexAIAdapter")
-if OllamaAdapter:
-    __all__.append("OllamaAdapter")
+# Provider adapters are listed without importing them; each resolves to None
+# when its dependency is missing
+__all__ += list(_PROVIDER_ADAPTERS)
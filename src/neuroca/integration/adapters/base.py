@@ -35,11 +35,14 @@ Example:
 
 import abc
 import asyncio
+import copy
 import dataclasses
+import importlib
 import logging
 import typing
 from typing import Any, ClassVar, Optional, Union
 from ..models import LLMRequest, LLMResponse
+from .pooling import ResponseCache, SingleFlight, request_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -125,6 +128,14 @@ class AdapterConfig:
         frequency_penalty (float): Frequency penalty for token generation
         stop_sequences (Optional[List[str]]): Sequences that stop generation
         extra_params (Dict[str, Any]): Additional model-specific parameters
+        coalesce_requests (bool): Share one upstream call between identical
+            concurrent requests
+        response_cache_size (int): Maximum cached responses (0 disables caching)
+        response_cache_ttl (float): Seconds a cached response stays valid
+        cache_nondeterministic (bool): Also cache requests sampled with a
+            non-zero temperature
+        pool_max_connections (int): Maximum pooled HTTP connections (0 for no limit)
+        pool_keepalive_timeout (float): Seconds idle pooled connections stay open
     """
     model_name: str
     api_key: Optional[str] = None
@@ -140,6 +151,12 @@ class AdapterConfig:
     frequency_penalty: float = 0.0
     stop_sequences: Optional[list[str]] = None
     extra_params: dict[str, Any] = dataclasses.field(default_factory=dict)
+    coalesce_requests: bool = True
+    response_cache_size: int = 0
+    response_cache_ttl: float = 300.0
+    cache_nondeterministic: bool = False
+    pool_max_connections: int = 100
+    pool_keepalive_timeout: float = 30.0
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -161,6 +178,15 @@ class AdapterConfig:
         if self.retry_delay < 0:
             raise ConfigurationError("retry_delay cannot be negative")
 
+        if self.response_cache_size < 0:
+            raise ConfigurationError("response_cache_size cannot be negative")
+
+        if self.response_cache_ttl <= 0:
+            raise ConfigurationError("response_cache_ttl must be positive")
+
+        if self.pool_max_connections < 0:
+            raise ConfigurationError("pool_max_connections cannot be negative")
+
     def to_dict(self) -> dict[str, Any]:
         """Convert configuration to dictionary, excluding sensitive information."""
         config_dict = dataclasses.asdict(self)
@@ -344,6 +370,93 @@ class BaseAdapter(abc.ABC):
         self.logger.error(f"Operation failed after {max_retries} retries: {str(last_error)}")
         raise last_error
 
+    def _request_dedup(self) -> tuple[Optional[SingleFlight], Optional[ResponseCache]]:
+        """Return the single-flight group and response cache, creating them on first use."""
+        state = self.__dict__.get("_dedup_state")
+        if state is None:
+            config = getattr(self, "config", None)
+            flights = SingleFlight() if getattr(config, "coalesce_requests", True) else None
+            cache = None
+            cache_size = getattr(config, "response_cache_size", 0)
+            if isinstance(cache_size, int) and cache_size > 0:
+                cache = ResponseCache(cache_size, getattr(config, "response_cache_ttl", 300.0))
+            state = self.__dict__["_dedup_state"] = (flights, cache)
+        return state
+
+    def is_cacheable(self, params: dict[str, Any]) -> bool:
+        """
+        Decide whether a response for ``params`` may be served from the cache.
+
+        Only greedy (temperature 0) requests are cached unless
+        ``cache_nondeterministic`` is enabled, since sampled responses are
+        expected to vary between calls.
+        """
+        config = getattr(self, "config", None)
+        if getattr(config, "cache_nondeterministic", False):
+            return True
+        return params.get("temperature") == 0
+
+    async def _run_deduplicated(
+        self,
+        key: str,
+        operation: typing.Callable[[], typing.Awaitable[Any]],
+        *,
+        cacheable: bool = False,
+    ) -> Any:
+        """
+        Execute an upstream call through the response cache and single-flight group.
+
+        Identical requests already in flight share one call; cacheable responses
+        are stored and served until they expire. Every caller receives its own
+        shallow copy with a private ``metadata`` dict, so callers can annotate
+        responses without affecting each other or the cache.
+
+        Args:
+            key: Request key, usually from ``request_fingerprint``
+            operation: Async callable performing the upstream call
+            cacheable: Whether the response may be cached
+
+        Returns:
+            A copy of the (possibly shared or cached) response
+        """
+        flights, cache = self._request_dedup()
+        if cacheable and cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                response = self._copy_response(cached)
+                if isinstance(getattr(response, "metadata", None), dict):
+                    response.metadata["cache_hit"] = True
+                return response
+
+        async def _call() -> Any:
+            result = await operation()
+            if cacheable and cache is not None:
+                cache.put(key, result)
+            return result
+
+        result = await flights.run(key, _call) if flights is not None else await _call()
+        return self._copy_response(result)
+
+    @staticmethod
+    def _copy_response(response: Any) -> Any:
+        """Return a shallow copy of ``response`` with its own metadata dict."""
+        if isinstance(response, dict):
+            return dict(response)
+        duplicate = copy.copy(response)
+        if isinstance(getattr(duplicate, "metadata", None), dict):
+            duplicate.metadata = dict(duplicate.metadata)
+        return duplicate
+
+    def request_stats(self) -> dict[str, Any]:
+        """Return request coalescing and response cache counters."""
+        flights, cache = self._request_dedup()
+        return {
+            "upstream_calls": flights.executed if flights is not None else None,
+            "coalesced_calls": flights.shared if flights is not None else 0,
+            "inflight": flights.inflight if flights is not None else 0,
+            "cache": cache.stats() if cache is not None else None,
+        }
+
     def get_merged_params(self, **kwargs) -> dict[str, Any]:
         """
         Merge configuration with provided parameters.
@@ -402,7 +515,14 @@ class BaseAdapter(abc.ABC):
         if request.additional_params:
             params.update(request.additional_params)
 
-        resp = await self.generate(request.prompt, **params)
+        key = request_fingerprint(
+            getattr(self, "name", "unknown"), request.model, {"prompt": request.prompt, **params}
+        )
+        resp = await self._run_deduplicated(
+            key,
+            lambda: self.generate(request.prompt, **params),
+            cacheable=self.is_cacheable(params),
+        )
 
         if isinstance(resp, LLMResponse):
             if resp.request is None:
@@ -459,6 +579,33 @@ class AdapterRegistry:
     allowing them to be registered, discovered, and instantiated by name.
     """
     _adapters: dict[str, type[BaseAdapter]] = {}
+    # Adapters imported on first lookup: name -> (module, class name)
+    _lazy_adapters: dict[str, tuple[str, str]] = {}
+    
+    @classmethod
+    def register_lazy(cls, name: str, module: str, class_name: str) -> None:
+        """
+        Register an adapter that is imported the first time it is looked up.
+        
+        Args:
+            name: Name of the adapter
+            module: Absolute name of the module defining the adapter
+            class_name: Name of the adapter class in that module
+        """
+        cls._lazy_adapters[name] = (module, class_name)
+    
+    @classmethod
+    def _load_lazy(cls, name: str) -> None:
+        """Import a lazily registered adapter, dropping it if it is unavailable."""
+        module, class_name = cls._lazy_adapters.pop(name)
+        if name in cls._adapters:
+            return
+        try:
+            adapter_cls = getattr(importlib.import_module(module), class_name)
+        except ImportError as e:
+            logger.debug(f"Adapter '{name}' not available: {e}")
+            return
+        cls.register(name)(adapter_cls)
     
     @classmethod
     def register(cls, name: Optional[str] = None):
@@ -507,6 +654,8 @@ class AdapterRegistry:
         Raises:
             AdapterNotFoundError: If no adapter with the given name is registered
         """
+        if name not in cls._adapters and name in cls._lazy_adapters:
+            cls._load_lazy(name)
         if name not in cls._adapters:
             raise AdapterNotFoundError(f"No adapter registered with name '{name}'")
         return cls._adapters[name]
@@ -534,9 +683,14 @@ class AdapterRegistry:
         """
         List all registered adapter names.
         
+        Lazily registered adapters are imported so that only available
+        adapters are listed.
+        
         Returns:
             List of registered adapter names
         """
+        for name in list(cls._lazy_adapters):
+            cls._load_lazy(name)
         return list(cls._adapters.keys())
     
     @classmethod
@@ -550,6 +704,10 @@ class AdapterRegistry:
         Raises:
             AdapterNotFoundError: If no adapter with the given name is registered
         """
+        if name in cls._lazy_adapters and name not in cls._adapters:
+            del cls._lazy_adapters[name]
+            logger.debug(f"Unregistered adapter '{name}'")
+            return
         if name not in cls._adapters:
             raise AdapterNotFoundError(f"No adapter registered with name '{name}'")
         del cls._adapters[name]
@@ -48,6 +48,7 @@ except Exception:  # pragma: no cover - allow tests without aiohttp installed
 
 from ..models import LLMRequest, LLMResponse, ResponseType, TokenUsage
 from .base import AdapterError, BaseAdapter, ConfigurationError, AdapterConfig  # Import AdapterConfig
+from .pooling import KeepAliveSessionPool, request_fingerprint
 
 # NOTE: ModelCapability was removed from the import above as it's not defined in base.py.
 # The capabilities property below might need adjustment if ModelCapability is defined elsewhere.
@@ -72,8 +73,10 @@ class OllamaAdapter(BaseAdapter): # Corrected inheritance
     def __init__(self, config: Union[dict[str, Any], AdapterConfig]):
         """
         Initialize the Ollama adapter. Supports either a raw dict config or AdapterConfig.
+
+        The HTTP session is opened lazily on the first request, so the adapter
+        can be constructed outside of an event loop.
         """
-        self._session = None
         self._available_models = set()
 
         if isinstance(config, AdapterConfig):
@@ -99,6 +102,15 @@ class OllamaAdapter(BaseAdapter): # Corrected inheritance
             self._max_retries = int(config.get("max_retries", 3))
             self._config = config
 
+            pooling_params = {
+                key: config[key]
+                for key in (
+                    "coalesce_requests", "response_cache_size", "response_cache_ttl",
+                    "cache_nondeterministic", "pool_max_connections", "pool_keepalive_timeout",
+                )
+                if key in config
+            }
+
             # Build AdapterConfig for BaseAdapter
             adapter_cfg = AdapterConfig(
                 model_name=self._default_model,
@@ -115,20 +127,26 @@ class OllamaAdapter(BaseAdapter): # Corrected inheritance
                 stop_sequences=config.get("stop_sequences"),
                 extra_params={k: v for k, v in config.items() if k not in {
                     "base_url","default_model","request_timeout","max_retries","retry_delay",
-                    "temperature","max_tokens","top_p","top_k","presence_penalty","frequency_penalty","stop_sequences"
+                    "temperature","max_tokens","top_p","top_k","presence_penalty","frequency_penalty","stop_sequences",
+                    *pooling_params,
                 }},
+                **pooling_params,
             )
             super().__init__(adapter_cfg)
 
-        # Initialize HTTP session
-        self._initialize_session()
+        # Keep-alive HTTP session shared by every request from this adapter
+        self._http = KeepAliveSessionPool(
+            timeout=self._request_timeout,
+            max_connections=self.config.pool_max_connections,
+            keepalive_timeout=self.config.pool_keepalive_timeout,
+            http=aiohttp,
+        )
         logger.info(f"Initialized Ollama adapter with base URL: {self._base_url}")
 
-    def _initialize_session(self):
-        """Initialize the HTTP session for API requests."""
-        self._session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self._request_timeout)
-        )
+    @property
+    def _session(self):
+        """The pooled HTTP session, or None before the first request."""
+        return self._http.session
     
     @property
     def capabilities(self) -> set[str]: # Changed return type hint as ModelCapability is undefined
@@ -142,8 +160,8 @@ class OllamaAdapter(BaseAdapter): # Corrected inheritance
     
     async def close(self):
         """Close the adapter and release resources."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        if self._http.session is not None:
+            await self._http.close()
             logger.debug("Closed Ollama adapter HTTP session")
     
     def validate_config(self):
@@ -167,11 +185,8 @@ class OllamaAdapter(BaseAdapter): # Corrected inheritance
         Raises:
             OllamaError: If fetching models fails
         """
-        if not self._session or self._session.closed:
-            self._initialize_session()
-            
         try:
-            async with self._session.get(f"{self._base_url}/api/tags") as response:
+            async with self._http.get().get(f"{self._base_url}/api/tags") as response:
                 if response.status != 200:
                     error_text = await response.text()
                     raise OllamaError(f"Failed to fetch Ollama models: {error_text}")
@@ -197,6 +212,10 @@ class OllamaAdapter(BaseAdapter): # Corrected inheritance
     async def execute(self, request: LLMRequest) -> LLMResponse:
         """
         Execute a request to the Ollama API.
+
+        Identical concurrent requests share one upstream call, and greedy
+        (temperature 0) requests are served from the response cache when
+        ``response_cache_size`` is configured.
         
         Args:
             request: The LLM request to execute
@@ -228,14 +247,36 @@ class OllamaAdapter(BaseAdapter): # Corrected inheritance
             if key not in payload:
                 payload[key] = value
         
-        # Execute the request
-        if not self._session or self._session.closed:
-            self._initialize_session()
-            
+        key = request_fingerprint(self.name, model, payload)
+        response = await self._run_deduplicated(
+            key,
+            lambda: self._post_generate(payload, request, model),
+            cacheable=self.is_cacheable(payload),
+        )
+        response.request = request
+        return response
+
+    async def _post_generate(
+        self, payload: dict[str, Any], request: LLMRequest, model: str
+    ) -> LLMResponse:
+        """
+        Send a generation payload to the Ollama API.
+
+        Args:
+            payload: Request body for ``/api/generate``
+            request: The originating request
+            model: Model name
+
+        Returns:
+            LLMResponse containing the model's response
+
+        Raises:
+            OllamaError: If the request fails
+        """
         start_time = time.time()
         
         try:
-            async with self._session.post(
+            async with self._http.get().post(
                 f"{self._base_url}/api/generate",
                 json=payload
             ) as response:
@@ -412,9 +453,7 @@ class OllamaAdapter(BaseAdapter): # Corrected inheritance
         Raises:
             AdapterError: If an error occurs during embedding generation
         """
-        if not self._session or self._session.closed:
-            self._initialize_session()
-
+        session = self._http.get()
         model = kwargs.get("model", self._default_model)
 
         # Handle both single text and list of texts
@@ -431,7 +470,7 @@ class OllamaAdapter(BaseAdapter): # Corrected inheritance
                     "prompt": single_text
                 }
 
-                async with self._session.post(
+                async with session.post(
                     f"{self._base_url}/api/embeddings",
                     json=payload
                 ) as response:
@@ -0,0 +1,257 @@
+"""
+Connection pooling, request coalescing and response caching for LLM adapters.
+
+These helpers are shared by the adapters in this package:
+
+- ``KeepAliveSessionPool`` lazily creates one ``aiohttp.ClientSession`` per
+  adapter, backed by a bounded keep-alive connector, and recreates it if it is
+  closed. The session is created inside the running event loop, so adapters can
+  be constructed from synchronous code, and aiohttp is only imported then.
+- ``SingleFlight`` lets concurrent callers with the same request key share one
+  upstream call.
+- ``ResponseCache`` is an LRU of responses with a TTL, keyed by
+  ``request_fingerprint``.
+
+Usage:
+    flights = SingleFlight()
+    cache = ResponseCache(max_entries=256, ttl=300.0)
+    key = request_fingerprint("ollama", "gemma3:4b", payload)
+    response = cache.get(key)
+    if response is None:
+        response = await flights.run(key, call_upstream)
+        cache.put(key, response)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def request_fingerprint(provider: str, model: Optional[str], payload: Any) -> str:
+    """
+    Return a stable key for a request.
+
+    The payload is serialized as canonical JSON (sorted keys, compact
+    separators), so parameter order does not change the key.
+
+    Args:
+        provider: Adapter name
+        model: Model name
+        payload: Prompt and generation parameters
+
+    Returns:
+        Hex digest identifying the request
+    """
+    canonical = json.dumps(
+        [provider, model, payload], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the operation; callers arriving while it
+    is in flight await the same result or exception. Cancelling a waiting
+    caller does not cancel the shared call; if the executing caller is
+    cancelled, a waiting caller re-issues the request.
+    """
+
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.executed = 0
+        self.shared = 0
+
+    @property
+    def inflight(self) -> int:
+        """Number of keys currently being executed."""
+        return len(self._inflight)
+
+    async def run(self, key: str, operation: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``operation`` unless a call with the same key is already in flight.
+
+        Args:
+            key: Request key
+            operation: Async callable performing the request
+
+        Returns:
+            The result of the shared call
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.shared += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The caller executing the request was cancelled; take over
+                return await self.run(key, operation)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.executed += 1
+        try:
+            result = await operation()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                # Mark retrieved so unshared failures do not log "never retrieved"
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+
+class ResponseCache:
+    """
+    Bounded LRU of responses with a time-to-live.
+
+    Args:
+        max_entries: Maximum number of cached responses
+        ttl: Seconds a response stays valid
+        clock: Monotonic time source, injectable for tests
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for ``key``, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: str, value: Any) -> None:
+        """Cache ``value`` under ``key``, evicting the least recently used entry."""
+        self._entries[key] = (self._clock() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and occupancy."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl": self._ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class KeepAliveSessionPool:
+    """
+    Lazily created, reusable HTTP session with a bounded keep-alive connector.
+
+    Args:
+        timeout: Total request timeout in seconds
+        max_connections: Maximum open connections in the pool
+        max_connections_per_host: Maximum open connections per host
+        keepalive_timeout: Seconds an idle connection is kept open
+        http: Module providing ``ClientSession``/``TCPConnector``; defaults to
+            ``aiohttp`` and can be substituted by adapters or tests
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 60.0,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        http: Any = None,
+    ):
+        self._timeout = timeout
+        self._max_connections = max_connections
+        self._max_connections_per_host = max_connections_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._http = http
+        self._session: Any = None
+        self.sessions_created = 0
+
+    @property
+    def session(self) -> Any:
+        """The current session, or None if none is open."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        return None
+
+    def get(self) -> Any:
+        """
+        Return the open session, creating it on first use.
+
+        Must be called from within a running event loop.
+        """
+        if self.session is not None:
+            return self._session
+        if self._http is None:
+            try:
+                import aiohttp  # type: ignore
+            except ImportError:  # pragma: no cover - optional dependency
+                raise RuntimeError("aiohttp is required for HTTP connection pooling") from None
+            self._http = aiohttp
+
+        kwargs: dict[str, Any] = {}
+        if hasattr(self._http, "ClientTimeout"):
+            kwargs["timeout"] = self._http.ClientTimeout(total=self._timeout)
+        if hasattr(self._http, "TCPConnector"):
+            kwargs["connector"] = self._http.TCPConnector(
+                limit=self._max_connections,
+                limit_per_host=self._max_connections_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+            )
+        self._session = self._http.ClientSession(**kwargs)
+        self.sessions_created += 1
+        logger.debug(
+            f"Opened HTTP session (limit={self._max_connections}, "
+            f"keepalive={self._keepalive_timeout}s)"
+        )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session and its pooled connections."""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
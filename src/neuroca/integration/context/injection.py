@@ -38,6 +38,11 @@ from neuroca.integration.context.injection_types import (
     ContextInjectionStrategy as ContextInjectionStrategy,
     ContextPriority as ContextPriority,
 )
+from neuroca.integration.context.tokenization import (
+    CachedTokenCounter,
+    Tokenizer,
+    build_tokenizer,
+)
 from neuroca.memory.models import MemoryRetrievalResult
 
 __all__ = [
@@ -65,7 +70,8 @@ class ContextInjectionManager:
         reserved_tokens (int): Tokens reserved for the LLM response window.
         format (ContextFormat): Provider-specific formatting directive.
         strategy (ContextInjectionStrategy): Strategy describing how context is merged.
-        token_counter (Callable[[str], int]): Callable used to estimate token counts.
+        tokenizer (Tokenizer): Tokenizer used to measure context budgets.
+        token_counter (Callable[[str], int]): Cached token counting callable.
     Side Effects:
         Emits structured debug/info logs describing prioritisation, selection,
         and formatting behaviour.
@@ -74,7 +80,7 @@ class ContextInjectionManager:
         application-level timeout controls when necessary.
     """
 
-    def __init__(self, config: ContextInjectionConfig):
+    def __init__(self, config: ContextInjectionConfig, tokenizer: Tokenizer | None = None):
         """Initialise the context injection manager with validated configuration.
 
         Summary:
@@ -83,10 +89,14 @@ class ContextInjectionManager:
         Parameters:
             config (ContextInjectionConfig): Validated configuration describing
                 token budgets, formatting preferences, and selection strategy.
+            tokenizer (Tokenizer | None): Explicit tokenizer; when omitted one is
+                built from ``config.tokenizer`` and ``config.tokenizer_path``.
         Returns:
             None
         Raises:
-            ValueError: Propagated if ``config`` fails its internal validation checks.
+            ValueError: Propagated if ``config`` fails its internal validation
+                checks or names an unknown tokenizer.
+            OSError: If the configured tokenizer vocabulary cannot be read.
         Side Effects:
             Caches a token counting callable and emits a debug statement describing
             the active strategy and token budget.
@@ -99,20 +109,22 @@ class ContextInjectionManager:
         self.reserved_tokens = config.reserved_tokens_for_response
         self.format = ContextFormat(config.context_format)
         self.strategy = ContextInjectionStrategy(config.injection_strategy)
+        self.tokenizer = tokenizer or build_tokenizer(config.tokenizer, config.tokenizer_path)
         self.token_counter = self._resolve_token_counter()
         logger.debug(
-            "Initialized ContextInjectionManager with format=%s, strategy=%s, max_tokens=%s",
+            "Initialized ContextInjectionManager with format=%s, strategy=%s, max_tokens=%s, tokenizer=%s",
             self.format.value,
             self.strategy.value,
             self.max_tokens,
+            self.tokenizer.name,
         )
 
     def _resolve_token_counter(self) -> Callable[[str], int]:
         """Return the token counting callable for the active configuration.
 
         Summary:
-            Provides a lightweight default token counter (whitespace tokenizer)
-            while allowing future extensions to inject provider-specific logic.
+            Wraps the active tokenizer in a per-text count cache so repeated
+            context (system instructions, older turns) is tokenised once.
         Parameters:
             None
         Returns:
@@ -125,7 +137,7 @@ class ContextInjectionManager:
             Not applicable.
         """
 
-        return lambda text: len(text.split())
+        return CachedTokenCounter(self.tokenizer, self.config.token_count_cache_size)
 
     def inject_context(
         self,
@@ -5,7 +5,7 @@ Purpose:
     inputs and apply token-budget-based selection logic for downstream
     formatting.
 External Dependencies:
-    Standard library only. No CLI tools or network requests are invoked.
+    numpy for the knapsack table. No CLI tools or network requests are invoked.
 Fallback Semantics:
     Callers are expected to supply validated inputs. The helpers surface issues
     via standard exceptions rather than attempting silent fallbacks.
@@ -17,8 +17,11 @@ from __future__ import annotations
 
 import json
 import logging
+import math
 from typing import Any, Callable, Iterable
 
+import numpy as np
+
 from neuroca.integration.context.injection_types import ContextElement, ContextPriority
 
 logger = logging.getLogger(__name__)
@@ -154,8 +157,10 @@ def select_context_elements(
     """Choose context elements that fit within the configured token budget.
 
     Summary:
-        Sorts elements by priority, keeps CRITICAL entries unconditionally, and
-        then adds lower-priority items while respecting the available token window.
+        Keeps CRITICAL entries unconditionally, then solves a 0/1 knapsack over
+        the remaining elements so the summed :func:`element_value` is maximal
+        without exceeding the available token window. Selected elements are
+        returned in priority order.
     Parameters:
         context_elements (list[ContextElement]): Candidate elements created by
             :func:`prepare_context_elements`.
@@ -180,16 +185,19 @@ def select_context_elements(
         )
 
     sorted_elements = sorted(context_elements, key=lambda element: element.priority.value)
-    selected_elements: list[ContextElement] = []
-    used_tokens = 0
-
-    for element in sorted_elements:
-        if element.priority == ContextPriority.CRITICAL:
-            selected_elements.append(element)
-            used_tokens += element.token_count
-            continue
+    critical = [element for element in sorted_elements if element.priority == ContextPriority.CRITICAL]
+    optional = [element for element in sorted_elements if element.priority != ContextPriority.CRITICAL]
+
+    used_tokens = sum(element.token_count for element in critical)
+    chosen = _solve_knapsack(
+        [element.token_count for element in optional],
+        [element_value(element) for element in optional],
+        max(available_tokens - used_tokens, 0),
+    )
 
-        if used_tokens + element.token_count <= available_tokens:
+    selected_elements = list(critical)
+    for index, element in enumerate(optional):
+        if index in chosen:
             selected_elements.append(element)
             used_tokens += element.token_count
         else:
@@ -210,6 +218,110 @@ def select_context_elements(
     return selected_elements
 
 
+def element_value(element: ContextElement) -> float:
+    """Score a context element for budget-constrained selection.
+
+    Summary:
+        Multiplies the priority weight (HIGH 8, MEDIUM 4, LOW 2, BACKGROUND 1)
+        by the element's ``relevance_score`` metadata when present, so relevance
+        orders elements within a priority band while higher bands still
+        dominate.
+    Parameters:
+        element (ContextElement): Candidate element.
+    Returns:
+        float: Non-negative selection value.
+    Raises:
+        None.
+    Side Effects:
+        None.
+    Timeout/Retry Notes:
+        Not applicable.
+    """
+
+    weight = _PRIORITY_WEIGHTS.get(element.priority, 1.0)
+    relevance = (element.metadata or {}).get("relevance_score")
+    if isinstance(relevance, (int, float)) and not isinstance(relevance, bool):
+        return weight * min(max(float(relevance), 0.0), 1.0)
+    return weight
+
+
+_PRIORITY_WEIGHTS = {
+    ContextPriority.HIGH: 8.0,
+    ContextPriority.MEDIUM: 4.0,
+    ContextPriority.LOW: 2.0,
+    ContextPriority.BACKGROUND: 1.0,
+}
+
+# Upper bound on knapsack table cells (items x capacity); larger problems are
+# solved on a coarser token grid.
+_MAX_KNAPSACK_CELLS = 400_000
+
+
+def _solve_knapsack(weights: list[int], values: list[float], capacity: int) -> set[int]:
+    """Return the indices of a maximum-value subset whose weight fits ``capacity``.
+
+    Summary:
+        Dynamic programme over token capacity, vectorised with numpy one item
+        at a time. When ``items x capacity`` exceeds ``_MAX_KNAPSACK_CELLS`` the
+        weights are rounded *up* to a coarser grid, which keeps every solution
+        within the exact budget; any capacity left over by the rounding is then
+        filled greedily by value density.
+    Parameters:
+        weights (list[int]): Token counts per item.
+        values (list[float]): Value per item.
+        capacity (int): Exact token budget.
+    Returns:
+        set[int]: Indices of the chosen items.
+    Raises:
+        None.
+    Side Effects:
+        None.
+    Timeout/Retry Notes:
+        Not applicable.
+    """
+
+    chosen = {index for index, weight in enumerate(weights) if weight <= 0 and values[index] > 0}
+    candidates = [
+        index
+        for index, weight in enumerate(weights)
+        if 0 < weight <= capacity and values[index] > 0
+    ]
+    if sum(weights[index] for index in candidates) <= capacity:
+        return chosen | set(candidates)
+
+    scale = max(1, math.ceil(len(candidates) * capacity / _MAX_KNAPSACK_CELLS))
+    grid_capacity = capacity // scale
+    grid_weights = [-(-weights[index] // scale) for index in candidates]
+
+    best = np.zeros(grid_capacity + 1)
+    keep = np.zeros((len(candidates), grid_capacity + 1), dtype=bool)
+    for row, (index, weight) in enumerate(zip(candidates, grid_weights)):
+        if weight > grid_capacity:
+            continue
+        with_item = best[: grid_capacity + 1 - weight] + values[index]
+        improved = with_item > best[weight:]
+        keep[row, weight:] = improved
+        best[weight:] = np.where(improved, with_item, best[weight:])
+
+    remaining = grid_capacity
+    for row in range(len(candidates) - 1, -1, -1):
+        if keep[row, remaining]:
+            chosen.add(candidates[row])
+            remaining -= grid_weights[row]
+
+    spare = capacity - sum(weights[index] for index in chosen)
+    leftovers = sorted(
+        (index for index in candidates if index not in chosen),
+        key=lambda index: values[index] / weights[index],
+        reverse=True,
+    )
+    for index in leftovers:
+        if weights[index] <= spare:
+            chosen.add(index)
+            spare -= weights[index]
+    return chosen
+
+
 def group_elements_by_source(elements: Iterable[ContextElement]) -> dict[str, list[ContextElement]]:
     """Group context elements by their ``source`` attribute.
 
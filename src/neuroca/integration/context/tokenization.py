@@ -0,0 +1,315 @@
+"""Token counting primitives for context injection.
+
+Purpose:
+    Provide a pluggable tokenizer interface so context budgets are measured in
+    the units the target model actually consumes, together with a bounded
+    per-text count cache.
+External Dependencies:
+    ``tiktoken`` (optional) performs exact BPE encoding. Vocabularies are read
+    from local ``.tiktoken`` rank files (one ``base64(token) rank`` pair per
+    line); no network access is attempted.
+Fallback Semantics:
+    When no vocabulary is configured, or ``tiktoken`` is not installed,
+    :class:`ApproximateTokenizer` estimates counts from a pre-tokenisation
+    pattern modelled on ``cl100k_base``.
+Timeout Strategy:
+    Not applicable; all operations are synchronous and CPU-bound.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Protocol, Sequence, runtime_checkable
+
+try:  # pragma: no cover - exercised when tiktoken is installed
+    import tiktoken  # type: ignore[import-not-found]
+    from tiktoken.load import load_tiktoken_bpe  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - import guard
+    tiktoken = None  # type: ignore[assignment]
+    load_tiktoken_bpe = None  # type: ignore[assignment]
+
+__all__ = [
+    "Tokenizer",
+    "WhitespaceTokenizer",
+    "ApproximateTokenizer",
+    "TiktokenTokenizer",
+    "CachedTokenCounter",
+    "build_tokenizer",
+]
+
+logger = logging.getLogger(__name__)
+
+# Pre-tokenisation pattern of ``cl100k_base``, used when loading rank files.
+CL100K_PATTERN = r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}++|\p{N}{1,3}+| ?[^\s\p{L}\p{N}]++[\r\n]*+|\s++$|\s*[\r\n]|\s+(?!\S)|\s"""
+
+# Approximation of the cl100k pre-tokeniser using ``re`` character classes:
+# ``[^\W\d_]`` stands in for letters and ``\d`` for numbers.
+PRETOKENIZE_PATTERN = re.compile(
+    r"(?i:'s|'t|'re|'ve|'m|'ll|'d)"
+    r"|(?:[^\r\n\w]|_)?[^\W\d_]+"
+    r"|\d{1,3}"
+    r"| ?(?:[^\s\w]|_)+[\r\n]*"
+    r"|\s*[\r\n]+"
+    r"|\s+(?!\S)"
+    r"|\s+"
+)
+
+
+@runtime_checkable
+class Tokenizer(Protocol):
+    """Interface implemented by tokenizers used for context budgeting.
+
+    Summary:
+        Tokenizers expose a stable ``name`` plus ``encode`` and ``count``
+        methods; ``count`` may be cheaper than ``len(encode(text))``.
+    Side Effects:
+        Implementations may cache intermediate results.
+    Timeout/Retry Notes:
+        Not applicable.
+    """
+
+    name: str
+
+    def encode(self, text: str) -> list[int]:
+        """Return token ids for ``text``."""
+
+    def count(self, text: str) -> int:
+        """Return the number of tokens in ``text``."""
+
+
+class WhitespaceTokenizer:
+    """Count whitespace-separated words (the historical heuristic).
+
+    Summary:
+        Retained for callers that depend on the previous ``len(text.split())``
+        behaviour. Token ids are positional and carry no vocabulary meaning.
+    Side Effects:
+        None.
+    Timeout/Retry Notes:
+        Not applicable.
+    """
+
+    name = "whitespace"
+
+    def encode(self, text: str) -> list[int]:
+        """Return one positional id per whitespace-separated word."""
+
+        return list(range(len(text.split())))
+
+    def count(self, text: str) -> int:
+        """Return the number of whitespace-separated words in ``text``."""
+
+        return len(text.split())
+
+
+class ApproximateTokenizer:
+    """Estimate BPE token counts without a vocabulary.
+
+    Summary:
+        Splits text with :data:`PRETOKENIZE_PATTERN` and charges each letter run one
+        token per ``chars_per_token`` characters, each digit group and
+        punctuation run one token, and whitespace runs one token. This tracks
+        common English BPE vocabularies far more closely than word counts.
+    Parameters:
+        chars_per_token (float): Average characters covered by a token within
+            a word.
+    Side Effects:
+        None.
+    Timeout/Retry Notes:
+        Not applicable.
+    """
+
+    name = "approximate"
+
+    def __init__(self, chars_per_token: float = 4.0) -> None:
+        if chars_per_token <= 0:
+            raise ValueError("chars_per_token must be positive")
+        self._chars_per_token = chars_per_token
+
+    def encode(self, text: str) -> list[int]:
+        """Return positional ids matching :meth:`count`."""
+
+        return list(range(self.count(text)))
+
+    def count(self, text: str) -> int:
+        """Return the estimated number of tokens in ``text``."""
+
+        total = 0
+        for piece in PRETOKENIZE_PATTERN.findall(text):
+            core = piece.strip()
+            if core and core[-1].isalpha():
+                total += math.ceil(len(core) / self._chars_per_token)
+            else:
+                total += 1
+        return total
+
+
+class TiktokenTokenizer:
+    """Exact BPE token counts from a ``tiktoken`` encoding.
+
+    Summary:
+        Wraps a :class:`tiktoken.Encoding`. Special tokens are treated as
+        ordinary text so user content can never inject them.
+    Parameters:
+        encoding (tiktoken.Encoding): Encoding used for all operations.
+    Side Effects:
+        None beyond ``tiktoken``'s own caches.
+    Timeout/Retry Notes:
+        Not applicable.
+    """
+
+    def __init__(self, encoding: "tiktoken.Encoding") -> None:
+        self.name = encoding.name
+        self._encoding = encoding
+
+    @property
+    def vocab_size(self) -> int:
+        """Number of entries in the vocabulary."""
+
+        return self._encoding.n_vocab
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str | Path,
+        *,
+        name: str | None = None,
+        pat_str: str = CL100K_PATTERN,
+    ) -> "TiktokenTokenizer":
+        """Load a ``.tiktoken`` rank file without network access.
+
+        Summary:
+            Reads lines of ``base64(token) rank`` as published for OpenAI
+            encodings such as ``cl100k_base``.
+        Parameters:
+            path (str | Path): Location of the rank file.
+            name (str | None): Identifier; defaults to the file stem.
+            pat_str (str): Pre-tokenisation pattern of the encoding.
+        Returns:
+            TiktokenTokenizer: Tokenizer using the loaded ranks.
+        Raises:
+            ImportError: If ``tiktoken`` is not installed.
+            OSError: If the file cannot be read.
+            ValueError: If a line is malformed.
+        Side Effects:
+            Reads the file from disk.
+        Timeout/Retry Notes:
+            Not applicable.
+        """
+
+        if tiktoken is None:
+            raise ImportError("tiktoken is required to load BPE rank files")
+        path = Path(path)
+        encoding = tiktoken.Encoding(
+            name or path.stem,
+            pat_str=pat_str,
+            mergeable_ranks=load_tiktoken_bpe(str(path)),
+            special_tokens={},
+        )
+        return cls(encoding)
+
+    def encode(self, text: str) -> list[int]:
+        """Return the token ids for ``text``."""
+
+        return self._encoding.encode_ordinary(text)
+
+    def count(self, text: str) -> int:
+        """Return the number of tokens in ``text``."""
+
+        return len(self._encoding.encode_ordinary(text))
+
+    def decode(self, ids: Sequence[int]) -> str:
+        """Return the text for ``ids``, replacing invalid UTF-8 sequences."""
+
+        return self._encoding.decode(list(ids))
+
+
+class CachedTokenCounter:
+    """Memoise token counts per text in a bounded LRU.
+
+    Summary:
+        Context elements such as system instructions and older conversation
+        turns are re-counted on every request; caching their counts avoids
+        re-tokenising identical text.
+    Parameters:
+        tokenizer (Tokenizer): Tokenizer whose ``count`` is memoised.
+        cache_size (int): Maximum number of cached texts; ``0`` disables caching.
+    Attributes:
+        hits (int): Number of counts served from the cache.
+        misses (int): Number of counts computed by the tokenizer.
+    Side Effects:
+        Holds references to up to ``cache_size`` recently counted texts.
+    Timeout/Retry Notes:
+        Not applicable.
+    """
+
+    def __init__(self, tokenizer: Tokenizer, cache_size: int = 4096) -> None:
+        self.tokenizer = tokenizer
+        self._cache: OrderedDict[str, int] = OrderedDict()
+        self._cache_size = max(0, cache_size)
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, text: str) -> int:
+        """Return the token count for ``text``."""
+
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        count = self.tokenizer.count(text)
+        if self._cache_size:
+            self._cache[text] = count
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return count
+
+
+def build_tokenizer(name: str = "auto", path: str | None = None) -> Tokenizer:
+    """Create the tokenizer described by configuration values.
+
+    Summary:
+        ``"bpe"`` loads the ``.tiktoken`` rank file at ``path`` with
+        ``tiktoken``; ``"approximate"`` and ``"whitespace"`` need no
+        vocabulary; ``"auto"`` loads ``path`` when one is given and
+        ``tiktoken`` is installed, and otherwise approximates.
+    Parameters:
+        name (str): Tokenizer identifier.
+        path (str | None): Location of a ``.tiktoken`` rank file.
+    Returns:
+        Tokenizer: The configured tokenizer.
+    Raises:
+        ValueError: For unknown names, or ``"bpe"`` without a ``path``.
+        ImportError: For ``"bpe"`` when ``tiktoken`` is not installed.
+        OSError: If the rank file cannot be read.
+    Side Effects:
+        Reads the rank file from disk when one is used.
+    Timeout/Retry Notes:
+        Not applicable.
+    """
+
+    factories: dict[str, Callable[[], Tokenizer]] = {
+        "whitespace": WhitespaceTokenizer,
+        "approximate": ApproximateTokenizer,
+    }
+    if name == "auto":
+        if not path:
+            return ApproximateTokenizer()
+        if tiktoken is None:
+            logger.warning("tiktoken is not installed; approximating token counts instead of loading %s", path)
+            return ApproximateTokenizer()
+        return TiktokenTokenizer.from_file(path)
+    if name == "bpe":
+        if not path:
+            raise ValueError("The 'bpe' tokenizer requires a tokenizer_path")
+        return TiktokenTokenizer.from_file(path)
+    if name not in factories:
+        raise ValueError(f"Unknown tokenizer {name!r}")
+    return factories[name]()
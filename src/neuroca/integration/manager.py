@@ -14,9 +14,11 @@ The manager:
 5. Adapts interactions based on health metrics and goal state
 """
 
+import asyncio
 import logging
 import time
 import re
+from collections import OrderedDict
 from typing import Any, Optional
 
 from neuroca.core.cognitive_control.goal_manager import GoalManager
@@ -25,7 +27,6 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from neuroca.memory.manager import MemoryManager
 
-from .adapters import AnthropicAdapter, OpenAIAdapter, VertexAIAdapter
 from .adapters import (  # Import necessary adapter classes
     BaseAdapter as LLMAdapter,  # Assuming BaseAdapter is the intended type for LLMAdapter
 )
@@ -38,6 +39,25 @@ from .prompts.templates import TemplateManager  # Import the manager class
 
 logger = logging.getLogger(__name__)
 
+# Built-in provider adapters, imported the first time a provider is configured
+_ADAPTER_CLASS_NAMES = ("OpenAIAdapter", "AnthropicAdapter", "VertexAIAdapter", "OllamaAdapter")
+
+
+def _adapter_class(name: str) -> Optional[type]:
+    """Return a built-in adapter class, or None if its dependencies are missing."""
+    if name not in globals():
+        from . import adapters
+
+        globals()[name] = getattr(adapters, name)
+    return globals()[name]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _ADAPTER_CLASS_NAMES:
+        return _adapter_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class LLMIntegrationManager:
     """
     The main manager class for integrating LLMs with the NeuroCognitive Architecture.
@@ -110,6 +130,9 @@ Task:
         self.total_tokens = 0
         self.total_cost = 0.0
         self.request_times = []
+
+        # Recent memory lookups keyed by normalized query: (expires_at, results)
+        self._memory_cache: OrderedDict[str, tuple[float, list[dict[str, Any]]]] = OrderedDict()
         
         logger.info(f"LLM Integration Manager initialized with {len(self.adapters)} providers")
         
@@ -117,22 +140,21 @@ Task:
         """Initialize adapters for each configured provider."""
         provider_configs = self.config.get("providers", {})
         
-        # Initialize built-in adapters
-        if "openai" in provider_configs and OpenAIAdapter:
-            self.adapters["openai"] = OpenAIAdapter(provider_configs["openai"])
+        # Initialize built-in adapters (imported only for configured providers)
+        if "openai" in provider_configs and _adapter_class("OpenAIAdapter"):
+            self.adapters["openai"] = _adapter_class("OpenAIAdapter")(provider_configs["openai"])
             
-        if "anthropic" in provider_configs and AnthropicAdapter:
-            self.adapters["anthropic"] = AnthropicAdapter(provider_configs["anthropic"])
+        if "anthropic" in provider_configs and _adapter_class("AnthropicAdapter"):
+            self.adapters["anthropic"] = _adapter_class("AnthropicAdapter")(provider_configs["anthropic"])
             
-        if "vertexai" in provider_configs and VertexAIAdapter:
-            self.adapters["vertexai"] = VertexAIAdapter(provider_configs["vertexai"])
+        if "vertexai" in provider_configs and _adapter_class("VertexAIAdapter"):
+            self.adapters["vertexai"] = _adapter_class("VertexAIAdapter")(provider_configs["vertexai"])
             
         # Initialize Ollama local models if configured
         if "ollama" in provider_configs:
-            try:
-                from .adapters.ollama import OllamaAdapter
-                self.adapters["ollama"] = OllamaAdapter(provider_configs["ollama"])
-            except ImportError:
+            if _adapter_class("OllamaAdapter"):
+                self.adapters["ollama"] = _adapter_class("OllamaAdapter")(provider_configs["ollama"])
+            else:
                 logger.warning("Ollama adapter requested but not available - install with pip install neuroca[ollama]")
         
         # Load any custom adapters
@@ -393,6 +415,9 @@ Task:
                 "timestamp": time.time()
             }
             
+            # Cached lookups predate this interaction
+            self._memory_cache.clear()
+
             # Use MemoryManager.store() to match test expectations
             await self.memory_manager.store(
                 content=memory_entry,
@@ -418,60 +443,152 @@ Task:
         """
         Retrieve relevant memories based on the query.
 
-        Compatibility note:
-        - Tests expect MemoryManager.retrieve to be called three times.
-        - We therefore call retrieve for STM/MTM/LTM tiers and aggregate results.
+        The STM, MTM and LTM tiers are queried concurrently, each bounded by its
+        own deadline, so the added latency is that of the slowest tier rather
+        than the sum of all three. A tier that times out or fails contributes
+        no results. Hits are deduplicated by memory id (falling back to the
+        content text), keeping the most relevant copy, and the merged list is
+        cut to ``top_k``.
+
+        Settings are read from ``config["memory_retrieval"]``:
+        ``tier_timeout_seconds`` (or per-tier ``tier_timeouts``), ``top_k``,
+        ``cache_ttl_seconds`` and ``cache_size``. When the TTL is positive,
+        complete results are cached by the normalized query so repeated prompts
+        skip the lookup.
         """
         if not self.memory_manager:
             return []
 
+        settings = self._memory_retrieval_settings()
+        cache_key = " ".join(query.casefold().split())
+        cached = self._cached_memories(cache_key, settings)
+        if cached is not None:
+            return cached
+
         try:
             tiers = ["stm", "mtm", "ltm"]
-            results: list[Any] = []
+            outcomes = await asyncio.gather(
+                *(
+                    self._retrieve_tier(query, tier, settings["tier_timeouts"][tier], settings["top_k"])
+                    for tier in tiers
+                )
+            )
 
-            # Call retrieve per tier to satisfy unit test expectations
-            for tier in tiers:
-                # Signature kept generic for mocks; real implementation may accept filters
-                items = await self.memory_manager.retrieve(query=query)  # type: ignore[arg-type]
-                if not items:
+            merged: dict[Any, dict[str, Any]] = {}
+            complete = True
+            for tier, items in zip(tiers, outcomes):
+                if items is None:
+                    complete = False
                     continue
-                results.extend((item, tier) for item in items)
-
-            # Normalize results for prompt context
-            normalized: list[dict[str, Any]] = []
-            for item, tier in results:
-                # Extract content text robustly (support dicts or objects)
-                content_text = ""
-                relevance = 0.5
-
-                if hasattr(item, "content"):
-                    content_val = getattr(item, "content")
-                    relevance = getattr(item, "relevance", 0.5)
-                elif isinstance(item, dict):
-                    content_val = item.get("content", "")
-                    relevance = item.get("_relevance", 0.5)
-                else:
-                    content_val = str(item)
-
-                if isinstance(content_val, dict):
-                    content_text = content_val.get("text", "") or str(content_val.get("data", ""))
-                else:
-                    content_text = str(content_val)
-
-                normalized.append({
-                    "content": content_text,
-                    "source": f"{tier}_memory",
-                    "relevance": relevance,
-                })
-
-            # Sort by relevance (best-first)
-            normalized.sort(key=lambda x: x.get("relevance", 0.5), reverse=True)
+                for item in items:
+                    memory_id, entry = self._normalize_memory(item, tier)
+                    key = memory_id if memory_id is not None else ("content", entry["content"])
+                    current = merged.get(key)
+                    if current is None or entry["relevance"] > current["relevance"]:
+                        merged[key] = entry
+
+            # Sort by relevance (best-first); ties keep tier order
+            normalized = sorted(merged.values(), key=lambda x: x["relevance"], reverse=True)
+            normalized = normalized[: settings["top_k"]]
+
+            if complete and settings["cache_ttl"] > 0:
+                self._memory_cache[cache_key] = (
+                    time.monotonic() + settings["cache_ttl"],
+                    [dict(entry) for entry in normalized],
+                )
+                self._memory_cache.move_to_end(cache_key)
+                while len(self._memory_cache) > settings["cache_size"]:
+                    self._memory_cache.popitem(last=False)
             return normalized
 
         except Exception as e:  # noqa: BLE001
             logger.warning(f"Failed to retrieve memories: {e}")
             return []
-        
+
+    def _memory_retrieval_settings(self) -> dict[str, Any]:
+        """Read retrieval deadlines, result limit and cache settings from config."""
+        options = self.config.get("memory_retrieval") or {}
+
+        def _number(value: Any, default: float, kind: type) -> Any:
+            try:
+                return kind(value)
+            except (TypeError, ValueError):
+                return default
+
+        timeout = _number(options.get("tier_timeout_seconds", 2.0), 2.0, float)
+        per_tier = options.get("tier_timeouts") or {}
+        return {
+            "tier_timeouts": {
+                tier: _number(per_tier.get(tier, timeout), timeout, float)
+                for tier in ("stm", "mtm", "ltm")
+            },
+            "top_k": max(1, _number(options.get("top_k", 10), 10, int)),
+            "cache_ttl": _number(options.get("cache_ttl_seconds", 0.0), 0.0, float),
+            "cache_size": max(1, _number(options.get("cache_size", 128), 128, int)),
+        }
+
+    def _cached_memories(self, key: str, settings: dict[str, Any]) -> Optional[list[dict[str, Any]]]:
+        """Return a copy of unexpired cached results for ``key``, if any."""
+        if settings["cache_ttl"] <= 0:
+            return None
+        cached = self._memory_cache.get(key)
+        if cached is None:
+            return None
+        expires_at, entries = cached
+        if expires_at <= time.monotonic():
+            del self._memory_cache[key]
+            return None
+        self._memory_cache.move_to_end(key)
+        return [dict(entry) for entry in entries]
+
+    async def _retrieve_tier(
+        self, query: str, tier: str, timeout: float, limit: int
+    ) -> Optional[list[Any]]:
+        """Query one tier within ``timeout`` seconds; ``None`` if it missed the deadline or failed."""
+        try:
+            lookup = self.memory_manager.retrieve(query=query, tier=tier, limit=limit)  # type: ignore[union-attr]
+            items = await asyncio.wait_for(lookup, timeout=timeout if timeout > 0 else None)
+        except asyncio.TimeoutError:
+            logger.warning(f"Memory retrieval from {tier} exceeded {timeout:.3f}s deadline")
+            return None
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Memory retrieval from {tier} failed: {e}")
+            return None
+        return list(items or [])
+
+    @staticmethod
+    def _normalize_memory(item: Any, tier: str) -> tuple[Any, dict[str, Any]]:
+        """Return the memory id (or ``None``) and the prompt-context entry for ``item``."""
+        memory_id = None
+        relevance = 0.5
+
+        if hasattr(item, "content"):
+            content_val = getattr(item, "content")
+            relevance = getattr(item, "relevance", 0.5)
+            memory_id = getattr(item, "id", None)
+        elif isinstance(item, dict):
+            content_val = item.get("content", "")
+            relevance = item.get("_relevance", 0.5)
+            memory_id = item.get("id", item.get("memory_id"))
+        else:
+            content_val = str(item)
+
+        if isinstance(content_val, dict):
+            content_text = content_val.get("text", "") or str(content_val.get("data", ""))
+        else:
+            content_text = str(content_val)
+
+        if not isinstance(relevance, (int, float)):
+            relevance = 0.5
+        if not isinstance(memory_id, (str, int)) or isinstance(memory_id, bool):
+            memory_id = None
+
+        return memory_id, {
+            "content": content_text,
+            "source": f"{tier}_memory",
+            "relevance": relevance,
+        }
+
     async def _get_health_context(self) -> dict[str, Any]:
         """
         Get current health context for LLM adaptation.
@@ -45,86 +45,88 @@ See Also:
 - neuroca.integration: For LLM integration with the memory system
 """
 
+from __future__ import annotations
+
+import importlib
 import logging
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from .exceptions import (
+    MemoryCapacityError,
+    MemoryConsolidationError,
+    MemoryDecayError,
+    MemoryRetrievalError,
+    MemoryStorageError,
+)
+
+if TYPE_CHECKING:
+    from .models import MemoryQuery, MemoryRetrievalResult
 
 # Configure module-level logger
 logger = logging.getLogger(__name__)
 
-# Import memory components
-# These imports will be implemented in separate files within the memory package
-try:
-    from .episodic_memory import EpisodicMemory
-    from .exceptions import (
-        MemoryCapacityError,
-        MemoryConsolidationError,
-        MemoryDecayError,
-        MemoryRetrievalError,
-        MemoryStorageError,
-    )
-    from .memory_consolidation import MemoryConsolidation
-    from .memory_decay import MemoryDecay
-    from .memory_retrieval import MemoryRetrieval
-    from .models import (
-        EpisodicMemoryItem,
-        MemoryItem,
-        MemoryQuery,
-        MemoryRetrievalResult,
-        SemanticMemoryItem,
-        WorkingMemoryItem,
-    )
-    from .semantic_memory import SemanticMemory
-    from .working_memory import WorkingMemory
-except ImportError as e:
-    logger.warning(f"Some memory components could not be imported: {e}")
-    # Define placeholder classes to prevent crashes if components are not yet implemented
-    # These will be replaced by actual implementations as they are developed
-    class NotImplementedComponent:
-        """Placeholder for components that are not yet implemented."""
-        def __init__(self, *args, **kwargs):
-            logger.warning(f"{self.__class__.__name__} is not yet implemented")
-        
-        def __getattr__(self, name):
-            logger.warning(f"Attempted to access unimplemented method {name} on {self.__class__.__name__}")
-            raise NotImplementedError(f"{self.__class__.__name__}.{name} is not yet implemented")
+# Memory components are imported on first access (PEP 562) so that importing
+# ``neuroca.memory`` or one of its subpackages does not load every tier.
+# name -> submodule providing it
+_LAZY_COMPONENTS: dict[str, str] = {
+    "WorkingMemory": ".working_memory",
+    "EpisodicMemory": ".episodic_memory",
+    "SemanticMemory": ".semantic_memory",
+    "MemoryConsolidation": ".memory_consolidation",
+    "MemoryRetrieval": ".memory_retrieval",
+    "MemoryDecay": ".memory_decay",
+    # Models
+    "MemoryItem": ".models",
+    "WorkingMemoryItem": ".models",
+    "EpisodicMemoryItem": ".models",
+    "SemanticMemoryItem": ".models",
+    "MemoryQuery": ".models",
+    "MemoryRetrievalResult": ".models",
+}
+
+
+class NotImplementedComponent:
+    """Placeholder for components that are not yet implemented."""
+    def __init__(self, *args, **kwargs):
+        logger.warning(f"{self.__class__.__name__} is not yet implemented")
     
-    # Create placeholder classes for any missing components
-    if 'WorkingMemory' not in locals():
-        WorkingMemory = type('WorkingMemory', (NotImplementedComponent,), {})
-    if 'EpisodicMemory' not in locals():
-        EpisodicMemory = type('EpisodicMemory', (NotImplementedComponent,), {})
-    if 'SemanticMemory' not in locals():
-        SemanticMemory = type('SemanticMemory', (NotImplementedComponent,), {})
-    if 'MemoryConsolidation' not in locals():
-        MemoryConsolidation = type('MemoryConsolidation', (NotImplementedComponent,), {})
-    if 'MemoryRetrieval' not in locals():
-        MemoryRetrieval = type('MemoryRetrieval', (NotImplementedComponent,), {})
-    if 'MemoryDecay' not in locals():
-        MemoryDecay = type('MemoryDecay', (NotImplementedComponent,), {})
-    # Add placeholders for models if they fail to import
-    if 'MemoryItem' not in locals():
-        MemoryItem = type('MemoryItem', (object,), {'__init__': lambda self, *args, **kwargs: None}) # Basic object placeholder
-    if 'WorkingMemoryItem' not in locals():
-        WorkingMemoryItem = type('WorkingMemoryItem', (MemoryItem,), {})
-    if 'EpisodicMemoryItem' not in locals():
-        EpisodicMemoryItem = type('EpisodicMemoryItem', (MemoryItem,), {})
-    if 'SemanticMemoryItem' not in locals():
-        SemanticMemoryItem = type('SemanticMemoryItem', (MemoryItem,), {})
-    if 'MemoryQuery' not in locals():
-        MemoryQuery = type('MemoryQuery', (object,), {'__init__': lambda self, *args, **kwargs: None})
-    if 'MemoryRetrievalResult' not in locals():
-        MemoryRetrievalResult = type('MemoryRetrievalResult', (object,), {'__init__': lambda self, *args, **kwargs: None})
-    # Add placeholders for exceptions if needed
-    if 'MemoryCapacityError' not in locals():
-        MemoryCapacityError = type('MemoryCapacityError', (Exception,), {})
-    if 'MemoryRetrievalError' not in locals():
-        MemoryRetrievalError = type('MemoryRetrievalError', (Exception,), {})
-    if 'MemoryStorageError' not in locals():
-        MemoryStorageError = type('MemoryStorageError', (Exception,), {})
-    if 'MemoryConsolidationError' not in locals():
-        MemoryConsolidationError = type('MemoryConsolidationError', (Exception,), {})
-    if 'MemoryDecayError' not in locals():
-        MemoryDecayError = type('MemoryDecayError', (Exception,), {})
+    def __getattr__(self, name):
+        logger.warning(f"Attempted to access unimplemented method {name} on {self.__class__.__name__}")
+        raise NotImplementedError(f"{self.__class__.__name__}.{name} is not yet implemented")
+
+
+def _placeholder(name: str) -> type:
+    """Create a placeholder class for a component that could not be imported."""
+    if _LAZY_COMPONENTS[name] != ".models":
+        return type(name, (NotImplementedComponent,), {})
+    if name.endswith("MemoryItem") and name != "MemoryItem":
+        return type(name, (_load("MemoryItem"),), {})
+    # Basic object placeholder
+    return type(name, (object,), {'__init__': lambda self, *args, **kwargs: None})
+
+
+def _load(name: str) -> Any:
+    """Import a memory component, substituting a placeholder if it is unavailable."""
+    if name in globals():
+        return globals()[name]
+    try:
+        value = getattr(importlib.import_module(_LAZY_COMPONENTS[name], __name__), name)
+    except ImportError as e:
+        logger.warning(f"Some memory components could not be imported: {e}")
+        # These will be replaced by actual implementations as they are developed
+        value = _placeholder(name)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_COMPONENTS:
+        return _load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_COMPONENTS))
 
 
 class MemorySystem:
@@ -181,26 +183,26 @@ class MemorySystem:
         
         try:
             # Initialize memory tiers
-            self.working = WorkingMemory(self.config.get('working_memory', {}))
-            self.episodic = EpisodicMemory(self.config.get('episodic_memory', {}))
-            self.semantic = SemanticMemory(self.config.get('semantic_memory', {}))
+            self.working = _load("WorkingMemory")(self.config.get('working_memory', {}))
+            self.episodic = _load("EpisodicMemory")(self.config.get('episodic_memory', {}))
+            self.semantic = _load("SemanticMemory")(self.config.get('semantic_memory', {}))
             
             # Initialize supporting components
-            self.consolidation = MemoryConsolidation(
+            self.consolidation = _load("MemoryConsolidation")(
                 working_memory=self.working,
                 episodic_memory=self.episodic,
                 semantic_memory=self.semantic,
                 config=self.config.get('consolidation', {})
             )
             
-            self.retrieval = MemoryRetrieval(
+            self.retrieval = _load("MemoryRetrieval")(
                 working_memory=self.working,
                 episodic_memory=self.episodic,
                 semantic_memory=self.semantic,
                 config=self.config.get('retrieval', {})
             )
             
-            self.decay = MemoryDecay(
+            self.decay = _load("MemoryDecay")(
                 working_memory=self.working,
                 episodic_memory=self.episodic,
                 semantic_memory=self.semantic,
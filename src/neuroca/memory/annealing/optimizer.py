@@ -20,6 +20,7 @@ from neuroca.memory.annealing.optimizer.types import OptimizationStrategy, Optim
 from neuroca.memory.annealing.optimizer.stats import OptimizationStats
 from neuroca.memory.annealing.optimizer.core import AnnealingOptimizer
 from neuroca.memory.annealing.optimizer.factory import create_optimizer
+from neuroca.memory.annealing.optimizer.parallel import ParallelTempering
 from neuroca.memory.annealing.optimizer.schedules.base import AnnealingSchedule
 from neuroca.memory.annealing.optimizer.schedules.exponential import ExponentialAnnealingSchedule
 from neuroca.memory.annealing.optimizer.schedules.linear import LinearAnnealingSchedule
@@ -28,6 +29,7 @@ from neuroca.memory.annealing.optimizer.schedules.adaptive import AdaptiveAnneal
 # Re-export components for backward compatibility
 __all__ = [
     'AnnealingOptimizer',
+    'ParallelTempering',
     'OptimizationStrategy',
     'OptimizationMetric',
     'OptimizationStats',
@@ -16,6 +16,7 @@ important memories while allowing for exploration of memory space early in the p
 from neuroca.memory.annealing.optimizer.types import OptimizationStrategy, OptimizationMetric
 from neuroca.memory.annealing.optimizer.stats import OptimizationStats
 from neuroca.memory.annealing.optimizer.core import AnnealingOptimizer
+from neuroca.memory.annealing.optimizer.parallel import ParallelTempering
 from neuroca.memory.annealing.optimizer.schedules.base import AnnealingSchedule
 from neuroca.memory.annealing.optimizer.schedules.exponential import ExponentialAnnealingSchedule
 from neuroca.memory.annealing.optimizer.schedules.linear import LinearAnnealingSchedule
@@ -32,5 +33,6 @@ __all__ = [
     'LinearAnnealingSchedule',
     'AdaptiveAnnealingSchedule',
     'AnnealingOptimizer',
+    'ParallelTempering',
     'create_optimizer'
 ]
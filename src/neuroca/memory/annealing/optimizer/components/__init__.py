@@ -4,25 +4,33 @@ Memory Annealing Optimizer Components Package
 This package provides modular components used by the memory annealing optimizer.
 """
 
+from neuroca.memory.annealing.optimizer.components.connectivity import ComponentTracker
+
 from neuroca.memory.annealing.optimizer.components.energy import (
+    accept_energy_delta,
     calculate_energy,
     calculate_redundancy_energy,
     calculate_fragmentation_energy,
     calculate_relevance_energy,
     get_strategy_weights,
     build_connection_graph,
-    calculate_fragmentation
+    calculate_fragmentation,
+    EnergyProposal,
+    IncrementalEnergy
 )
 
 from neuroca.memory.annealing.optimizer.components.transformations import (
     clone_memories,
+    generate_move,
     generate_neighbor,
+    NeighborMove,
     merge_memories,
     split_memory,
     post_process
 )
 
 __all__ = [
+    'accept_energy_delta',
     'calculate_energy',
     'calculate_redundancy_energy',
     'calculate_fragmentation_energy',
@@ -30,8 +38,13 @@ __all__ = [
     'get_strategy_weights',
     'build_connection_graph',
     'calculate_fragmentation',
+    'EnergyProposal',
+    'IncrementalEnergy',
+    'ComponentTracker',
     'clone_memories',
+    'generate_move',
     'generate_neighbor',
+    'NeighborMove',
     'merge_memories',
     'split_memory',
     'post_process'
@@ -0,0 +1,220 @@
+"""
+Connectivity Tracking Module for Memory Annealing Optimizer
+
+This module maintains the connected components of the memory connection graph while
+the annealing optimizer adds and removes memories, so the fragmentation energy term
+can be updated without rebuilding the graph for every structural move.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+
+@dataclass
+class ComponentGroup:
+    """
+    A connected component of a candidate state that differs from the current labelling.
+
+    Attributes:
+        rows: Retained rows that were split off a component losing a memory
+        labels: Unchanged current components that are merged into this group
+        new_items: Indices of new memories (in proposal order) belonging to the group
+    """
+    rows: List[int] = field(default_factory=list)
+    labels: List[int] = field(default_factory=list)
+    new_items: List[int] = field(default_factory=list)
+
+
+@dataclass
+class ComponentChange:
+    """
+    Component structure of a candidate state relative to a ComponentTracker.
+
+    Attributes:
+        count: Number of connected components of the candidate state
+        dropped: Rows removed by the move
+        retired: Current component labels that no longer exist as-is
+        groups: Components that must be relabelled if the move is committed
+    """
+    count: int
+    dropped: List[int]
+    retired: Set[int]
+    groups: List[ComponentGroup]
+
+
+class ComponentTracker:
+    """
+    Connected components of a row-indexed boolean adjacency under node churn.
+
+    Each row of the current graph carries a component label and each label keeps its
+    member rows. Adding memories only unions the components they link to, which costs
+    O(k * n) for k new memories using the links the caller already computed. Removing
+    memories re-checks connectivity among the surviving members of the components
+    that lost a memory; all other components are reused unchanged.
+    """
+
+    def __init__(self, adjacency: np.ndarray, rows: Sequence[int]):
+        """
+        Label the components of the graph induced by ``rows``.
+
+        Args:
+            adjacency: Symmetric boolean adjacency indexed by row
+            rows: Rows that make up the current graph
+        """
+        self._labels: Dict[int, int] = {}
+        self._members: Dict[int, Set[int]] = {}
+        self._next_label = 0
+
+        rows = list(rows)
+        if rows:
+            graph = sparse.csr_matrix(adjacency[np.ix_(rows, rows)])
+            count, assignment = connected_components(graph, directed=False)
+            for _ in range(count):
+                self._new_label()
+            for row, label in zip(rows, assignment):
+                self._labels[row] = int(label)
+                self._members[int(label)].add(row)
+
+    @property
+    def count(self) -> int:
+        """Number of connected components of the current graph."""
+        return len(self._members)
+
+    def preview(
+        self,
+        adjacency: np.ndarray,
+        kept: Sequence[int],
+        dropped: Sequence[int],
+        new_to_kept: np.ndarray,
+        new_to_new: np.ndarray,
+    ) -> ComponentChange:
+        """
+        Compute the components after removing ``dropped`` and adding new memories.
+
+        Args:
+            adjacency: Symmetric boolean adjacency of the current rows
+            kept: Retained rows, in the column order of ``new_to_kept``
+            dropped: Rows removed by the move
+            new_to_kept: Boolean links between new memories and ``kept``
+            new_to_new: Symmetric boolean links among the new memories
+
+        Returns:
+            ComponentChange describing the candidate state
+        """
+        dropped = list(dict.fromkeys(dropped))
+        dropped_set = set(dropped)
+        retired = {self._labels[row] for row in dropped}
+
+        survivors = sorted(
+            row for label in retired for row in self._members[label] if row not in dropped_set
+        )
+        survivor_group: Dict[int, int] = {}
+        n_groups = 0
+        if survivors:
+            graph = sparse.csr_matrix(adjacency[np.ix_(survivors, survivors)])
+            n_groups, assignment = connected_components(graph, directed=False)
+            survivor_group = {row: int(group) for row, group in zip(survivors, assignment)}
+
+        n_new = new_to_new.shape[0]
+        count = self.count - len(retired) + n_groups + n_new
+
+        parent: Dict[Tuple[str, int], Tuple[str, int]] = {}
+
+        def find(node: Tuple[str, int]) -> Tuple[str, int]:
+            root = parent.setdefault(node, node)
+            while root != parent[root]:
+                root = parent[root]
+            while node != root:
+                parent[node], node = root, parent[node]
+            return root
+
+        def union(a: Tuple[str, int], b: Tuple[str, int]) -> bool:
+            root_a, root_b = find(a), find(b)
+            if root_a == root_b:
+                return False
+            parent[root_b] = root_a
+            return True
+
+        for group in range(n_groups):
+            find(("group", group))
+        for a in range(n_new):
+            node = ("new", a)
+            find(node)
+            for b in np.flatnonzero(new_to_kept[a]):
+                row = kept[b]
+                if row in survivor_group:
+                    target = ("group", survivor_group[row])
+                else:
+                    target = ("label", self._labels[row])
+                if union(node, target):
+                    count -= 1
+            for b in np.flatnonzero(new_to_new[a, a + 1:]):
+                if union(node, ("new", a + 1 + int(b))):
+                    count -= 1
+
+        merged: Dict[Tuple[str, int], ComponentGroup] = {}
+        survivor_rows: Dict[int, List[int]] = {}
+        for row, group in survivor_group.items():
+            survivor_rows.setdefault(group, []).append(row)
+        for node in list(parent):
+            target = merged.setdefault(find(node), ComponentGroup())
+            kind, index = node
+            if kind == "group":
+                target.rows.extend(survivor_rows[index])
+            elif kind == "label":
+                target.labels.append(index)
+                retired.add(index)
+            else:
+                target.new_items.append(index)
+
+        return ComponentChange(
+            count=count,
+            dropped=dropped,
+            retired=retired,
+            groups=list(merged.values()),
+        )
+
+    def apply(self, change: ComponentChange, new_rows: Sequence[int]) -> None:
+        """
+        Commit a previewed change.
+
+        Args:
+            change: Change returned by ``preview`` for the accepted move
+            new_rows: Rows assigned to the new memories, in proposal order
+        """
+        for row in change.dropped:
+            del self._labels[row]
+
+        for group in change.groups:
+            # Keep the largest merged component's label to minimise relabelling
+            reused = max(group.labels, key=lambda label: len(self._members[label]), default=None)
+            if reused is None:
+                label, members = self._new_label(), set()
+            else:
+                label, members = reused, self._members[reused]
+            for other in group.labels:
+                if other != reused:
+                    moved = self._members.pop(other)
+                    members.update(moved)
+                    for row in moved:
+                        self._labels[row] = label
+            rows = list(group.rows) + [new_rows[index] for index in group.new_items]
+            members.update(rows)
+            for row in rows:
+                self._labels[row] = label
+            self._members[label] = members
+            change.retired.discard(label)
+
+        for label in change.retired:
+            self._members.pop(label, None)
+
+    def _new_label(self) -> int:
+        """Allocate an unused component label."""
+        label = self._next_label
+        self._next_label += 1
+        self._members[label] = set()
+        return label
@@ -6,8 +6,15 @@ during the annealing optimization process.
 """
 
 import logging
-from typing import Dict, List, Set
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
 
+import numpy as np
+
+from neuroca.memory.annealing.optimizer.components.connectivity import ComponentChange, ComponentTracker
+from neuroca.memory.annealing.optimizer.components.transformations import NeighborMove
 from neuroca.memory.annealing.optimizer.types import OptimizationStrategy
 from neuroca.memory.models.memory_item import MemoryItem
 from neuroca.memory.utils.similarity import calculate_similarity
@@ -15,6 +22,9 @@ from neuroca.memory.utils.similarity import calculate_similarity
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Similarity above which two memories are considered connected
+CONNECTION_THRESHOLD = 0.3
+
 
 def calculate_energy(state: List[MemoryItem], strategy: OptimizationStrategy) -> float:
     """
@@ -125,6 +135,29 @@ def calculate_relevance_energy(state: List[MemoryItem]) -> float:
     return relevance_energy
 
 
+def accept_energy_delta(energy_delta: float, temperature: float) -> bool:
+    """
+    Apply the Metropolis criterion to an energy change.
+    
+    Args:
+        energy_delta: Energy of the candidate state minus energy of the current state
+        temperature: Current temperature
+        
+    Returns:
+        True if the candidate state should be accepted, False otherwise
+    """
+    if energy_delta < 0:
+        # Always accept better states
+        return True
+    
+    if temperature <= 0:
+        # A frozen chain only moves downhill
+        return False
+    
+    # Accept worse states with probability based on temperature
+    return random.random() < math.exp(-energy_delta / temperature)
+
+
 def get_strategy_weights(
     strategy: OptimizationStrategy, 
     redundancy_level: float = 0.0
@@ -183,7 +216,7 @@ def build_connection_graph(state: List[MemoryItem]) -> Dict[int, Set[int]]:
     connection_graph: Dict[int, Set[int]] = {i: set() for i in range(len(state))}
     
     # Connect memories with similarity above threshold
-    similarity_threshold = 0.3
+    similarity_threshold = CONNECTION_THRESHOLD
     for i, mem1 in enumerate(state):
         for j, mem2 in enumerate(state):
             if i != j and calculate_similarity(mem1, mem2) > similarity_threshold:
@@ -232,3 +265,238 @@ def dfs(node: int, graph: Dict[int, Set[int]], visited: Set[int]) -> None:
     for neighbor in graph[node]:
         if neighbor not in visited:
             dfs(neighbor, graph, visited)
+
+
+@dataclass
+class EnergyProposal:
+    """
+    Energy of a candidate neighbour state evaluated against an IncrementalEnergy model.
+
+    Attributes:
+        energy: Total energy of the candidate state
+        delta: Energy difference relative to the current state
+        rows: Matrix row (or -1 for a new memory) of each position in the candidate state
+        new_items: Memories without a cached row, in candidate-state order
+        new_to_kept: Similarities between new memories and retained rows
+        new_to_new: Similarities among the new memories
+        redundancy_sum: Sum of squared pairwise similarities of the candidate state
+        fragmentation: Fragmentation energy of the candidate state
+        relevance: Relevance energy of the candidate state
+        components: Component structure of the candidate state for structural moves
+    """
+    energy: float
+    delta: float
+    rows: List[int]
+    new_items: List[MemoryItem]
+    new_to_kept: np.ndarray
+    new_to_new: np.ndarray
+    redundancy_sum: float
+    fragmentation: float
+    relevance: float
+    components: Optional[ComponentChange] = None
+
+
+class IncrementalEnergy:
+    """
+    Energy model that caches pairwise similarities and evaluates moves by delta.
+
+    The model keeps a symmetric similarity matrix indexed by internal rows and the row
+    assigned to each position of the current state. A neighbour move only touches the
+    memories it replaces, removes or appends, so evaluating it costs O(k * n)
+    ``calculate_similarity`` calls for k touched memories instead of O(n^2). The
+    fragmentation term is maintained by a ComponentTracker: new memories are unioned
+    into the components they link to, and only components that lose a memory are
+    re-checked for splits, so structural moves never rebuild the whole graph.
+
+    Energies are identical to ``calculate_energy`` provided ``calculate_similarity`` is
+    symmetric and does not depend on ``relevance_score``.
+    """
+
+    def __init__(self, state: List[MemoryItem], strategy: OptimizationStrategy):
+        """
+        Build the similarity cache for an initial state.
+
+        Args:
+            state: Initial state of memory fragments
+            strategy: The optimization strategy to use
+        """
+        self.strategy = strategy
+        n = len(state)
+        capacity = max(8, n)
+
+        self._similarity = np.zeros((capacity, capacity), dtype=np.float64)
+        self._adjacency = np.zeros((capacity, capacity), dtype=bool)
+        self._items: List[Optional[MemoryItem]] = [None] * capacity
+        self._free: List[int] = list(range(capacity - 1, n - 1, -1))
+        self._rows: List[int] = list(range(n))
+
+        for i, memory in enumerate(state):
+            self._items[i] = memory
+            for j in range(i + 1, n):
+                sim = calculate_similarity(memory, state[j])
+                self._similarity[i, j] = self._similarity[j, i] = sim
+        self._adjacency[:n, :n] = self._similarity[:n, :n] > CONNECTION_THRESHOLD
+
+        sub = self._similarity[:n, :n]
+        self._redundancy_sum = float(np.square(np.triu(sub, k=1)).sum())
+        self._components = ComponentTracker(self._adjacency, self._rows)
+        self._fragmentation = self._fragmentation_for(self._components.count, n)
+        self._relevance = calculate_relevance_energy(state)
+        self.energy = self._combine(n, self._redundancy_sum, self._fragmentation, self._relevance)
+
+    def propose(self, new_state: List[MemoryItem], move: NeighborMove) -> EnergyProposal:
+        """
+        Evaluate a neighbour state produced from the current state by ``move``.
+
+        Args:
+            new_state: Candidate state returned by ``generate_move``
+            move: Move descriptor returned by ``generate_move``
+
+        Returns:
+            EnergyProposal that can be passed to ``commit`` if accepted
+        """
+        rows = list(self._rows)
+        if move.swapped is not None:
+            i, j = move.swapped
+            rows[i], rows[j] = rows[j], rows[i]
+
+        dropped: List[int] = []
+        for position in move.replaced:
+            dropped.append(rows[position])
+            rows[position] = -1
+        for position in sorted(move.removed, reverse=True):
+            row = rows.pop(position)
+            if row >= 0:
+                dropped.append(row)
+        rows.extend([-1] * move.appended)
+
+        kept = [row for row in rows if row >= 0]
+        new_items = [new_state[pos] for pos, row in enumerate(rows) if row < 0]
+
+        # Similarities of new memories against retained memories and each other
+        new_to_kept = np.zeros((len(new_items), len(kept)), dtype=np.float64)
+        new_to_new = np.zeros((len(new_items), len(new_items)), dtype=np.float64)
+        for a, memory in enumerate(new_items):
+            for b, row in enumerate(kept):
+                new_to_kept[a, b] = calculate_similarity(memory, self._items[row])
+            for b in range(a + 1, len(new_items)):
+                new_to_new[a, b] = new_to_new[b, a] = calculate_similarity(memory, new_items[b])
+
+        redundancy_sum = self._redundancy_sum
+        if dropped:
+            current = self._rows
+            block = np.square(self._similarity[np.ix_(dropped, current)]).sum()
+            within = np.square(self._similarity[np.ix_(dropped, dropped)]).sum() / 2.0
+            redundancy_sum -= float(block - within)
+        redundancy_sum += float(np.square(new_to_kept).sum())
+        redundancy_sum += float(np.square(np.triu(new_to_new, k=1)).sum())
+
+        components = None
+        fragmentation = self._fragmentation
+        if move.structural:
+            components = self._components.preview(
+                self._adjacency,
+                kept,
+                dropped,
+                new_to_kept > CONNECTION_THRESHOLD,
+                new_to_new > CONNECTION_THRESHOLD,
+            )
+            fragmentation = self._fragmentation_for(components.count, len(new_state))
+
+        relevance = calculate_relevance_energy(new_state)
+        energy = self._combine(len(new_state), redundancy_sum, fragmentation, relevance)
+
+        return EnergyProposal(
+            energy=energy,
+            delta=energy - self.energy,
+            rows=rows,
+            new_items=new_items,
+            new_to_kept=new_to_kept,
+            new_to_new=new_to_new,
+            redundancy_sum=redundancy_sum,
+            fragmentation=fragmentation,
+            relevance=relevance,
+            components=components,
+        )
+
+    def commit(self, proposal: EnergyProposal) -> None:
+        """
+        Make an evaluated proposal the current state of the model.
+
+        Args:
+            proposal: Proposal returned by ``propose`` for the accepted move
+        """
+        kept = [row for row in proposal.rows if row >= 0]
+        for row in set(self._rows).difference(kept):
+            self._release(row)
+
+        new_rows = [self._allocate() for _ in proposal.new_items]
+        for row, memory in zip(new_rows, proposal.new_items):
+            self._items[row] = memory
+
+        if new_rows:
+            self._similarity[np.ix_(new_rows, kept)] = proposal.new_to_kept
+            self._similarity[np.ix_(kept, new_rows)] = proposal.new_to_kept.T
+            self._similarity[np.ix_(new_rows, new_rows)] = proposal.new_to_new
+            self._adjacency[np.ix_(new_rows, kept)] = proposal.new_to_kept > CONNECTION_THRESHOLD
+            self._adjacency[np.ix_(kept, new_rows)] = proposal.new_to_kept.T > CONNECTION_THRESHOLD
+            self._adjacency[np.ix_(new_rows, new_rows)] = proposal.new_to_new > CONNECTION_THRESHOLD
+
+        if proposal.components is not None:
+            self._components.apply(proposal.components, new_rows)
+
+        fresh = iter(new_rows)
+        self._rows = [row if row >= 0 else next(fresh) for row in proposal.rows]
+        self._redundancy_sum = proposal.redundancy_sum
+        self._fragmentation = proposal.fragmentation
+        self._relevance = proposal.relevance
+        self.energy = proposal.energy
+
+    def _combine(self, n: int, redundancy_sum: float, fragmentation: float, relevance: float) -> float:
+        """Combine energy components exactly as ``calculate_energy`` does."""
+        if n == 0:
+            return 0.0
+
+        n_pairs = n * (n - 1) / 2
+        redundancy = redundancy_sum / n_pairs if n_pairs > 0 else 0.0
+        weights = get_strategy_weights(self.strategy, redundancy)
+
+        return (
+            weights["redundancy"] * redundancy +
+            weights["fragmentation"] * fragmentation +
+            weights["relevance"] * relevance
+        )
+
+    @staticmethod
+    def _fragmentation_for(components: int, n: int) -> float:
+        """Normalise a component count exactly as ``calculate_fragmentation`` does."""
+        if n == 0:
+            return 0.0
+        return (components - 1) / max(1, n)
+
+    def _allocate(self) -> int:
+        """Return a free matrix row, growing the cache when necessary."""
+        if not self._free:
+            old = self._similarity.shape[0]
+            capacity = old * 2
+
+            similarity = np.zeros((capacity, capacity), dtype=np.float64)
+            similarity[:old, :old] = self._similarity
+            adjacency = np.zeros((capacity, capacity), dtype=bool)
+            adjacency[:old, :old] = self._adjacency
+
+            self._similarity = similarity
+            self._adjacency = adjacency
+            self._items.extend([None] * (capacity - old))
+            self._free = list(range(capacity - 1, old - 1, -1))
+
+        return self._free.pop()
+
+    def _release(self, row: int) -> None:
+        """Clear a matrix row and return it to the free list."""
+        self._similarity[row, :] = 0.0
+        self._similarity[:, row] = 0.0
+        self._adjacency[row, :] = False
+        self._adjacency[:, row] = False
+        self._items[row] = None
+        self._free.append(row)
@@ -7,7 +7,8 @@ to memory fragments during the annealing optimization process.
 
 import logging
 import random
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
 from neuroca.memory.models.memory_item import MemoryItem
 from neuroca.memory.utils.similarity import calculate_similarity
@@ -16,6 +17,27 @@ from neuroca.memory.utils.similarity import calculate_similarity
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class NeighborMove:
+    """
+    Description of the positions touched by a neighbour transformation.
+
+    Positions refer to the state the transformation was applied to. Operations are
+    applied in the order swap, replace, remove (descending), append, which reproduces
+    the list produced by the transformation functions below.
+    """
+    kind: str = "noop"
+    replaced: List[int] = field(default_factory=list)
+    removed: List[int] = field(default_factory=list)
+    appended: int = 0
+    swapped: Optional[Tuple[int, int]] = None
+
+    @property
+    def structural(self) -> bool:
+        """Whether the move changed the set of memories (not just order or weights)."""
+        return bool(self.replaced or self.removed or self.appended)
+
+
 def clone_memories(memories: List[MemoryItem]) -> List[MemoryItem]:
     """
     Create a deep copy of memory fragments for optimization.
@@ -46,8 +68,25 @@ def generate_neighbor(state: List[MemoryItem]) -> List[MemoryItem]:
     Returns:
         New state after applying transformation
     """
+    new_state, _move = generate_move(state)
+    return new_state
+
+
+def generate_move(state: List[MemoryItem]) -> Tuple[List[MemoryItem], NeighborMove]:
+    """
+    Generate a neighboring state together with a description of what changed.
+
+    The move descriptor lets incremental energy models update only the affected
+    memories instead of re-evaluating the whole state.
+
+    Args:
+        state: Current state of memory fragments
+
+    Returns:
+        Tuple of the new state and the NeighborMove that produced it
+    """
     if not state:
-        return []
+        return [], NeighborMove()
 
     # Create a copy of the state
     new_state = clone_memories(state)
@@ -57,32 +96,36 @@ def generate_neighbor(state: List[MemoryItem]) -> List[MemoryItem]:
         "merge", "adjust_weights", "reorder", "prune", "split"
     ])
 
+    move = NeighborMove()
     try:
         if transformation == "merge" and len(new_state) >= 2:
-            apply_merge_transformation(new_state)
+            move = apply_merge_transformation(new_state)
         elif transformation == "split" and new_state:
-            apply_split_transformation(new_state)
+            move = apply_split_transformation(new_state)
         elif transformation == "prune" and new_state:
-            apply_prune_transformation(new_state)
+            move = apply_prune_transformation(new_state)
         elif transformation == "adjust_weights" and new_state:
-            apply_adjust_weights_transformation(new_state)
+            move = apply_adjust_weights_transformation(new_state)
         elif transformation == "reorder" and len(new_state) >= 2:
-            apply_reorder_transformation(new_state)
+            move = apply_reorder_transformation(new_state)
 
     except Exception as e:
         # Log error but continue with original state
         logger.warning(f"Error generating neighbor state: {str(e)}")
-        return state
+        return state, NeighborMove()
 
-    return new_state
+    return new_state, move
 
 
-def apply_merge_transformation(state: List[MemoryItem]) -> None:
+def apply_merge_transformation(state: List[MemoryItem]) -> NeighborMove:
     """
     Apply merge transformation to the state.
 
     Args:
         state: Current state to modify
+
+    Returns:
+        Description of the applied move
     """
     # Merge two similar memories
     idx1, idx2 = random.sample(range(len(state)), 2)
@@ -95,14 +138,20 @@ def apply_merge_transformation(state: List[MemoryItem]) -> None:
         smaller_idx, larger_idx = (idx1, idx2) if idx1 < idx2 else (idx2, idx1)
         state[smaller_idx] = merged
         state.pop(larger_idx)
+        return NeighborMove(kind="merge", replaced=[smaller_idx], removed=[larger_idx])
+
+    return NeighborMove()
 
 
-def apply_split_transformation(state: List[MemoryItem]) -> None:
+def apply_split_transformation(state: List[MemoryItem]) -> NeighborMove:
     """
     Apply split transformation to the state.
 
     Args:
         state: Current state to modify
+
+    Returns:
+        Description of the applied move
     """
     # Split a memory into components
     idx = random.randrange(len(state))
@@ -116,14 +165,20 @@ def apply_split_transformation(state: List[MemoryItem]) -> None:
             state[idx] = components[0]
             for comp in components[1:]:
                 state.append(comp)
+            return NeighborMove(kind="split", replaced=[idx], appended=len(components) - 1)
 
+    return NeighborMove()
 
-def apply_prune_transformation(state: List[MemoryItem]) -> None:
+
+def apply_prune_transformation(state: List[MemoryItem]) -> NeighborMove:
     """
     Apply prune transformation to the state.
 
     Args:
         state: Current state to modify
+
+    Returns:
+        Description of the applied move
     """
     # Prune a low-relevance memory
     # Sort by relevance and consider bottom 30% as candidates
@@ -136,14 +191,20 @@ def apply_prune_transformation(state: List[MemoryItem]) -> None:
     if prune_candidates:
         idx_to_prune = random.choice(prune_candidates)
         state.pop(idx_to_prune)
+        return NeighborMove(kind="prune", removed=[idx_to_prune])
+
+    return NeighborMove()
 
 
-def apply_adjust_weights_transformation(state: List[MemoryItem]) -> None:
+def apply_adjust_weights_transformation(state: List[MemoryItem]) -> NeighborMove:
     """
     Apply adjust weights transformation to the state.
 
     Args:
         state: Current state to modify
+
+    Returns:
+        Description of the applied move
     """
     # Adjust memory weights
     idx = random.randrange(len(state))
@@ -152,18 +213,23 @@ def apply_adjust_weights_transformation(state: List[MemoryItem]) -> None:
     # Adjust relevance score slightly
     adjustment = random.uniform(-0.1, 0.1)
     memory.relevance_score = max(0.0, min(1.0, memory.relevance_score + adjustment))
+    return NeighborMove(kind="adjust_weights")
 
 
-def apply_reorder_transformation(state: List[MemoryItem]) -> None:
+def apply_reorder_transformation(state: List[MemoryItem]) -> NeighborMove:
     """
     Apply reorder transformation to the state.
 
     Args:
         state: Current state to modify
+
+    Returns:
+        Description of the applied move
     """
     # Reorder memories (swap two random memories)
     idx1, idx2 = random.sample(range(len(state)), 2)
     state[idx1], state[idx2] = state[idx2], state[idx1]
+    return NeighborMove(kind="reorder", swapped=(idx1, idx2))
 
 
 def merge_memories(mem1: MemoryItem, mem2: MemoryItem) -> MemoryItem:
@@ -7,7 +7,6 @@ aspects of the optimization process.
 """
 
 import logging
-import math
 import random
 import time
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
@@ -17,12 +16,15 @@ import numpy as np
 from neuroca.config.settings import get_settings
 from neuroca.core.exceptions import OptimizationError, ValidationError
 from neuroca.memory.annealing.optimizer.types import OptimizationStrategy
+from neuroca.memory.annealing.optimizer.parallel import ParallelTempering
 from neuroca.memory.annealing.optimizer.stats import OptimizationStats
 from neuroca.memory.annealing.optimizer.schedules.base import AnnealingSchedule
 from neuroca.memory.annealing.optimizer.schedules.exponential import ExponentialAnnealingSchedule
-from neuroca.memory.annealing.optimizer.components.energy import calculate_energy
+from neuroca.memory.annealing.optimizer.components.energy import (
+    IncrementalEnergy, accept_energy_delta, calculate_energy
+)
 from neuroca.memory.annealing.optimizer.components.transformations import (
-    clone_memories, generate_neighbor, post_process
+    clone_memories, generate_move, generate_neighbor, post_process
 )
 from neuroca.memory.models.memory_item import MemoryItem
 from neuroca.memory.interfaces.memory_store import MemoryStore
@@ -48,7 +50,11 @@ class AnnealingOptimizer:
         max_iterations: int = 1000,
         early_stopping_threshold: float = 0.001,
         early_stopping_iterations: int = 50,
-        random_seed: Optional[int] = None
+        random_seed: Optional[int] = None,
+        incremental_energy: bool = True,
+        num_chains: int = 1,
+        exchange_interval: int = 50,
+        temperature_ratio: float = 2.0
     ):
         """
         Initialize the annealing optimizer.
@@ -61,6 +67,12 @@ class AnnealingOptimizer:
             early_stopping_threshold: Energy change threshold for early stopping (default: 0.001)
             early_stopping_iterations: Number of iterations below threshold to trigger early stopping (default: 50)
             random_seed: Seed for random number generator (default: None)
+            incremental_energy: Evaluate moves by energy delta against a cached similarity
+                matrix instead of recomputing the full energy (default: True)
+            num_chains: Number of replicas; values above 1 run parallel tempering with one
+                process per chain (default: 1)
+            exchange_interval: Steps between replica exchange attempts (default: 50)
+            temperature_ratio: Temperature ratio between neighbouring replicas (default: 2.0)
             
         Raises:
             ValidationError: If configuration parameters are invalid
@@ -75,11 +87,18 @@ class AnnealingOptimizer:
             raise ValidationError("Early stopping threshold must be non-negative")
         if early_stopping_iterations <= 0:
             raise ValidationError("Early stopping iterations must be positive")
+        if num_chains <= 0:
+            raise ValidationError("Number of chains must be positive")
             
         self.max_iterations = max_iterations
         self.early_stopping_threshold = early_stopping_threshold
         self.early_stopping_iterations = early_stopping_iterations
         self.strategy = strategy
+        self.incremental_energy = incremental_energy
+        self.num_chains = num_chains
+        self.exchange_interval = exchange_interval
+        self.temperature_ratio = temperature_ratio
+        self.random_seed = random_seed
         
         # Set random seed if provided
         if random_seed is not None:
@@ -89,9 +108,21 @@ class AnnealingOptimizer:
         # Set annealing schedule
         self.annealing_schedule = annealing_schedule or ExponentialAnnealingSchedule()
         
+        # Multi-chain driver (validated eagerly so bad settings fail at construction)
+        self._parallel: Optional[ParallelTempering] = None
+        if num_chains > 1:
+            self._parallel = ParallelTempering(
+                schedule=self.annealing_schedule,
+                strategy=strategy,
+                num_chains=num_chains,
+                exchange_interval=exchange_interval,
+                temperature_ratio=temperature_ratio,
+            )
+        
         logger.info(
             f"Initialized AnnealingOptimizer with strategy={strategy.name}, "
-            f"max_iterations={max_iterations}, schedule={type(self.annealing_schedule).__name__}"
+            f"max_iterations={max_iterations}, schedule={type(self.annealing_schedule).__name__}, "
+            f"chains={num_chains}"
         )
         
     def optimize(
@@ -143,7 +174,10 @@ class AnnealingOptimizer:
             
         try:
             # Execute the annealing process
-            optimized_fragments, stats = self._run_annealing_process(memory_fragments, callbacks)
+            if self._parallel is not None:
+                optimized_fragments, stats = self._run_parallel_tempering(memory_fragments, callbacks)
+            else:
+                optimized_fragments, stats = self._run_annealing_process(memory_fragments, callbacks)
             
             # Return in the same format as input
             if using_memory_store:
@@ -180,8 +214,9 @@ class AnnealingOptimizer:
         # Start timing
         start_time = time.time()
         
-        # Calculate initial energy
-        current_energy = calculate_energy(current_state, self.strategy)
+        # Calculate initial energy (building the similarity cache when incremental)
+        energy_model = IncrementalEnergy(current_state, self.strategy) if self.incremental_energy else None
+        current_energy = energy_model.energy if energy_model else calculate_energy(current_state, self.strategy)
         initial_energy = current_energy
         
         # Initialize tracking variables
@@ -204,12 +239,20 @@ class AnnealingOptimizer:
             temperature = self.annealing_schedule.get_temperature(iteration, self.max_iterations)
             temperature_history.append(temperature)
             
-            # Generate neighbor state
-            neighbor_state = generate_neighbor(current_state)
-            neighbor_energy = calculate_energy(neighbor_state, self.strategy)
+            # Generate neighbor state and evaluate its energy
+            proposal = None
+            if energy_model is not None:
+                neighbor_state, move = generate_move(current_state)
+                proposal = energy_model.propose(neighbor_state, move)
+                neighbor_energy = proposal.energy
+                energy_delta = proposal.delta
+            else:
+                neighbor_state = generate_neighbor(current_state)
+                neighbor_energy = calculate_energy(neighbor_state, self.strategy)
+                energy_delta = neighbor_energy - current_energy
             
             # Decide whether to accept the new state
-            accept = self._decide_acceptance(current_energy, neighbor_energy, temperature)
+            accept = self._accept_delta(energy_delta, temperature)
             
             # Update adaptive schedule if used
             if adaptive_schedule:
@@ -217,6 +260,8 @@ class AnnealingOptimizer:
             
             # Update state if accepted
             if accept:
+                if proposal is not None:
+                    energy_model.commit(proposal)
                 current_state = neighbor_state
                 current_energy = neighbor_energy
                 accepted_moves += 1
@@ -284,6 +329,38 @@ class AnnealingOptimizer:
         
         return optimized_memories, stats
     
+    def _run_parallel_tempering(
+        self,
+        memory_fragments: List[MemoryItem],
+        callbacks: Optional[List[Callable[[Dict[str, Any]], None]]] = None
+    ) -> Tuple[List[MemoryItem], OptimizationStats]:
+        """
+        Run multi-chain annealing with replica exchange across a process pool.
+        
+        Callbacks are invoked once per exchange round rather than per iteration.
+        
+        Args:
+            memory_fragments: List of memory fragments to optimize
+            callbacks: Optional list of callback functions
+            
+        Returns:
+            Tuple containing optimized fragments and merged statistics
+        """
+        def dispatch(data: Dict[str, Any]) -> None:
+            for callback in callbacks or []:
+                callback(data)
+        
+        best_state, stats = self._parallel.run(
+            memory_fragments,
+            max_iterations=self.max_iterations,
+            random_seed=self.random_seed,
+            early_stopping_threshold=self.early_stopping_threshold,
+            early_stopping_iterations=self.early_stopping_iterations,
+            callback=dispatch if callbacks else None,
+        )
+        
+        return post_process(best_state), stats
+    
     def _decide_acceptance(self, current_energy: float, neighbor_energy: float, temperature: float) -> bool:
         """
         Decide whether to accept a new state.
@@ -296,14 +373,20 @@ class AnnealingOptimizer:
         Returns:
             True if the new state should be accepted, False otherwise
         """
-        if neighbor_energy < current_energy:
-            # Always accept better states
-            return True
-        else:
-            # Accept worse states with probability based on temperature
-            energy_delta = neighbor_energy - current_energy
-            acceptance_probability = math.exp(-energy_delta / temperature)
-            return random.random() < acceptance_probability
+        return self._accept_delta(neighbor_energy - current_energy, temperature)
+    
+    def _accept_delta(self, energy_delta: float, temperature: float) -> bool:
+        """
+        Apply the Metropolis criterion to an energy change.
+        
+        Args:
+            energy_delta: Energy of the neighbor state minus energy of the current state
+            temperature: Current temperature
+            
+        Returns:
+            True if the new state should be accepted, False otherwise
+        """
+        return accept_energy_delta(energy_delta, temperature)
     
     def _should_stop_early(
         self, 
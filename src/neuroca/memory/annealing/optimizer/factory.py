@@ -71,7 +71,8 @@ def create_optimizer(
     valid_params = {
         k: v for k, v in kwargs.items() 
         if k in ["max_iterations", "early_stopping_threshold", 
-                "early_stopping_iterations", "random_seed"]
+                "early_stopping_iterations", "random_seed", "incremental_energy",
+                "num_chains", "exchange_interval", "temperature_ratio"]
     }
     
     return AnnealingOptimizer(
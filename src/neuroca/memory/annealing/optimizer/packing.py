@@ -0,0 +1,157 @@
+"""
+Memory Packing Module for Parallel Tempering
+
+This module provides the compact payload used to ship memory fragments to parallel
+tempering worker processes. ``PackedMemories`` stores contents and tags as UTF-8 text
+buffers plus NumPy arrays for offsets, relevance and timestamps, so sending a state to a
+worker costs a few buffers instead of pickled pydantic models. Workers operate on
+``PackedFragment`` instances, which expose the attributes the annealing transformations
+use, and ``rehydrate`` rebuilds full memory items from them once a run completes.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Sequence
+
+import numpy as np
+
+from neuroca.memory.models.memory_item import MemoryItem
+
+# Separator used to pack tag lists into a single string
+_TAG_SEPARATOR = "\x1f"
+
+
+class PackedFragment:
+    """
+    Lightweight memory fragment used inside chain worker processes.
+
+    Exposes the attributes the annealing transformations operate on. ``source`` is the
+    index of the original memory the fragment derives from and is used to rebuild full
+    memory items once the run completes.
+    """
+
+    __slots__ = ("content", "relevance_score", "tags", "created_at", "source")
+
+    def __init__(self, content: str, relevance_score: float, tags: List[str], created_at: float, source: int):
+        self.content = content
+        self.relevance_score = relevance_score
+        self.tags = tags
+        self.created_at = created_at
+        self.source = source
+
+    def clone(self) -> "PackedFragment":
+        """Create a copy of the fragment."""
+        return PackedFragment(self.content, self.relevance_score, list(self.tags), self.created_at, self.source)
+
+
+@dataclass
+class PackedMemories:
+    """
+    Compact, array-backed representation of a list of memory fragments.
+
+    Attributes:
+        text: UTF-8 encoded contents, concatenated
+        text_offsets: Start offset of each content in ``text`` (length n + 1)
+        tags: UTF-8 encoded tag lists, concatenated
+        tag_offsets: Start offset of each tag list in ``tags`` (length n + 1)
+        relevance: Relevance score of each fragment
+        created_at: Creation timestamp (seconds since epoch) of each fragment
+        source: Index of the original memory each fragment derives from
+    """
+    text: bytes
+    text_offsets: np.ndarray
+    tags: bytes
+    tag_offsets: np.ndarray
+    relevance: np.ndarray
+    created_at: np.ndarray
+    source: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.relevance.shape[0])
+
+    @classmethod
+    def pack(cls, fragments: Sequence[Any]) -> "PackedMemories":
+        """
+        Pack memory items or fragments into arrays.
+
+        Args:
+            fragments: Memory items (or PackedFragment instances) to pack
+
+        Returns:
+            Packed representation
+        """
+        texts = [str(fragment.content).encode("utf-8") for fragment in fragments]
+        tags = [_TAG_SEPARATOR.join(fragment.tags or []).encode("utf-8") for fragment in fragments]
+
+        return cls(
+            text=b"".join(texts),
+            text_offsets=np.cumsum([0] + [len(t) for t in texts], dtype=np.int64),
+            tags=b"".join(tags),
+            tag_offsets=np.cumsum([0] + [len(t) for t in tags], dtype=np.int64),
+            relevance=np.fromiter((f.relevance_score for f in fragments), dtype=np.float64, count=len(fragments)),
+            created_at=np.fromiter(
+                (_to_timestamp(f.created_at) for f in fragments), dtype=np.float64, count=len(fragments)
+            ),
+            source=np.fromiter(
+                (getattr(f, "source", index) for index, f in enumerate(fragments)),
+                dtype=np.int64,
+                count=len(fragments),
+            ),
+        )
+
+    def unpack(self) -> List[PackedFragment]:
+        """
+        Rebuild lightweight fragments from the packed arrays.
+
+        Returns:
+            List of PackedFragment instances
+        """
+        fragments = []
+        text_offsets = self.text_offsets.tolist()
+        tag_offsets = self.tag_offsets.tolist()
+        for i in range(len(self)):
+            raw_tags = self.tags[tag_offsets[i]:tag_offsets[i + 1]].decode("utf-8")
+            fragments.append(PackedFragment(
+                content=self.text[text_offsets[i]:text_offsets[i + 1]].decode("utf-8"),
+                relevance_score=float(self.relevance[i]),
+                tags=raw_tags.split(_TAG_SEPARATOR) if raw_tags else [],
+                created_at=float(self.created_at[i]),
+                source=int(self.source[i]),
+            ))
+        return fragments
+
+
+def _to_timestamp(value: Any) -> float:
+    """Convert a datetime or numeric creation time to seconds since epoch."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value or 0.0)
+
+
+def rehydrate(fragments: Sequence[PackedFragment], originals: Sequence[MemoryItem]) -> List[MemoryItem]:
+    """
+    Rebuild full memory items from optimized fragments.
+
+    Each fragment is applied to a clone of the original memory it derives from, so
+    fields the optimizer does not touch are preserved.
+
+    Args:
+        fragments: Optimized fragments
+        originals: Memories the optimization started from
+
+    Returns:
+        List of memory items
+    """
+    result = []
+    for fragment in fragments:
+        memory = originals[fragment.source].clone()
+        memory.content = fragment.content
+        memory.relevance_score = fragment.relevance_score
+        memory.tags = list(fragment.tags)
+        original_created = originals[fragment.source].created_at
+        if isinstance(original_created, datetime):
+            memory.created_at = datetime.fromtimestamp(fragment.created_at, tz=original_created.tzinfo)
+        else:
+            memory.created_at = fragment.created_at
+        result.append(memory)
+    return result
@@ -0,0 +1,351 @@
+"""
+Parallel Tempering Module
+
+This module runs several annealing chains at different temperatures in separate
+processes and periodically exchanges replicas between neighbouring temperatures
+(parallel tempering / replica exchange Monte Carlo). Hot chains explore the memory
+space freely while cold chains refine; exchanges let good configurations found by hot
+chains migrate to the cold end of the ladder.
+
+Each chain is pinned to its own single-worker ``ProcessPoolExecutor`` and keeps its
+state, similarity cache and random stream in that process for the whole run; with
+``in_process=True`` the same chains run in the calling process instead. The initial
+memories are sent once as a ``PackedMemories`` payload (see ``packing``) rather than
+pickled pydantic models, and replica exchange swaps temperature slots instead of
+states, so only scalars and small arrays cross process boundaries during optimization.
+"""
+
+import logging
+import math
+import random
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from neuroca.core.exceptions import ValidationError
+from neuroca.memory.annealing.optimizer.components.energy import IncrementalEnergy, accept_energy_delta
+from neuroca.memory.annealing.optimizer.components.transformations import generate_move
+from neuroca.memory.annealing.optimizer.packing import PackedMemories, rehydrate
+from neuroca.memory.annealing.optimizer.schedules.base import AnnealingSchedule
+from neuroca.memory.annealing.optimizer.stats import OptimizationStats
+from neuroca.memory.annealing.optimizer.types import OptimizationStrategy
+from neuroca.memory.models.memory_item import MemoryItem
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+@dataclass
+class SegmentResult:
+    """Outcome of advancing one chain by a segment of steps."""
+    energy: float
+    best_energy: float
+    accepted: np.ndarray
+    energies: np.ndarray
+
+
+class _ChainState:
+    """
+    State of a single annealing chain.
+
+    Each chain keeps its own random number generator state and installs it only while
+    it is advancing, so a chain produces the same sequence of moves whether it owns a
+    worker process or shares the calling process with the other chains.
+    """
+
+    def __init__(self, packed: PackedMemories, strategy: OptimizationStrategy, seed: int):
+        self.state = packed.unpack()
+        self.model = IncrementalEnergy(self.state, strategy)
+        self.best_state = self.state
+        self.best_energy = self.model.energy
+        self.rng_state = random.Random(seed).getstate()
+
+
+# Chains owned by the current process, keyed by chain index. A worker process holds one
+# chain; in-process runs hold all of them.
+_CHAINS: Dict[int, _ChainState] = {}
+
+
+def _init_chain(chain: int, packed: PackedMemories, strategy_name: str, seed: int) -> None:
+    """Executor initializer: build the state of one chain in this process."""
+    _CHAINS[chain] = _ChainState(packed, OptimizationStrategy[strategy_name], seed)
+
+
+def _chain_energy(chain: int) -> float:
+    """Return the current energy of a process-local chain."""
+    return _CHAINS[chain].model.energy
+
+
+def _advance_chain(chain: int, temperatures: np.ndarray) -> SegmentResult:
+    """
+    Run one annealing step per temperature on a process-local chain.
+
+    Args:
+        chain: Index of the chain to advance
+        temperatures: Temperature to use at each step
+
+    Returns:
+        SegmentResult describing the segment
+    """
+    state = _CHAINS[chain]
+    accepted = np.zeros(len(temperatures), dtype=bool)
+    energies = np.empty(len(temperatures), dtype=np.float64)
+
+    # The transformations draw from the global generator; swap in the chain's stream
+    outer_rng_state = random.getstate()
+    random.setstate(state.rng_state)
+    try:
+        for step, temperature in enumerate(temperatures.tolist()):
+            neighbor_state, move = generate_move(state.state)
+            proposal = state.model.propose(neighbor_state, move)
+            if accept_energy_delta(proposal.delta, temperature):
+                state.model.commit(proposal)
+                state.state = neighbor_state
+                accepted[step] = True
+                if state.model.energy < state.best_energy:
+                    state.best_state = state.state
+                    state.best_energy = state.model.energy
+            energies[step] = state.model.energy
+    finally:
+        state.rng_state = random.getstate()
+        random.setstate(outer_rng_state)
+
+    return SegmentResult(
+        energy=state.model.energy,
+        best_energy=state.best_energy,
+        accepted=accepted,
+        energies=energies,
+    )
+
+
+def _export_best(chain: int) -> Tuple[float, PackedMemories]:
+    """Return the best energy and packed best state of a process-local chain."""
+    state = _CHAINS[chain]
+    return state.best_energy, PackedMemories.pack(state.best_state)
+
+
+def _release_chain(chain: int) -> None:
+    """Drop a process-local chain."""
+    _CHAINS.pop(chain, None)
+
+
+class _InlineExecutor:
+    """Executor stand-in that runs a chain's work synchronously in the calling process."""
+
+    def __init__(self, initializer: Callable[..., None], initargs: Tuple[Any, ...]):
+        initializer(*initargs)
+        self._chain = initargs[0]
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        _release_chain(self._chain)
+
+
+class ParallelTempering:
+    """
+    Multi-chain annealing with periodic replica exchange across a process pool.
+
+    Chain temperatures follow the base schedule scaled by a geometric ladder: the
+    replica in slot k runs at ``schedule.get_temperature(step) * temperature_ratio ** k``.
+    After every ``exchange_interval`` steps, neighbouring slots attempt a Metropolis
+    swap of their replicas.
+    """
+
+    def __init__(
+        self,
+        schedule: AnnealingSchedule,
+        strategy: OptimizationStrategy = OptimizationStrategy.STANDARD,
+        num_chains: int = 4,
+        exchange_interval: int = 50,
+        temperature_ratio: float = 2.0,
+        in_process: bool = False,
+    ):
+        """
+        Initialize the parallel tempering driver.
+
+        Args:
+            schedule: Base temperature schedule (used for the coldest slot)
+            strategy: Optimization strategy to use (default: STANDARD)
+            num_chains: Number of replicas, one process each (default: 4)
+            exchange_interval: Steps between replica exchange attempts (default: 50)
+            temperature_ratio: Temperature ratio between neighbouring slots (default: 2.0)
+            in_process: Run every chain in the calling process instead of a process
+                pool. Results are identical for the same seed; useful for debugging
+                and for inputs too small to amortize process start-up (default: False)
+
+        Raises:
+            ValidationError: If parameters are invalid
+        """
+        if num_chains < 2:
+            raise ValidationError("Parallel tempering requires at least two chains")
+        if exchange_interval <= 0:
+            raise ValidationError("Exchange interval must be positive")
+        if temperature_ratio <= 1.0:
+            raise ValidationError("Temperature ratio must be greater than 1")
+
+        self.schedule = schedule
+        self.strategy = strategy
+        self.num_chains = num_chains
+        self.exchange_interval = exchange_interval
+        self.temperature_ratio = temperature_ratio
+        self.in_process = in_process
+
+    def run(
+        self,
+        memory_fragments: List[MemoryItem],
+        max_iterations: int,
+        random_seed: Optional[int] = None,
+        early_stopping_threshold: float = 0.0,
+        early_stopping_iterations: Optional[int] = None,
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Tuple[List[MemoryItem], OptimizationStats]:
+        """
+        Optimize memory fragments with parallel tempering.
+
+        Args:
+            memory_fragments: Memories to optimize
+            max_iterations: Steps per chain
+            random_seed: Base seed; chain k uses ``random_seed + k`` (default: random)
+            early_stopping_threshold: Minimum best-energy improvement that resets the
+                early stopping counter (default: 0.0)
+            early_stopping_iterations: Steps without improvement before stopping
+                (default: None, never stop early)
+            callback: Optional function called after every exchange round
+
+        Returns:
+            Tuple of the best state found (as memory items) and merged statistics
+        """
+        start_time = time.time()
+        rng = random.Random(random_seed)
+        base_seed = random_seed if random_seed is not None else rng.randrange(2 ** 31)
+        packed = PackedMemories.pack(memory_fragments)
+
+        executors = []
+        for chain in range(self.num_chains):
+            initargs = (chain, packed, self.strategy.name, base_seed + chain)
+            if self.in_process:
+                executors.append(_InlineExecutor(_init_chain, initargs))
+            else:
+                executors.append(ProcessPoolExecutor(max_workers=1, initializer=_init_chain, initargs=initargs))
+
+        try:
+            energies = [
+                f.result() for f in [e.submit(_chain_energy, chain) for chain, e in enumerate(executors)]
+            ]
+            initial_energy = energies[0]
+            best_energies = list(energies)
+
+            # chain_at_slot[k] is the chain currently running at ladder slot k
+            chain_at_slot = list(range(self.num_chains))
+            accepted = [0] * self.num_chains
+            steps_done = [0] * self.num_chains
+            temperature_history: List[float] = []
+            energy_history: List[float] = [initial_energy]
+            exchange_attempts = 0
+            exchange_accepts = 0
+            overall_best = initial_energy
+            last_improvement = 0
+
+            step = 0
+            round_index = 0
+            while step < max_iterations:
+                count = min(self.exchange_interval, max_iterations - step)
+                base = np.array(
+                    [self.schedule.get_temperature(step + i, max_iterations) for i in range(count)],
+                    dtype=np.float64,
+                )
+
+                futures = {}
+                for slot, chain in enumerate(chain_at_slot):
+                    temperatures = base * (self.temperature_ratio ** slot)
+                    futures[chain] = executors[chain].submit(_advance_chain, chain, temperatures)
+                results = {chain: future.result() for chain, future in futures.items()}
+
+                for chain, result in results.items():
+                    energies[chain] = result.energy
+                    best_energies[chain] = result.best_energy
+                    accepted[chain] += int(result.accepted.sum())
+                    steps_done[chain] += count
+
+                coldest = results[chain_at_slot[0]]
+                temperature_history.extend(base.tolist())
+                energy_history.extend(coldest.energies.tolist())
+                if hasattr(self.schedule, "record_acceptance"):
+                    for flag in coldest.accepted.tolist():
+                        self.schedule.record_acceptance(flag)  # type: ignore
+
+                step += count
+
+                # Attempt swaps between neighbouring slots, alternating even and odd pairs
+                final_temperature = float(base[-1])
+                for slot in range(round_index % 2, self.num_chains - 1, 2):
+                    cold, hot = chain_at_slot[slot], chain_at_slot[slot + 1]
+                    beta_cold = 1.0 / (final_temperature * self.temperature_ratio ** slot)
+                    beta_hot = 1.0 / (final_temperature * self.temperature_ratio ** (slot + 1))
+                    exponent = (beta_cold - beta_hot) * (energies[cold] - energies[hot])
+                    exchange_attempts += 1
+                    if exponent >= 0 or rng.random() < math.exp(exponent):
+                        chain_at_slot[slot], chain_at_slot[slot + 1] = hot, cold
+                        exchange_accepts += 1
+                round_index += 1
+
+                round_best = min(best_energies)
+                if overall_best - round_best > early_stopping_threshold:
+                    overall_best = round_best
+                    last_improvement = step
+
+                if callback:
+                    callback({
+                        "iteration": step,
+                        "temperature": final_temperature,
+                        "current_energy": energies[chain_at_slot[0]],
+                        "best_energy": round_best,
+                        "exchange_acceptance_ratio": exchange_accepts / max(1, exchange_attempts),
+                        "chain_energies": list(energies),
+                    })
+
+                if early_stopping_iterations is not None and step - last_improvement >= early_stopping_iterations:
+                    logger.info(f"Parallel tempering stopping early at step {step}: no improvement")
+                    break
+
+            best_chain = min(range(self.num_chains), key=lambda c: best_energies[c])
+            best_energy, best_packed = executors[best_chain].submit(_export_best, best_chain).result()
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
+
+        duration = time.time() - start_time
+        coldest_first = [chain_at_slot[0]] + [c for c in range(self.num_chains) if c != chain_at_slot[0]]
+        chain_stats = []
+        for chain in coldest_first:
+            is_coldest = chain == chain_at_slot[0]
+            chain_stats.append(OptimizationStats(
+                initial_energy=initial_energy,
+                final_energy=best_energies[chain],
+                iterations=steps_done[chain],
+                accepted_moves=accepted[chain],
+                rejected_moves=steps_done[chain] - accepted[chain],
+                duration_seconds=duration,
+                temperature_history=temperature_history if is_coldest else [],
+                energy_history=energy_history if is_coldest else [],
+            ))
+        stats = OptimizationStats.merge(chain_stats)
+        stats.exchange_attempts = exchange_attempts
+        stats.exchange_accepts = exchange_accepts
+
+        logger.info(
+            f"Parallel tempering with {self.num_chains} chains completed in {duration:.2f}s: "
+            f"best energy {best_energy:.4f}, exchange acceptance "
+            f"{exchange_accepts}/{exchange_attempts}"
+        )
+
+        return rehydrate(best_packed.unpack(), memory_fragments), stats
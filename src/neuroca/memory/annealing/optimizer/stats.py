@@ -6,7 +6,7 @@ the results of memory optimization operations.
 """
 
 from dataclasses import dataclass
-from typing import Any, List
+from typing import Any, List, Sequence
 
 
 @dataclass
@@ -21,6 +21,41 @@ class OptimizationStats:
     duration_seconds: float
     temperature_history: List[float]
     energy_history: List[float]
+    chains: int = 1
+    exchange_attempts: int = 0
+    exchange_accepts: int = 0
+    
+    @classmethod
+    def merge(cls, chain_stats: Sequence["OptimizationStats"]) -> "OptimizationStats":
+        """
+        Combine per-chain statistics from a multi-chain run.
+        
+        Move counts are summed across chains, energies report the best chain, and the
+        histories are taken from the first entry (by convention the coldest replica).
+        
+        Args:
+            chain_stats: Statistics of each chain, coldest first
+            
+        Returns:
+            Merged statistics
+        """
+        if not chain_stats:
+            raise ValueError("At least one chain is required to merge statistics")
+        
+        coldest = chain_stats[0]
+        return cls(
+            initial_energy=min(s.initial_energy for s in chain_stats),
+            final_energy=min(s.final_energy for s in chain_stats),
+            iterations=sum(s.iterations for s in chain_stats),
+            accepted_moves=sum(s.accepted_moves for s in chain_stats),
+            rejected_moves=sum(s.rejected_moves for s in chain_stats),
+            duration_seconds=max(s.duration_seconds for s in chain_stats),
+            temperature_history=list(coldest.temperature_history),
+            energy_history=list(coldest.energy_history),
+            chains=sum(s.chains for s in chain_stats),
+            exchange_attempts=sum(s.exchange_attempts for s in chain_stats),
+            exchange_accepts=sum(s.exchange_accepts for s in chain_stats),
+        )
     
     @property
     def acceptance_ratio(self) -> float:
@@ -46,5 +81,8 @@ class OptimizationStats:
             "rejected_moves": self.rejected_moves,
             "duration_seconds": self.duration_seconds,
             "acceptance_ratio": self.acceptance_ratio,
-            "energy_reduction": self.energy_reduction
+            "energy_reduction": self.energy_reduction,
+            "chains": self.chains,
+            "exchange_attempts": self.exchange_attempts,
+            "exchange_accepts": self.exchange_accepts
         }
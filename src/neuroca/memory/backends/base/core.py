@@ -17,6 +17,7 @@ from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar, Unio
 from neuroca.memory.backends.base.batch import BatchOperations
 from neuroca.memory.backends.base.operations import CoreOperations
 from neuroca.memory.backends.base.stats import BackendStats
+from neuroca.memory.backends.keyset import SeekKey
 from neuroca.memory.backends.policies import (
     BackendOperationPolicy,
     DEFAULT_OPERATION_POLICY,
@@ -387,6 +388,20 @@ class BaseStorageBackend(StorageBackendInterface, CoreOperations, BatchOperation
 
         return await self._execute_with_policy("query", _call)
 
+    async def seek(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        after: Optional[SeekKey] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """Seek a keyset page of items while respecting the configured policy."""
+        self.stats.update_stat("query_count")
+
+        def _call() -> Awaitable[List[Dict[str, Any]]]:
+            return CoreOperations.seek(self, filters=filters, after=after, limit=limit)
+
+        return await self._execute_with_policy("seek", _call)
+
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:  # type: ignore[override]
         """Count items while respecting the configured policy."""
 
@@ -6,9 +6,11 @@ CRUD operations that all storage backends must support.
 """
 
 import abc
+import heapq
 import logging
 from typing import Any, Dict, List, Optional
 
+from neuroca.memory.backends.keyset import SeekKey, is_after, row_seek_key
 from neuroca.memory.exceptions import (
     StorageOperationError,
     ItemExistsError,
@@ -208,6 +210,38 @@ class CoreOperations(abc.ABC):
                 message=f"Failed to query items: {str(e)}"
             ) from e
     
+    async def seek(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        after: Optional[SeekKey] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return items ordered by ``(created_at, id)`` following a keyset boundary.
+        
+        Args:
+            filters: Dict of field-value pairs to filter by
+            after: Key of the last item of the previous page (None for the first page)
+            limit: Maximum number of results to return
+            
+        Returns:
+            Up to ``limit`` matching items sorting strictly after ``after``
+            
+        Raises:
+            StorageOperationError: If the seek operation fails
+        """
+        self._ensure_initialized()
+        
+        try:
+            return await self._seek_items(filters, after, limit)
+        except Exception as e:
+            logger.exception("Failed to seek items")
+            raise StorageOperationError(
+                operation="seek",
+                backend_type=self.__class__.__name__,
+                message=f"Failed to seek items: {str(e)}"
+            ) from e
+    
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
         Count items in storage, optionally filtered.
@@ -309,6 +343,25 @@ class CoreOperations(abc.ABC):
         """Query items in the specific backend."""
         pass
     
+    async def _seek_items(
+        self,
+        filters: Optional[Dict[str, Any]],
+        after: Optional[SeekKey],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Seek items in the specific backend.
+        
+        The default implementation filters a full query result, so each page
+        costs a scan of every matching item. Backends with an ordered index
+        should override it to start reading at ``after``; the SQLite and
+        in-memory backends do. The SQL, Redis and Qdrant backends currently
+        use this fallback, which is a known limitation for large tiers.
+        """
+        rows = await self._query_items(filters, None, True, None, None)
+        candidates = [row for row in rows if is_after(row_seek_key(row), after)]
+        return heapq.nsmallest(max(limit, 0), candidates, key=row_seek_key)
+    
     @abc.abstractmethod
     async def _count_items(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count items in the specific backend."""
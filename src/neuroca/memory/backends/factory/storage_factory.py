@@ -6,9 +6,10 @@ The factory is responsible for creating the appropriate backend based on
 configuration settings and ensures only one instance of each backend is created.
 """
 
+import importlib
 import inspect
 import logging
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Optional, Set, Tuple, Type
 
 from neuroca.memory.backends.base import BaseStorageBackend
 from neuroca.memory.backends.factory.backend_type import BackendType
@@ -23,54 +24,65 @@ from neuroca.memory.exceptions import ConfigurationError
 
 logger = logging.getLogger(__name__)
 
-# SQL backend is optional; import lazily to avoid requiring SQLAlchemy everywhere.
-try:
-    from neuroca.memory.backends.sql_backend import SQLBackend
-
-    SQL_AVAILABLE = True
-except ImportError:  # pragma: no cover - depends on optional SQL stack
-    SQL_AVAILABLE = False
-    logger.warning(
-        "SQL backend not available. Install SQL dependencies (e.g. sqlalchemy) for SQL support."
-    )
-
-# Import Redis conditionally as it requires external dependencies
-try:
-    from neuroca.memory.backends.redis_backend import RedisBackend
-
-    REDIS_AVAILABLE = True
-except ImportError:
-    REDIS_AVAILABLE = False
-    logger.warning("Redis backend not available. Install redis for Redis support.")
-
-# Vector backend is optional depending on feature completeness
-try:
-    from neuroca.memory.backends.vector_backend import VectorBackend
-
-    _VECTOR_METHODS = ("store", "retrieve", "update", "delete", "search")
-    VECTOR_AVAILABLE = all(hasattr(VectorBackend, method) for method in _VECTOR_METHODS)
-    if not VECTOR_AVAILABLE:
+# Optional backends are imported the first time they are requested, so that
+# creating in-memory or SQLite backends does not load SQLAlchemy, redis or
+# qdrant-client. backend type -> (module, class name, required methods, install hint)
+_VECTOR_METHODS = ("store", "retrieve", "update", "delete", "search")
+_QDRANT_METHODS = ("store", "retrieve", "update", "delete", "similarity_search")
+_OPTIONAL_BACKENDS: Dict[BackendType, Tuple[str, str, Tuple[str, ...], str]] = {
+    BackendType.SQL: (
+        "neuroca.memory.backends.sql_backend",
+        "SQLBackend",
+        (),
+        "Install SQL dependencies (e.g. sqlalchemy) for SQL support.",
+    ),
+    BackendType.REDIS: (
+        "neuroca.memory.backends.redis_backend",
+        "RedisBackend",
+        (),
+        "Install redis for Redis support.",
+    ),
+    BackendType.VECTOR: (
+        "neuroca.memory.backends.vector_backend",
+        "VectorBackend",
+        _VECTOR_METHODS,
+        "Install vector extras for support.",
+    ),
+    BackendType.QDRANT: (
+        "neuroca.memory.backends.qdrant",
+        "QdrantVectorBackend",
+        _QDRANT_METHODS,
+        "Install qdrant-client for support.",
+    ),
+}
+
+# Module attributes kept for compatibility; evaluating one imports its backend
+_AVAILABILITY_FLAGS = {
+    "SQL_AVAILABLE": BackendType.SQL,
+    "REDIS_AVAILABLE": BackendType.REDIS,
+    "VECTOR_AVAILABLE": BackendType.VECTOR,
+    "QDRANT_AVAILABLE": BackendType.QDRANT,
+}
+
+
+def _import_optional_backend(backend_type: BackendType) -> Optional[Type[BaseStorageBackend]]:
+    """Import an optional backend class, returning None if it cannot be used."""
+    module_name, class_name, required_methods, install_hint = _OPTIONAL_BACKENDS[backend_type]
+    try:
+        backend_class = getattr(importlib.import_module(module_name), class_name)
+    except ImportError:
+        logger.warning(f"{class_name} not available. {install_hint}")
+        return None
+
+    missing = [method for method in required_methods if not hasattr(backend_class, method)]
+    if missing:
         logger.warning(
-            "Vector backend missing required methods %s; skipping registration until implementation is complete",
-            [method for method in _VECTOR_METHODS if not hasattr(VectorBackend, method)],
+            "%s missing required methods %s; skipping registration until implementation is complete",
+            class_name,
+            missing,
         )
-except ImportError:
-    VECTOR_AVAILABLE = False
-    logger.warning("Vector backend not available. Install vector extras for support.")
-
-try:
-    from neuroca.memory.backends.qdrant import QdrantVectorBackend
-
-    _QDRANT_METHODS = ("store", "retrieve", "update", "delete", "similarity_search")
-    QDRANT_AVAILABLE = all(hasattr(QdrantVectorBackend, method) for method in _QDRANT_METHODS)
-    if not QDRANT_AVAILABLE:
-        logger.warning(
-            "Qdrant backend missing required methods %s; skipping registration until implementation is complete",
-            [method for method in _QDRANT_METHODS if not hasattr(QdrantVectorBackend, method)],
-        )
-except ImportError:
-    QDRANT_AVAILABLE = False
-    logger.warning("Qdrant backend not available. Install qdrant-client for support.")
+        return None
+    return backend_class
 
 
 _SENSITIVE_KEYS = {"password", "secret", "token", "key", "api_key", "access_token"}
@@ -94,23 +106,15 @@ class StorageBackendFactory:
     appropriate backend is created for each memory tier.
     """
     
-    # Registry of backend implementations
+    # Registry of backend implementations. Optional backends are added the
+    # first time they are requested (see _OPTIONAL_BACKENDS).
     _backend_registry: Dict[BackendType, Type[BaseStorageBackend]] = {
         BackendType.MEMORY: InMemoryBackend,
         BackendType.SQLITE: SQLiteBackend,
     }
 
-    # Register SQL backend only when its dependencies are available.
-    if "SQL_AVAILABLE" in globals() and SQL_AVAILABLE:
-        _backend_registry[BackendType.SQL] = SQLBackend
-
-    # Add Redis backend only if it's available
-    if REDIS_AVAILABLE:
-        _backend_registry[BackendType.REDIS] = RedisBackend
-    if VECTOR_AVAILABLE:
-        _backend_registry[BackendType.VECTOR] = VectorBackend
-    if 'QDRANT_AVAILABLE' in globals() and QDRANT_AVAILABLE:
-        _backend_registry[BackendType.QDRANT] = QdrantVectorBackend
+    # Optional backends whose import has already been attempted
+    _optional_backends_loaded: Set[BackendType] = set()
     
     # Instances of created backends (for reuse)
     _instances: Dict[str, BaseStorageBackend] = {}
@@ -152,7 +156,8 @@ class StorageBackendFactory:
                 backend_type = cls._get_default_backend_for_tier(tier)
         
         # Get the backend class
-        if backend_type not in cls._backend_registry:
+        if not cls.is_available(backend_type):
+            cls._load_optional_backends()
             supported = ", ".join(sorted(type_.value for type_ in cls._backend_registry))
             raise ConfigurationError(
                 f"Unsupported backend type: {backend_type}. Supported types: {supported}"
@@ -257,16 +262,48 @@ class StorageBackendFactory:
         cls._backend_registry[backend_type] = backend_class
         logger.info(f"Registered {backend_class.__name__} implementation for {backend_type.value} backend")
     
+    @classmethod
+    def is_available(cls, backend_type: BackendType) -> bool:
+        """
+        Check whether a backend type can be created, importing it if needed.
+        
+        Args:
+            backend_type: The backend type to check
+            
+        Returns:
+            True if an implementation is registered for the backend type
+        """
+        if backend_type in cls._backend_registry:
+            return True
+        if backend_type not in _OPTIONAL_BACKENDS or backend_type in cls._optional_backends_loaded:
+            return False
+
+        cls._optional_backends_loaded.add(backend_type)
+        backend_class = _import_optional_backend(backend_type)
+        if backend_class is None:
+            return False
+        cls._backend_registry.setdefault(backend_type, backend_class)
+        return True
+    
     @classmethod
     def get_registry(cls) -> Dict[BackendType, Type[BaseStorageBackend]]:
         """
         Get the current backend registry.
         
+        All optional backends are imported so the registry is complete.
+        
         Returns:
             Dictionary mapping backend types to their implementations
         """
+        cls._load_optional_backends()
         return cls._backend_registry.copy()
     
+    @classmethod
+    def _load_optional_backends(cls) -> None:
+        """Attempt to register every optional backend."""
+        for backend_type in _OPTIONAL_BACKENDS:
+            cls.is_available(backend_type)
+    
     @classmethod
     def get_existing_instances(cls) -> Dict[str, BaseStorageBackend]:
         """
@@ -323,7 +360,7 @@ class StorageBackendFactory:
         if tier == MemoryTier.STM:
             # STM: Fast access for working memory
             if env in ("production", "staging"):
-                return BackendType.REDIS if REDIS_AVAILABLE else BackendType.MEMORY
+                return BackendType.REDIS if cls.is_available(BackendType.REDIS) else BackendType.MEMORY
             else:
                 return BackendType.MEMORY  # Development/testing
                 
@@ -342,3 +379,11 @@ class StorageBackendFactory:
                 return BackendType.SQLITE  # SQLite for development
         else:
             return BackendType.MEMORY  # Default fallback
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy ``*_AVAILABLE`` flags on first access."""
+    backend_type = _AVAILABILITY_FLAGS.get(name)
+    if backend_type is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return StorageBackendFactory.is_available(backend_type)
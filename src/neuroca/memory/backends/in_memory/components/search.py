@@ -5,9 +5,11 @@ This module provides a class for searching and querying memory items in the
 in-memory storage.
 """
 
+import copy
 from typing import Any, Dict, List, Optional
 
 from neuroca.memory.backends.in_memory.components.storage import InMemoryStorage
+from neuroca.memory.backends.keyset import SeekKey
 
 
 class InMemorySearch:
@@ -84,6 +86,45 @@ class InMemorySearch:
         finally:
             self.storage.release_lock()
     
+    async def seek_items(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        after: Optional[SeekKey] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return a keyset page of items ordered by ``(created_at, id)``.
+        
+        Reading starts at ``after`` in the storage's ordered index and stops
+        as soon as ``limit`` matches are found, so only the returned items are
+        copied and earlier pages are never re-scanned.
+        
+        Args:
+            filters: Dict of field-value pairs to filter by
+            after: Key of the last item of the previous page
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of matching items
+        """
+        filters = filters or {}
+        results: List[Dict[str, Any]] = []
+        if limit <= 0:
+            return results
+        
+        await self.storage.acquire_lock()
+        try:
+            for item_id, data in self.storage.iter_ordered(after):
+                item = {"_id": item_id, **data}
+                if filters and not self._matches_filters(item, filters):
+                    continue
+                results.append(copy.deepcopy(item))
+                if len(results) >= limit:
+                    break
+            return results
+        finally:
+            self.storage.release_lock()
+    
     async def count_items(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
         Count items in the in-memory store.
@@ -181,7 +222,7 @@ class InMemorySearch:
                 if "_meta" not in item or meta_field not in item["_meta"]:
                     return False
                 
-                if item["_meta"][meta_field] != value:
+                if not self._value_matches(item["_meta"][meta_field], value):
                     return False
             elif field == "_id":
                 # Special case for item ID
@@ -197,15 +238,22 @@ class InMemorySearch:
                         return False
                     current = current[part]
                 
-                if current != value:
+                if not self._value_matches(current, value):
                     return False
             elif field not in item:
                 return False
-            elif item[field] != value:
+            elif not self._value_matches(item[field], value):
                 return False
         
         return True
     
+    @staticmethod
+    def _value_matches(actual: Any, expected: Any) -> bool:
+        """Compare a field value to a filter value, supporting ``{"$in": [...]}``."""
+        if isinstance(expected, dict) and set(expected) == {"$in"}:
+            return actual in expected["$in"]
+        return actual == expected
+    
     def _get_field_value(self, item: Dict[str, Any], field: str) -> Any:
         """
         Get the value of a field from an item, handling nested fields.
@@ -7,8 +7,11 @@ including data structures and management operations.
 
 import asyncio
 import copy
+from bisect import bisect_right, insort
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from neuroca.memory.backends.keyset import SeekKey, item_seek_key
 
 
 class InMemoryStorage:
@@ -28,6 +31,9 @@ class InMemoryStorage:
             max_items: Maximum number of items to store (defaults to no limit)
         """
         self._data: Dict[str, Dict[str, Any]] = {}
+        # Items ordered by (created_at, id) for keyset pagination
+        self._order: List[SeekKey] = []
+        self._order_keys: Dict[str, SeekKey] = {}
         self._lock = asyncio.Lock()
         self.max_items = max_items
     
@@ -76,6 +82,13 @@ class InMemoryStorage:
         """
         # Store a deep copy to ensure data isolation
         self._data[item_id] = copy.deepcopy(data)
+        key = item_seek_key(item_id, data)
+        previous = self._order_keys.get(item_id)
+        if previous != key:
+            if previous is not None:
+                self._unorder(previous)
+            insort(self._order, key)
+            self._order_keys[item_id] = key
     
     def delete_item(self, item_id: str) -> bool:
         """
@@ -91,6 +104,7 @@ class InMemoryStorage:
             return False
         
         del self._data[item_id]
+        self._unorder(self._order_keys.pop(item_id))
         return True
     
     def has_item(self, item_id: str) -> bool:
@@ -120,6 +134,8 @@ class InMemoryStorage:
         Clear all items from storage (no locking).
         """
         self._data.clear()
+        self._order.clear()
+        self._order_keys.clear()
     
     def count_items(self) -> int:
         """
@@ -130,6 +146,29 @@ class InMemoryStorage:
         """
         return len(self._data)
     
+    def iter_ordered(self, after: Optional[SeekKey] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Iterate items by ``(created_at, id)`` starting after a keyset boundary (no locking).
+        
+        Items are yielded without copying; callers must not mutate them.
+        
+        Args:
+            after: Key of the last item already seen, or None to start at the beginning
+            
+        Yields:
+            Tuples of (item_id, item data)
+        """
+        start = 0 if after is None else bisect_right(self._order, tuple(after))
+        for index in range(start, len(self._order)):
+            item_id = self._order[index][1]
+            yield item_id, self._data[item_id]
+    
+    def _unorder(self, key: SeekKey) -> None:
+        """Remove *key* from the ordered index."""
+        index = bisect_right(self._order, key) - 1
+        if index >= 0 and self._order[index] == key:
+            del self._order[index]
+    
     def evict_oldest_item(self) -> Optional[str]:
         """
         Evict the oldest item from storage when max_items is reached.
@@ -155,13 +194,13 @@ class InMemoryStorage:
         
         # If we found an oldest item, remove it
         if oldest_id:
-            del self._data[oldest_id]
+            self.delete_item(oldest_id)
             return oldest_id
         else:
             # If we couldn't determine the oldest by timestamp, remove the first item
             if self._data:
                 first_id = next(iter(self._data))
-                del self._data[first_id]
+                self.delete_item(first_id)
                 return first_id
             
         return None
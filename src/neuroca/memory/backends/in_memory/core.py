@@ -15,6 +15,7 @@ from neuroca.memory.backends.in_memory.components.crud import InMemoryCRUD
 from neuroca.memory.backends.in_memory.components.search import InMemorySearch
 from neuroca.memory.backends.in_memory.components.stats import InMemoryStats
 from neuroca.memory.backends.in_memory.components.storage import InMemoryStorage
+from neuroca.memory.backends.keyset import SeekKey
 from neuroca.memory.exceptions import StorageOperationError
 from neuroca.memory.models.memory_item import MemoryItem
 from neuroca.memory.models.search import MemorySearchOptions as SearchFilter, MemorySearchResults as SearchResults
@@ -184,6 +185,15 @@ class InMemoryBackend(BaseStorageBackend):
             offset=offset
         )
     
+    async def _seek_items(
+        self,
+        filters: Optional[Dict[str, Any]],
+        after: Optional[SeekKey],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Seek a keyset page using the storage's ordered index."""
+        return await self.search.seek_items(filters=filters, after=after, limit=limit)
+    
     async def _count_items(self, query: Optional[Dict[str, Any]] = None) -> int:
         """Count items in storage."""
         if query:
@@ -0,0 +1,56 @@
+"""Keyset ordering helpers shared by storage backends.
+
+Listing endpoints page through memories ordered by ``(created_at, id)``. A
+page boundary is expressed as the key of the last item returned, so a backend
+can seek directly to the next page instead of re-scanning skipped rows the way
+``offset`` pagination does.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Mapping, Optional, Tuple
+
+SeekKey = Tuple[float, str]
+
+
+def _timestamp(value: Any) -> float:
+    """Return *value* as POSIX seconds, treating naive datetimes as UTC."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return 0.0
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return 0.0
+
+
+def item_seek_key(item_id: str, data: Mapping[str, Any]) -> SeekKey:
+    """Return the ``(created_at, id)`` ordering key of a stored item."""
+    created_at = None
+    metadata = data.get("metadata")
+    if isinstance(metadata, Mapping):
+        created_at = metadata.get("created_at")
+    if created_at is None:
+        meta = data.get("_meta")
+        if isinstance(meta, Mapping):
+            created_at = meta.get("created_at")
+    return (_timestamp(created_at), str(item_id))
+
+
+def row_seek_key(row: Mapping[str, Any]) -> SeekKey:
+    """Return the ordering key of a query result row."""
+    return item_seek_key(row.get("id") or row.get("_id") or "", row)
+
+
+def is_after(key: SeekKey, after: Optional[SeekKey]) -> bool:
+    """Return ``True`` when *key* sorts strictly after the *after* boundary."""
+    return after is None or key > tuple(after)
+
+
+__all__ = ["SeekKey", "item_seek_key", "row_seek_key", "is_after"]
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, Mapping, MutableMapping, Optional, Sequence
+from typing import Any, Iterable, Mapping, MutableMapping, Optional, Sequence
+
+# Upper bound on neighbours fetched per node by the generic traversal fallbacks
+DEFAULT_TRAVERSAL_FANOUT = 10_000
 
 
 class KnowledgeGraphBackend(abc.ABC):
@@ -42,6 +45,15 @@ class KnowledgeGraphBackend(abc.ABC):
     async def remove_node(self, node_id: str) -> None:
         """Remove a node and its relationships from the graph."""
 
+    async def remove_nodes(self, node_ids: Iterable[str]) -> None:
+        """Remove several nodes and their relationships.
+
+        The default implementation calls :meth:`remove_node` for each
+        identifier; backends with a native bulk path should override it.
+        """
+        for node_id in node_ids:
+            await self.remove_node(node_id)
+
     @abc.abstractmethod
     async def add_relationship(
         self,
@@ -54,6 +66,29 @@ class KnowledgeGraphBackend(abc.ABC):
     ) -> bool:
         """Create or update a relationship between two nodes."""
 
+    async def add_relationships(
+        self,
+        relationships: Iterable[Mapping[str, Any]],
+    ) -> int:
+        """Create or update several relationships and return how many were written.
+
+        Each mapping provides ``source_id``, ``target_id``,
+        ``relationship_type`` and ``strength`` plus optional ``metadata``. The
+        default implementation calls :meth:`add_relationship` for each entry;
+        backends with a native bulk path should override it.
+        """
+        count = 0
+        for relationship in relationships:
+            await self.add_relationship(
+                relationship["source_id"],
+                relationship["target_id"],
+                relationship["relationship_type"],
+                strength=relationship["strength"],
+                metadata=relationship.get("metadata"),
+            )
+            count += 1
+        return count
+
     @abc.abstractmethod
     async def remove_relationship(
         self,
@@ -73,3 +108,136 @@ class KnowledgeGraphBackend(abc.ABC):
         limit: int = 10,
     ) -> Sequence[MutableMapping[str, Any]]:
         """Return related nodes and relationship metadata for *node_id*."""
+
+    async def neighborhood(
+        self,
+        node_id: str,
+        *,
+        max_depth: int = 2,
+        relationship_type: Optional[str] = None,
+        min_strength: float = 0.0,
+        limit: Optional[int] = None,
+    ) -> Sequence[MutableMapping[str, Any]]:
+        """Return nodes reachable from *node_id* within *max_depth* hops.
+
+        Each entry carries ``node_id`` and ``depth`` (the hop distance), ordered
+        by depth. The start node is not included. The default implementation
+        walks :meth:`get_related` level by level; backends should override it
+        with a native traversal.
+        """
+        depths = await self._breadth_first(node_id, max_depth, relationship_type, min_strength)
+        results = [
+            {"node_id": other_id, "depth": depth}
+            for other_id, (depth, _parent) in depths.items()
+            if other_id != node_id
+        ]
+        return results if limit is None else results[: max(limit, 0)]
+
+    async def shortest_path(
+        self,
+        source_id: str,
+        target_id: str,
+        *,
+        max_depth: int = 3,
+        relationship_type: Optional[str] = None,
+        min_strength: float = 0.0,
+    ) -> Optional[list[str]]:
+        """Return the node ids of a shortest directed path, or ``None``.
+
+        The path includes both endpoints and spans at most *max_depth* hops.
+        The default implementation walks :meth:`get_related` level by level;
+        backends should override it with a native traversal.
+        """
+        if source_id == target_id:
+            return [source_id]
+        depths = await self._breadth_first(
+            source_id, max_depth, relationship_type, min_strength, stop_at=target_id
+        )
+        if target_id not in depths:
+            return None
+        path = [target_id]
+        while path[-1] != source_id:
+            path.append(depths[path[-1]][1])
+        path.reverse()
+        return path
+
+    async def expand(
+        self,
+        node_id: str,
+        *,
+        max_depth: int = 2,
+        relationship_type: Optional[str] = None,
+        min_strength: float = 0.0,
+        decay: float = 1.0,
+        limit: int = 10,
+    ) -> Sequence[MutableMapping[str, Any]]:
+        """Rank nodes around *node_id* by their strongest connecting path.
+
+        A path scores the product of ``strength * decay`` over its edges; each
+        reachable node keeps its best score. Entries carry ``node_id``,
+        ``score`` and ``depth`` and are ordered by descending score. The
+        default implementation walks :meth:`get_related`; backends should
+        override it with a native traversal.
+        """
+        best: dict[str, tuple[float, int]] = {node_id: (1.0, 0)}
+        frontier: dict[str, float] = {node_id: 1.0}
+        for depth in range(1, max_depth + 1):
+            next_frontier: dict[str, float] = {}
+            for current_id, score in frontier.items():
+                related = await self.get_related(
+                    current_id,
+                    relationship_type=relationship_type,
+                    min_strength=min_strength,
+                    limit=DEFAULT_TRAVERSAL_FANOUT,
+                )
+                for entry in related:
+                    other_id = entry["target_id"]
+                    candidate = score * float(entry["strength"]) * decay
+                    if candidate > best.get(other_id, (-1.0, 0))[0]:
+                        best[other_id] = (candidate, depth)
+                        next_frontier[other_id] = candidate
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        results = [
+            {"node_id": other_id, "score": score, "depth": depth}
+            for other_id, (score, depth) in best.items()
+            if other_id != node_id
+        ]
+        results.sort(key=lambda entry: entry["score"], reverse=True)
+        return results[: max(limit, 0)]
+
+    async def _breadth_first(
+        self,
+        node_id: str,
+        max_depth: int,
+        relationship_type: Optional[str],
+        min_strength: float,
+        *,
+        stop_at: Optional[str] = None,
+    ) -> dict[str, tuple[int, Optional[str]]]:
+        """Map reachable node ids to ``(depth, parent)`` using :meth:`get_related`."""
+        visited: dict[str, tuple[int, Optional[str]]] = {node_id: (0, None)}
+        frontier = [node_id]
+        for depth in range(1, max_depth + 1):
+            next_frontier: list[str] = []
+            for current_id in frontier:
+                related = await self.get_related(
+                    current_id,
+                    relationship_type=relationship_type,
+                    min_strength=min_strength,
+                    limit=DEFAULT_TRAVERSAL_FANOUT,
+                )
+                for entry in related:
+                    other_id = entry["target_id"]
+                    if other_id in visited:
+                        continue
+                    visited[other_id] = (depth, current_id)
+                    if other_id == stop_at:
+                        return visited
+                    next_frontier.append(other_id)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return visited
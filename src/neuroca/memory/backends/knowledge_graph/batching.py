@@ -0,0 +1,174 @@
+"""Session pooling and write coalescing helpers for remote graph backends."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SessionPool:
+    """Lease a bounded number of long-lived connections from a blocking pool.
+
+    Connections are checked out of the underlying pool (any object exposing a
+    ``get_connection()`` context manager) the first time they are needed and are
+    then reused across calls, instead of being acquired and released around
+    every query. Blocking driver calls run on a dedicated thread pool with one
+    worker per session, so at most ``max_sessions`` queries are in flight.
+    """
+
+    def __init__(self, pool: Any, *, max_sessions: int = 4) -> None:
+        """Wrap *pool* with at most *max_sessions* concurrent sessions."""
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self._pool = pool
+        self._max_sessions = max_sessions
+        self._semaphore = asyncio.Semaphore(max_sessions)
+        self._idle: List[Any] = []
+        self._leases: Dict[int, ExitStack] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def open_sessions(self) -> int:
+        """Number of connections currently leased from the underlying pool."""
+        return len(self._leases)
+
+    async def run(self, operation: Callable[[Any], T]) -> T:
+        """Run the blocking *operation* with a leased connection."""
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            executor = self._ensure_executor()
+            connection = self._idle.pop() if self._idle else await loop.run_in_executor(executor, self._open)
+            try:
+                result = await loop.run_in_executor(executor, operation, connection)
+            except Exception:
+                # Hand a possibly broken connection back to the pool for validation
+                await loop.run_in_executor(executor, self._release, connection)
+                raise
+            self._idle.append(connection)
+            return result
+
+    async def close(self) -> None:
+        """Return every leased connection and stop the worker threads."""
+        executor = self._executor
+        if executor is None:
+            return
+        loop = asyncio.get_running_loop()
+        for connection in list(self._idle):
+            await loop.run_in_executor(executor, self._release, connection)
+        self._idle.clear()
+        self._executor = None
+        executor.shutdown(wait=True)
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        """Create the worker threads on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_sessions,
+                thread_name_prefix="GraphSession",
+            )
+        return self._executor
+
+    def _open(self) -> Any:
+        """Check a connection out of the underlying pool and keep it leased."""
+        stack = ExitStack()
+        connection = stack.enter_context(self._pool.get_connection())
+        self._leases[id(connection)] = stack
+        return connection
+
+    def _release(self, connection: Any) -> None:
+        """Return a leased connection to the underlying pool."""
+        stack = self._leases.pop(id(connection), None)
+        if stack is not None:
+            stack.close()
+
+
+class WriteCoalescer:
+    """Merge concurrent write requests into chunked batch writes.
+
+    Rows submitted within ``window`` seconds of each other are flushed together;
+    a flush is triggered early as soon as ``batch_size`` rows are pending. Each
+    caller awaits only the batches containing its own rows, so a completed
+    ``submit`` means the rows were written. Batches are flushed one at a time
+    so repeated writes to the same key apply in submission order.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[Dict[str, Any]]], Awaitable[None]],
+        *,
+        batch_size: int = 500,
+        window: float = 0.005,
+    ) -> None:
+        """Coalesce rows for *flush* in chunks of *batch_size* over *window* seconds."""
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._flush = flush
+        self._batch_size = batch_size
+        self._window = max(window, 0.0)
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight: Set[asyncio.Task] = set()
+        self._write_lock = asyncio.Lock()
+        self.batches_flushed = 0
+        self.rows_flushed = 0
+
+    async def submit(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Queue *rows* for writing and wait until they have been flushed."""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for row in rows:
+            future = loop.create_future()
+            self._pending.append((row, future))
+            futures.append(future)
+            if len(self._pending) >= self._batch_size:
+                self._dispatch()
+
+        if self._pending:
+            if self._window == 0.0:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self._window, self._dispatch)
+
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return len(futures)
+
+    async def drain(self) -> None:
+        """Flush pending rows and wait for every in-flight batch."""
+        self._dispatch()
+        if self._inflight:
+            await asyncio.gather(*list(self._inflight), return_exceptions=True)
+
+    def _dispatch(self) -> None:
+        """Start flushing pending rows in batch_size chunks."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), self._batch_size):
+            task = asyncio.ensure_future(self._write(pending[start:start + self._batch_size]))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _write(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Flush one batch and resolve the futures of its rows."""
+        try:
+            async with self._write_lock:
+                await self._flush([row for row, _future in batch])
+        except Exception as exc:
+            for _row, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        self.batches_flushed += 1
+        self.rows_flushed += len(batch)
+        for _row, future in batch:
+            if not future.done():
+                future.set_result(None)
@@ -2,18 +2,45 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Mapping, MutableMapping, Optional, Sequence
+from bisect import bisect_left, insort
+from collections import deque
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from neuroca.memory.backends.knowledge_graph.base import KnowledgeGraphBackend
 
+# Ordering key of an edge inside a source's ranked list: strongest first, then
+# relationship type and target id so every (type, target) pair has a unique slot.
+_RankKey = Tuple[float, str, str]
+
 
 class InMemoryKnowledgeGraphBackend(KnowledgeGraphBackend):
-    """Maintain knowledge graph relationships inside the current process."""
+    """Maintain knowledge graph relationships inside the current process.
+
+    Outbound edges are stored per source and relationship type, with an inbound
+    index (target -> source -> relationship types) so detaching a node only
+    touches its own edges. Each source also keeps its edges in a list ordered
+    by descending strength, which lets :meth:`get_related` stream results
+    without sorting. Traversals run synchronously over these indexes.
+    """
 
     def __init__(self) -> None:
         """Initialise the in-memory node and edge registries."""
         self._nodes: Dict[str, Dict[str, Any]] = {}
         self._edges: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        self._inbound: Dict[str, Dict[str, Set[str]]] = {}
+        self._ranked: Dict[str, List[_RankKey]] = {}
 
     async def upsert_node(
         self,
@@ -28,15 +55,12 @@ class InMemoryKnowledgeGraphBackend(KnowledgeGraphBackend):
 
     async def remove_node(self, node_id: str) -> None:
         """Remove *node_id* and detach any relationships."""
-        self._nodes.pop(node_id, None)
-        self._edges.pop(node_id, None)
-        for source_id, buckets in list(self._edges.items()):
-            for rel_type, targets in list(buckets.items()):
-                targets.pop(node_id, None)
-                if not targets:
-                    buckets.pop(rel_type, None)
-            if not buckets:
-                self._edges.pop(source_id, None)
+        self._remove_node(node_id)
+
+    async def remove_nodes(self, node_ids: Iterable[str]) -> None:
+        """Remove every node in *node_ids* and detach their relationships."""
+        for node_id in node_ids:
+            self._remove_node(node_id)
 
     async def add_relationship(
         self,
@@ -48,19 +72,26 @@ class InMemoryKnowledgeGraphBackend(KnowledgeGraphBackend):
         metadata: Optional[Mapping[str, Any]] = None,
     ) -> bool:
         """Persist or update a relationship between two nodes."""
-        await self.upsert_node(source_id)
-        await self.upsert_node(target_id)
-
-        bucket = self._edges.setdefault(source_id, {}).setdefault(relationship_type, {})
-        payload: Dict[str, Any] = {
-            "relationship_type": relationship_type,
-            "target_id": target_id,
-            "strength": float(strength),
-            "metadata": dict(metadata or {}),
-        }
-        bucket[target_id] = payload
+        self._add_edge(source_id, target_id, relationship_type, strength, metadata)
         return True
 
+    async def add_relationships(
+        self,
+        relationships: Iterable[Mapping[str, Any]],
+    ) -> int:
+        """Persist or update several relationships in one call."""
+        count = 0
+        for relationship in relationships:
+            self._add_edge(
+                relationship["source_id"],
+                relationship["target_id"],
+                relationship["relationship_type"],
+                relationship["strength"],
+                relationship.get("metadata"),
+            )
+            count += 1
+        return count
+
     async def remove_relationship(
         self,
         source_id: str,
@@ -72,17 +103,10 @@ class InMemoryKnowledgeGraphBackend(KnowledgeGraphBackend):
         if not buckets:
             return False
 
-        removed = False
         relationship_types = [relationship_type] if relationship_type else list(buckets.keys())
+        removed = False
         for rel_type in relationship_types:
-            targets = buckets.get(rel_type)
-            if not targets:
-                continue
-            removed = targets.pop(target_id, None) is not None or removed
-            if not targets:
-                buckets.pop(rel_type, None)
-        if not buckets:
-            self._edges.pop(source_id, None)
+            removed = self._remove_edge(source_id, target_id, rel_type) or removed
         return removed
 
     async def get_related(
@@ -94,20 +118,211 @@ class InMemoryKnowledgeGraphBackend(KnowledgeGraphBackend):
         limit: int = 10,
     ) -> Sequence[MutableMapping[str, Any]]:
         """Return relationships originating from *node_id*."""
-        buckets = self._edges.get(node_id)
-        if not buckets:
+        ranked = self._ranked.get(node_id)
+        limit = max(limit, 0)
+        if not ranked or limit == 0:
             return []
 
+        buckets = self._edges[node_id]
         results: list[MutableMapping[str, Any]] = []
-        types_to_check = [relationship_type] if relationship_type else list(buckets.keys())
-        for rel_type in types_to_check:
-            targets = buckets.get(rel_type)
-            if not targets:
+        for negative_strength, rel_type, target_id in ranked:
+            if -negative_strength < min_strength:
+                break
+            if relationship_type and rel_type != relationship_type:
                 continue
-            for payload in targets.values():
-                if payload["strength"] < min_strength:
-                    continue
-                results.append(dict(payload))
+            results.append(dict(buckets[rel_type][target_id]))
+            if len(results) >= limit:
+                break
+        return results
+
+    async def neighborhood(
+        self,
+        node_id: str,
+        *,
+        max_depth: int = 2,
+        relationship_type: Optional[str] = None,
+        min_strength: float = 0.0,
+        limit: Optional[int] = None,
+    ) -> Sequence[MutableMapping[str, Any]]:
+        """Return nodes within *max_depth* hops of *node_id*, nearest first."""
+        parents = self._breadth_first(node_id, max_depth, relationship_type, min_strength)
+        results = [
+            {"node_id": other_id, "depth": depth}
+            for other_id, (depth, _parent) in parents.items()
+            if other_id != node_id
+        ]
+        return results if limit is None else results[: max(limit, 0)]
+
+    async def shortest_path(
+        self,
+        source_id: str,
+        target_id: str,
+        *,
+        max_depth: int = 3,
+        relationship_type: Optional[str] = None,
+        min_strength: float = 0.0,
+    ) -> Optional[list[str]]:
+        """Return the node ids of a shortest directed path, or ``None``."""
+        if source_id == target_id:
+            return [source_id]
+        parents = self._breadth_first(
+            source_id, max_depth, relationship_type, min_strength, stop_at=target_id
+        )
+        if target_id not in parents:
+            return None
+        path = [target_id]
+        while path[-1] != source_id:
+            path.append(parents[path[-1]][1])
+        path.reverse()
+        return path
+
+    async def expand(
+        self,
+        node_id: str,
+        *,
+        max_depth: int = 2,
+        relationship_type: Optional[str] = None,
+        min_strength: float = 0.0,
+        decay: float = 1.0,
+        limit: int = 10,
+    ) -> Sequence[MutableMapping[str, Any]]:
+        """Rank nodes around *node_id* by their strongest connecting path."""
+        best: Dict[str, Tuple[float, int]] = {node_id: (1.0, 0)}
+        frontier: Dict[str, float] = {node_id: 1.0}
+        for depth in range(1, max_depth + 1):
+            next_frontier: Dict[str, float] = {}
+            for current_id, score in frontier.items():
+                for other_id, strength in self._successors(current_id, relationship_type, min_strength):
+                    candidate = score * strength * decay
+                    if candidate > best.get(other_id, (-1.0, 0))[0]:
+                        best[other_id] = (candidate, depth)
+                        next_frontier[other_id] = candidate
+            if not next_frontier:
+                break
+            frontier = next_frontier
 
-        results.sort(key=lambda entry: entry.get("strength", 0.0), reverse=True)
+        results = [
+            {"node_id": other_id, "score": score, "depth": depth}
+            for other_id, (score, depth) in best.items()
+            if other_id != node_id
+        ]
+        results.sort(key=lambda entry: entry["score"], reverse=True)
         return results[: max(limit, 0)]
+
+    def _successors(
+        self,
+        node_id: str,
+        relationship_type: Optional[str],
+        min_strength: float,
+    ) -> Iterator[Tuple[str, float]]:
+        """Yield ``(target_id, strength)`` for qualifying outbound edges, strongest first."""
+        for negative_strength, rel_type, target_id in self._ranked.get(node_id, ()):
+            if -negative_strength < min_strength:
+                return
+            if relationship_type and rel_type != relationship_type:
+                continue
+            yield target_id, -negative_strength
+
+    def _breadth_first(
+        self,
+        node_id: str,
+        max_depth: int,
+        relationship_type: Optional[str],
+        min_strength: float,
+        *,
+        stop_at: Optional[str] = None,
+    ) -> Dict[str, Tuple[int, Optional[str]]]:
+        """Map reachable node ids to ``(depth, parent)`` in breadth-first order."""
+        visited: Dict[str, Tuple[int, Optional[str]]] = {node_id: (0, None)}
+        queue = deque([node_id])
+        while queue:
+            current_id = queue.popleft()
+            depth = visited[current_id][0]
+            if depth >= max_depth:
+                continue
+            for other_id, _strength in self._successors(current_id, relationship_type, min_strength):
+                if other_id in visited:
+                    continue
+                visited[other_id] = (depth + 1, current_id)
+                if other_id == stop_at:
+                    return visited
+                queue.append(other_id)
+        return visited
+
+    def _add_edge(
+        self,
+        source_id: str,
+        target_id: str,
+        relationship_type: str,
+        strength: float,
+        metadata: Optional[Mapping[str, Any]],
+    ) -> None:
+        """Insert or replace a single edge, keeping every index in sync."""
+        self._nodes.setdefault(source_id, {})
+        self._nodes.setdefault(target_id, {})
+
+        bucket = self._edges.setdefault(source_id, {}).setdefault(relationship_type, {})
+        ranked = self._ranked.setdefault(source_id, [])
+        previous = bucket.get(target_id)
+        if previous is not None:
+            self._unrank(ranked, (-previous["strength"], relationship_type, target_id))
+
+        payload: Dict[str, Any] = {
+            "relationship_type": relationship_type,
+            "target_id": target_id,
+            "strength": float(strength),
+            "metadata": dict(metadata or {}),
+        }
+        bucket[target_id] = payload
+        insort(ranked, (-payload["strength"], relationship_type, target_id))
+        self._inbound.setdefault(target_id, {}).setdefault(source_id, set()).add(relationship_type)
+
+    def _remove_edge(self, source_id: str, target_id: str, relationship_type: str) -> bool:
+        """Remove a single edge if present, keeping every index in sync."""
+        buckets = self._edges.get(source_id)
+        if not buckets:
+            return False
+        targets = buckets.get(relationship_type)
+        if not targets:
+            return False
+        payload = targets.pop(target_id, None)
+        if payload is None:
+            return False
+
+        if not targets:
+            buckets.pop(relationship_type, None)
+        ranked = self._ranked[source_id]
+        self._unrank(ranked, (-payload["strength"], relationship_type, target_id))
+        if not buckets:
+            self._edges.pop(source_id, None)
+            self._ranked.pop(source_id, None)
+
+        sources = self._inbound.get(target_id)
+        if sources is not None:
+            types = sources.get(source_id)
+            if types is not None:
+                types.discard(relationship_type)
+                if not types:
+                    sources.pop(source_id, None)
+            if not sources:
+                self._inbound.pop(target_id, None)
+        return True
+
+    def _remove_node(self, node_id: str) -> None:
+        """Remove a node, touching only the edges incident to it."""
+        self._nodes.pop(node_id, None)
+
+        for rel_type, targets in list(self._edges.get(node_id, {}).items()):
+            for target_id in list(targets):
+                self._remove_edge(node_id, target_id, rel_type)
+
+        for source_id, types in list(self._inbound.get(node_id, {}).items()):
+            for rel_type in list(types):
+                self._remove_edge(source_id, node_id, rel_type)
+
+    @staticmethod
+    def _unrank(ranked: List[_RankKey], key: _RankKey) -> None:
+        """Remove *key* from a ranked edge list."""
+        index = bisect_left(ranked, key)
+        if index < len(ranked) and ranked[index] == key:
+            del ranked[index]
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
-import asyncio
-from typing import Any, Mapping, MutableMapping, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence
 
 from neuroca.memory.backends.knowledge_graph.base import KnowledgeGraphBackend
+from neuroca.memory.backends.knowledge_graph.batching import SessionPool, WriteCoalescer
 
 
 class Neo4jKnowledgeGraphBackend(KnowledgeGraphBackend):
-    """Persist knowledge graph relationships using a Neo4j connection pool."""
+    """Persist knowledge graph relationships using a Neo4j connection pool.
+
+    Relationship writes are coalesced: rows submitted within
+    ``coalesce_window`` seconds are merged and written with ``UNWIND $rows``
+    queries of at most ``batch_size`` rows. All queries run on a bounded
+    :class:`SessionPool` that keeps up to ``max_sessions`` connections leased
+    from *pool* rather than checking one out per call.
+    """
 
     def __init__(
         self,
@@ -17,6 +24,9 @@ class Neo4jKnowledgeGraphBackend(KnowledgeGraphBackend):
         *,
         node_label: str = "Memory",
         relationship_label: str = "RELATED_TO",
+        batch_size: int = 500,
+        coalesce_window: float = 0.005,
+        max_sessions: int = 4,
     ) -> None:
         """Configure the backend with an externally managed connection pool."""
         if pool is None:
@@ -24,6 +34,27 @@ class Neo4jKnowledgeGraphBackend(KnowledgeGraphBackend):
         self._pool = pool
         self._node_label = node_label
         self._relationship_label = relationship_label
+        self._batch_size = batch_size
+        self._sessions = SessionPool(pool, max_sessions=max_sessions)
+        self._relationship_writes = WriteCoalescer(
+            self._write_relationship_rows,
+            batch_size=batch_size,
+            window=coalesce_window,
+        )
+
+    async def shutdown(self) -> None:
+        """Flush queued writes and return leased connections to the pool."""
+        await self._relationship_writes.drain()
+        await self._sessions.close()
+
+    @property
+    def write_stats(self) -> Dict[str, int]:
+        """Return counters describing coalesced relationship writes."""
+        return {
+            "batches": self._relationship_writes.batches_flushed,
+            "rows": self._relationship_writes.rows_flushed,
+            "open_sessions": self._sessions.open_sessions,
+        }
 
     async def upsert_node(
         self,
@@ -40,10 +71,18 @@ class Neo4jKnowledgeGraphBackend(KnowledgeGraphBackend):
 
     async def remove_node(self, node_id: str) -> None:
         """Detach and delete the node identified by *node_id*."""
-        await self._run_query(
-            f"MATCH (n:{self._node_label} {{id: $id}}) DETACH DELETE n",
-            {"id": node_id},
-        )
+        await self.remove_nodes([node_id])
+
+    async def remove_nodes(self, node_ids: Iterable[str]) -> None:
+        """Detach and delete several nodes with chunked ``UNWIND`` queries."""
+        # Queued relationship writes must not resurrect nodes deleted after them
+        await self._relationship_writes.drain()
+        ids = list(dict.fromkeys(node_ids))
+        for start in range(0, len(ids), self._batch_size):
+            await self._run_query(
+                f"UNWIND $ids AS id MATCH (n:{self._node_label} {{id: id}}) DETACH DELETE n",
+                {"ids": ids[start:start + self._batch_size]},
+            )
 
     async def add_relationship(
         self,
@@ -55,21 +94,55 @@ class Neo4jKnowledgeGraphBackend(KnowledgeGraphBackend):
         metadata: Optional[Mapping[str, Any]] = None,
     ) -> bool:
         """Persist a relationship between two memory nodes."""
-        parameters = {
+        await self._relationship_writes.submit(
+            [self._relationship_row(source_id, target_id, relationship_type, strength, metadata)]
+        )
+        return True
+
+    async def add_relationships(
+        self,
+        relationships: Iterable[Mapping[str, Any]],
+    ) -> int:
+        """Persist several relationships through the coalescing write queue."""
+        rows = [
+            self._relationship_row(
+                relationship["source_id"],
+                relationship["target_id"],
+                relationship["relationship_type"],
+                relationship["strength"],
+                relationship.get("metadata"),
+            )
+            for relationship in relationships
+        ]
+        return await self._relationship_writes.submit(rows)
+
+    @staticmethod
+    def _relationship_row(
+        source_id: str,
+        target_id: str,
+        relationship_type: str,
+        strength: float,
+        metadata: Optional[Mapping[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the UNWIND row for a relationship."""
+        return {
             "source_id": source_id,
             "target_id": target_id,
             "type": relationship_type,
             "strength": float(strength),
             "metadata": dict(metadata or {}),
         }
+
+    async def _write_relationship_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Write one chunk of relationship rows in a single transaction."""
         await self._run_query(
-            f"MERGE (s:{self._node_label} {{id: $source_id}}) "
-            f"MERGE (t:{self._node_label} {{id: $target_id}}) "
-            f"MERGE (s)-[r:{self._relationship_label} {{type: $type}}]->(t) "
-            "SET r.strength = $strength, r.metadata = $metadata",
-            parameters,
+            "UNWIND $rows AS row "
+            f"MERGE (s:{self._node_label} {{id: row.source_id}}) "
+            f"MERGE (t:{self._node_label} {{id: row.target_id}}) "
+            f"MERGE (s)-[r:{self._relationship_label} {{type: row.type}}]->(t) "
+            "SET r.strength = row.strength, r.metadata = row.metadata",
+            {"rows": rows},
         )
-        return True
 
     async def remove_relationship(
         self,
@@ -78,6 +151,7 @@ class Neo4jKnowledgeGraphBackend(KnowledgeGraphBackend):
         relationship_type: Optional[str] = None,
     ) -> bool:
         """Remove relationships between two nodes."""
+        await self._relationship_writes.drain()
         query = (
             f"MATCH (s:{self._node_label} {{id: $source_id}})"
             f"-[r:{self._relationship_label}]->"
@@ -123,6 +197,122 @@ class Neo4jKnowledgeGraphBackend(KnowledgeGraphBackend):
         records = await self._run_query(query, parameters, read_only=True)
         return [dict(record) for record in records]
 
+    async def neighborhood(
+        self,
+        node_id: str,
+        *,
+        max_depth: int = 2,
+        relationship_type: Optional[str] = None,
+        min_strength: float = 0.0,
+        limit: Optional[int] = None,
+    ) -> Sequence[MutableMapping[str, Any]]:
+        """Return nodes within *max_depth* hops using a variable-length match."""
+        if max_depth < 1:
+            return []
+        query, parameters = self._path_match(
+            "MATCH p = (s:{node} {{id: $id}})-[:{rel}*1..{depth}]->(t:{node}) ",
+            max_depth,
+            relationship_type,
+            min_strength,
+        )
+        query += (
+            "AND t.id <> $id "
+            "RETURN t.id AS node_id, min(length(p)) AS depth "
+            "ORDER BY depth, node_id"
+        )
+        parameters["id"] = node_id
+        if limit is not None:
+            query += " LIMIT $limit"
+            parameters["limit"] = max(limit, 0)
+
+        records = await self._run_query(query, parameters, read_only=True)
+        return [dict(record) for record in records]
+
+    async def shortest_path(
+        self,
+        source_id: str,
+        target_id: str,
+        *,
+        max_depth: int = 3,
+        relationship_type: Optional[str] = None,
+        min_strength: float = 0.0,
+    ) -> Optional[list[str]]:
+        """Return the node ids of a shortest directed path using ``shortestPath``."""
+        if source_id == target_id:
+            return [source_id]
+        if max_depth < 1:
+            return None
+        query, parameters = self._path_match(
+            "MATCH (s:{node} {{id: $source_id}}), (t:{node} {{id: $target_id}}) "
+            "MATCH p = shortestPath((s)-[:{rel}*1..{depth}]->(t)) ",
+            max_depth,
+            relationship_type,
+            min_strength,
+        )
+        query += "RETURN [n IN nodes(p) | n.id] AS node_ids LIMIT 1"
+        parameters.update({"source_id": source_id, "target_id": target_id})
+
+        records = await self._run_query(query, parameters, read_only=True)
+        if not records:
+            return None
+        return list(records[0].get("node_ids") or []) or None
+
+    async def expand(
+        self,
+        node_id: str,
+        *,
+        max_depth: int = 2,
+        relationship_type: Optional[str] = None,
+        min_strength: float = 0.0,
+        decay: float = 1.0,
+        limit: int = 10,
+    ) -> Sequence[MutableMapping[str, Any]]:
+        """Rank nearby nodes by the best product of edge strengths along a path."""
+        if max_depth < 1:
+            return []
+        query, parameters = self._path_match(
+            "MATCH p = (s:{node} {{id: $id}})-[:{rel}*1..{depth}]->(t:{node}) ",
+            max_depth,
+            relationship_type,
+            min_strength,
+        )
+        query += (
+            "AND t.id <> $id "
+            "WITH t, length(p) AS depth, "
+            "reduce(score = 1.0, r IN relationships(p) | score * r.strength * $decay) AS score "
+            "RETURN t.id AS node_id, max(score) AS score, min(depth) AS depth "
+            "ORDER BY score DESC LIMIT $limit"
+        )
+        parameters.update({"id": node_id, "decay": float(decay), "limit": max(limit, 0)})
+
+        records = await self._run_query(query, parameters, read_only=True)
+        return [dict(record) for record in records]
+
+    def _path_match(
+        self,
+        pattern: str,
+        max_depth: int,
+        relationship_type: Optional[str],
+        min_strength: float,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build a variable-length MATCH with per-relationship filters.
+
+        Cypher does not accept parameters for path length bounds, so the depth
+        is validated and inlined.
+        """
+        query = pattern.format(
+            node=self._node_label,
+            rel=self._relationship_label,
+            depth=int(max_depth),
+        )
+        query += "WHERE all(r IN relationships(p) WHERE r.strength >= $min_strength"
+        parameters: dict[str, Any] = {"min_strength": float(min_strength)}
+        if relationship_type:
+            query += " AND r.type = $type"
+            parameters["type"] = relationship_type
+        query += ") "
+        return query, parameters
+
     async def _run_query(
         self,
         query: str,
@@ -130,10 +320,8 @@ class Neo4jKnowledgeGraphBackend(KnowledgeGraphBackend):
         *,
         read_only: bool = False,
     ) -> Sequence[MutableMapping[str, Any]]:
-        """Execute *query* using the configured connection pool."""
-
-        def _execute() -> Sequence[MutableMapping[str, Any]]:
-            with self._pool.get_connection() as connection:
-                return connection.query(query, dict(parameters), read_only=read_only)
-
-        return await asyncio.to_thread(_execute)
+        """Execute *query* on a pooled session."""
+        parameters = dict(parameters)
+        return await self._sessions.run(
+            lambda connection: connection.query(query, parameters, read_only=read_only)
+        )
@@ -11,6 +11,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+from neuroca.memory.backends.keyset import item_seek_key
 from neuroca.memory.models.memory_item import MemoryContent, MemoryItem, MemoryMetadata
 
 logger = logging.getLogger(__name__)
@@ -103,6 +104,12 @@ class SQLiteCRUD:
             return value.astimezone(timezone.utc).isoformat()
         return value
 
+    def _seek_timestamp(self, memory_id: str, metadata: Any) -> float:
+        """Return the keyset timestamp for ``metadata`` as it will be stored."""
+
+        metadata_dict, _ = self._serialise_metadata(metadata)
+        return item_seek_key(memory_id, {"metadata": metadata_dict})[0]
+
     def _now_iso(self) -> str:
         """Return the current UTC timestamp in ISO 8601 format."""
 
@@ -169,14 +176,15 @@ class SQLiteCRUD:
 
         conn.execute(
             """
-            INSERT INTO memory_items (id, content, summary, created_at)
-            VALUES (?, ?, ?, ?)
+            INSERT INTO memory_items (id, content, summary, created_at, seek_ts)
+            VALUES (?, ?, ?, ?, ?)
             """,
             (
                 memory_id,
                 serialised_content,
                 memory_item.summary,
-                self._now_iso()
+                self._now_iso(),
+                self._seek_timestamp(memory_id, memory_item.metadata),
             )
         )
 
@@ -312,13 +320,14 @@ class SQLiteCRUD:
         conn.execute(
             """
             UPDATE memory_items
-            SET content = ?, summary = ?, last_modified = ?
+            SET content = ?, summary = ?, last_modified = ?, seek_ts = ?
             WHERE id = ?
             """,
             (
                 serialised_content,
                 memory_item.summary,
                 self._now_iso(),
+                self._seek_timestamp(memory_id, memory_item.metadata),
                 memory_id
             )
         )
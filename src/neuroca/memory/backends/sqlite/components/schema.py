@@ -5,8 +5,11 @@ This module provides a class for managing SQLite database schema, including
 tables, indices, and constraints for the memory storage system.
 """
 
+import json
 import logging
 
+from neuroca.memory.backends.keyset import item_seek_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,7 +55,8 @@ class SQLiteSchema:
                     embeddings BLOB,
                     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
                     last_accessed TIMESTAMP,
-                    last_modified TIMESTAMP
+                    last_modified TIMESTAMP,
+                    seek_ts REAL
                 )
             """)
             
@@ -76,11 +80,46 @@ class SQLiteSchema:
                 )
             """)
             
+            # Databases created before keyset pagination lack seek_ts
+            self._ensure_seek_column()
+            
             # Create indices for improved search performance
             self._create_indices()
             
             logger.debug("SQLite database schema initialized successfully")
     
+    def _ensure_seek_column(self) -> None:
+        """
+        Add and backfill the ``seek_ts`` keyset column on older databases.
+        
+        ``seek_ts`` holds the POSIX ``metadata.created_at`` of each memory so
+        that listings can seek on ``(seek_ts, id)`` with the same key the
+        manager encodes into pagination cursors.
+        """
+        conn = self.connection_manager.get_connection()
+        
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(memory_items)")}
+        if "seek_ts" not in columns:
+            conn.execute("ALTER TABLE memory_items ADD COLUMN seek_ts REAL")
+        
+        rows = conn.execute(
+            """
+            SELECT m.id, mm.metadata_json
+            FROM memory_items m
+            LEFT JOIN memory_metadata mm ON m.id = mm.memory_id
+            WHERE m.seek_ts IS NULL
+            """
+        ).fetchall()
+        if rows:
+            conn.executemany(
+                "UPDATE memory_items SET seek_ts = ? WHERE id = ?",
+                [
+                    (item_seek_key(row[0], {"metadata": json.loads(row[1] or "{}")})[0], row[0])
+                    for row in rows
+                ],
+            )
+            logger.info(f"Backfilled keyset column for {len(rows)} memories")
+    
     def _create_indices(self) -> None:
         """
         Create indices for improved query performance.
@@ -109,6 +148,11 @@ class SQLiteSchema:
                 "CREATE INDEX IF NOT EXISTS idx_memory_created ON memory_items(created_at)"
             )
             
+            # Index on the keyset (seek_ts, id) for cursor pagination
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_memory_seek ON memory_items(seek_ts, id)"
+            )
+            
             # Index on last_accessed for filtering
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_memory_accessed ON memory_items(last_accessed)"
@@ -9,8 +9,9 @@ import json
 import logging
 import sqlite3
 from datetime import datetime, timezone
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from neuroca.memory.backends.keyset import SeekKey
 from neuroca.memory.models.memory_item import MemoryItem
 from neuroca.memory.models.search import MemorySearchOptions as SearchFilter, MemorySearchResult as SearchResult, MemorySearchResults as SearchResults
 
@@ -104,6 +105,150 @@ class SQLiteSearch:
         logger.debug(f"Count returned {count} memories")
         return count
     
+    def seek(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        after: Optional[SeekKey] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return a keyset page of memories ordered by ``(seek_ts, id)``.
+        
+        The page starts strictly after ``after`` using the ``idx_memory_seek``
+        index, so later pages cost the same as the first. Scalar
+        ``metadata.*`` equality and ``{"$in": [...]}`` membership filters are
+        evaluated in SQL; any other filter
+        is checked on the returned rows, reading further batches until
+        ``limit`` matches are found.
+        
+        Args:
+            filters: Dict of dotted field paths to required values
+            after: Key of the last memory of the previous page
+            limit: Maximum number of memories to return
+            
+        Returns:
+            List of memory dictionaries
+        """
+        if limit <= 0:
+            return []
+        
+        conn = self.connection_manager.get_connection()
+        where_clauses, params, residual = self._keyset_filter_clauses(filters or {})
+        batch_size = limit if not residual else max(limit * 2, 100)
+        
+        results: List[Dict[str, Any]] = []
+        boundary = tuple(after) if after is not None else None
+        while len(results) < limit:
+            clauses = list(where_clauses)
+            query_params = list(params)
+            if boundary is not None:
+                clauses.append("(m.seek_ts, m.id) > (?, ?)")
+                query_params.extend(boundary)
+            
+            sql_query = """
+                SELECT m.id, m.content, m.summary, m.created_at,
+                       m.last_accessed, m.last_modified, mm.metadata_json, m.seek_ts
+                FROM memory_items m
+                LEFT JOIN memory_metadata mm ON m.id = mm.memory_id
+            """
+            if clauses:
+                sql_query += " WHERE " + " AND ".join(clauses)
+            sql_query += " ORDER BY m.seek_ts, m.id LIMIT ?"
+            query_params.append(batch_size)
+            
+            rows = conn.execute(sql_query, query_params).fetchall()
+            for row in rows:
+                boundary = (row[7], row[0])
+                item = self._row_to_seek_item(row)
+                if residual and not self._matches_residual(item, residual):
+                    continue
+                results.append(item)
+                if len(results) >= limit:
+                    break
+            if len(rows) < batch_size:
+                break
+        
+        return results
+    
+    def _keyset_filter_clauses(
+        self,
+        filters: Dict[str, Any],
+    ) -> Tuple[List[str], List[Any], Dict[str, Any]]:
+        """
+        Translate dotted equality filters into SQL where possible.
+        
+        Args:
+            filters: Dict of dotted field paths to required values
+            
+        Returns:
+            Tuple of (where clauses, parameters, filters left to check in Python)
+        """
+        where_clauses: List[str] = []
+        params: List[Any] = []
+        residual: Dict[str, Any] = {}
+        
+        for field, value in filters.items():
+            path = field.split(".")
+            members = self._in_members(value)
+            json_field = len(path) > 1 and path[0] == "metadata" and path[1] != "tags"
+            json_path = "$." + ".".join(f'"{part}"' for part in path[1:])
+            if len(path) == 3 and path[:2] == ["metadata", "tags"] and value is True:
+                where_clauses.append(
+                    "EXISTS (SELECT 1 FROM memory_tags t WHERE t.memory_id = m.id AND t.tag = ?)"
+                )
+                params.append(path[2])
+            elif json_field and self._is_sql_scalar(value):
+                where_clauses.append("json_extract(mm.metadata_json, ?) = ?")
+                params.extend([json_path, value])
+            elif json_field and members:
+                placeholders = ", ".join("?" for _ in members)
+                where_clauses.append(f"json_extract(mm.metadata_json, ?) IN ({placeholders})")
+                params.extend([json_path, *members])
+            else:
+                residual[field] = value
+        
+        return where_clauses, params, residual
+    
+    @staticmethod
+    def _is_sql_scalar(value: Any) -> bool:
+        """Whether a filter value compares equal to its json_extract result."""
+        return isinstance(value, (str, int, float)) and not isinstance(value, bool)
+    
+    @classmethod
+    def _in_members(cls, value: Any) -> Optional[List[Any]]:
+        """Return the members of a ``{"$in": [...]}`` filter of SQL scalars, if it is one."""
+        if not isinstance(value, dict) or set(value) != {"$in"}:
+            return None
+        members = value["$in"]
+        if not isinstance(members, (list, tuple, set)) or not all(cls._is_sql_scalar(m) for m in members):
+            return None
+        return list(members)
+    
+    def _row_to_seek_item(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a keyset row into the dictionary form used by listings."""
+        item = self._row_to_memory_item(row).model_dump()
+        if not row[6]:
+            # Without stored metadata the keyset timestamp is 0.0; keep the
+            # returned created_at consistent with it for cursor encoding.
+            item["metadata"]["created_at"] = datetime.fromtimestamp(row[7] or 0.0, timezone.utc)
+        return item
+    
+    @staticmethod
+    def _matches_residual(item: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+        """Check dotted-path equality filters against a memory dictionary."""
+        for field, value in filters.items():
+            current: Any = item
+            for part in field.split("."):
+                if not isinstance(current, dict) or part not in current:
+                    return False
+                current = current[part]
+            if isinstance(value, dict) and set(value) == {"$in"}:
+                if current not in value["$in"]:
+                    return False
+            elif current != value:
+                return False
+        return True
+    
     def _build_search_query(
         self,
         query: str,
@@ -280,25 +425,7 @@ class SQLiteSearch:
         results = []
         
         for row in rows:
-            metadata = {}
-            if row[6]:  # metadata_json
-                metadata = json.loads(row[6])
-                tags_field = metadata.get("tags")
-                if isinstance(tags_field, list):
-                    metadata["tags"] = {str(tag): True for tag in tags_field}
-
-            content_value = row[1]
-            if isinstance(content_value, str):
-                content_payload: dict[str, Any] = {"text": content_value}
-            else:
-                content_payload = content_value
-
-            memory_item = MemoryItem(
-                id=row[0],
-                content=content_payload,
-                summary=row[2],
-                metadata=metadata
-            )
+            memory_item = self._row_to_memory_item(row)
             
             # For simplicity, use a constant score
             # In a real implementation, you might want to calculate relevance scores
@@ -308,6 +435,42 @@ class SQLiteSearch:
 
         return results
 
+    def _row_to_memory_item(self, row: sqlite3.Row) -> MemoryItem:
+        """
+        Build a memory item from a ``memory_items``/``memory_metadata`` row.
+        
+        Args:
+            row: SQL row starting with (id, content, summary, created_at,
+                last_accessed, last_modified, metadata_json)
+            
+        Returns:
+            MemoryItem: The reconstructed memory item
+        """
+        metadata = {}
+        if row[6]:  # metadata_json
+            metadata = json.loads(row[6])
+            tags_field = metadata.get("tags")
+            if isinstance(tags_field, list):
+                metadata["tags"] = {str(tag): True for tag in tags_field}
+
+        content_value = row[1]
+        if isinstance(content_value, str):
+            # Structured content is stored as JSON; plain strings are text.
+            try:
+                decoded = json.loads(content_value)
+            except json.JSONDecodeError:
+                decoded = None
+            content_payload: Any = decoded if isinstance(decoded, dict) else {"text": content_value}
+        else:
+            content_payload = content_value
+
+        return MemoryItem(
+            id=row[0],
+            content=content_payload,
+            summary=row[2],
+            metadata=metadata
+        )
+
     @staticmethod
     def _normalise_timestamp(value: Any) -> Any:
         """Convert datetime filters to timezone-aware ISO strings."""
@@ -9,6 +9,7 @@ import logging
 from typing import Any, Dict, List, Optional
 
 from neuroca.memory.backends.base import BaseStorageBackend
+from neuroca.memory.backends.keyset import SeekKey
 from neuroca.memory.backends.sqlite.components.batch import SQLiteBatch
 from neuroca.memory.backends.sqlite.components.connection import SQLiteConnection
 from neuroca.memory.backends.sqlite.components.crud import SQLiteCRUD
@@ -136,6 +137,24 @@ class SQLiteBackend(BaseStorageBackend):
         except Exception as e:
             raise StorageOperationError(f"Failed to query items: {str(e)}") from e
 
+    async def _seek_items(
+        self,
+        filters: Optional[Dict[str, Any]],
+        after: Optional[SeekKey],
+        limit: int,
+    ) -> List[dict]:
+        """Read one keyset page using the ``(seek_ts, id)`` index."""
+
+        try:
+            return await self.connection.execute_async(
+                self.search.seek,
+                filters,
+                after,
+                limit,
+            )
+        except Exception as e:
+            raise StorageOperationError(f"Failed to seek items: {str(e)}") from e
+
     async def _count_items(self, filter_criteria: Optional[dict] = None) -> int:
         """Count items matching filter criteria."""
         try:
@@ -137,6 +137,11 @@ class InvalidTierError(Exception):
     pass
 
 
+class InvalidCursorError(ValueError):
+    """Exception raised when a pagination cursor cannot be decoded."""
+    pass
+
+
 class MemoryManagerInitializationError(Exception):
     """Exception raised when memory manager initialization fails."""
     pass
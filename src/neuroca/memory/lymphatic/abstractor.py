@@ -38,6 +38,7 @@ from typing import Any, Optional
 from neuroca.config.settings import AbstractorConfig
 from neuroca.core.exceptions import AbstractionError, ConfigurationError
 from neuroca.memory.base import MemoryComponent, MemoryItem
+from neuroca.memory.lymphatic.clustering import VectorizedClusteringBackend
 from neuroca.memory.utils.metrics import track_processing_time
 from neuroca.memory.utils.validation import validate_memory_items
 
@@ -162,6 +163,14 @@ class Abstractor(MemoryComponent):
         # Internal storage for concepts being processed
         self._concept_cache: dict[str, AbstractConcept] = {}
         
+        # Clustering engine ("vectorized" by default, "greedy" for the legacy single pass)
+        self._clustering_backend_name = getattr(self.config, "clustering_backend", "vectorized")
+        self._clustering_backend: Optional[VectorizedClusteringBackend] = None
+        if self._clustering_backend_name == "vectorized":
+            self._clustering_backend = VectorizedClusteringBackend(
+                block_size=getattr(self.config, "clustering_block_size", 256)
+            )
+        
         # Tracking metrics
         self._processed_items_count = 0
         self._generated_concepts_count = 0
@@ -184,6 +193,13 @@ class Abstractor(MemoryComponent):
             
             if self.config.max_attributes_per_concept < 1:
                 raise ConfigurationError("max_attributes_per_concept must be at least 1")
+            
+            backend = getattr(self.config, "clustering_backend", "vectorized")
+            if backend not in ("vectorized", "greedy"):
+                raise ConfigurationError("clustering_backend must be 'vectorized' or 'greedy'")
+            
+            if getattr(self.config, "clustering_block_size", 256) < 1:
+                raise ConfigurationError("clustering_block_size must be at least 1")
                 
         except AttributeError as e:
             raise ConfigurationError(f"Missing required configuration: {str(e)}")
@@ -394,8 +410,12 @@ class Abstractor(MemoryComponent):
             logger.debug(f"Not enough items ({len(features)}) for clustering, minimum is {self.config.min_items_for_abstraction}")
             return [[f] for f in features]  # Each item in its own cluster
         
-        # Simple clustering based on keyword/entity overlap
-        # In production, use more sophisticated clustering algorithms
+        if self._clustering_backend is not None:
+            clusters = self._clustering_backend.cluster(features, self.config.similarity_threshold)
+            logger.debug(f"Identified {len(clusters)} clusters from {len(features)} items")
+            return clusters
+        
+        # Legacy greedy clustering based on keyword/entity overlap
         clusters = []
         unassigned = features.copy()
         
@@ -733,16 +753,19 @@ class Abstractor(MemoryComponent):
             return 0.5  # Default confidence for single-item clusters
         
         # Calculate average pairwise similarity
-        total_similarity = 0.0
-        pair_count = 0
-        
-        for i in range(len(cluster)):
-            for j in range(i + 1, len(cluster)):
-                similarity = self._calculate_similarity(cluster[i], cluster[j])
-                total_similarity += similarity
-                pair_count += 1
-        
-        avg_similarity = total_similarity / pair_count if pair_count > 0 else 0.0
+        if self._clustering_backend is not None:
+            avg_similarity = self._clustering_backend.mean_pairwise_similarity(cluster) or 0.0
+        else:
+            total_similarity = 0.0
+            pair_count = 0
+            
+            for i in range(len(cluster)):
+                for j in range(i + 1, len(cluster)):
+                    similarity = self._calculate_similarity(cluster[i], cluster[j])
+                    total_similarity += similarity
+                    pair_count += 1
+            
+            avg_similarity = total_similarity / pair_count if pair_count > 0 else 0.0
         
         # Adjust confidence based on cluster size
         size_factor = min(1.0, len(cluster) / self.config.optimal_cluster_size)
@@ -0,0 +1,334 @@
+"""
+Vectorized Clustering Backend for the Lymphatic Abstractor
+
+This module provides the clustering engine used by the Abstractor to group related
+memory features before concept generation. The original greedy implementation compared
+every unassigned item against a seed with a pure-Python similarity function, which is
+quadratic in interpreter time and dominates abstraction runs on large batches.
+
+The vectorized backend instead compiles the feature dictionaries produced by
+``Abstractor._extract_features`` into matrices:
+
+- a sparse binary keyword matrix and a sparse binary entity matrix (CSR)
+- dense, L2-normalised embedding matrices grouped by dimensionality
+- integer codes for content types and a sentiment vector
+
+Pairwise similarity is then evaluated block by block with matrix products in float64,
+adding the terms in the same order as ``Abstractor._calculate_similarity``. Clusters are
+formed with the same seed pass as the greedy implementation: the first unassigned item
+seeds a cluster and takes every unassigned item whose similarity to the seed meets the
+threshold. Only the comparisons are vectorized, so the clusters, their order and the
+order of their members are the ones the greedy pass produces. Cosine similarities of
+embeddings are computed from normalised vectors and may differ from the Python loop in
+the last bits, which only matters for pairs exactly at the threshold.
+
+Usage:
+    backend = VectorizedClusteringBackend(block_size=256)
+    clusters = backend.cluster(features, threshold=0.7)
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import numpy as np
+from scipy import sparse
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Weights mirror Abstractor._calculate_similarity
+KEYWORD_WEIGHT = 0.4
+ENTITY_WEIGHT = 0.4
+CONTENT_TYPE_WEIGHT = 0.1
+SENTIMENT_WEIGHT = 0.1
+
+
+@dataclass
+class FeatureMatrix:
+    """
+    Matrix representation of a batch of extracted memory features.
+
+    Attributes:
+        keywords: Binary CSR matrix (items x keyword vocabulary)
+        entities: Binary CSR matrix (items x entity vocabulary)
+        keyword_counts: Number of distinct keywords per item
+        entity_counts: Number of distinct entities per item
+        content_types: Integer code of each item's content type
+        sentiments: Sentiment score of each item
+        embedding_dims: Embedding dimensionality per item (0 when absent)
+        embeddings: Mapping of dimensionality to (row indices, normalised matrix)
+    """
+    keywords: sparse.csr_matrix
+    entities: sparse.csr_matrix
+    keyword_counts: np.ndarray
+    entity_counts: np.ndarray
+    content_types: np.ndarray
+    sentiments: np.ndarray
+    embedding_dims: np.ndarray
+    embeddings: dict[int, tuple[np.ndarray, np.ndarray]] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """Number of items represented by the matrix."""
+        return int(self.sentiments.shape[0])
+
+
+def _binary_csr(rows: list[list[Any]], vocabulary: dict[Any, int]) -> tuple[sparse.csr_matrix, np.ndarray]:
+    """
+    Build a binary CSR matrix from per-row token lists.
+
+    Args:
+        rows: Token list for each row
+        vocabulary: Token to column mapping, extended in place
+
+    Returns:
+        Tuple of the CSR matrix and the number of distinct tokens per row
+    """
+    indptr = [0]
+    indices: list[int] = []
+    for tokens in rows:
+        columns = {vocabulary.setdefault(token, len(vocabulary)) for token in tokens}
+        indices.extend(sorted(columns))
+        indptr.append(len(indices))
+
+    data = np.ones(len(indices), dtype=np.float64)
+    matrix = sparse.csr_matrix(
+        (data, np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+        shape=(len(rows), max(1, len(vocabulary))),
+    )
+    counts = np.diff(matrix.indptr).astype(np.float64)
+    return matrix, counts
+
+
+def build_feature_matrix(features: list[dict[str, Any]]) -> FeatureMatrix:
+    """
+    Compile Abstractor feature dictionaries into a FeatureMatrix.
+
+    Args:
+        features: Feature dictionaries as produced by ``Abstractor._extract_features``
+
+    Returns:
+        FeatureMatrix describing the batch
+    """
+    keywords, keyword_counts = _binary_csr([f.get("keywords") or [] for f in features], {})
+    entities, entity_counts = _binary_csr([f.get("entities") or [] for f in features], {})
+
+    type_codes: dict[Any, int] = {}
+    content_types = np.fromiter(
+        (type_codes.setdefault(f.get("content_type"), len(type_codes)) for f in features),
+        dtype=np.int64,
+        count=len(features),
+    )
+    sentiments = np.fromiter(
+        (float(f.get("sentiment", 0) or 0) for f in features),
+        dtype=np.float64,
+        count=len(features),
+    )
+
+    # Group embeddings by dimensionality; mismatched dimensions never compare as similar
+    embedding_dims = np.zeros(len(features), dtype=np.int64)
+    grouped: dict[int, tuple[list[int], list[Any]]] = {}
+    for index, feature in enumerate(features):
+        embedding = feature.get("embedding")
+        if embedding is None or len(embedding) == 0:
+            continue
+        dim = len(embedding)
+        embedding_dims[index] = dim
+        rows, vectors = grouped.setdefault(dim, ([], []))
+        rows.append(index)
+        vectors.append(embedding)
+
+    embeddings: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    for dim, (rows, vectors) in grouped.items():
+        matrix = np.asarray(vectors, dtype=np.float64)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        # Zero vectors stay zero so their cosine similarity evaluates to 0.0
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        embeddings[dim] = (np.asarray(rows, dtype=np.int64), matrix)
+
+    return FeatureMatrix(
+        keywords=keywords,
+        entities=entities,
+        keyword_counts=keyword_counts,
+        entity_counts=entity_counts,
+        content_types=content_types,
+        sentiments=sentiments,
+        embedding_dims=embedding_dims,
+        embeddings=embeddings,
+    )
+
+
+def _jaccard_block(
+    matrix: sparse.csr_matrix,
+    counts: np.ndarray,
+    rows: slice,
+) -> np.ndarray:
+    """
+    Compute Jaccard similarity between a block of rows and every row.
+
+    Args:
+        matrix: Binary CSR matrix
+        counts: Number of set bits per row
+        rows: Slice selecting the block rows
+
+    Returns:
+        Dense (block x n) Jaccard similarity matrix
+    """
+    intersection = (matrix[rows] @ matrix.T).toarray()
+    union = counts[rows, None] + counts[None, :] - intersection
+    # Two empty sets are considered identical, as in Abstractor._jaccard_similarity
+    return np.divide(intersection, union, out=np.ones_like(intersection), where=union > 0)
+
+
+def similarity_block(matrix: FeatureMatrix, start: int, stop: int) -> np.ndarray:
+    """
+    Compute the similarity of rows ``start:stop`` against every row in the batch.
+
+    Args:
+        matrix: Compiled feature matrix
+        start: First row of the block
+        stop: One past the last row of the block
+
+    Returns:
+        Dense (block x n) similarity matrix in the range used by the Abstractor
+    """
+    rows = slice(start, stop)
+
+    score = KEYWORD_WEIGHT * _jaccard_block(matrix.keywords, matrix.keyword_counts, rows)
+    score += ENTITY_WEIGHT * _jaccard_block(matrix.entities, matrix.entity_counts, rows)
+    score += CONTENT_TYPE_WEIGHT * (
+        matrix.content_types[rows, None] == matrix.content_types[None, :]
+    )
+    sentiment_diff = np.abs(matrix.sentiments[rows, None] - matrix.sentiments[None, :])
+    score += SENTIMENT_WEIGHT * np.maximum(0.0, 1.0 - sentiment_diff)
+
+    # Pairs where both items carry an embedding use cosine similarity instead
+    dims = matrix.embedding_dims
+    block_dims = dims[rows]
+    has_embedding = block_dims[:, None] > 0
+    both = has_embedding & (dims[None, :] > 0)
+    if both.any():
+        score[both] = 0.0
+        for dim, (members, vectors) in matrix.embeddings.items():
+            local = np.nonzero(block_dims == dim)[0]
+            if local.size == 0:
+                continue
+            # Map block-local rows to their position in the dimension group
+            positions = np.searchsorted(members, local + start)
+            cosine = vectors[positions] @ vectors.T
+            score[np.ix_(local, members)] = cosine
+
+    return score
+
+
+class VectorizedClusteringBackend:
+    """
+    Seed-based clustering over compiled feature matrices.
+
+    Produces the same clusters as the Abstractor's greedy pass: each cluster is seeded by
+    the first unassigned item and absorbs every unassigned item at least ``threshold``
+    similar to the seed. Similarity rows are evaluated in blocks, so peak memory stays
+    at ``block_size * n`` floats regardless of batch size, and blocks whose rows were
+    all assigned by earlier seeds are skipped.
+    """
+
+    def __init__(self, block_size: int = 256):
+        """
+        Initialize the clustering backend.
+
+        Args:
+            block_size: Number of rows evaluated per similarity block
+
+        Raises:
+            ValueError: If block_size is not positive
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        self.block_size = block_size
+
+    def cluster(self, features: list[dict[str, Any]], threshold: float) -> list[list[dict[str, Any]]]:
+        """
+        Cluster feature dictionaries by similarity.
+
+        Args:
+            features: Feature dictionaries to cluster
+            threshold: Minimum similarity for two items to share a cluster
+
+        Returns:
+            List of clusters, ordered by the position of their first member
+        """
+        if not features:
+            return []
+
+        labels = self.labels(build_feature_matrix(features), threshold)
+
+        clusters: dict[int, list[dict[str, Any]]] = {}
+        for feature, label in zip(features, labels.tolist()):
+            clusters.setdefault(label, []).append(feature)
+
+        logger.debug(f"Vectorized clustering produced {len(clusters)} clusters from {len(features)} items")
+        return list(clusters.values())
+
+    def labels(self, matrix: FeatureMatrix, threshold: float) -> np.ndarray:
+        """
+        Compute a cluster label for every row of a feature matrix.
+
+        Args:
+            matrix: Compiled feature matrix
+            threshold: Minimum similarity to a seed for joining its cluster
+
+        Returns:
+            Array of cluster labels, one per row, numbered in seed order
+        """
+        n = matrix.size
+        labels = np.full(n, -1, dtype=np.int64)
+        next_label = 0
+
+        for start in range(0, n, self.block_size):
+            stop = min(start + self.block_size, n)
+            if (labels[start:stop] >= 0).all():
+                continue
+            block = similarity_block(matrix, start, stop)
+            for local in range(stop - start):
+                seed = start + local
+                if labels[seed] >= 0:
+                    continue
+                # Every row before the seed is already assigned, as in the greedy pass
+                members = (labels < 0) & (block[local] >= threshold)
+                members[seed] = True
+                labels[members] = next_label
+                next_label += 1
+
+        return labels
+
+    def mean_pairwise_similarity(self, features: list[dict[str, Any]]) -> Optional[float]:
+        """
+        Compute the average pairwise similarity of a group of feature dictionaries.
+
+        Args:
+            features: Feature dictionaries (typically a single cluster)
+
+        Returns:
+            Average similarity over distinct pairs, or None for fewer than two items
+        """
+        n = len(features)
+        if n < 2:
+            return None
+
+        matrix = build_feature_matrix(features)
+        total = 0.0
+        for start in range(0, n, self.block_size):
+            stop = min(start + self.block_size, n)
+            block = similarity_block(matrix, start, stop)
+            total += float(np.triu(block, k=start + 1).sum(dtype=np.float64))
+
+        return total / (n * (n - 1) / 2)
+
+
+__all__ = [
+    "FeatureMatrix",
+    "VectorizedClusteringBackend",
+    "build_feature_matrix",
+    "similarity_block",
+]
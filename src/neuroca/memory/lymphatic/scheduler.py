@@ -13,6 +13,18 @@ The scheduler manages:
 4. Priority-based scheduling of maintenance tasks
 5. Adaptive scheduling based on system load and urgency
 
+Due tasks are dispatched to a worker pool rather than executed on the scheduler
+thread: synchronous callbacks run on a thread pool sized to ``max_concurrent_tasks``
+and coroutines run on a dedicated event loop thread, so the concurrency limit is
+actually honoured. CPU load for idle detection is sampled in the background, and
+per-priority queue latency (time between a task becoming due and being dispatched)
+is reported in the scheduler statistics.
+
+Python threads cannot be interrupted, so a synchronous task that exceeds its timeout
+is reported as failed while its worker keeps running. Such abandoned workers keep
+their concurrency slot until the callback returns, which caps them at
+``max_concurrent_tasks``, and the task itself is not dispatched again until then.
+
 Usage:
     scheduler = LymphaticScheduler()
     scheduler.register_task(memory_consolidation_task, priority=Priority.HIGH)
@@ -30,7 +42,9 @@ import logging
 import threading
 import time
 import uuid
+from collections import deque
 from collections.abc import Coroutine
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from functools import total_ordering
 from typing import Any, Callable, Optional, Union
@@ -38,6 +52,9 @@ from typing import Any, Callable, Optional, Union
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Number of recent dispatch latencies kept per priority for percentile reporting
+LATENCY_WINDOW = 256
+
 
 class Priority(enum.IntEnum):
     """Priority levels for scheduled tasks."""
@@ -114,6 +131,15 @@ class ScheduledTask:
         return True
 
 
+@dataclass
+class _Execution:
+    """Bookkeeping for a task handed to the worker pool."""
+    task: ScheduledTask
+    future: Union[Future, "asyncio.Future[Any]"]
+    dispatched_at: float
+    deadline: Optional[float] = None
+
+
 class LymphaticScheduler:
     """
     Scheduler for lymphatic memory system tasks.
@@ -123,13 +149,19 @@ class LymphaticScheduler:
     tasks, and adaptive scheduling based on system load.
     """
     
-    def __init__(self, max_concurrent_tasks: int = 5, idle_threshold: float = 0.3):
+    def __init__(
+        self,
+        max_concurrent_tasks: int = 5,
+        idle_threshold: float = 0.3,
+        idle_sample_interval: float = 1.0
+    ):
         """
         Initialize the lymphatic scheduler.
         
         Args:
             max_concurrent_tasks: Maximum number of tasks to run concurrently
             idle_threshold: CPU utilization threshold below which to consider the system idle
+            idle_sample_interval: Seconds between background CPU utilization samples
         """
         self._task_queue: list[ScheduledTask] = []
         self._task_map: dict[str, ScheduledTask] = {}
@@ -141,6 +173,18 @@ class LymphaticScheduler:
         self._max_concurrent_tasks = max_concurrent_tasks
         self._idle_threshold = idle_threshold
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executions: dict[str, _Execution] = {}
+        # Timed-out synchronous runs still occupying a worker, and their deferred tasks
+        self._abandoned: dict[str, Future] = {}
+        self._held: dict[str, ScheduledTask] = {}
+        
+        # Background CPU sampling for idle detection
+        self._idle_sample_interval = idle_sample_interval
+        self._idle_stop = threading.Event()
+        self._idle_thread: Optional[threading.Thread] = None
+        self._cpu_percent: Optional[float] = None
         
         # Statistics and monitoring
         self._stats = {
@@ -149,6 +193,10 @@ class LymphaticScheduler:
             "avg_execution_time": 0.0,
             "last_idle_period": None,
         }
+        self._latency_counts = {priority: 0 for priority in Priority}
+        self._latency_totals = {priority: 0.0 for priority in Priority}
+        self._latency_max = {priority: 0.0 for priority in Priority}
+        self._latency_recent = {priority: deque(maxlen=LATENCY_WINDOW) for priority in Priority}
     
     def start(self) -> None:
         """Start the scheduler thread."""
@@ -157,6 +205,19 @@ class LymphaticScheduler:
             return
         
         self._running = True
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_concurrent_tasks,
+            thread_name_prefix="LymphaticWorker"
+        )
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._run_event_loop,
+            name="LymphaticEventLoop",
+            daemon=True
+        )
+        self._loop_thread.start()
+        self._start_idle_sampler()
+        
         self._scheduler_thread = threading.Thread(
             target=self._scheduler_loop,
             name="LymphaticScheduler",
@@ -175,6 +236,19 @@ class LymphaticScheduler:
         self._event.set()
         if self._scheduler_thread and self._scheduler_thread.is_alive():
             self._scheduler_thread.join(timeout=5.0)
+        
+        self._idle_stop.set()
+        if self._idle_thread and self._idle_thread.is_alive():
+            self._idle_thread.join(timeout=5.0)
+        
+        # Queued-but-unstarted work is cancelled; running callbacks finish in the background
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._loop_thread and self._loop_thread.is_alive():
+                self._loop_thread.join(timeout=5.0)
         logger.info("Lymphatic scheduler stopped")
     
     def register_task(
@@ -202,7 +276,10 @@ class LymphaticScheduler:
             interval: Interval between recurring executions (in seconds)
             args: Positional arguments to pass to the callback
             kwargs: Keyword arguments to pass to the callback
-            timeout: Maximum execution time before considering the task failed
+            timeout: Maximum execution time before considering the task failed.
+                A synchronous callback cannot be interrupted: it keeps its worker
+                and concurrency slot until it returns, and the task is not run
+                again in the meantime.
             max_retries: Maximum number of retry attempts for failed tasks
             
         Returns:
@@ -259,6 +336,7 @@ class LymphaticScheduler:
             # If the task is not currently running, remove it from the queue
             if task_id not in self._running_tasks:
                 self._task_map.pop(task_id)
+                self._held.pop(task_id, None)
                 # Rebuild the heap without the cancelled task
                 self._task_queue = [t for t in self._task_queue if t.task_id != task_id]
                 heapq.heapify(self._task_queue)
@@ -290,29 +368,71 @@ class LymphaticScheduler:
             Dict: Dictionary containing scheduler statistics
         """
         with self._lock:
-            return self._stats.copy()
+            stats = self._stats.copy()
+            stats["tasks_running"] = len(self._running_tasks)
+            stats["tasks_abandoned"] = len(self._abandoned)
+            stats["tasks_queued"] = len(self._task_queue)
+            stats["queue_latency"] = self._queue_latency_stats()
+            return stats
+    
+    def _queue_latency_stats(self) -> dict[str, dict[str, float]]:
+        """
+        Summarize dispatch latency per priority.
+        
+        Returns:
+            Dict: Per-priority count, average, p95 and maximum latency in seconds
+        """
+        summary = {}
+        for priority in Priority:
+            count = self._latency_counts[priority]
+            recent = sorted(self._latency_recent[priority])
+            summary[priority.name.lower()] = {
+                "count": count,
+                "avg": self._latency_totals[priority] / count if count else 0.0,
+                "p95": recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0,
+                "max": self._latency_max[priority],
+            }
+        return summary
+    
+    def _record_queue_latency(self, task: ScheduledTask, dispatched_at: float) -> None:
+        """
+        Record how long a due task waited before being dispatched.
+        
+        Args:
+            task: The dispatched task
+            dispatched_at: Dispatch timestamp
+        """
+        latency = max(0.0, dispatched_at - task.next_run_time)
+        self._latency_counts[task.priority] += 1
+        self._latency_totals[task.priority] += latency
+        self._latency_max[task.priority] = max(self._latency_max[task.priority], latency)
+        self._latency_recent[task.priority].append(latency)
+    
+    def _run_event_loop(self) -> None:
+        """Run the event loop used for coroutine tasks."""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+        self._loop.close()
     
     def _scheduler_loop(self) -> None:
         """Main scheduler loop that processes the task queue."""
         logger.debug("Scheduler loop started")
         
-        # Create an event loop for this thread if needed
-        try:
-            self._loop = asyncio.get_event_loop()
-        except RuntimeError:
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
-        
         while self._running:
             try:
+                self._expire_timed_out_tasks()
                 self._process_due_tasks()
                 
-                # Wait for the next task or until a new task is added
+                # Wait for the next task, a deadline, a completion or a new task
                 with self._lock:
                     if not self._task_queue:
                         next_task_time = None
                     else:
                         next_task_time = self._task_queue[0].next_run_time
+                    deadlines = [e.deadline for e in self._executions.values() if e.deadline is not None]
+                    if deadlines:
+                        earliest = min(deadlines)
+                        next_task_time = earliest if next_task_time is None else min(next_task_time, earliest)
                 
                 if next_task_time is None:
                     # No tasks in queue, wait for a new task to be added
@@ -336,8 +456,8 @@ class LymphaticScheduler:
         tasks_to_execute = []
         
         with self._lock:
-            # Check if we can run more tasks
-            available_slots = self._max_concurrent_tasks - len(self._running_tasks)
+            # Check if we can run more tasks; abandoned workers still hold a slot
+            available_slots = self._max_concurrent_tasks - len(self._running_tasks) - len(self._abandoned)
             if available_slots <= 0:
                 return
             
@@ -352,71 +472,174 @@ class LymphaticScheduler:
                     self._task_map.pop(task.task_id, None)
                     continue
                 
+                # Never overlap a run whose timed-out predecessor is still executing
+                if task.task_id in self._abandoned:
+                    self._held[task.task_id] = task
+                    continue
+                
                 tasks_to_execute.append(task)
                 self._running_tasks.add(task.task_id)
                 task.status = TaskStatus.RUNNING
+                self._record_queue_latency(task, current_time)
         
-        # Execute the tasks outside the lock
+        # Dispatch the tasks outside the lock
         for task in tasks_to_execute:
             self._execute_task(task)
     
     def _execute_task(self, task: ScheduledTask) -> None:
         """
-        Execute a single task.
+        Dispatch a single task to the worker pool without waiting for it.
+        
+        Synchronous callbacks are submitted to the thread pool and coroutine functions
+        are scheduled on the scheduler's event loop. Completion is handled by a done
+        callback on the resulting future.
         
         Args:
             task: The task to execute
         """
-        logger.debug(f"Executing task '{task.name}' (ID: {task.task_id})")
-        start_time = time.time()
+        logger.debug(f"Dispatching task '{task.name}' (ID: {task.task_id})")
+        dispatched_at = time.time()
         
         try:
-            # Handle both regular functions and coroutines
             if asyncio.iscoroutinefunction(task.callback):
-                future = asyncio.run_coroutine_threadsafe(
-                    task.callback(*task.args, **task.kwargs),
-                    self._loop
-                )
-                
-                # Wait for the coroutine to complete with timeout if specified
-                future.result(task.timeout) if task.timeout else future.result()
+                future = asyncio.run_coroutine_threadsafe(self._run_coroutine(task), self._loop)
+                # Coroutines enforce their own timeout via asyncio.wait_for
+                deadline = None
             else:
-                # Execute synchronous function
-                if task.timeout:
-                    # Use a separate thread with timeout for synchronous functions
-                    result_container = []
-                    
-                    def run_with_result():
-                        try:
-                            result = task.callback(*task.args, **task.kwargs)
-                            result_container.append(result)
-                        except Exception as e:
-                            result_container.append(e)
-                    
-                    thread = threading.Thread(target=run_with_result)
-                    thread.daemon = True
-                    thread.start()
-                    thread.join(task.timeout)
-                    
-                    if thread.is_alive():
-                        raise TimeoutError(f"Task '{task.name}' timed out after {task.timeout} seconds")
-                    
-                    if result_container and isinstance(result_container[0], Exception):
-                        raise result_container[0]
-                    
-                    result_container[0] if result_container else None
-                else:
-                    # Execute directly without timeout
-                    task.callback(*task.args, **task.kwargs)
+                future = self._executor.submit(self._run_callable, task)
+                deadline = dispatched_at + task.timeout if task.timeout else None
+        except Exception as e:
+            self._handle_task_failure(task, e, 0.0)
+            return
+        
+        with self._lock:
+            self._executions[task.task_id] = _Execution(task, future, dispatched_at, deadline)
+        future.add_done_callback(lambda done, task_id=task.task_id: self._on_task_done(task_id, done))
+    
+    @staticmethod
+    def _run_callable(task: ScheduledTask) -> tuple[Optional[BaseException], float]:
+        """
+        Run a synchronous task callback on a worker thread.
+        
+        Args:
+            task: The task to run
             
-            # Task completed successfully
-            execution_time = time.time() - start_time
-            self._handle_task_completion(task, execution_time)
+        Returns:
+            Tuple of the raised exception (or None) and the execution time
+        """
+        start_time = time.time()
+        try:
+            task.callback(*task.args, **task.kwargs)
+            return None, time.time() - start_time
+        except Exception as e:
+            return e, time.time() - start_time
+    
+    @staticmethod
+    async def _run_coroutine(task: ScheduledTask) -> tuple[Optional[BaseException], float]:
+        """
+        Run a coroutine task on the scheduler's event loop.
+        
+        Args:
+            task: The task to run
             
+        Returns:
+            Tuple of the raised exception (or None) and the execution time
+        """
+        start_time = time.time()
+        try:
+            coroutine = task.callback(*task.args, **task.kwargs)
+            if task.timeout:
+                await asyncio.wait_for(coroutine, task.timeout)
+            else:
+                await coroutine
+            return None, time.time() - start_time
+        except asyncio.TimeoutError:
+            error = TimeoutError(f"Task '{task.name}' timed out after {task.timeout} seconds")
+            return error, time.time() - start_time
         except Exception as e:
-            # Task failed
-            execution_time = time.time() - start_time
-            self._handle_task_failure(task, e, execution_time)
+            return e, time.time() - start_time
+    
+    def _claim_execution(self, task_id: str, future: Optional[Future] = None) -> Optional[_Execution]:
+        """
+        Take ownership of a finished or expired execution exactly once.
+        
+        Args:
+            task_id: ID of the task
+            future: Future that must match the registered execution, if given
+            
+        Returns:
+            The execution record, or None if it was already handled
+        """
+        with self._lock:
+            execution = self._executions.get(task_id)
+            if execution is None or (future is not None and execution.future is not future):
+                return None
+            return self._executions.pop(task_id)
+    
+    def _on_task_done(self, task_id: str, future: Future) -> None:
+        """
+        Handle a task future finishing on a worker or event loop thread.
+        
+        Args:
+            task_id: ID of the task
+            future: The completed future
+        """
+        execution = self._claim_execution(task_id, future)
+        if execution is None:
+            # Already reported as timed out; release the worker's slot
+            with self._lock:
+                if self._abandoned.get(task_id) is future:
+                    del self._abandoned[task_id]
+                    held = self._held.pop(task_id, None)
+                    if held is not None:
+                        heapq.heappush(self._task_queue, held)
+            self._event.set()
+            return
+        
+        task = execution.task
+        if future.cancelled():
+            # Cancelled during shutdown before it started; keep it for the next start()
+            with self._lock:
+                self._running_tasks.discard(task.task_id)
+                if task.status != TaskStatus.CANCELLED:
+                    task.status = TaskStatus.PENDING
+                    heapq.heappush(self._task_queue, task)
+            return
+        
+        error = future.exception()
+        if error is None:
+            error, execution_time = future.result()
+        else:
+            execution_time = time.time() - execution.dispatched_at
+        
+        if error is None:
+            self._handle_task_completion(task, execution_time)
+        else:
+            self._handle_task_failure(task, error, execution_time)
+        self._event.set()  # A slot is free again
+    
+    def _expire_timed_out_tasks(self) -> None:
+        """Fail synchronous tasks that have run past their timeout."""
+        now = time.time()
+        with self._lock:
+            expired = [
+                task_id for task_id, execution in self._executions.items()
+                if execution.deadline is not None and execution.deadline <= now
+            ]
+        
+        for task_id in expired:
+            with self._lock:
+                execution = self._claim_execution(task_id)
+                if execution is None:
+                    continue
+                # The worker thread cannot be interrupted; its eventual result is
+                # ignored and it keeps a slot until _on_task_done releases it
+                if not execution.future.done():
+                    self._abandoned[task_id] = execution.future
+            task = execution.task
+            logger.warning(f"Task '{task.name}' timed out; its worker keeps running until the callback returns")
+            error = TimeoutError(f"Task '{task.name}' timed out after {task.timeout} seconds")
+            self._handle_task_failure(task, error, now - execution.dispatched_at)
     
     def _handle_task_completion(self, task: ScheduledTask, execution_time: float) -> None:
         """
@@ -480,30 +703,64 @@ class LymphaticScheduler:
                 else:
                     self._task_map.pop(task.task_id, None)
     
+    def _start_idle_sampler(self) -> None:
+        """Start the background thread that samples CPU utilization."""
+        try:
+            import psutil
+        except ImportError:
+            logger.warning("psutil not available, idle detection disabled")
+            return
+        
+        # Prime the counters; the first non-blocking reading is meaningless
+        psutil.cpu_percent(interval=None)
+        self._idle_stop.clear()
+        self._idle_thread = threading.Thread(
+            target=self._sample_idle_loop,
+            args=(psutil,),
+            name="LymphaticIdleSampler",
+            daemon=True
+        )
+        self._idle_thread.start()
+    
+    def _sample_idle_loop(self, psutil: Any) -> None:
+        """
+        Periodically record CPU utilization without blocking callers.
+        
+        Args:
+            psutil: The psutil module
+        """
+        while not self._idle_stop.wait(self._idle_sample_interval):
+            # Utilization since the previous call, i.e. over the last sample interval
+            self._cpu_percent = psutil.cpu_percent(interval=None)
+    
     def is_system_idle(self) -> bool:
         """
         Check if the system is currently idle.
         
         This can be used to determine if it's a good time to run
-        resource-intensive maintenance tasks.
+        resource-intensive maintenance tasks. The check never blocks: it reads
+        the latest background sample while the scheduler is running, and
+        otherwise the utilization since the previous psutil reading.
         
         Returns:
             bool: True if the system is idle, False otherwise
         """
-        try:
-            import psutil
-            # Get CPU utilization over the last second
-            cpu_percent = psutil.cpu_percent(interval=1.0)
-            is_idle = cpu_percent < (self._idle_threshold * 100)
-            
-            if is_idle:
-                self._stats["last_idle_period"] = datetime.datetime.now().isoformat()
-            
-            return is_idle
-        except ImportError:
-            logger.warning("psutil not available, cannot determine system idle state")
-            # Default to assuming the system is not idle
-            return False
+        cpu_percent = self._cpu_percent
+        if cpu_percent is None:
+            try:
+                import psutil
+            except ImportError:
+                logger.warning("psutil not available, cannot determine system idle state")
+                # Default to assuming the system is not idle
+                return False
+            cpu_percent = psutil.cpu_percent(interval=None)
+        
+        is_idle = cpu_percent < (self._idle_threshold * 100)
+        
+        if is_idle:
+            self._stats["last_idle_period"] = datetime.datetime.now().isoformat()
+        
+        return is_idle
     
     def schedule_during_idle(
         self,
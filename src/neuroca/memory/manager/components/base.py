@@ -16,6 +16,7 @@ from neuroca.memory.manager.circuit_breaker import MaintenanceCircuitBreaker
 from neuroca.memory.manager.consolidation_guard import ConsolidationInFlightGuard
 from neuroca.memory.manager.consolidation_pipeline import TransactionalConsolidationPipeline
 from neuroca.memory.manager.drift_monitor import EmbeddingDriftMonitor
+from neuroca.memory.manager.embedding import EmbeddingPipeline
 from neuroca.memory.manager.events import MaintenanceEventPublisher
 from neuroca.memory.manager.metrics import MemoryMetricsPublisher
 from neuroca.memory.manager.quality import MemoryQualityAnalyzer
@@ -143,6 +144,14 @@ class MemoryManagerBase(MemoryManagerInterface):
         self._sanitizer = MemorySanitizer(
             log=LOGGER.getChild("manager.sanitizer")
         )
+        embedding_config = self._config.get("embedding")
+        if not isinstance(embedding_config, dict):
+            embedding_config = {}
+        self._embedding_pipeline = EmbeddingPipeline.from_config(
+            embedding_config,
+            dimension=self._embedding_dimension,
+            log=LOGGER.getChild("manager.embedding"),
+        )
         self._audit_trail = MemoryAuditTrail(
             log=LOGGER.getChild("manager.audit")
         )
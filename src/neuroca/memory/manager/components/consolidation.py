@@ -175,6 +175,9 @@ class MemoryManagerConsolidationMixin:
                         ) from exc
 
                     reservation.commit(new_id)
+                    self._resource_watchdog.record_transfer(
+                        source_tier, target_tier, memory_data
+                    )
                     if metrics is not None:
                         metrics.record_consolidation(
                             source=source_tier,
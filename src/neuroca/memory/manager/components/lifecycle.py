@@ -129,6 +129,10 @@ class MemoryManagerLifecycleMixin:
                     "Timed out waiting for in-flight consolidations to finish during shutdown",
                 )
 
+            await self._resource_watchdog.close()
+            if self._embedding_pipeline is not None:
+                await self._embedding_pipeline.drain()
+
             if self._stm:
                 await self._stm.shutdown()
 
@@ -33,7 +33,6 @@ class MemoryManagerAddMixin(MemoryManagerOperationSupportMixin):
     ) -> str:
         """Add a sanitised memory item to ``initial_tier`` and return its ID."""
 
-        del embedding  # Retained for signature compatibility.
         self._ensure_initialized()
 
         tier_name = self._resolve_initial_tier(initial_tier)
@@ -47,6 +46,7 @@ class MemoryManagerAddMixin(MemoryManagerOperationSupportMixin):
             tags,
             tier_name,
         )
+        await self._attach_embedding(memory_item, embedding)
         serialized_memory = self._serialize_memory_item(memory_item)
         memory_id = await self._store_memory_with_backpressure(
             tier_name,
@@ -184,6 +184,32 @@ class MemoryManagerAddMixin(MemoryManagerOperationSupportMixin):
             if not getattr(memory_metadata, "tier", None):
                 memory_metadata.tier = tier_name
 
+    async def _attach_embedding(
+        self,
+        memory_item: MemoryItem,
+        embedding: Optional[List[float]],
+    ) -> None:
+        """Attach the caller's embedding or compute one through the pipeline."""
+
+        if embedding is not None:
+            memory_item.embedding = [float(value) for value in embedding]
+            memory_item.metadata.embedding_dimensions = len(memory_item.embedding)
+            return
+
+        pipeline = self._embedding_pipeline
+        if pipeline is None:
+            return
+        text = memory_item.get_text()
+        if not text:
+            return
+        try:
+            memory_item.embedding = await pipeline.embed(text)
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("Storing memory without an embedding: %s", exc)
+            return
+        memory_item.metadata.embedding_model = pipeline.model_name
+        memory_item.metadata.embedding_dimensions = len(memory_item.embedding)
+
     def _serialize_memory_item(self, memory_item: MemoryItem) -> Dict[str, Any]:
         """Serialise ``memory_item`` with graceful fallbacks."""
 
@@ -43,7 +43,10 @@ class MemoryManagerDeleteMixin(MemoryManagerOperationSupportMixin):
         """Delete ``memory_id`` from ``tier_name``."""
 
         tier_instance = self._get_tier_by_name(tier_name)
-        return await tier_instance.delete(memory_id)
+        deleted = await tier_instance.delete(memory_id)
+        if deleted:
+            self._resource_watchdog.record_removed(self._normalize_tier_name(tier_name))
+        return deleted
 
     async def _delete_from_all_tiers(self, memory_id: str) -> bool:
         """Attempt deletion across every configured tier."""
@@ -52,6 +55,7 @@ class MemoryManagerDeleteMixin(MemoryManagerOperationSupportMixin):
         for tier_name in self._tier_iteration_order():
             tier_instance = self._get_tier_by_name(tier_name)
             if await tier_instance.delete(memory_id):
+                self._resource_watchdog.record_removed(tier_name)
                 success = True
         return success
 
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from neuroca.memory.exceptions import MemoryManagerOperationError
+from neuroca.memory.backends.keyset import SeekKey, row_seek_key
+from neuroca.memory.exceptions import InvalidCursorError, MemoryManagerOperationError
 from neuroca.memory.manager.components.base import LOGGER
+from neuroca.memory.manager.pagination import ListCursor, listing_fingerprint
 from neuroca.memory.manager.scoping import MemoryRetrievalScope
 
 from .support import MemoryManagerOperationSupportMixin
@@ -48,6 +50,74 @@ class MemoryManagerSearchMixin(MemoryManagerOperationSupportMixin):
                 f"Failed to search memories: {exc}"
             ) from exc
 
+    async def list_memories_page(
+        self,
+        tags: Optional[List[str]] = None,
+        metadata_filters: Optional[Dict[str, Any]] = None,
+        limit: int = 50,
+        tiers: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        scope: MemoryRetrievalScope | None = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Return one page of memories in tier then ``(created_at, id)`` order.
+
+        Each tier is read with a keyset seek from the position encoded in
+        ``cursor``, so later pages cost the same as the first. The returned
+        cursor is ``None`` once every requested tier has been exhausted.
+        """
+
+        self._ensure_initialized()
+        scope_obj = self._normalize_scope(scope)
+        search_tiers = self._determine_search_tiers(tiers)
+        filters = self._build_search_filters(tags, metadata_filters)
+        fingerprint = listing_fingerprint(filters, search_tiers)
+
+        start = 0
+        after: Optional[SeekKey] = None
+        if cursor:
+            position = ListCursor.decode(cursor)
+            if position.fingerprint != fingerprint or position.tier not in search_tiers:
+                raise InvalidCursorError("Cursor does not belong to this listing")
+            start = search_tiers.index(position.tier)
+            after = position.key
+
+        try:
+            page: List[Dict[str, Any]] = []
+            last: Optional[Tuple[str, SeekKey]] = None
+            for tier_name in search_tiers[start:]:
+                tier_instance = self._get_tier_by_name(tier_name)
+                while len(page) < limit:
+                    wanted = limit - len(page)
+                    rows = await tier_instance.list_page(filters or None, after, wanted)
+                    for row in rows:
+                        after = row_seek_key(row)
+                        memory = self._coerce_memory_item(
+                            {key: value for key, value in row.items() if key not in ("_id", "_meta")}
+                        )
+                        if not self._is_memory_visible(memory, scope_obj):
+                            continue
+                        result = memory.model_dump()
+                        result["tier"] = tier_name
+                        page.append(result)
+                        last = (tier_name, after)
+                        if len(page) >= limit:
+                            break
+                    if len(rows) < wanted:
+                        break
+                if len(page) >= limit:
+                    break
+                after = None
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.exception("Failed to list memories")
+            raise MemoryManagerOperationError(
+                f"Failed to list memories: {exc}"
+            ) from exc
+
+        next_cursor = None
+        if len(page) >= limit and last is not None:
+            next_cursor = ListCursor(tier=last[0], key=last[1], fingerprint=fingerprint).encode()
+        return page, next_cursor
+
     def _determine_search_tiers(self, tiers: Optional[List[str]]) -> List[str]:
         """Return the tier list to query."""
 
@@ -100,6 +100,7 @@ class MemoryManagerTransferMixin(MemoryManagerOperationSupportMixin):
             raise MemoryManagerOperationError(
                 f"Failed to move memory to {target_tier_name}: {exc}"
             ) from exc
+        self._resource_watchdog.record_stored(target_tier_name, payload)
 
     async def _remove_from_source(
         self,
@@ -110,7 +111,7 @@ class MemoryManagerTransferMixin(MemoryManagerOperationSupportMixin):
         """Best-effort deletion from the source tier."""
 
         try:
-            await source_tier.delete(memory_id)
+            deleted = await source_tier.delete(memory_id)
         except Exception:  # noqa: BLE001
             LOGGER.warning(
                 "Failed to delete memory %s from %s after transfer",
@@ -118,6 +119,9 @@ class MemoryManagerTransferMixin(MemoryManagerOperationSupportMixin):
                 source_tier_name,
                 exc_info=True,
             )
+            return
+        if deleted:
+            self._resource_watchdog.record_removed(source_tier_name)
 
     def _remove_from_working_memory(self, memory_id: str) -> None:
         """Remove ``memory_id`` from the working-memory buffer when present."""
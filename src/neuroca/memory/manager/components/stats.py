@@ -197,6 +197,9 @@ class MemoryManagerStatsMixin:
                 )
                 continue
 
+            # Piggy-back on this count to correct the watchdog's occupancy counter
+            self._resource_watchdog.reconcile_count(tier_name, current_value)
+
             try:
                 ratio = max(0.0, min(1.0, current_value / float(capacity)))
             except ZeroDivisionError:
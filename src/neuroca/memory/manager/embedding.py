@@ -0,0 +1,304 @@
+"""Embedding pipeline for memory ingestion.
+
+Memories added without a caller-supplied vector are embedded here before they
+are stored. Requests from concurrent writers are collected into micro-batches
+so the embedder runs once per batch rather than once per memory, vectors are
+cached by a hash of the embedded text, and identical texts that are already
+being embedded share a single in-flight request.
+
+The default :class:`HashingEmbedder` is deterministic and works offline. It
+uses signed feature hashing over word unigrams and bigrams, which is cheap
+and keeps lexically similar texts close, but it is not a semantic model; plug
+in a real embedder for semantic search quality.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import inspect
+import logging
+import re
+from collections import OrderedDict
+from typing import Any, Awaitable, Dict, List, Optional, Protocol, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EmbedderOutput = Union[Sequence[Sequence[float]], np.ndarray]
+
+
+class Embedder(Protocol):
+    """Interface for embedders used by :class:`EmbeddingPipeline`."""
+
+    model_name: str
+
+    def embed(self, texts: Sequence[str]) -> Union[EmbedderOutput, Awaitable[EmbedderOutput]]:
+        """Return one vector per text, synchronously or as an awaitable."""
+
+
+def content_key(text: str) -> str:
+    """Return the cache key for ``text``."""
+
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class HashingEmbedder:
+    """Deterministic, dependency-free embedder based on signed feature hashing.
+
+    Each lower-cased word and each pair of adjacent words is hashed with
+    BLAKE2b to a dimension and a sign; a text's vector is the L2-normalised
+    sum of its features. Feature hashes are memoised, and a whole batch is
+    accumulated with a single :func:`numpy.bincount`.
+    """
+
+    _TOKEN = re.compile(r"\w+")
+
+    def __init__(
+        self,
+        dimension: int = 768,
+        *,
+        seed: int = 0,
+        memo_size: int = 65536,
+    ) -> None:
+        if dimension < 1:
+            raise ValueError("dimension must be at least 1")
+        self.dimension = dimension
+        self.model_name = f"hashing-{dimension}"
+        self._key = seed.to_bytes(8, "little", signed=True)
+        self._memo: Dict[str, Tuple[int, float]] = {}
+        self._memo_size = max(0, memo_size)
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Return a ``(len(texts), dimension)`` array of unit vectors."""
+
+        slots: List[int] = []
+        signs: List[float] = []
+        for row, text in enumerate(texts):
+            offset = row * self.dimension
+            for slot, sign in self._features(text):
+                slots.append(offset + slot)
+                signs.append(sign)
+
+        matrix = np.bincount(
+            np.asarray(slots, dtype=np.int64),
+            weights=np.asarray(signs, dtype=np.float64),
+            minlength=len(texts) * self.dimension,
+        ).reshape(len(texts), self.dimension)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    def _features(self, text: str) -> List[Tuple[int, float]]:
+        """Return the ``(slot, sign)`` pairs for the features of ``text``."""
+
+        words = self._TOKEN.findall(text.lower())
+        features = words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+        return [self._hash(feature) for feature in features]
+
+    def _hash(self, feature: str) -> Tuple[int, float]:
+        cached = self._memo.get(feature)
+        if cached is not None:
+            return cached
+        digest = int.from_bytes(
+            hashlib.blake2b(feature.encode("utf-8"), digest_size=8, key=self._key).digest(),
+            "little",
+        )
+        hashed = (digest % self.dimension, -1.0 if digest >> 63 else 1.0)
+        if len(self._memo) >= self._memo_size:
+            self._memo.clear()
+        if self._memo_size:
+            self._memo[feature] = hashed
+        return hashed
+
+
+class EmbeddingPipeline:
+    """Micro-batch, deduplicate and cache embedding requests.
+
+    Calls to :meth:`embed` made within ``max_batch_delay`` seconds of each
+    other are sent to the embedder together; a batch is dispatched early once
+    ``max_batch_size`` texts are pending. Vectors are cached by content hash
+    in an LRU of ``cache_size`` entries.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        *,
+        max_batch_size: int = 32,
+        max_batch_delay: float = 0.002,
+        cache_size: int = 4096,
+        run_in_thread: bool = False,
+        log: logging.Logger | None = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._embedder = embedder
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay = max(0.0, max_batch_delay)
+        self._cache_size = max(0, cache_size)
+        self._run_in_thread = run_in_thread
+        self._log = log or logger
+
+        self._cache: OrderedDict[str, Tuple[float, ...]] = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._pending: List[Tuple[str, str]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: set[asyncio.Task] = set()
+
+        self.batches = 0
+        self.embedded = 0
+        self.cache_hits = 0
+        self.shared = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Dict[str, Any] | None,
+        *,
+        dimension: int = 768,
+        log: logging.Logger | None = None,
+    ) -> "EmbeddingPipeline | None":
+        """Construct a pipeline from manager configuration.
+
+        Returns ``None`` unless ``enabled`` is set. ``embedder`` may be an
+        object implementing :class:`Embedder`; otherwise the hashing embedder
+        is used with ``dimension`` (or the configured ``dimension``).
+        """
+
+        config = dict(config or {})
+        if not config.get("enabled", False):
+            return None
+
+        embedder = config.get("embedder")
+        if embedder is None or isinstance(embedder, str):
+            if embedder not in (None, "hashing"):
+                raise ValueError(f"Unknown embedder: {embedder}")
+            try:
+                dimension = int(config.get("dimension", dimension))
+            except (TypeError, ValueError):
+                pass
+            embedder = HashingEmbedder(dimension)
+
+        def _number(key: str, default: float, kind: type) -> Any:
+            try:
+                return kind(config.get(key, default))
+            except (TypeError, ValueError):
+                return default
+
+        return cls(
+            embedder,
+            max_batch_size=max(1, _number("max_batch_size", 32, int)),
+            max_batch_delay=_number("max_batch_delay_seconds", 0.002, float),
+            cache_size=_number("cache_size", 4096, int),
+            run_in_thread=bool(config.get("run_in_thread", False)),
+            log=log,
+        )
+
+    @property
+    def model_name(self) -> str:
+        """Name recorded in memory metadata for vectors from this pipeline."""
+
+        return str(getattr(self._embedder, "model_name", type(self._embedder).__name__))
+
+    async def embed(self, text: str) -> List[float]:
+        """Return the embedding for ``text``."""
+
+        key = content_key(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return list(cached)
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.shared += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            self._pending.append((key, text))
+            if len(self._pending) >= self._max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(
+                    self._max_batch_delay, self._dispatch
+                )
+        return list(await asyncio.shield(future))
+
+    async def drain(self) -> None:
+        """Embed pending texts and wait for every in-flight batch."""
+
+        self._dispatch()
+        if self._batches:
+            await asyncio.gather(*list(self._batches), return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return batching and cache counters."""
+
+        return {
+            "model": self.model_name,
+            "batches": self.batches,
+            "embedded": self.embedded,
+            "average_batch_size": self.embedded / self.batches if self.batches else 0.0,
+            "cache_hits": self.cache_hits,
+            "shared_requests": self.shared,
+            "cached_vectors": len(self._cache),
+            "pending": len(self._pending),
+        }
+
+    def _dispatch(self) -> None:
+        """Start embedding pending texts in ``max_batch_size`` chunks."""
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), self._max_batch_size):
+            task = asyncio.ensure_future(self._run(pending[start:start + self._max_batch_size]))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run(self, batch: List[Tuple[str, str]]) -> None:
+        """Embed one batch and resolve the waiting callers."""
+
+        texts = [text for _key, text in batch]
+        try:
+            if self._run_in_thread:
+                vectors = await asyncio.to_thread(self._embedder.embed, texts)
+            else:
+                vectors = self._embedder.embed(texts)
+            if inspect.isawaitable(vectors):
+                vectors = await vectors
+            if len(vectors) != len(batch):
+                raise ValueError(
+                    f"Embedder returned {len(vectors)} vectors for {len(batch)} texts"
+                )
+        except Exception as exc:  # noqa: BLE001
+            self._log.warning("Embedding batch of %d texts failed: %s", len(batch), exc)
+            for key, _text in batch:
+                future = self._inflight.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(exc)
+            return
+
+        if isinstance(vectors, np.ndarray):
+            rows = vectors.tolist()
+        else:
+            rows = [[float(value) for value in vector] for vector in vectors]
+
+        self.batches += 1
+        self.embedded += len(batch)
+        for (key, _text), row in zip(batch, rows):
+            values = tuple(row)
+            if self._cache_size:
+                self._cache[key] = values
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+            future = self._inflight.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(values)
+
+
+__all__ = ["Embedder", "EmbeddingPipeline", "HashingEmbedder", "content_key"]
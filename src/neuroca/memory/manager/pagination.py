@@ -0,0 +1,68 @@
+"""Opaque keyset cursors for paging through memories across tiers."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping
+
+from neuroca.memory.backends.keyset import SeekKey
+from neuroca.memory.exceptions import InvalidCursorError
+
+CURSOR_VERSION = 1
+
+
+def listing_fingerprint(filters: Mapping[str, Any], tiers: Iterable[str]) -> str:
+    """Return a short digest binding a cursor to the listing it came from."""
+
+    payload = json.dumps(
+        {"filters": filters, "tiers": list(tiers)},
+        sort_keys=True,
+        default=str,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class ListCursor:
+    """Position after the last memory returned: its tier and ``(created_at, id)`` key."""
+
+    tier: str
+    key: SeekKey
+    fingerprint: str
+
+    def encode(self) -> str:
+        """Serialise the cursor into a URL-safe token."""
+
+        payload = json.dumps(
+            {"v": CURSOR_VERSION, "t": self.tier, "k": list(self.key), "f": self.fingerprint},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> "ListCursor":
+        """Parse a token produced by :meth:`encode`."""
+
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            if payload.get("v") != CURSOR_VERSION:
+                raise InvalidCursorError("Unsupported cursor version")
+            timestamp, memory_id = payload["k"]
+            return cls(
+                tier=str(payload["t"]),
+                key=(float(timestamp), str(memory_id)),
+                fingerprint=str(payload["f"]),
+            )
+        except InvalidCursorError:
+            raise
+        except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError, AttributeError) as exc:
+            raise InvalidCursorError("Malformed pagination cursor") from exc
+
+
+__all__ = ["CURSOR_VERSION", "ListCursor", "listing_fingerprint"]
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from neuroca.memory.exceptions import MemoryCapacityError
 
@@ -54,6 +56,65 @@ def _coerce_timeout(value: Any) -> float | None:
 
 
 
+def _estimate_bytes(payload: Any) -> int:
+    """Return a cheap estimate of the serialised size of ``payload``."""
+
+    if payload is None:
+        return 0
+    if isinstance(payload, (str, bytes, bytearray)):
+        return len(payload)
+    if isinstance(payload, (int, float, bool)):
+        return 8
+    if isinstance(payload, Mapping):
+        return sum(_estimate_bytes(key) + _estimate_bytes(value) for key, value in payload.items())
+    if isinstance(payload, (list, tuple, set, frozenset)):
+        if not payload:
+            return 0
+        # Embeddings dominate payload size; avoid walking numeric vectors element by element
+        if isinstance(payload, (list, tuple)) and isinstance(payload[0], (int, float)):
+            return 8 * len(payload)
+        return sum(_estimate_bytes(item) for item in payload)
+    dump = getattr(payload, "model_dump", None)
+    if callable(dump):
+        try:
+            return _estimate_bytes(dump())
+        except Exception:  # noqa: BLE001
+            return 0
+    return 8
+
+
+
+@dataclass(slots=True)
+class TierOccupancy:
+    """Running item count and byte estimate for a single tier.
+
+    ``items`` is authoritative between reconciliations: it is seeded from the
+    backend count and then adjusted on every store, delete, transfer and
+    cleanup the manager performs, so admission checks never scan the tier.
+    ``nbytes`` is an estimate derived from stored payload sizes.
+    """
+
+    items: int = 0
+    nbytes: int = 0
+    reconciled_at: float | None = None
+
+    @property
+    def average_item_bytes(self) -> float:
+        """Return the estimated mean payload size in bytes."""
+
+        return self.nbytes / self.items if self.items > 0 else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a serialisable view of the occupancy."""
+
+        return {
+            "items": self.items,
+            "bytes": self.nbytes,
+            "reconciled_at": self.reconciled_at,
+        }
+
+
+
 @dataclass(slots=True)
 class TierResourceLimit:
     """Configuration describing the safeguards for a single tier."""
@@ -65,6 +126,9 @@ class TierResourceLimit:
     ingest_timeout_seconds: float | None = None
     eviction_timeout_seconds: float | None = 5.0
     max_eviction_attempts: int = 2
+    low_watermark_ratio: float | None = 0.75
+    reconcile_interval_seconds: float | None = 60.0
+    eviction_cooldown_seconds: float = 5.0
 
     @classmethod
     def from_config(cls, name: str, config: Dict[str, Any] | None) -> "TierResourceLimit":
@@ -84,6 +148,9 @@ class TierResourceLimit:
         )
 
         attempts = _coerce_positive_int(config.get("max_eviction_attempts")) or 2
+        low_watermark = _coerce_ratio(config.get("low_watermark_ratio", 0.75))
+        reconcile_interval = _coerce_timeout(config.get("reconcile_interval_seconds", 60.0))
+        cooldown = _coerce_timeout(config.get("eviction_cooldown_seconds"))
 
         return cls(
             name=name,
@@ -93,6 +160,9 @@ class TierResourceLimit:
             ingest_timeout_seconds=ingest_timeout,
             eviction_timeout_seconds=eviction_timeout,
             max_eviction_attempts=attempts,
+            low_watermark_ratio=low_watermark,
+            reconcile_interval_seconds=reconcile_interval,
+            eviction_cooldown_seconds=5.0 if cooldown is None else cooldown,
         )
 
     @property
@@ -104,6 +174,15 @@ class TierResourceLimit:
 
         return max(0, int(self.max_items * self.soft_limit_ratio))
 
+    @property
+    def low_watermark_threshold(self) -> int | None:
+        """Return the item count background eviction tries to get below."""
+
+        if self.max_items is None or self.low_watermark_ratio is None:
+            return None
+
+        return max(0, int(self.max_items * self.low_watermark_ratio))
+
     @property
     def capacity_enforced(self) -> bool:
         """Return ``True`` when a hard item limit is configured."""
@@ -112,17 +191,36 @@ class TierResourceLimit:
 
 
 class ResourceLimitWatchdog:
-    """Enforce resource limits and guard against runaway ingestion."""
+    """Enforce resource limits and guard against runaway ingestion.
+
+    Admission decisions use a per-tier :class:`TierOccupancy` rather than
+    counting the backend on every write. The counter is seeded from
+    ``tier.count({})`` on first use, adjusted as the manager stores, deletes,
+    transfers and evicts, and reconciled against the backend in the
+    background once it is older than ``reconcile_interval_seconds``. Stores
+    reserve their slot before awaiting the backend, so concurrent writers
+    cannot overshoot the hard limit between the check and the write.
+
+    With the ``evict`` policy, crossing the soft limit starts a background
+    sweep that runs the tier's cleanup hook until occupancy drops below the
+    low watermark; eviction only happens inline once the hard limit is hit.
+    """
 
     def __init__(
         self,
         limits: Dict[str, TierResourceLimit] | None = None,
         *,
         log: logging.Logger | None = None,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self._limits = dict(limits or {})
         self._log = log or logger.getChild("watchdog")
+        self._clock = clock
         self._locks: Dict[str, asyncio.Lock] = {}
+        self._occupancy: Dict[str, TierOccupancy] = {}
+        self._reconciles: Dict[str, asyncio.Task] = {}
+        self._sweeps: Dict[str, asyncio.Task] = {}
+        self._last_sweep: Dict[str, float] = {}
 
     @classmethod
     def from_config(
@@ -152,6 +250,11 @@ class ResourceLimitWatchdog:
 
         return self._limits.get(tier_name)
 
+    def occupancy(self, tier_name: str) -> TierOccupancy | None:
+        """Return the tracked occupancy for ``tier_name`` once it has been seeded."""
+
+        return self._occupancy.get(tier_name)
+
     def _lock_for(self, tier_name: str) -> asyncio.Lock:
         """Return the watchdog lock for ``tier_name`` creating it lazily."""
 
@@ -166,35 +269,174 @@ class ResourceLimitWatchdog:
         if limit is None or not limit.capacity_enforced:
             return
 
-        lock = self._lock_for(tier_name)
-        async with lock:
-            current = await tier.count({})
+        occupancy = self._occupancy.get(tier_name)
+        if occupancy is None or occupancy.reconciled_at is None:
+            occupancy = await self.reconcile(tier_name, tier)
+        elif self._is_stale(limit, occupancy):
+            self._schedule_reconcile(tier_name, tier)
+
+        max_items = limit.max_items or 0
+        current = occupancy.items
+        if current < max_items:
             threshold = limit.soft_limit_threshold
             if threshold is not None and current >= threshold:
-                self._log.debug(
-                    "Tier %s nearing capacity (%s/%s)", tier_name, current, limit.max_items
-                )
+                if self._log.isEnabledFor(logging.DEBUG):
+                    self._log.debug(
+                        "Tier %s nearing capacity (%s/%s)", tier_name, current, limit.max_items
+                    )
+                if limit.overflow_policy == "evict":
+                    self._schedule_sweep(tier_name, tier, limit)
+            return
+
+        self._log.warning(
+            "Tier %s reached configured capacity (%s/%s) with %s policy",  # noqa: G004
+            tier_name,
+            current,
+            limit.max_items,
+            limit.overflow_policy,
+        )
 
-            if current < (limit.max_items or 0):
+        if limit.overflow_policy == "evict":
+            async with self._lock_for(tier_name):
+                # A sweep or a concurrent writer may already have made room
+                if occupancy.items >= max_items:
+                    await self._attempt_evictions(tier_name, tier, limit, occupancy.items)
+            if occupancy.items < max_items:
                 return
 
-            self._log.warning(
-                "Tier %s reached configured capacity (%s/%s) with %s policy",  # noqa: G004
-                tier_name,
-                current,
-                limit.max_items,
-                limit.overflow_policy,
-            )
+        raise MemoryCapacityError(
+            f"{tier_name} tier is at capacity ({current}/{limit.max_items})"
+        )
+
+    async def reconcile(self, tier_name: str, tier: Any) -> TierOccupancy:
+        """Re-count ``tier`` on the backend and correct the tracked occupancy.
+
+        Changes recorded while the count is running are re-applied on top of
+        it, so a reconciliation never discards writes that raced it.
+        """
+
+        occupancy = self._occupancy.setdefault(tier_name, TierOccupancy())
+        baseline = occupancy.items
+        counted = _coerce_positive_int(await tier.count({})) or 0
+
+        drift = occupancy.items - baseline
+        self._apply_count(occupancy, max(0, counted + drift))
+        return occupancy
+
+    def reconcile_count(self, tier_name: str, count: int) -> None:
+        """Correct the tracked occupancy with a count obtained by the caller."""
+
+        occupancy = self._occupancy.setdefault(tier_name, TierOccupancy())
+        self._apply_count(occupancy, max(0, int(count)))
+
+    def _apply_count(self, occupancy: TierOccupancy, count: int) -> None:
+        """Set ``occupancy`` to ``count`` items, rescaling the byte estimate."""
+
+        if occupancy.items != count:
+            occupancy.nbytes = int(occupancy.average_item_bytes * count)
+            occupancy.items = count
+        occupancy.reconciled_at = self._clock()
 
-            if limit.overflow_policy == "evict":
-                await self._attempt_evictions(tier_name, tier, limit, current)
-                post_cleanup = await tier.count({})
-                if post_cleanup < (limit.max_items or 0):
-                    return
+    def record_stored(self, tier_name: str, payload: Any = None) -> int:
+        """Account for an item stored in ``tier_name`` and return its estimated size."""
 
-            raise MemoryCapacityError(
-                f"{tier_name} tier is at capacity ({current}/{limit.max_items})"
-            )
+        occupancy = self._occupancy.get(tier_name)
+        if occupancy is None:
+            return 0
+        size = _estimate_bytes(payload)
+        occupancy.items += 1
+        occupancy.nbytes += size
+        return size
+
+    def record_removed(self, tier_name: str, count: int = 1, *, nbytes: int | None = None) -> None:
+        """Account for ``count`` items removed from ``tier_name``."""
+
+        occupancy = self._occupancy.get(tier_name)
+        if occupancy is None or count <= 0:
+            return
+        if nbytes is None:
+            nbytes = int(occupancy.average_item_bytes * min(count, occupancy.items))
+        occupancy.items = max(0, occupancy.items - count)
+        occupancy.nbytes = max(0, occupancy.nbytes - nbytes) if occupancy.items else 0
+
+    def record_transfer(self, source_tier: str, target_tier: str, payload: Any = None) -> None:
+        """Account for an item moved from ``source_tier`` into ``target_tier``."""
+
+        if source_tier == target_tier:
+            return
+        self.record_stored(target_tier, payload)
+        self.record_removed(source_tier)
+
+    def _is_stale(self, limit: TierResourceLimit, occupancy: TierOccupancy) -> bool:
+        """Return ``True`` when ``occupancy`` is due for reconciliation."""
+
+        interval = limit.reconcile_interval_seconds
+        if interval is None or occupancy.reconciled_at is None:
+            return False
+        return self._clock() - occupancy.reconciled_at >= interval
+
+    def _schedule_reconcile(self, tier_name: str, tier: Any) -> None:
+        """Reconcile ``tier_name`` in the background unless already running."""
+
+        task = self._reconciles.get(tier_name)
+        if task is not None and not task.done():
+            return
+        self._reconciles[tier_name] = asyncio.get_running_loop().create_task(
+            self._run_background(tier_name, "reconciliation", self.reconcile(tier_name, tier)),
+            name=f"resource-watchdog-reconcile-{tier_name}",
+        )
+
+    def _schedule_sweep(self, tier_name: str, tier: Any, limit: TierResourceLimit) -> None:
+        """Start a low-watermark eviction sweep unless one ran recently."""
+
+        task = self._sweeps.get(tier_name)
+        if task is not None and not task.done():
+            return
+        now = self._clock()
+        last = self._last_sweep.get(tier_name)
+        if last is not None and now - last < limit.eviction_cooldown_seconds:
+            return
+        self._last_sweep[tier_name] = now
+        self._sweeps[tier_name] = asyncio.get_running_loop().create_task(
+            self._run_background(tier_name, "eviction sweep", self._sweep(tier_name, tier, limit)),
+            name=f"resource-watchdog-sweep-{tier_name}",
+        )
+
+    async def _sweep(self, tier_name: str, tier: Any, limit: TierResourceLimit) -> None:
+        """Evict until ``tier_name`` drops below its low watermark."""
+
+        target = limit.low_watermark_threshold
+        if target is None:
+            target = limit.soft_limit_threshold
+        if target is None:
+            return
+
+        async with self._lock_for(tier_name):
+            occupancy = self._occupancy.get(tier_name)
+            if occupancy is None or occupancy.items < target:
+                return
+            await self._attempt_evictions(tier_name, tier, limit, occupancy.items, target=target)
+
+    async def _run_background(self, tier_name: str, description: str, coro: Any) -> None:
+        """Await ``coro`` and log failures instead of surfacing them."""
+
+        try:
+            await coro
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # noqa: BLE001
+            self._log.exception("Background %s for tier %s failed", description, tier_name)
+
+    async def close(self) -> None:
+        """Cancel background reconciliation and eviction tasks."""
+
+        tasks = [*self._reconciles.values(), *self._sweeps.values()]
+        self._reconciles.clear()
+        self._sweeps.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _attempt_evictions(
         self,
@@ -202,14 +444,22 @@ class ResourceLimitWatchdog:
         tier: Any,
         limit: TierResourceLimit,
         starting_count: int,
+        *,
+        target: int | None = None,
     ) -> None:
-        """Attempt to free capacity using the tier's cleanup hook."""
+        """Attempt to free capacity using the tier's cleanup hook.
+
+        Evictions stop once the tier holds fewer than ``target`` items, which
+        defaults to the hard limit.
+        """
 
         cleanup = getattr(tier, "cleanup", None)
         if cleanup is None:
             self._log.error("Tier %s does not implement cleanup; cannot evict", tier_name)
             return
 
+        if target is None:
+            target = limit.max_items or 0
         attempts = max(1, limit.max_eviction_attempts)
         for attempt in range(1, attempts + 1):
             try:
@@ -254,31 +504,42 @@ class ResourceLimitWatchdog:
                     "Tier %s eviction attempt %s removed no items", tier_name, attempt
                 )
 
-            current = await tier.count({})
-            if current < (limit.max_items or 0):
+            # Cleanup may remove items the manager never saw; trust the backend here
+            occupancy = await self.reconcile(tier_name, tier)
+            if occupancy.items < target:
                 return
 
     async def store(self, tier_name: str, tier: Any, payload: Any) -> Any:
-        """Store ``payload`` in ``tier`` honouring configured timeouts."""
+        """Store ``payload`` in ``tier`` honouring configured timeouts.
+
+        The item is counted before the backend is awaited so that concurrent
+        admission checks see it, and un-counted again if the store fails.
+        """
 
         limit = self.limit_for(tier_name)
-        store_coro = tier.store(payload)
+        size = self.record_stored(tier_name, payload)
+        try:
+            store_coro = tier.store(payload)
 
-        if limit is None or not limit.ingest_timeout_seconds:
-            return await store_coro
+            if limit is None or not limit.ingest_timeout_seconds:
+                return await store_coro
 
-        try:
-            return await asyncio.wait_for(store_coro, timeout=limit.ingest_timeout_seconds)
-        except asyncio.TimeoutError:
-            self._log.error(
-                "Timed out storing memory in tier %s after %.2fs",
-                tier_name,
-                limit.ingest_timeout_seconds,
-            )
+            try:
+                return await asyncio.wait_for(store_coro, timeout=limit.ingest_timeout_seconds)
+            except asyncio.TimeoutError:
+                self._log.error(
+                    "Timed out storing memory in tier %s after %.2fs",
+                    tier_name,
+                    limit.ingest_timeout_seconds,
+                )
+                raise
+        except BaseException:
+            self.record_removed(tier_name, nbytes=size)
             raise
 
 
 __all__ = [
+    "TierOccupancy",
     "TierResourceLimit",
     "ResourceLimitWatchdog",
 ]
@@ -13,10 +13,19 @@ persisted. The sanitization process performs several responsibilities:
 The sanitiser is intentionally light-weight and dependency free so it can be
 used inside the memory manager without dragging infrastructure concerns into
 the business logic layer.
+
+All rules share a prefilter built from literal or character-class conditions
+that every rule needs in order to match. Clean text is accepted after a few
+substring searches, and only the rules whose trigger fired run on the slow
+path. Values that were already sanitized are remembered by digest so repeated
+tags and metadata values skip scanning entirely; the cache never holds raw
+input, only redacted output or a marker for values that came through
+unchanged, and it is bounded by both entry count and total cached characters.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
 from typing import Any, Iterable, Mapping
@@ -37,6 +46,9 @@ else:
     def _sanitize_input(input_str: str, allow_html: bool = False) -> str:
         return _external_sanitize_input(input_str, allow_html=allow_html)
 
+# Cache marker for inputs that sanitization returned unchanged
+_UNCHANGED = object()
+
 
 class MemorySanitizer:
     """Scrub and validate memory payloads before persistence."""
@@ -71,6 +83,35 @@ class MemorySanitizer:
         re.compile(r"(?i)\bdo anything now\b"),
     )
 
+    # Necessary conditions for the rules above: a rule can only match text in
+    # which its trigger fires too. Keywords are checked with plain substring
+    # searches on case-folded text, which is far cheaper than running the
+    # patterns (or one alternation of them) across every position.
+    _KEYWORD_TRIGGERS: tuple[tuple[str, str], ...] = (
+        ("api", "api_secret"),
+        ("secret", "api_secret"),
+        ("token", "api_secret"),
+        ("akia", "aws_key"),
+        ("sk-", "openai"),
+        ("ignore", "injection"),
+        ("disregard", "injection"),
+        ("reset", "injection"),
+        ("you are now", "injection"),
+        ("do anything now", "injection"),
+    )
+    _CONTROL_TRIGGER = re.compile(r"[\x00-\x1F\x7F]")
+    _NUMERIC_TRIGGER = re.compile(r"\d(?:\d{3}|[\d -]{12})")
+
+    _RULE_TRIGGERS: Mapping[str, str] = {
+        "email": "email",
+        "phone": "numeric",
+        "ssn": "numeric",
+        "credit_card": "numeric",
+        "api_secret": "api_secret",
+        "aws_key": "aws_key",
+        "openai": "openai",
+    }
+
     _TAG_INVALID_CHARS = re.compile(r"[^a-z0-9:_-]+")
     _TAG_DUPLICATE_UNDERSCORES = re.compile(r"_{2,}")
 
@@ -79,11 +120,21 @@ class MemorySanitizer:
         *,
         redaction_token: str = "[REDACTED]",
         max_tag_length: int = 64,
+        cache_size: int = 4096,
+        cache_max_chars: int = 1024 * 1024,
         log: logging.Logger | None = None,
     ) -> None:
         self._log = log or logging.getLogger(__name__)
         self._redaction_token = redaction_token
         self._max_tag_length = max(8, max_tag_length)
+        self._cache_size = max(0, cache_size)
+        self._cache_max_chars = max(0, cache_max_chars)
+        self._cache_chars = 0
+        # Keyed by (allow_html, digest of the input); values are redacted output or _UNCHANGED
+        self._cache: dict[tuple[bool, bytes], Any] = {}
+        # Skipping untriggered rules is only exact if redacting cannot itself
+        # introduce a trigger for a later rule
+        self._selective = not self._scan(redaction_token)
 
     # ------------------------------------------------------------------
     # Public sanitization helpers
@@ -213,12 +264,86 @@ class MemorySanitizer:
     ) -> str:
         """Scrub ``value`` and enforce prompt-injection safeguards."""
 
-        sanitized = _sanitize_input(value, allow_html=allow_html)
-        sanitized = sanitized.strip()
-        sanitized = self._redact_sensitive(field, sanitized)
-        self._ensure_prompt_safe(field, sanitized)
+        if not isinstance(value, str):
+            # Preserve the input scrubber's error for non-string values
+            _sanitize_input(value, allow_html=allow_html)
+
+        key = (allow_html, self._digest(value))
+        cached = self._cache.get(key)
+        if cached is not None:
+            return value if cached is _UNCHANGED else cached
+
+        triggers = self._scan(value)
+        if triggers and ("control" in triggers or ("markup" in triggers and not allow_html)):
+            sanitized = _sanitize_input(value, allow_html=allow_html).strip()
+            triggers = self._scan(sanitized)
+        else:
+            sanitized = value.strip()
+
+        redacted = False
+        if triggers:
+            scanned = sanitized
+            sanitized = self._redact_sensitive(field, sanitized, triggers)
+            redacted = sanitized != scanned
+            # Redaction can open up word boundaries the trigger scan did not see
+            if redacted or "injection" in triggers:
+                self._ensure_prompt_safe(field, sanitized)
+
+        if self._cache_size:
+            self._remember(key, _UNCHANGED if sanitized == value else sanitized)
+            if not redacted and sanitized != value:
+                # Scrubbing and stripping are idempotent, so the output is a fixed point
+                self._remember((allow_html, self._digest(sanitized)), _UNCHANGED)
         return sanitized
 
+    @staticmethod
+    def _digest(value: str) -> bytes:
+        """Return the cache key digest of ``value``."""
+
+        return hashlib.blake2b(value.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _remember(self, key: tuple[bool, bytes], result: Any) -> None:
+        """Cache ``result`` under ``key``, evicting the oldest entries to stay in budget."""
+
+        size = 0 if result is _UNCHANGED else len(result)
+        if size > self._cache_max_chars:
+            return
+
+        cache = self._cache
+        previous = cache.pop(key, None)
+        if previous is not None and previous is not _UNCHANGED:
+            self._cache_chars -= len(previous)
+        while cache and (
+            len(cache) >= self._cache_size or self._cache_chars + size > self._cache_max_chars
+        ):
+            evicted = cache.pop(next(iter(cache)))
+            if evicted is not _UNCHANGED:
+                self._cache_chars -= len(evicted)
+        cache[key] = result
+        self._cache_chars += size
+
+    def _scan(self, value: str) -> set[str]:
+        """Return the trigger groups that fire for ``value``."""
+
+        triggers: set[str] = set()
+        if "<" in value:
+            triggers.add("markup")
+        if "@" in value:
+            triggers.add("email")
+        if self._CONTROL_TRIGGER.search(value):
+            triggers.add("control")
+        if self._NUMERIC_TRIGGER.search(value):
+            triggers.add("numeric")
+
+        folded = value.casefold()
+        if not folded.isascii():
+            # IGNORECASE also matches the dotted and dotless capital I to "i"
+            folded = folded.replace("i\u0307", "i").replace("\u0131", "i")
+        for literal, group in self._KEYWORD_TRIGGERS:
+            if group not in triggers and literal in folded:
+                triggers.add(group)
+        return triggers
+
     def _sanitize_value(self, field: str, value: Any) -> Any:
         if isinstance(value, str):
             return self._sanitize_string(field, value)
@@ -265,12 +390,20 @@ class MemorySanitizer:
 
         return sanitized
 
-    def _redact_sensitive(self, field: str, value: str) -> str:
+    def _redact_sensitive(
+        self, field: str, value: str, triggers: set[str] | None = None
+    ) -> str:
         redacted = value
         for label, pattern in self._SENSITIVE_PATTERNS:
-            if pattern.search(redacted):
+            if (
+                triggers is not None
+                and self._selective
+                and self._RULE_TRIGGERS[label] not in triggers
+            ):
+                continue
+            redacted, replaced = pattern.subn(self._redaction_token, redacted)
+            if replaced:
                 self._log.debug("Redacting %s pattern from %s", label, field)
-                redacted = pattern.sub(self._redaction_token, redacted)
         return redacted
 
     def _ensure_prompt_safe(self, field: str, value: str) -> None:
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import logging
 from uuid import UUID
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable
 
 # Import the memory models from the memory system
 try:
@@ -505,6 +505,99 @@ class MemoryService:
         await self._ensure_initialized()
         logger.debug(f"Service: Listing memories for user {search_params.user_id}")
  
+        metadata_filters, tiers, resolved_user_id = self._list_filters(search_params)
+        scope = self._build_scope(
+            user=user,
+            user_id=resolved_user_id,
+            roles=roles,
+            allow_admin=allow_admin,
+        )
+ 
+        offset = max(int(getattr(search_params, "offset", 0) or 0), 0)
+        results = await self.memory_manager.search_memories(
+            query=search_params.query,
+            limit=search_params.limit + offset,
+            metadata_filters=metadata_filters,
+            tiers=tiers,
+            scope=scope,
+        )
+        return [MemoryResponse.from_orm(res) for res in results[offset:]]
+
+    async def list_memories_page(
+        self,
+        search_params: MemorySearchParams,
+        *,
+        cursor: str | None = None,
+        user: "User" | None = None,
+        roles: Iterable[str] | None = None,
+        allow_admin: bool | None = None,
+    ) -> tuple[list[MemoryResponse], str | None]:
+        """
+        Lists one page of memories using keyset pagination.
+        
+        Args:
+            search_params: The parameters to filter memories; ``query`` is ignored.
+            cursor: Opaque cursor returned by the previous page, if any.
+            
+        Returns:
+            Tuple of (memories, next cursor). The cursor is None on the last page.
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed or belongs to another listing.
+        """
+        await self._ensure_initialized()
+        metadata_filters, tiers, resolved_user_id = self._list_filters(search_params)
+        scope = self._build_scope(
+            user=user,
+            user_id=resolved_user_id,
+            roles=roles,
+            allow_admin=allow_admin,
+        )
+ 
+        results, next_cursor = await self.memory_manager.list_memories_page(
+            tags=list(search_params.tags or []) or None,
+            metadata_filters=metadata_filters,
+            limit=search_params.limit,
+            tiers=tiers,
+            cursor=cursor,
+            scope=scope,
+        )
+        return [MemoryResponse.from_orm(res) for res in results], next_cursor
+
+    async def iter_memories(
+        self,
+        search_params: MemorySearchParams,
+        *,
+        page_size: int = 500,
+        user: "User" | None = None,
+        roles: Iterable[str] | None = None,
+        allow_admin: bool | None = None,
+    ) -> AsyncIterator[MemoryResponse]:
+        """
+        Stream every memory matching ``search_params`` page by page.
+        
+        Only one page is held in memory at a time, which makes this suitable
+        for exporting a whole tenant.
+        """
+        page_params = MemorySearchParams(**{**vars(search_params), "limit": page_size})
+        cursor: str | None = None
+        while True:
+            page, cursor = await self.list_memories_page(
+                page_params,
+                cursor=cursor,
+                user=user,
+                roles=roles,
+                allow_admin=allow_admin,
+            )
+            for memory in page:
+                yield memory
+            if cursor is None:
+                return
+
+    def _list_filters(
+        self, search_params: MemorySearchParams
+    ) -> tuple[dict[str, Any] | None, list[str] | None, str | None]:
+        """Return (metadata filters, tiers, user id) for a listing request."""
         metadata_filters: dict[str, Any] | None = None
         resolved_user_id = self._coerce_optional_str(search_params.user_id)
         if resolved_user_id is not None:
@@ -524,22 +617,7 @@ class MemoryService:
                 tiers = [MemoryTier.from_string(search_params.tier).storage_key]
             except ValueError:
                 tiers = [str(search_params.tier)]
- 
-        scope = self._build_scope(
-            user=user,
-            user_id=resolved_user_id,
-            roles=roles,
-            allow_admin=allow_admin,
-        )
- 
-        results = await self.memory_manager.search_memories(
-            query=search_params.query,
-            limit=search_params.limit,
-            metadata_filters=metadata_filters,
-            tiers=tiers,
-            scope=scope,
-        )
-        return [MemoryResponse.from_orm(res) for res in results]
+        return metadata_filters, tiers, resolved_user_id
 
     @staticmethod
     def _resolve_initial_tier(tier: Any) -> str:
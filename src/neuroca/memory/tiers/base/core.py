@@ -12,6 +12,7 @@ from datetime import datetime
 
 from neuroca.memory.backends import BaseStorageBackend, BackendType, MemoryTier as BackendTier
 from neuroca.memory.backends.factory import StorageBackendFactory
+from neuroca.memory.backends.keyset import SeekKey
 from neuroca.memory.exceptions import (
     TierInitializationError,
     TierOperationError,
@@ -629,6 +630,39 @@ class BaseMemoryTier(MemoryTierInterface, abc.ABC):
                 message=f"Failed to get important memories: {str(e)}"
             ) from e
     
+    async def list_page(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        after: Optional[SeekKey] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """
+        List memories in ``(created_at, id)`` order after a keyset boundary.
+        
+        Args:
+            filters: Optional metadata filters
+            after: Key of the last memory of the previous page
+            limit: Maximum number of memories to return
+            
+        Returns:
+            List of stored memory dictionaries
+            
+        Raises:
+            TierOperationError: If the operation fails
+        """
+        self._ensure_initialized()
+        
+        try:
+            combined_filters = await self._searcher.apply_tier_filters(self._tier_name, filters)
+            return await self._backend.seek(filters=combined_filters, after=after, limit=limit)
+        except Exception as e:
+            logger.exception(f"Failed to list memories from {self._tier_name} tier")
+            raise TierOperationError(
+                operation="list_page",
+                tier_name=self._tier_name,
+                message=f"Failed to list memories: {str(e)}"
+            ) from e
+    
     #-----------------------------------------------------------------------
     # Tier-Specific Operations
     #-----------------------------------------------------------------------
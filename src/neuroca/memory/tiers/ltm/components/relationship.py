@@ -5,6 +5,7 @@ This module provides the LTMRelationship class which handles the creation,
 maintenance, and querying of relationships between memories in the LTM tier.
 """
 
+import asyncio
 import logging
 from copy import deepcopy
 from enum import Enum
@@ -241,7 +242,6 @@ class LTMRelationship:
                 message=f"Target memory {related_id} not found"
             )
         
-        graph_backend = self._require_graph_backend()
         await graph_backend.upsert_node(memory_id)
         await graph_backend.upsert_node(related_id)
 
@@ -269,15 +269,29 @@ class LTMRelationship:
 
         source_memory.metadata.tags["relationships"][related_id] = relationship_data
 
-        # Update the memory
-        await graph_backend.add_relationship(
-            memory_id,
-            related_id,
-            relationship_type,
-            strength=strength,
-            metadata=metadata_payload,
-        )
+        # Persist both graph edges in a single backend call
+        edges = [
+            {
+                "source_id": memory_id,
+                "target_id": related_id,
+                "relationship_type": relationship_type,
+                "strength": strength,
+                "metadata": metadata_payload,
+            }
+        ]
+        if bidirectional:
+            edges.append(
+                {
+                    "source_id": related_id,
+                    "target_id": memory_id,
+                    "relationship_type": relationship_type,
+                    "strength": strength,
+                    "metadata": metadata_payload,
+                }
+            )
+        await graph_backend.add_relationships(edges)
 
+        # Update the memory
         source_success = await self._update_func(memory_id, metadata=source_memory.metadata.tags)
 
         # Update relationship map
@@ -304,14 +318,6 @@ class LTMRelationship:
             target_memory.metadata.tags["relationships"][memory_id] = reverse_relationship
 
             # Update the target memory
-            await graph_backend.add_relationship(
-                related_id,
-                memory_id,
-                relationship_type,
-                strength=strength,
-                metadata=metadata_payload,
-            )
-
             target_success = await self._update_func(related_id, metadata=target_memory.metadata.tags)
 
             # Update relationship map
@@ -436,13 +442,17 @@ class LTMRelationship:
             limit=limit,
         )
 
+        target_ids = [
+            relation["target_id"]
+            for relation in relationships
+            if isinstance(relation.get("target_id"), str)
+        ]
+        hydrated = await self._hydrate(target_ids)
+
         related_memories: List[Dict[str, Any]] = []
         for relation in relationships:
             target_id = relation.get("target_id")
-            if not isinstance(target_id, str):
-                continue
-
-            related_data = await self._backend.retrieve(target_id)
+            related_data = hydrated.get(target_id) if isinstance(target_id, str) else None
             if related_data is None:
                 continue
 
@@ -454,10 +464,95 @@ class LTMRelationship:
 
             related_copy = dict(related_data)
             related_copy["_relationship"] = metadata_payload
-        related_memories.append(related_copy)
+            related_memories.append(related_copy)
 
         return related_memories[: max(limit, 0)]
 
+    async def expand_related_memories(
+        self,
+        memory_id: str,
+        max_depth: int = 2,
+        relationship_type: Optional[str] = None,
+        min_strength: float = 0.0,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Get memories reachable within several hops, ranked by connection strength.
+        
+        A memory's score is the best product of relationship strengths along any
+        path from the source memory. The traversal runs inside the knowledge graph
+        backend and memory payloads are loaded with a single batch read.
+        
+        Args:
+            memory_id: The ID of the memory to expand from
+            max_depth: Maximum number of relationship hops
+            relationship_type: Type of relationship to follow (or None for all)
+            min_strength: Minimum strength of every relationship on a path
+            limit: Maximum number of memories to return
+            
+        Returns:
+            List of memories with an ``_expansion`` entry holding score and depth
+            
+        Raises:
+            TierOperationError: If the operation fails
+        """
+        graph_backend = self._require_graph_backend()
+
+        ranked = await graph_backend.expand(
+            memory_id,
+            max_depth=max_depth,
+            relationship_type=relationship_type,
+            min_strength=min_strength,
+            limit=limit,
+        )
+        hydrated = await self._hydrate([entry["node_id"] for entry in ranked])
+
+        expanded: List[Dict[str, Any]] = []
+        for entry in ranked:
+            memory_data = hydrated.get(entry["node_id"])
+            if memory_data is None:
+                continue
+            memory_copy = dict(memory_data)
+            memory_copy["_expansion"] = {"score": entry["score"], "depth": entry["depth"]}
+            expanded.append(memory_copy)
+
+        return expanded
+
+    async def _hydrate(self, memory_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load memory payloads for several IDs with one storage round trip.
+        
+        Uses the storage backend's ``batch_read`` when available and falls back to
+        concurrent ``retrieve`` calls otherwise. Missing memories are omitted.
+        
+        Args:
+            memory_ids: IDs of the memories to load
+            
+        Returns:
+            Mapping of memory ID to a plain dictionary payload
+        """
+        unique_ids = list(dict.fromkeys(memory_ids))
+        if not unique_ids:
+            return {}
+
+        batch_read = getattr(self._backend, "batch_read", None)
+        if batch_read is not None:
+            loaded = await batch_read(unique_ids)
+        else:
+            results = await asyncio.gather(*(self._backend.retrieve(mid) for mid in unique_ids))
+            loaded = dict(zip(unique_ids, results))
+
+        hydrated: Dict[str, Dict[str, Any]] = {}
+        for memory_id, data in loaded.items():
+            if data is None:
+                continue
+            if isinstance(data, MemoryItem):
+                hydrated[memory_id] = data.model_dump()
+            else:
+                # Drop storage-internal bookkeeping such as the in-memory backend's _meta
+                hydrated[memory_id] = {k: v for k, v in dict(data).items() if k != "_meta"}
+        return hydrated
+
     async def register_memory(self, memory_item: MemoryItem) -> None:
         """Register *memory_item* with the knowledge graph backend."""
 
@@ -490,10 +585,13 @@ class LTMRelationship:
         """
         Find a path between two memories through relationships.
         
+        The shortest path is resolved by the knowledge graph backend and the
+        memories along it are loaded with a single batch read.
+        
         Args:
             start_id: The ID of the starting memory
             end_id: The ID of the ending memory
-            max_depth: Maximum path length/depth
+            max_depth: Maximum path length/depth, counted in memories
             
         Returns:
             List of memories forming the path, or None if no path found
@@ -501,42 +599,13 @@ class LTMRelationship:
         Raises:
             TierOperationError: If the operation fails
         """
-        # Breadth-first search to find the shortest path
-        visited = set()
-        queue = [(start_id, [])]  # (memory_id, path_so_far)
-        
-        while queue:
-            current_id, path = queue.pop(0)
-            
-            # Skip if already visited
-            if current_id in visited:
-                continue
-                
-            visited.add(current_id)
-            
-            # Get the current memory
-            current_data = await self._backend.retrieve(current_id)
-            if current_data is None:
-                continue
-                
-            current_memory = MemoryItem.model_validate(current_data)
-            current_path = path + [current_data]
-            
-            # Check if we've reached the end
-            if current_id == end_id:
-                return current_path
-                
-            # Stop if we've reached the maximum depth
-            if len(current_path) >= max_depth:
-                continue
-                
-            # Get relationships from memory
-            relationships = current_memory.metadata.tags.get("relationships", {})
-            
-            # Add related memories to the queue
-            for related_id in relationships:
-                if related_id not in visited:
-                    queue.append((related_id, current_path))
-        
-        # No path found
-        return None
+        # max_depth counts memories on the path, so it allows max_depth - 1 hops
+        graph_backend = self._require_graph_backend()
+        node_ids = await graph_backend.shortest_path(start_id, end_id, max_depth=max_depth - 1)
+        if node_ids is None:
+            return None
+
+        hydrated = await self._hydrate(node_ids)
+        if any(node_id not in hydrated for node_id in node_ids):
+            return None
+        return [hydrated[node_id] for node_id in node_ids]
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import contextlib
+import json
 import logging
+import os
 from datetime import datetime, timezone
-from typing import Any, Callable, Iterable, Mapping, Sequence
+from typing import IO, Any, AsyncIterator, Callable, Iterable, Mapping, Sequence
 
 from pydantic import ValidationError
 
 from neuroca.memory.backends import BaseStorageBackend
+from neuroca.memory.backends.keyset import SeekKey, row_seek_key
 from neuroca.memory.models.memory_item import MemoryItem, MemoryStatus
 from neuroca.memory.tiers.ltm.components.lifecycle import LTMLifecycle
+from neuroca.utils.record_stream import encode_record, iter_records, open_record_stream
 
 
 logger = logging.getLogger(__name__)
@@ -76,45 +81,12 @@ class LTMSnapshotExporter:
         except Exception:  # pragma: no cover - defensive logging path
             logger.warning("Failed to count LTM records before export", exc_info=True)
 
-        offset = 0
-        collected: list[dict[str, Any]] = []
-        invalid = 0
-
-        while True:
-            remaining = None if limit is None else max(0, limit - len(collected))
-            if remaining == 0:
-                break
-
-            batch_limit = requested_batch if remaining is None else min(requested_batch, remaining)
-            items = await backend.query(
-                filters=filters or None,
-                sort_by="metadata.created_at",
-                ascending=True,
-                limit=batch_limit,
-                offset=offset,
-            )
-            if not items:
-                break
-
-            offset += len(items)
-
-            for raw in items:
-                try:
-                    item = MemoryItem.model_validate(raw)
-                except ValidationError:
-                    invalid += 1
-                    logger.warning("Skipping invalid LTM record during snapshot export", exc_info=True)
-                    continue
-
-                collected.append(item.model_dump())
-                if limit is not None and len(collected) >= limit:
-                    break
-
-            if limit is not None and len(collected) >= limit:
-                break
-
-            if len(items) < batch_limit:
-                break
+        counters = {"invalid": 0}
+        collected = [
+            item.model_dump()
+            async for item in self._iter_memories(filters, limit, requested_batch, counters)
+        ]
+        invalid = counters["invalid"]
 
         snapshot: dict[str, Any] = {
             "version": self.VERSION,
@@ -203,6 +175,304 @@ class LTMSnapshotExporter:
             "invalid": invalid,
         }
 
+    async def iter_snapshot_records(
+        self,
+        *,
+        statuses: Iterable[MemoryStatus | str] | None = None,
+        limit: int | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield a snapshot as a sequence of streamable records.
+
+        The stream starts with a ``header`` record, continues with one
+        ``memory`` record per exported item (read page by page from the
+        backend), then the lifecycle ``categories`` and ``relationships`` and
+        finally a ``footer`` carrying the export counters.
+        """
+
+        backend = self._require_backend()
+        filters = self._build_filters(statuses)
+        requested_batch = self._resolve_batch_size(batch_size)
+
+        header: dict[str, Any] = {
+            "kind": "header",
+            "version": self.VERSION,
+            "tier": self._tier_name,
+            "exported_at": self._clock().isoformat(),
+            "filters": filters or {},
+        }
+        try:
+            header["total"] = await backend.count(filters or None)
+        except Exception:  # pragma: no cover - defensive logging path
+            logger.warning("Failed to count LTM records before export", exc_info=True)
+        yield header
+
+        counters = {"invalid": 0}
+        count = 0
+        async for item in self._iter_memories(filters, limit, requested_batch, counters):
+            count += 1
+            yield {"kind": "memory", "memory": item.model_dump(mode="json")}
+
+        if self._lifecycle is not None:
+            categories = self._serialize_categories(self._lifecycle.get_category_map())
+            relationships = self._serialize_relationships(self._lifecycle.get_relationship_map())
+            if categories:
+                yield {"kind": "categories", "categories": categories}
+            if relationships:
+                yield {"kind": "relationships", "relationships": relationships}
+
+        yield {"kind": "footer", "count": count, "invalid": counters["invalid"]}
+
+    async def export_snapshot_stream(
+        self,
+        target: str | os.PathLike[str] | IO[bytes],
+        *,
+        statuses: Iterable[MemoryStatus | str] | None = None,
+        limit: int | None = None,
+        batch_size: int | None = None,
+        fmt: str = "ndjson",
+        compression: str | None = "auto",
+    ) -> dict[str, int]:
+        """Write a snapshot to *target* without materialising it in memory.
+
+        Records are encoded as they are produced by
+        :meth:`iter_snapshot_records`; only one backend page is buffered at a
+        time. Compression is inferred from the file suffix unless given.
+        """
+
+        flush_every = self._resolve_batch_size(batch_size)
+        written = 0
+        footer: Mapping[str, Any] = {}
+        with open_record_stream(target, "wb", compression=compression) as stream:
+            pending: list[bytes] = []
+            async for record in self.iter_snapshot_records(
+                statuses=statuses, limit=limit, batch_size=batch_size
+            ):
+                pending.append(encode_record(record, fmt))
+                written += 1
+                if record["kind"] == "footer":
+                    footer = record
+                if len(pending) >= flush_every:
+                    stream.write(b"".join(pending))
+                    pending.clear()
+            if pending:
+                stream.write(b"".join(pending))
+
+        return {
+            "records": written,
+            "count": int(footer.get("count", 0)),
+            "invalid": int(footer.get("invalid", 0)),
+        }
+
+    async def restore_snapshot_stream(
+        self,
+        source: str | os.PathLike[str] | IO[bytes],
+        *,
+        overwrite: bool = False,
+        batch_size: int | None = None,
+        fmt: str = "ndjson",
+        compression: str | None = "auto",
+        checkpoint_path: str | os.PathLike[str] | None = None,
+    ) -> dict[str, int]:
+        """Restore a streamed snapshot using bulk backend writes.
+
+        Memory records are applied in chunks of *batch_size* with a single
+        ``batch_read`` existence check followed by ``batch_create`` and, when
+        *overwrite* is set, ``batch_update``. Peak memory is bounded by one
+        chunk. When *checkpoint_path* is given, progress is recorded after
+        every committed chunk so an interrupted restore resumes where it
+        stopped; the checkpoint is removed once the restore completes.
+        """
+
+        backend = self._require_backend()
+        requested_batch = self._resolve_batch_size(batch_size)
+
+        stats = {"restored": 0, "created": 0, "updated": 0, "skipped": 0, "invalid": 0}
+        committed = 0
+        checkpoint = self._load_checkpoint(checkpoint_path)
+        if checkpoint is not None:
+            committed = int(checkpoint.get("records", 0))
+            stats.update({key: int(checkpoint.get("stats", {}).get(key, 0)) for key in stats})
+            logger.info(f"Resuming LTM snapshot restore after {committed} records")
+
+        categories: dict[str, list[str]] = {}
+        relationships: dict[str, dict[str, float]] = {}
+        seen = 0
+        chunk: list[Any] = []
+
+        async def flush() -> None:
+            nonlocal committed
+            await self._restore_chunk(backend, chunk, overwrite, stats)
+            committed += len(chunk)
+            chunk.clear()
+            self._save_checkpoint(checkpoint_path, committed, stats)
+
+        with open_record_stream(source, "rb", compression=compression) as stream:
+            for record in iter_records(stream, fmt):
+                kind = record.get("kind")
+                if kind == "header":
+                    snapshot_tier = record.get("tier")
+                    if snapshot_tier and snapshot_tier != self._tier_name:
+                        raise ValueError(
+                            f"Snapshot tier {snapshot_tier!r} does not match {self._tier_name!r}"
+                        )
+                elif kind == "memory":
+                    seen += 1
+                    if seen <= committed:
+                        continue
+                    chunk.append(record.get("memory"))
+                    if len(chunk) >= requested_batch:
+                        await flush()
+                elif kind == "categories":
+                    categories.update(self._coerce_categories(record.get("categories")))
+                elif kind == "relationships":
+                    relationships.update(self._coerce_relationships(record.get("relationships")))
+
+            if chunk:
+                await flush()
+
+        if self._lifecycle is not None:
+            self._lifecycle.apply_snapshot_state(
+                categories=categories,
+                relationships=relationships,
+            )
+
+        if checkpoint_path is not None:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(checkpoint_path)
+
+        return stats
+
+    async def _iter_memories(
+        self,
+        filters: Mapping[str, Any],
+        limit: int | None,
+        batch_size: int,
+        counters: dict[str, int],
+    ) -> AsyncIterator[MemoryItem]:
+        """Seek through the backend by ``(created_at, id)`` and yield validated memory items.
+
+        Each batch resumes after the key of the previous batch's last row, so a
+        full export reads every row once instead of re-scanning skipped rows the
+        way offset paging does.
+        """
+
+        backend = self._require_backend()
+        after: SeekKey | None = None
+        produced = 0
+
+        while True:
+            remaining = None if limit is None else max(0, limit - produced)
+            if remaining == 0:
+                return
+
+            batch_limit = batch_size if remaining is None else min(batch_size, remaining)
+            items = await backend.seek(
+                filters=dict(filters) or None,
+                after=after,
+                limit=batch_limit,
+            )
+            if not items:
+                return
+
+            after = row_seek_key(items[-1])
+
+            for raw in items:
+                try:
+                    item = MemoryItem.model_validate(raw)
+                except ValidationError:
+                    counters["invalid"] += 1
+                    logger.warning("Skipping invalid LTM record during snapshot export", exc_info=True)
+                    continue
+
+                yield item
+                produced += 1
+                if limit is not None and produced >= limit:
+                    return
+
+            if len(items) < batch_limit:
+                return
+
+    async def _restore_chunk(
+        self,
+        backend: BaseStorageBackend,
+        raw_memories: Sequence[Any],
+        overwrite: bool,
+        stats: dict[str, int],
+    ) -> None:
+        """Apply one chunk of streamed memories with bulk backend calls."""
+
+        payloads: dict[str, dict[str, Any]] = {}
+        for raw in raw_memories:
+            try:
+                item = MemoryItem.model_validate(raw)
+            except ValidationError:
+                stats["invalid"] += 1
+                logger.warning("Skipping invalid LTM record during snapshot restore", exc_info=True)
+                continue
+            payloads[item.id] = item.model_dump()
+
+        if not payloads:
+            return
+
+        existing = await backend.batch_read(list(payloads))
+        to_create = {
+            memory_id: payload
+            for memory_id, payload in payloads.items()
+            if existing.get(memory_id) is None
+        }
+        to_update = {
+            memory_id: payload
+            for memory_id, payload in payloads.items()
+            if memory_id not in to_create
+        }
+
+        if to_create:
+            results = await backend.batch_create(to_create)
+            created = sum(1 for ok in results.values() if ok)
+            stats["created"] += created
+            stats["restored"] += created
+
+        if not to_update:
+            return
+        if not overwrite:
+            stats["skipped"] += len(to_update)
+            return
+        results = await backend.batch_update(to_update)
+        updated = sum(1 for ok in results.values() if ok)
+        stats["updated"] += updated
+        stats["restored"] += updated
+
+    def _load_checkpoint(
+        self, checkpoint_path: str | os.PathLike[str] | None
+    ) -> dict[str, Any] | None:
+        """Return the saved restore progress, or ``None`` when there is nothing to resume."""
+
+        if checkpoint_path is None or not os.path.exists(checkpoint_path):
+            return None
+        with open(checkpoint_path, encoding="utf-8") as handle:
+            checkpoint = json.load(handle)
+        if checkpoint.get("tier") not in (None, self._tier_name):
+            raise ValueError(
+                f"Checkpoint tier {checkpoint.get('tier')!r} does not match {self._tier_name!r}"
+            )
+        return checkpoint
+
+    def _save_checkpoint(
+        self,
+        checkpoint_path: str | os.PathLike[str] | None,
+        records: int,
+        stats: Mapping[str, int],
+    ) -> None:
+        """Atomically record how many streamed records have been committed."""
+
+        if checkpoint_path is None:
+            return
+        temp_path = f"{os.fspath(checkpoint_path)}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump({"tier": self._tier_name, "records": records, "stats": dict(stats)}, handle)
+        os.replace(temp_path, checkpoint_path)
+
     def _require_backend(self) -> BaseStorageBackend:
         if self._backend is None:
             raise RuntimeError("LTMSnapshotExporter requires a configured backend")
@@ -8,7 +8,8 @@ handle different aspects of the LTM functionality.
 """
 
 import logging
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+import os
+from typing import IO, Any, Dict, Iterable, List, Mapping, Optional
 
 from neuroca.memory.backends import BackendType
 from neuroca.memory.backends.knowledge_graph import (
@@ -188,6 +189,9 @@ class LongTermMemoryTier(BaseMemoryTier):
                 pool=pool,
                 node_label=graph_config.get("node_label", "Memory"),
                 relationship_label=graph_config.get("relationship_label", "RELATED_TO"),
+                batch_size=int(graph_config.get("batch_size", 500)),
+                coalesce_window=float(graph_config.get("coalesce_window", 0.005)),
+                max_sessions=int(graph_config.get("max_sessions", 4)),
             )
         else:
             backend = InMemoryKnowledgeGraphBackend()
@@ -283,6 +287,50 @@ class LongTermMemoryTier(BaseMemoryTier):
             snapshot,
             overwrite=overwrite,
         )
+
+    async def export_snapshot_stream(
+        self,
+        target: str | os.PathLike[str] | IO[bytes],
+        *,
+        statuses: Iterable[MemoryStatus | str] | None = None,
+        limit: int | None = None,
+        batch_size: int | None = None,
+        fmt: str = "ndjson",
+        compression: str | None = "auto",
+    ) -> Dict[str, int]:
+        """Stream a redundancy snapshot of stored LTM memories to *target*."""
+
+        self._ensure_initialized()
+        return await self._snapshot.export_snapshot_stream(
+            target,
+            statuses=statuses,
+            limit=limit,
+            batch_size=batch_size,
+            fmt=fmt,
+            compression=compression,
+        )
+
+    async def restore_snapshot_stream(
+        self,
+        source: str | os.PathLike[str] | IO[bytes],
+        *,
+        overwrite: bool = False,
+        batch_size: int | None = None,
+        fmt: str = "ndjson",
+        compression: str | None = "auto",
+        checkpoint_path: str | os.PathLike[str] | None = None,
+    ) -> Dict[str, int]:
+        """Restore LTM memories from a streamed snapshot, resuming from a checkpoint."""
+
+        self._ensure_initialized()
+        return await self._snapshot.restore_snapshot_stream(
+            source,
+            overwrite=overwrite,
+            batch_size=batch_size,
+            fmt=fmt,
+            compression=compression,
+            checkpoint_path=checkpoint_path,
+        )
     
     async def _post_delete(self, memory_id: str) -> None:
         """
@@ -0,0 +1,448 @@
+"""
+Compiled Pathway Graph for Neural Tubules
+
+This module provides an array-backed representation of the pathway network managed by
+``PathwayManager``. Pathways are stored as edge slots in NumPy arrays and compiled on
+demand into CSR (by source) and CSC (by target) adjacency structures, which lets
+spreading activation run as vectorized sparse matrix-vector products and path finding
+run as a frontier BFS over integer arrays instead of walking Python dictionaries.
+
+The compiled structures are maintained incrementally:
+
+- adding or removing pathways marks the structure dirty; the CSR/CSC views are rebuilt
+  lazily on the next query, and removed slots are compacted once they dominate
+- strength changes are written straight into the compiled weight vectors, so
+  reinforcement and decay never trigger a rebuild
+
+Spreading activation counts how often each edge fires while it propagates and reports
+the totals per pathway once it finishes, so callers can update pathway metrics in one
+batch instead of once per edge visit.
+
+Usage:
+    graph = CompiledPathwayGraph()
+    graph.add_pathway(pathway)
+    activations = graph.spread_activation({"semantic_1": 1.0}, max_depth=3)
+    weights = graph.as_weight_matrix()
+"""
+
+import logging
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+import numpy as np
+from scipy import sparse
+
+from neuroca.core.exceptions import ValidationError
+from neuroca.memory.tubules.weights import WeightMatrix
+
+if TYPE_CHECKING:
+    from neuroca.memory.tubules.pathways import Pathway
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Matches Pathway.activate: an activation succeeds when strength * input reaches this
+SUCCESS_THRESHOLD = 0.1
+
+
+class CompiledPathwayGraph:
+    """
+    CSR/CSC adjacency over the pathway registry with vectorized traversal.
+
+    Every pathway contributes one directed edge (source -> target), and bidirectional
+    pathways contribute a second edge (target -> source). Parallel pathways between the
+    same tubules are kept as separate edges.
+    """
+
+    def __init__(self, initial_capacity: int = 1024) -> None:
+        """
+        Initialize an empty compiled graph.
+
+        Args:
+            initial_capacity: Number of edge slots to preallocate
+        """
+        self._node_index: dict[str, int] = {}
+        self._node_ids: list[str] = []
+
+        capacity = max(1, initial_capacity)
+        self._src = np.zeros(capacity, dtype=np.int64)
+        self._dst = np.zeros(capacity, dtype=np.int64)
+        self._weight = np.zeros(capacity, dtype=np.float64)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._edge_pathway: list[Optional[str]] = [None] * capacity
+        self._slots_by_pathway: dict[str, list[int]] = {}
+        self._edge_count = 0
+        self._dead_count = 0
+
+        # Compiled views (valid while not dirty)
+        self._dirty = True
+        self._csr: Optional[sparse.csr_matrix] = None
+        self._csc: Optional[sparse.csc_matrix] = None
+        self._csr_slots = np.zeros(0, dtype=np.int64)
+        self._csc_slots = np.zeros(0, dtype=np.int64)
+        self._csr_position = np.zeros(0, dtype=np.int64)
+        self._csc_position = np.zeros(0, dtype=np.int64)
+        self._csc_sources = np.zeros(0, dtype=np.int64)
+
+    @property
+    def node_count(self) -> int:
+        """Number of tubules known to the graph."""
+        return len(self._node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of live directed edges."""
+        return self._edge_count - self._dead_count
+
+    def add_pathway(self, pathway: "Pathway") -> None:
+        """
+        Add the edges of a pathway.
+
+        Args:
+            pathway: Pathway to add
+        """
+        source = self._node(pathway.source_id)
+        target = self._node(pathway.target_id)
+
+        slots = [self._append_edge(source, target, pathway.strength, pathway.id)]
+        if pathway.bidirectional:
+            slots.append(self._append_edge(target, source, pathway.strength, pathway.id))
+
+        self._slots_by_pathway[pathway.id] = slots
+        self._dirty = True
+
+    def remove_pathway(self, pathway_id: str) -> None:
+        """
+        Remove the edges of a pathway.
+
+        Args:
+            pathway_id: ID of the pathway to remove
+        """
+        slots = self._slots_by_pathway.pop(pathway_id, [])
+        for slot in slots:
+            self._alive[slot] = False
+            self._edge_pathway[slot] = None
+        self._dead_count += len(slots)
+        if slots:
+            self._dirty = True
+
+    def update_strength(self, pathway_id: str, strength: float) -> None:
+        """
+        Update the weight of a pathway's edges in place.
+
+        Args:
+            pathway_id: ID of the pathway
+            strength: New pathway strength
+        """
+        slots = self._slots_by_pathway.get(pathway_id)
+        if not slots:
+            return
+
+        self._weight[slots] = strength
+        if not self._dirty:
+            self._csr.data[self._csr_position[slots]] = strength
+            self._csc.data[self._csc_position[slots]] = strength
+
+    def clear(self) -> None:
+        """Remove all tubules and edges."""
+        self.__init__(initial_capacity=self._src.shape[0])
+
+    @property
+    def csr(self) -> sparse.csr_matrix:
+        """Compiled (source x target) adjacency with pathway strengths as data."""
+        self._compile()
+        return self._csr
+
+    def as_weight_matrix(self, name: Optional[str] = None) -> WeightMatrix:
+        """
+        Expose the compiled adjacency as a WeightMatrix sharing the same storage.
+
+        Strength updates are reflected in the returned matrix until the next structural
+        change forces a rebuild.
+
+        Args:
+            name: Optional name for the weight matrix
+
+        Returns:
+            Sparse WeightMatrix backed by the compiled CSR adjacency
+        """
+        return WeightMatrix.from_sparse(self.csr, name=name or "pathway_weights")
+
+    def node_ids(self, indices: np.ndarray) -> list[str]:
+        """Map node indices back to tubule IDs."""
+        return [self._node_ids[i] for i in indices.tolist()]
+
+    def spread_activation(
+        self,
+        initial_activations: dict[str, float],
+        max_depth: int = 3,
+        decay_factor: float = 0.7,
+        activation_threshold: float = 0.1,
+        on_activated: Optional[Callable[[str, int, int, float], None]] = None,
+    ) -> dict[str, float]:
+        """
+        Spread activation level by level using sparse (max, x) products.
+
+        A tubule at or above the threshold passes ``activation * strength * decay`` along
+        each outgoing edge; every target keeps the maximum incoming value that reaches
+        the threshold, and the overall result keeps each tubule's maximum activation.
+
+        Args:
+            initial_activations: Mapping of tubule IDs to initial activation (0.0 to 1.0)
+            max_depth: Maximum propagation depth
+            decay_factor: Factor by which activation decays at each step
+            activation_threshold: Minimum activation strength to continue propagation
+            on_activated: Called once per pathway that fired, after propagation, with
+                (pathway_id, activations, successful_activations, activation_time_ms)
+
+        Returns:
+            Mapping of every activated tubule ID to its maximum activation
+
+        Raises:
+            ValidationError: If an initial activation is outside 0.0 to 1.0
+        """
+        for tubule_id, activation in initial_activations.items():
+            if not 0.0 <= activation <= 1.0:
+                raise ValidationError(
+                    f"Activation strength must be between 0.0 and 1.0, got {activation} for {tubule_id}"
+                )
+
+        result = dict(initial_activations)
+        self._compile()
+        n = self.node_count
+        if n == 0 or self._csc.nnz == 0:
+            return result
+
+        current = np.full(n, -np.inf)
+        for tubule_id, activation in initial_activations.items():
+            index = self._node_index.get(tubule_id)
+            if index is not None:
+                current[index] = activation
+
+        started = time.perf_counter()
+        best = np.full(n, -np.inf)
+        targets = np.nonzero(np.diff(self._csc.indptr))[0]
+        starts = self._csc.indptr[targets]
+        weights = self._csc.data
+        fired = np.zeros(weights.shape[0], dtype=np.int64)
+        succeeded = np.zeros(weights.shape[0], dtype=np.int64)
+
+        for _depth in range(max_depth):
+            frontier = current >= activation_threshold
+            if not frontier.any():
+                break
+
+            # Per-edge output, with edges from inactive sources masked out
+            active = frontier[self._csc_sources]
+            edge_output = np.where(frontier, current, 0.0)[self._csc_sources] * weights
+            fired += active
+            succeeded += active & (edge_output >= SUCCESS_THRESHOLD)
+            edge_output *= decay_factor
+            edge_output[~active] = -np.inf
+
+            incoming = np.full(n, -np.inf)
+            incoming[targets] = np.maximum.reduceat(edge_output, starts)
+            incoming[incoming < activation_threshold] = -np.inf
+
+            if not np.isfinite(incoming).any():
+                break
+
+            best = np.maximum(best, incoming)
+            current = incoming
+
+        for index in np.nonzero(np.isfinite(best))[0].tolist():
+            tubule_id = self._node_ids[index]
+            result[tubule_id] = max(result.get(tubule_id, -np.inf), float(best[index]))
+
+        if on_activated is not None:
+            self._report_activations(fired, succeeded, time.perf_counter() - started, on_activated)
+
+        return result
+
+    def _report_activations(
+        self,
+        fired: np.ndarray,
+        succeeded: np.ndarray,
+        elapsed: float,
+        on_activated: Callable[[str, int, int, float], None],
+    ) -> None:
+        """Sum per-edge firing counts by pathway and report each pathway once."""
+        positions = np.nonzero(fired)[0]
+        if positions.size == 0:
+            return
+
+        totals: dict[str, list[int]] = {}
+        for position, count, hits in zip(
+            positions.tolist(), fired[positions].tolist(), succeeded[positions].tolist()
+        ):
+            pathway_id = self._edge_pathway[int(self._csc_slots[position])]
+            entry = totals.setdefault(pathway_id, [0, 0])
+            entry[0] += count
+            entry[1] += hits
+
+        activation_time_ms = elapsed * 1000 / int(fired.sum())
+        for pathway_id, (count, hits) in totals.items():
+            on_activated(pathway_id, count, hits, activation_time_ms)
+
+    def find_path(self, source_id: str, target_id: str, max_depth: int = 5) -> Optional[list[str]]:
+        """
+        Find a shortest path (by hop count) with a frontier BFS over the CSR arrays.
+
+        Args:
+            source_id: ID of the source tubule
+            target_id: ID of the target tubule
+            max_depth: Maximum number of hops
+
+        Returns:
+            Pathway IDs along the path, an empty list when source equals target, or None
+            if no path exists within max_depth hops
+        """
+        if source_id == target_id:
+            return []
+
+        source = self._node_index.get(source_id)
+        target = self._node_index.get(target_id)
+        if source is None or target is None:
+            return None
+
+        self._compile()
+        indptr, indices = self._csr.indptr, self._csr.indices
+        visited = np.zeros(self.node_count, dtype=bool)
+        parent_edge = np.full(self.node_count, -1, dtype=np.int64)
+        visited[source] = True
+        frontier = np.array([source], dtype=np.int64)
+
+        for _depth in range(max_depth):
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            total = int(counts.sum())
+            if total == 0:
+                return None
+
+            # Flatten the outgoing edge ranges of the whole frontier
+            offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+            edges = offsets + np.arange(total)
+            neighbours = indices[edges]
+
+            fresh = ~visited[neighbours]
+            neighbours, first = np.unique(neighbours[fresh], return_index=True)
+            if neighbours.size == 0:
+                return None
+
+            visited[neighbours] = True
+            parent_edge[neighbours] = edges[fresh][first]
+
+            if visited[target]:
+                return self._trace(parent_edge, source, target)
+
+            frontier = neighbours
+
+        return None
+
+    def _trace(self, parent_edge: np.ndarray, source: int, target: int) -> list[str]:
+        """Reconstruct pathway IDs from BFS parent edges."""
+        path = []
+        node = target
+        while node != source:
+            position = int(parent_edge[node])
+            slot = int(self._csr_slots[position])
+            path.append(self._edge_pathway[slot])
+            node = int(self._src[slot])
+        path.reverse()
+        return path
+
+    def _node(self, tubule_id: str) -> int:
+        """Return the index of a tubule, registering it if needed."""
+        index = self._node_index.get(tubule_id)
+        if index is None:
+            index = len(self._node_ids)
+            self._node_index[tubule_id] = index
+            self._node_ids.append(tubule_id)
+        return index
+
+    def _append_edge(self, source: int, target: int, weight: float, pathway_id: str) -> int:
+        """Store an edge in the next free slot, growing the arrays when full."""
+        if self._edge_count == self._src.shape[0]:
+            if self._dead_count * 2 >= self._edge_count:
+                self._compact()
+            else:
+                self._grow(self._src.shape[0] * 2)
+
+        slot = self._edge_count
+        self._src[slot] = source
+        self._dst[slot] = target
+        self._weight[slot] = weight
+        self._alive[slot] = True
+        self._edge_pathway[slot] = pathway_id
+        self._edge_count += 1
+        return slot
+
+    def _grow(self, capacity: int) -> None:
+        """Resize the edge arrays."""
+        for name in ("_src", "_dst", "_weight", "_alive"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:old.shape[0]] = old
+            setattr(self, name, new)
+        self._edge_pathway.extend([None] * (capacity - len(self._edge_pathway)))
+
+    def _compact(self) -> None:
+        """Drop removed edge slots and renumber the remaining ones."""
+        live = np.nonzero(self._alive[:self._edge_count])[0]
+        count = live.shape[0]
+        remap = {int(old): new for new, old in enumerate(live.tolist())}
+
+        for name in ("_src", "_dst", "_weight", "_alive"):
+            array = getattr(self, name)
+            array[:count] = array[live]
+            array[count:] = 0
+        self._edge_pathway = [self._edge_pathway[i] for i in live.tolist()]
+        self._edge_pathway.extend([None] * (self._src.shape[0] - count))
+        self._slots_by_pathway = {
+            pid: [remap[slot] for slot in slots] for pid, slots in self._slots_by_pathway.items()
+        }
+
+        self._edge_count = count
+        self._dead_count = 0
+        self._dirty = True
+
+    def _compile(self) -> None:
+        """Rebuild the CSR/CSC views if the edge set changed."""
+        if not self._dirty:
+            return
+
+        if self._dead_count * 2 > self._edge_count:
+            self._compact()
+
+        n = self.node_count
+        slots = np.nonzero(self._alive[:self._edge_count])[0]
+        src, dst, weight = self._src[slots], self._dst[slots], self._weight[slots]
+
+        csr_order = np.argsort(src, kind="stable")
+        csr_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=csr_indptr[1:])
+        self._csr = sparse.csr_matrix(
+            (weight[csr_order], dst[csr_order], csr_indptr), shape=(n, n)
+        )
+
+        csc_order = np.argsort(dst, kind="stable")
+        csc_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(dst, minlength=n), out=csc_indptr[1:])
+        self._csc = sparse.csc_matrix(
+            (weight[csc_order], src[csc_order], csc_indptr), shape=(n, n)
+        )
+        self._csc_sources = src[csc_order]
+
+        self._csr_slots = slots[csr_order]
+        self._csc_slots = slots[csc_order]
+        capacity = self._src.shape[0]
+        self._csr_position = np.zeros(capacity, dtype=np.int64)
+        self._csr_position[self._csr_slots] = np.arange(self._csr_slots.shape[0])
+        self._csc_position = np.zeros(capacity, dtype=np.int64)
+        self._csc_position[self._csc_slots] = np.arange(self._csc_slots.shape[0])
+
+        self._dirty = False
+        logger.debug(f"Compiled pathway graph: {n} tubules, {slots.shape[0]} edges")
+
+
+__all__ = ["CompiledPathwayGraph"]
@@ -31,11 +31,13 @@ import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 
 from neuroca.core.exceptions import PathwayError, ValidationError
+from neuroca.memory.tubules.graph import CompiledPathwayGraph
+from neuroca.memory.tubules.weights import WeightMatrix
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -96,6 +98,30 @@ class PathwayMetrics:
         else:
             self.average_activation_time = activation_time_ms
 
+    def record_activations(self, count: int, successes: int, activation_time_ms: float) -> None:
+        """
+        Record a batch of activation events and update metrics.
+        
+        Equivalent to calling record_activation ``count`` times, ``successes`` of them
+        successful, each taking ``activation_time_ms``.
+        
+        Args:
+            count: Number of activations
+            successes: Number of successful activations
+            activation_time_ms: Average time per activation in milliseconds
+        """
+        if count <= 0:
+            return
+        
+        total = self.activation_count + count
+        self.success_rate = (self.success_rate * self.activation_count + successes) / total
+        self.average_activation_time = (
+            (self.average_activation_time * self.activation_count + activation_time_ms * count) /
+            total
+        )
+        self.activation_count = total
+        self.last_activation = datetime.now()
+
 
 @dataclass
 class Pathway:
@@ -115,6 +141,10 @@ class Pathway:
     last_modified: datetime = field(default_factory=datetime.now)
     metadata: dict = field(default_factory=dict)
     metrics: PathwayMetrics = field(default_factory=PathwayMetrics)
+    # Notified with (pathway_id, strength) when the strength changes; set by PathwayManager
+    _on_strength_change: Optional[Callable[[str, float], None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self) -> None:
         """Validate pathway attributes after initialization."""
@@ -158,6 +188,8 @@ class Pathway:
             
         self.strength = new_strength
         self.last_modified = datetime.now()
+        if self._on_strength_change is not None:
+            self._on_strength_change(self.id, self.strength)
         logger.debug(f"Pathway {self.id} strengthened to {self.strength}")
     
     def weaken(self, amount: float = 0.1) -> None:
@@ -176,6 +208,8 @@ class Pathway:
             
         self.strength = new_strength
         self.last_modified = datetime.now()
+        if self._on_strength_change is not None:
+            self._on_strength_change(self.id, self.strength)
         logger.debug(f"Pathway {self.id} weakened to {self.strength}")
     
     def activate(self, activation_strength: float = 1.0) -> float:
@@ -299,6 +333,9 @@ class PathwayManager:
             pathway_type: set() for pathway_type in PathwayType
         }
         
+        # Array-backed adjacency used for spreading activation and path finding
+        self._graph = CompiledPathwayGraph()
+        
         logger.info("PathwayManager initialized")
     
     def register_pathway(self, pathway: Pathway) -> str:
@@ -342,6 +379,9 @@ class PathwayManager:
                 self._target_index[pathway.source_id] = set()
             self._target_index[pathway.source_id].add(pathway.id)
         
+        self._graph.add_pathway(pathway)
+        pathway._on_strength_change = self._graph.update_strength
+        
         logger.debug(f"Registered pathway {pathway.id}: {pathway.source_id} -> {pathway.target_id}")
         return pathway.id
     
@@ -403,6 +443,9 @@ class PathwayManager:
                 if not self._target_index[pathway.source_id]:
                     del self._target_index[pathway.source_id]
         
+        self._graph.remove_pathway(pathway_id)
+        pathway._on_strength_change = None
+        
         # Remove pathway
         del self._pathways[pathway_id]
         logger.debug(f"Removed pathway {pathway_id}")
@@ -537,7 +580,10 @@ class PathwayManager:
         Spread activation through the pathway network from multiple initial sources.
         
         This implements spreading activation, a cognitive science concept where
-        activation flows from initially activated nodes to connected nodes.
+        activation flows from initially activated nodes to connected nodes. Each
+        level is evaluated as a sparse (max, x) product over the compiled pathway
+        graph, and every pathway that fired has its activation metrics updated
+        once the spread is complete.
         
         Args:
             initial_activations: Dictionary mapping tubule_ids to initial activation strengths
@@ -560,73 +606,25 @@ class PathwayManager:
         if max_depth < 1:
             raise ValidationError(f"Max depth must be at least 1, got {max_depth}")
         
-        # Initialize with the starting activations
-        all_activations = dict(initial_activations)
-        current_activations = dict(initial_activations)
-        
-        # Track which tubules have been processed at each depth
-        processed = set()
-        
-        # Spread activation for max_depth steps
-        for _depth in range(max_depth):
-            next_activations = {}
-            
-            # Process each currently activated tubule
-            for tubule_id, activation in current_activations.items():
-                # Skip if activation is below threshold
-                if activation < activation_threshold:
-                    continue
-                
-                # Skip if already processed at this depth to prevent cycles
-                if tubule_id in processed:
-                    continue
-                
-                processed.add(tubule_id)
-                
-                # Get all pathways from this tubule
-                pathways = self.get_pathways_from_source(tubule_id)
-                
-                # Activate each pathway
-                for pathway in pathways:
-                    # Calculate decayed activation
-                    output_activation = pathway.activate(activation) * decay_factor
-                    
-                    # Skip if below threshold
-                    if output_activation < activation_threshold:
-                        continue
-                    
-                    target_id = pathway.target_id
-                    
-                    # Update next_activations with maximum activation
-                    if target_id in next_activations:
-                        next_activations[target_id] = max(
-                            next_activations[target_id],
-                            output_activation
-                        )
-                    else:
-                        next_activations[target_id] = output_activation
-                    
-                    # Update all_activations with maximum activation
-                    if target_id in all_activations:
-                        all_activations[target_id] = max(
-                            all_activations[target_id],
-                            output_activation
-                        )
-                    else:
-                        all_activations[target_id] = output_activation
-            
-            # If no new activations, stop spreading
-            if not next_activations:
-                break
-            
-            # Update current activations for next iteration
-            current_activations = next_activations
-            # Reset processed set for next depth level
-            processed = set()
+        all_activations = self._graph.spread_activation(
+            initial_activations,
+            max_depth=max_depth,
+            decay_factor=decay_factor,
+            activation_threshold=activation_threshold,
+            on_activated=self._record_activations,
+        )
         
         logger.debug(f"Spread activation to {len(all_activations)} tubules (max depth: {max_depth})")
         return all_activations
     
+    def _record_activations(
+        self, pathway_id: str, count: int, successes: int, activation_time_ms: float
+    ) -> None:
+        """Apply a batch of activations reported by the compiled graph to a pathway."""
+        pathway = self._pathways.get(pathway_id)
+        if pathway is not None:
+            pathway.metrics.record_activations(count, successes, activation_time_ms)
+    
     def create_pathway(
         self,
         source_id: str,
@@ -722,12 +720,13 @@ class PathwayManager:
         """
         Find a path between source and target tubules through the pathway network.
         
-        Uses breadth-first search to find the shortest path.
+        Uses a level-synchronous breadth-first search over the compiled pathway graph
+        to find the shortest path. Bidirectional pathways can be traversed from either end.
         
         Args:
             source_id: ID of the source tubule
             target_id: ID of the target tubule
-            max_depth: Maximum search depth
+            max_depth: Maximum number of pathways in the path
             
         Returns:
             Optional[List[Pathway]]: List of pathways forming the path, or None if no path found
@@ -735,30 +734,22 @@ class PathwayManager:
         if source_id == target_id:
             return []
         
-        # Queue of (current_id, path_so_far)
-        queue = [(source_id, [])]
-        visited = {source_id}
+        path_ids = self._graph.find_path(source_id, target_id, max_depth=max_depth)
+        if path_ids is None:
+            return None
         
-        while queue and len(visited) <= max_depth:
-            current_id, path = queue.pop(0)
-            
-            # Get all pathways from current node
-            pathways = self.get_pathways_from_source(current_id)
-            
-            for pathway in pathways:
-                next_id = pathway.target_id
-                
-                # If found target, return path
-                if next_id == target_id:
-                    return path + [pathway]
-                
-                # If not visited, add to queue
-                if next_id not in visited:
-                    visited.add(next_id)
-                    queue.append((next_id, path + [pathway]))
+        return [self._pathways[pid] for pid in path_ids]
+    
+    def get_weight_matrix(self) -> WeightMatrix:
+        """
+        Get the pathway strengths as a sparse tubule-by-tubule weight matrix.
+        
+        The matrix shares storage with the compiled pathway graph.
         
-        # No path found
-        return None
+        Returns:
+            WeightMatrix: Sparse weight matrix of pathway strengths
+        """
+        return self._graph.as_weight_matrix()
     
     def get_stats(self) -> dict:
         """
@@ -778,6 +769,7 @@ class PathwayManager:
             "pathway_types": {ptype.value: count for ptype, count in pathway_types.items()},
             "bidirectional_count": sum(1 for p in self._pathways.values() if p.bidirectional),
             "average_strength": np.mean([p.strength for p in self._pathways.values()]) if self._pathways else 0.0,
+            "compiled_edges": self._graph.edge_count,
         }
     
     def to_dict(self) -> dict:
@@ -815,10 +807,13 @@ class PathwayManager:
     
     def clear(self) -> None:
         """Clear all pathways and indices."""
+        for pathway in self._pathways.values():
+            pathway._on_strength_change = None
         self._pathways.clear()
         self._source_index.clear()
         self._target_index.clear()
         for pathway_type in PathwayType:
             self._type_index[pathway_type] = set()
+        self._graph.clear()
         
         logger.info("PathwayManager cleared")
\ No newline at end of file
@@ -632,6 +632,29 @@ class WeightMatrix:
             logger.error(f"Failed to save weights to {filepath}: {str(e)}")
             raise OSError(f"Failed to save weights: {str(e)}") from e
     
+    @classmethod
+    def from_sparse(cls, matrix: sparse.spmatrix, name: Optional[str] = None) -> 'WeightMatrix':
+        """
+        Wrap an existing sparse matrix without copying it.
+
+        Args:
+            matrix: Sparse matrix to use as the weight storage (converted to CSR if needed)
+            name: Optional name for the weight matrix
+
+        Returns:
+            Sparse WeightMatrix sharing storage with the given CSR matrix
+        """
+        instance = cls.__new__(cls)
+        instance.weights = matrix if sparse.isspmatrix_csr(matrix) else matrix.tocsr()
+        instance.dimensions = tuple(matrix.shape)
+        instance.name = name or f"weights_{int(time.time())}"
+        instance.use_sparse = True
+        instance.creation_time = time.time()
+        instance.last_update_time = instance.creation_time
+        instance.update_count = 0
+        instance._update_metadata()
+        return instance
+
     @classmethod
     def load(cls, filepath: Union[str, Path]) -> 'WeightMatrix':
         """
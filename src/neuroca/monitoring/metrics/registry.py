@@ -28,16 +28,27 @@ Usage:
     
     # Get all metrics for a specific component
     memory_metrics = registry.get_metrics_by_tags({"component": "memory"})
+    
+    # Hot paths: sharded counters and log-linear histograms with quantiles
+    ops = registry.create_sharded_counter("memory_ops_total", "Memory operations")
+    latency = registry.create_log_linear_histogram("memory_op_seconds", "Memory op latency")
+    ops.increment()
+    latency.observe(0.0042)
+    p99 = latency.quantile(0.99)
 """
 
 import json
 import logging
+import math
 import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
 from enum import Enum
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Optional, Sequence, Union
+
+import numpy as np
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -266,7 +277,8 @@ class Counter(Metric):
         
         self._value += amount
         self.update_last_updated()
-        logger.debug(f"Counter '{self.name}' incremented by {amount} to {self._value}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Counter '{self.name}' incremented by {amount} to {self._value}")
     
     def reset(self) -> None:
         """Reset the counter to zero."""
@@ -317,7 +329,8 @@ class Gauge(Metric):
         
         self._value = float(value)
         self.update_last_updated()
-        logger.debug(f"Gauge '{self.name}' set to {self._value}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Gauge '{self.name}' set to {self._value}")
     
     def increment(self, amount: Union[int, float] = 1.0) -> None:
         """
@@ -334,7 +347,8 @@ class Gauge(Metric):
         
         self._value += float(amount)
         self.update_last_updated()
-        logger.debug(f"Gauge '{self.name}' incremented by {amount} to {self._value}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Gauge '{self.name}' incremented by {amount} to {self._value}")
     
     def decrement(self, amount: Union[int, float] = 1.0) -> None:
         """
@@ -351,7 +365,8 @@ class Gauge(Metric):
         
         self._value -= float(amount)
         self.update_last_updated()
-        logger.debug(f"Gauge '{self.name}' decremented by {amount} to {self._value}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Gauge '{self.name}' decremented by {amount} to {self._value}")
 
 
 class Histogram(Metric):
@@ -469,17 +484,17 @@ class Histogram(Metric):
         self._min = min(self._min, value)
         self._max = max(self._max, value)
         
-        # Update bucket counts
-        for bucket in self._buckets:
-            if value <= bucket:
-                self._bucket_counts[bucket] += 1
-                break
+        # Update bucket counts: the first bucket whose boundary is >= value
+        index = bisect_left(self._buckets, value)
+        if index < len(self._buckets):
+            self._bucket_counts[self._buckets[index]] += 1
         else:
-            # If we get here, the value is larger than all defined buckets
+            # The value is larger than all defined buckets
             self._bucket_counts[float('inf')] += 1
         
         self.update_last_updated()
-        logger.debug(f"Histogram '{self.name}' observed value {value}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Histogram '{self.name}' observed value {value}")
     
     def reset(self) -> None:
         """Reset the histogram to its initial state."""
@@ -565,7 +580,8 @@ class Timer(Metric):
         duration = time.time() - start_time
         
         self._histogram.observe(duration)
-        logger.debug(f"Timer '{self.name}' stopped with ID {timer_id}, duration: {duration:.6f}s")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Timer '{self.name}' stopped with ID {timer_id}, duration: {duration:.6f}s")
         
         return duration
     
@@ -596,6 +612,335 @@ class Timer(Metric):
         logger.debug(f"Timer '{self.name}' reset")
 
 
+class _Shard:
+    """Per-thread slice of a sharded metric, written only by its owning thread."""
+    
+    __slots__ = ("thread", "value", "counts", "total", "minimum", "maximum")
+    
+    def __init__(self, buckets: int = 0):
+        self.thread = threading.current_thread()
+        self.value = 0
+        self.counts = [0] * buckets
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+
+class _ShardSet:
+    """
+    Registry of per-thread shards for a single metric.
+    
+    Each thread lazily creates its own shard through a ``threading.local`` slot,
+    so the hot path never takes a lock: a shard is only ever mutated by the
+    thread that owns it, and asyncio tasks on the same loop share their thread's
+    shard safely because they cannot preempt one another mid-update. Readers
+    merge all shards on scrape; shards of threads that have exited are folded
+    into a retired shard so short-lived worker threads do not accumulate.
+    """
+    
+    def __init__(self, buckets: int = 0):
+        self._buckets = buckets
+        self.thread_local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: list[_Shard] = []
+        self._retired = _Shard(buckets)
+    
+    def local(self) -> _Shard:
+        """Return the calling thread's shard, creating it on first use."""
+        try:
+            return self.thread_local.shard
+        except AttributeError:
+            shard = _Shard(self._buckets)
+            with self._lock:
+                self._shards.append(shard)
+            self.thread_local.shard = shard
+            return shard
+    
+    def collect(self) -> list[_Shard]:
+        """Return every shard to merge, retiring those of finished threads."""
+        with self._lock:
+            live = []
+            for shard in self._shards:
+                if shard.thread.is_alive():
+                    live.append(shard)
+                else:
+                    self._fold(shard)
+            self._shards = live
+            return [self._retired, *live]
+    
+    def reset(self) -> None:
+        """Zero every shard in place.
+        
+        Observations racing with the reset may survive it; this mirrors the
+        best-effort semantics of resetting any metric that is still being written.
+        """
+        with self._lock:
+            for shard in [self._retired, *self._shards]:
+                shard.value = 0
+                shard.counts[:] = [0] * self._buckets
+                shard.total = 0.0
+                shard.minimum = math.inf
+                shard.maximum = -math.inf
+    
+    def _fold(self, shard: _Shard) -> None:
+        retired = self._retired
+        retired.value += shard.value
+        if self._buckets:
+            retired.counts = [a + b for a, b in zip(retired.counts, shard.counts)]
+        retired.total += shard.total
+        retired.minimum = min(retired.minimum, shard.minimum)
+        retired.maximum = max(retired.maximum, shard.maximum)
+
+
+class ShardedCounter(Counter):
+    """
+    A counter optimised for very frequent increments from many threads.
+    
+    Each thread increments its own shard without locking or timestamping and
+    the shards are summed when the value is read, which keeps an increment in
+    the low hundreds of nanoseconds. ``last_updated_at`` is refreshed on scrape
+    rather than on every increment.
+    """
+    
+    def __init__(self, name: str, description: str, tags: Optional[dict[str, str]] = None):
+        """
+        Initialize a new sharded counter metric.
+        
+        Args:
+            name: The name of the counter
+            description: A human-readable description of what the counter represents
+            tags: Optional dictionary of tags to associate with this counter
+        """
+        super().__init__(name, description, tags)
+        self._shards = _ShardSet()
+        self._local = self._shards.thread_local
+    
+    def get_value(self) -> int:
+        """Get the current counter value, summed across all shards."""
+        self.update_last_updated()
+        return sum(shard.value for shard in self._shards.collect())
+    
+    def increment(self, amount: int = 1) -> None:
+        """
+        Increment the calling thread's shard by the specified amount.
+        
+        Args:
+            amount: The amount to increment by (default: 1)
+            
+        Raises:
+            ValueError: If the amount is not positive
+        """
+        if amount <= 0:
+            raise ValueError(f"Increment amount must be positive, got {amount}")
+        try:
+            self._local.shard.value += amount
+        except AttributeError:
+            self._shards.local().value += amount
+    
+    def reset(self) -> None:
+        """Reset the counter to zero."""
+        self._shards.reset()
+        self.update_last_updated()
+
+
+class LogLinearHistogram(Metric):
+    """
+    A high-resolution histogram with HDR-style log-linear buckets.
+    
+    The range ``[lowest, highest]`` is split into powers of two and every
+    power of two is divided into ``2**ceil(log2(10**significant_digits))``
+    equal sub-buckets, so any recorded value is reported with a relative error
+    below ``10**-significant_digits``. Values below ``lowest`` share an
+    underflow bucket and values above ``highest`` an overflow bucket; both are
+    still reflected exactly in ``min``/``max``.
+    
+    Observations are bucketed with :func:`bisect.bisect_right` over the
+    precomputed boundaries and counted in per-thread shards without locking.
+    The boundaries live in a NumPy array and shards are merged into NumPy
+    arrays on scrape, where quantiles are resolved with a cumulative sum. The
+    hot-path counts themselves are plain lists because incrementing a single
+    ndarray element from Python costs several times more than a list slot.
+    """
+    
+    DEFAULT_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+    
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        lowest: float = 1e-6,
+        highest: float = 3600.0,
+        significant_digits: int = 2,
+        tags: Optional[dict[str, str]] = None
+    ):
+        """
+        Initialize a new log-linear histogram metric.
+        
+        Args:
+            name: The name of the histogram
+            description: A human-readable description of what the histogram represents
+            lowest: Smallest value tracked with full precision (default: 1 microsecond in seconds)
+            highest: Largest value tracked with full precision (default: one hour in seconds)
+            significant_digits: Decimal digits of precision, between 1 and 4 (default: 2)
+            tags: Optional dictionary of tags to associate with this histogram
+            
+        Raises:
+            MetricValidationError: If the range or precision is invalid
+        """
+        super().__init__(name, description, tags)
+        
+        if not isinstance(significant_digits, int) or not 1 <= significant_digits <= 4:
+            raise MetricValidationError(
+                f"significant_digits must be an integer between 1 and 4, got {significant_digits}"
+            )
+        if not (isinstance(lowest, (int, float)) and isinstance(highest, (int, float))):
+            raise MetricValidationError("Histogram range bounds must be numbers")
+        if lowest <= 0 or highest <= lowest:
+            raise MetricValidationError(
+                f"Histogram range must satisfy 0 < lowest < highest, got [{lowest}, {highest}]"
+            )
+        
+        self.lowest = float(lowest)
+        self.highest = float(highest)
+        self.significant_digits = significant_digits
+        
+        sub_buckets = 1 << math.ceil(math.log2(10 ** significant_digits))
+        octaves = max(1, math.ceil(math.log2(self.highest / self.lowest)))
+        steps = 1.0 + np.arange(sub_buckets, dtype=np.float64) / sub_buckets
+        scales = self.lowest * np.exp2(np.arange(octaves, dtype=np.float64))
+        self._boundaries = np.append(np.outer(scales, steps).ravel(), self.lowest * 2.0 ** octaves)
+        # bisect works on Python sequences; a list avoids per-call NumPy scalar boxing
+        self._bounds = self._boundaries.tolist()
+        # Bucket i covers [bounds[i - 1], bounds[i]); 0 is underflow, the last is overflow
+        self._shards = _ShardSet(len(self._bounds) + 1)
+        self._local = self._shards.thread_local
+    
+    def get_type(self) -> MetricType:
+        """Get the metric type."""
+        return MetricType.HISTOGRAM
+    
+    @property
+    def bucket_count(self) -> int:
+        """Number of buckets, including the underflow and overflow buckets."""
+        return len(self._bounds) + 1
+    
+    def observe(self, value: Union[int, float]) -> None:
+        """
+        Record an observation in the histogram.
+        
+        Args:
+            value: The value to record
+            
+        Raises:
+            ValueError: If the value is negative or NaN
+        """
+        if not value >= 0:
+            raise ValueError(f"Observation value must be non-negative, got {value}")
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._shards.local()
+        shard.counts[bisect_right(self._bounds, value)] += 1
+        shard.total += value
+        if value < shard.minimum:
+            shard.minimum = value
+        if value > shard.maximum:
+            shard.maximum = value
+    
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Merge all shards into a point-in-time view.
+        
+        Returns:
+            Dictionary with ``count``, ``sum``, ``min``, ``max`` and the merged
+            per-bucket ``counts`` as a NumPy ``int64`` array
+        """
+        shards = self._shards.collect()
+        counts = np.array([shard.counts for shard in shards], dtype=np.int64).sum(axis=0)
+        self.update_last_updated()
+        return {
+            "count": int(counts.sum()),
+            "sum": sum(shard.total for shard in shards),
+            "min": min(shard.minimum for shard in shards),
+            "max": max(shard.maximum for shard in shards),
+            "counts": counts,
+        }
+    
+    def quantiles(self, quantiles: Sequence[float]) -> list[float]:
+        """
+        Estimate several quantiles from a single merged snapshot.
+        
+        Args:
+            quantiles: Quantiles to compute, each in ``[0, 1]``
+            
+        Returns:
+            The estimated values in the same order, or zeros if nothing was observed
+            
+        Raises:
+            ValueError: If a quantile lies outside ``[0, 1]``
+        """
+        for q in quantiles:
+            if not 0.0 <= q <= 1.0:
+                raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+        return self._resolve(self.snapshot(), quantiles)
+    
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a single quantile, e.g. ``0.99`` for p99.
+        
+        Args:
+            q: The quantile to compute, in ``[0, 1]``
+            
+        Returns:
+            The estimated value, or zero if nothing was observed
+        """
+        return self.quantiles([q])[0]
+    
+    def _resolve(self, snapshot: dict[str, Any], quantiles: Sequence[float]) -> list[float]:
+        """Map quantiles onto bucket midpoints, clamped to the observed range."""
+        total = snapshot["count"]
+        if total == 0:
+            return [0.0 for _ in quantiles]
+        
+        cumulative = np.cumsum(snapshot["counts"])
+        ranks = np.maximum(1, np.ceil(np.asarray(quantiles, dtype=np.float64) * total))
+        indices = np.searchsorted(cumulative, ranks, side="left")
+        
+        # The overflow bucket has no upper bound, so it resolves to the observed max
+        lower = np.concatenate(([0.0], self._boundaries[:-1], [snapshot["max"]]))
+        upper = np.concatenate((self._boundaries, [snapshot["max"]]))
+        estimates = (lower[indices] + upper[indices]) / 2.0
+        return np.clip(estimates, snapshot["min"], snapshot["max"]).tolist()
+    
+    def get_value(self) -> dict[str, Any]:
+        """
+        Get the current histogram value.
+        
+        Returns:
+            Dictionary containing summary statistics and the p50, p90, p99 and
+            p999 quantile estimates
+        """
+        snapshot = self.snapshot()
+        count = snapshot["count"]
+        p50, p90, p99, p999 = self._resolve(snapshot, self.DEFAULT_QUANTILES)
+        return {
+            "count": count,
+            "sum": snapshot["sum"],
+            "min": snapshot["min"] if count > 0 else 0,
+            "max": snapshot["max"] if count > 0 else 0,
+            "avg": (snapshot["sum"] / count) if count > 0 else 0,
+            "p50": p50,
+            "p90": p90,
+            "p99": p99,
+            "p999": p999,
+        }
+    
+    def reset(self) -> None:
+        """Reset the histogram to its initial state."""
+        self._shards.reset()
+        self.update_last_updated()
+
+
 class MetricsRegistry:
     """
     Central registry for all metrics in the NCA system.
@@ -875,6 +1220,60 @@ class MetricsRegistry:
         self.register_metric(histogram)
         return histogram
     
+    def create_sharded_counter(
+        self,
+        name: str,
+        description: str,
+        tags: Optional[dict[str, str]] = None
+    ) -> ShardedCounter:
+        """
+        Create and register a new sharded counter for high-frequency increments.
+        
+        Args:
+            name: The name of the counter
+            description: A human-readable description of what the counter represents
+            tags: Optional dictionary of tags to associate with this counter
+            
+        Returns:
+            The created counter
+            
+        Raises:
+            MetricRegistrationError: If a metric with the same name already exists
+        """
+        counter = ShardedCounter(name, description, tags)
+        self.register_metric(counter)
+        return counter
+    
+    def create_log_linear_histogram(
+        self,
+        name: str,
+        description: str,
+        lowest: float = 1e-6,
+        highest: float = 3600.0,
+        significant_digits: int = 2,
+        tags: Optional[dict[str, str]] = None
+    ) -> LogLinearHistogram:
+        """
+        Create and register a new log-linear histogram with quantile support.
+        
+        Args:
+            name: The name of the histogram
+            description: A human-readable description of what the histogram represents
+            lowest: Smallest value tracked with full precision
+            highest: Largest value tracked with full precision
+            significant_digits: Decimal digits of precision, between 1 and 4
+            tags: Optional dictionary of tags to associate with this histogram
+            
+        Returns:
+            The created histogram
+            
+        Raises:
+            MetricRegistrationError: If a metric with the same name already exists
+        """
+        histogram = LogLinearHistogram(name, description, lowest, highest, significant_digits, tags)
+        self.register_metric(histogram)
+        return histogram
+    
     def create_timer(self, name: str, description: str, tags: Optional[dict[str, str]] = None) -> Timer:
         """
         Create and register a new timer metric.
@@ -16,6 +16,7 @@ import builtins
 import datetime
 import functools
 import hashlib
+import heapq
 import hmac
 import io
 import json
@@ -23,9 +24,11 @@ import logging
 import os
 import pickle
 import secrets
+import sys
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -238,16 +241,201 @@ class CacheBackend(ABC):
         pass
 
 
-class InMemoryCache(CacheBackend):
+def _estimate_size(value: Any) -> int:
+    """Estimate the memory footprint of a cached value in bytes."""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class _RecencyIndex:
+    """
+    Keys in insertion or access order, oldest first.
+
+    Used for LRU (accesses move a key to the back) and FIFO (accesses are
+    ignored). Every operation is O(1).
+    """
+
+    def __init__(self, move_on_access: bool = True):
+        self._order: OrderedDict[str, None] = OrderedDict()
+        self._move_on_access = move_on_access
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._order
+
+    def add(self, key: str) -> None:
+        self._order[key] = None
+
+    def touch(self, key: str) -> None:
+        if self._move_on_access:
+            self._order.move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        self._order.pop(key, None)
+
+    def victim(self) -> Optional[str]:
+        return next(iter(self._order), None)
+
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class _FrequencyIndex:
+    """
+    Keys bucketed by access count for LFU eviction.
+
+    Each bucket keeps its keys in recency order, so ties are broken by
+    evicting the least recently used key. Adding, touching and evicting are
+    O(1); only removing the last key of the lowest bucket outside of eviction
+    requires rescanning the (few) distinct counts.
+    """
+
+    def __init__(self) -> None:
+        self._counts: dict[str, int] = {}
+        self._buckets: dict[int, OrderedDict[str, None]] = {}
+        self._min_count = 0
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._counts
+
+    def add(self, key: str) -> None:
+        self._counts[key] = 0
+        self._buckets.setdefault(0, OrderedDict())[key] = None
+        self._min_count = 0
+
+    def touch(self, key: str) -> None:
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def remove(self, key: str) -> None:
+        count = self._counts.pop(key, None)
+        if count is None:
+            return
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count and self._buckets:
+                self._min_count = min(self._buckets)
+
+    def victim(self) -> Optional[str]:
+        bucket = self._buckets.get(self._min_count)
+        return next(iter(bucket), None) if bucket else None
+
+    def clear(self) -> None:
+        self._counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+
+class _FrequencySketch:
     """
-    In-memory cache implementation with LRU eviction.
+    Approximate access frequencies for TinyLFU admission.
 
-    This cache stores entries in memory and evicts the least recently used
-    entries when the cache size exceeds the maximum capacity.
+    A Count-Min sketch with four rows of counters saturating at 15. All
+    counters are halved once the number of recorded accesses reaches ten
+    times the cache capacity, so the sketch reflects recent popularity.
+    """
+
+    _MAX_COUNT = 15
+    _HALVE = bytes(count >> 1 for count in range(256))
+
+    def __init__(self, capacity: int):
+        # Eight counters per entry keep collisions between keys rare
+        width = 16
+        while width < 8 * capacity:
+            width <<= 1
+        self._mask = width - 1
+        self._rows = tuple(bytearray(width) for _ in range(4))
+        self._sample_size = 10 * max(capacity, 1)
+        self._additions = 0
+
+    def _slots(self, key: str) -> tuple[int, int, int, int]:
+        # Double hashing derives the four row slots from one hash
+        first = hash(key)
+        step = (first >> 17) | 1
+        mask = self._mask
+        return (
+            first & mask,
+            (first + step) & mask,
+            (first + 2 * step) & mask,
+            (first + 3 * step) & mask,
+        )
+
+    def increment(self, key: str) -> None:
+        first, second, third, fourth = self._slots(key)
+        row0, row1, row2, row3 = self._rows
+        limit = self._MAX_COUNT
+        if row0[first] < limit:
+            row0[first] += 1
+        if row1[second] < limit:
+            row1[second] += 1
+        if row2[third] < limit:
+            row2[third] += 1
+        if row3[fourth] < limit:
+            row3[fourth] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._rows = tuple(row.translate(self._HALVE) for row in self._rows)
+            self._additions //= 2
+
+    def frequency(self, key: str) -> int:
+        first, second, third, fourth = self._slots(key)
+        row0, row1, row2, row3 = self._rows
+        return min(row0[first], row1[second], row2[third], row3[fourth])
+
+    def clear(self) -> None:
+        for row in self._rows:
+            row[:] = bytes(len(row))
+        self._additions = 0
+
+
+class InMemoryCache(CacheBackend):
+    """
+    In-memory cache implementation with constant-time eviction.
+
+    Entries are evicted by the configured policy once the cache holds
+    ``max_size`` entries or, when ``max_bytes`` is set, once the estimated
+    size of the cached values exceeds that budget. LRU and FIFO order is kept
+    in an ``OrderedDict`` and LFU order in per-count buckets, so finding a
+    victim never scans the cache.
+
+    With ``admission="tinylfu"`` new entries first land in a small LRU window
+    (``window_ratio`` of ``max_size``). Entries leaving the window are only
+    admitted to the main region if a frequency sketch says they are more
+    popular than the entry they would displace (W-TinyLFU), which keeps
+    one-hit wonders from flushing frequently used entries.
+
+    Expiry is lazy: deadlines are kept in a heap and due entries are purged
+    when an operation finds the earliest deadline has passed, instead of
+    checking or scanning entries individually.
     """
 
     def __init__(
-        self, max_size: int = 1000, eviction_policy: str = "lru", eviction_threshold: float = 0.9
+        self,
+        max_size: int = 1000,
+        eviction_policy: str = "lru",
+        eviction_threshold: float = 0.9,
+        *,
+        max_bytes: Optional[int] = None,
+        admission: Optional[str] = None,
+        window_ratio: float = 0.01,
+        size_estimator: Optional[Callable[[Any], int]] = None,
+        clock: Callable[[], float] = time.time,
     ):
         """
         Initialize the in-memory cache.
@@ -255,20 +443,58 @@ class InMemoryCache(CacheBackend):
         Args:
             max_size: Maximum number of entries to store in the cache
             eviction_policy: Policy to use when evicting entries ('lru', 'lfu', 'fifo')
-            eviction_threshold: Threshold at which to start evicting entries (0.0-1.0)
+            eviction_threshold: Occupancy (0.0-1.0) from which writes purge expired entries
+            max_bytes: Optional budget for the estimated size of cached values
+            admission: Optional admission policy ('tinylfu')
+            window_ratio: Share of ``max_size`` reserved for the TinyLFU window
+            size_estimator: Callable returning the size of a value in bytes
+                (defaults to the pickled size when ``max_bytes`` is set)
+            clock: Wall clock used for expiry deadlines
         """
-        self._cache: dict[str, CacheEntry] = {}
         self._max_size = max_size
         self._eviction_policy = eviction_policy.lower()
         self._eviction_threshold = eviction_threshold
+        self._max_bytes = max_bytes
+        self._admission = admission.lower() if admission else None
+        self._clock = clock
         self._lock = threading.RLock()
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        self._expirations = 0
+        self._rejections = 0
+        self._get_ns = 0
+        self._get_calls = 0
+        self._set_ns = 0
+        self._set_calls = 0
 
         # Validate eviction policy
         if self._eviction_policy not in ("lru", "lfu", "fifo"):
             raise ValueError(f"Unknown eviction policy: {eviction_policy}")
+        if self._admission not in (None, "tinylfu"):
+            raise ValueError(f"Unknown admission policy: {admission}")
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self._cache: dict[str, CacheEntry] = {}
+        self._main: Union[_RecencyIndex, _FrequencyIndex] = (
+            _FrequencyIndex()
+            if self._eviction_policy == "lfu"
+            else _RecencyIndex(move_on_access=self._eviction_policy == "lru")
+        )
+        self._window: Optional[_RecencyIndex] = None
+        self._sketch: Optional[_FrequencySketch] = None
+        if self._admission == "tinylfu":
+            self._window = _RecencyIndex()
+            self._window_size = max(1, int(max_size * window_ratio))
+            self._sketch = _FrequencySketch(max_size)
+
+        self._size_of = size_estimator or (_estimate_size if max_bytes is not None else None)
+        self._sizes: dict[str, int] = {}
+        self._bytes = 0
+        # (expires_at, sequence, key, entry); superseded entries are skipped when popped
+        self._deadlines: list[tuple[float, int, str, CacheEntry]] = []
+        self._sequence = 0
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -280,21 +506,28 @@ class InMemoryCache(CacheBackend):
         Returns:
             Cached value or None if not found
         """
+        started = time.perf_counter_ns()
         with self._lock:
-            entry = self._cache.get(key)
+            deadlines = self._deadlines
+            if deadlines and deadlines[0][0] <= self._clock():
+                self._purge_expired()
+            if self._sketch is not None:
+                self._sketch.increment(key)
 
+            entry = self._cache.get(key)
             if entry is None:
                 self._misses += 1
-                return None
-
-            if entry.is_expired():
-                self._cache.pop(key)
-                self._misses += 1
-                return None
+            else:
+                if self._window is not None and key in self._window:
+                    self._window.touch(key)
+                else:
+                    self._main.touch(key)
+                entry.access()
+                self._hits += 1
 
-            entry.access()
-            self._hits += 1
-            return entry.value
+            self._get_calls += 1
+            self._get_ns += time.perf_counter_ns() - started
+            return None if entry is None else entry.value
 
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
         """
@@ -305,18 +538,35 @@ class InMemoryCache(CacheBackend):
             value: Value to cache
             ttl: Time to live in seconds (optional)
         """
+        started = time.perf_counter_ns()
         with self._lock:
-            # Check if we need to evict entries
-            self._maybe_evict()
+            size = self._size_of(value) if self._size_of is not None else 0
+            if key in self._cache:
+                self._discard(key)
+            elif self._sketch is not None:
+                self._sketch.increment(key)
 
-            # Calculate expiration time
-            expires_at = None
-            if ttl is not None:
-                expires_at = time.time() + ttl
+            if self._max_bytes is not None and size > self._max_bytes:
+                self._rejections += 1
+            else:
+                if len(self._cache) >= self._max_size * self._eviction_threshold:
+                    self._purge_expired()
 
-            # Create and store the entry
-            entry = CacheEntry(key=key, value=value, expires_at=expires_at)
-            self._cache[key] = entry
+                # Calculate expiration time
+                expires_at = None
+                if ttl is not None:
+                    expires_at = self._clock() + ttl
+
+                entry = CacheEntry(key=key, value=value, expires_at=expires_at)
+                if self._window is None:
+                    self._evict_for(1, size)
+                    self._insert(key, entry, size, self._main)
+                else:
+                    self._insert(key, entry, size, self._window)
+                    self._admit_from_window()
+
+            self._set_calls += 1
+            self._set_ns += time.perf_counter_ns() - started
 
     def delete(self, key: str) -> bool:
         """
@@ -330,7 +580,7 @@ class InMemoryCache(CacheBackend):
         """
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
+                self._discard(key)
                 return True
             return False
 
@@ -338,6 +588,14 @@ class InMemoryCache(CacheBackend):
         """Clear all entries from the cache."""
         with self._lock:
             self._cache.clear()
+            self._main.clear()
+            if self._window is not None:
+                self._window.clear()
+            if self._sketch is not None:
+                self._sketch.clear()
+            self._sizes.clear()
+            self._bytes = 0
+            self._deadlines.clear()
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -350,6 +608,13 @@ class InMemoryCache(CacheBackend):
             total_requests = self._hits + self._misses
             hit_rate = self._hits / total_requests if total_requests > 0 else 0
 
+            if self._size_of is not None:
+                memory_usage = self._bytes
+            else:
+                memory_usage = sum(
+                    pickle.dumps(entry.value).__sizeof__() for entry in self._cache.values()
+                )
+
             return {
                 "backend": "in_memory",
                 "size": len(self._cache),
@@ -359,39 +624,105 @@ class InMemoryCache(CacheBackend):
                 "misses": self._misses,
                 "hit_rate": hit_rate,
                 "evictions": self._evictions,
+                "expirations": self._expirations,
+                "rejections": self._rejections,
                 "eviction_policy": self._eviction_policy,
-                "memory_usage_bytes": sum(
-                    pickle.dumps(entry.value).__sizeof__() for entry in self._cache.values()
+                "admission_policy": self._admission,
+                "memory_usage_bytes": memory_usage,
+                "max_bytes": self._max_bytes,
+                "avg_get_latency_us": (
+                    self._get_ns / self._get_calls / 1000 if self._get_calls else 0.0
+                ),
+                "avg_set_latency_us": (
+                    self._set_ns / self._set_calls / 1000 if self._set_calls else 0.0
                 ),
             }
 
-    def _maybe_evict(self) -> None:
-        """Evict entries if the cache is full."""
-        if len(self._cache) < self._max_size * self._eviction_threshold:
+    def _insert(
+        self,
+        key: str,
+        entry: CacheEntry,
+        size: int,
+        index: Union[_RecencyIndex, _FrequencyIndex],
+    ) -> None:
+        """Store an entry and register it with *index* and the expiry heap."""
+        self._cache[key] = entry
+        index.add(key)
+        if self._size_of is not None:
+            self._sizes[key] = size
+            self._bytes += size
+        if entry.expires_at is not None:
+            self._sequence += 1
+            heapq.heappush(self._deadlines, (entry.expires_at, self._sequence, key, entry))
+            if len(self._deadlines) > 2 * len(self._cache) + 64:
+                self._compact_deadlines()
+
+    def _discard(self, key: str) -> None:
+        """Remove an entry from the cache and whichever index holds it."""
+        del self._cache[key]
+        if self._window is not None and key in self._window:
+            self._window.remove(key)
+        else:
+            self._main.remove(key)
+        if self._size_of is not None:
+            self._bytes -= self._sizes.pop(key)
+
+    def _over_capacity(self, entries: int = 0, size: int = 0) -> bool:
+        """Whether adding *entries* entries of *size* bytes would exceed a limit."""
+        if len(self._cache) + entries > self._max_size:
+            return True
+        return self._max_bytes is not None and self._bytes + size > self._max_bytes
+
+    def _evict_for(self, entries: int, size: int) -> None:
+        """Evict policy victims until the requested room is available."""
+        if not self._over_capacity(entries, size):
             return
-
-        # Remove expired entries first
-        expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
-        for key in expired_keys:
-            del self._cache[key]
+        # Expired entries go first
+        self._purge_expired()
+        while self._cache and self._over_capacity(entries, size):
+            victim = self._main.victim()
+            if victim is None and self._window is not None:
+                victim = self._window.victim()
+            if victim is None:
+                break
+            self._discard(victim)
             self._evictions += 1
 
-        # If we still need to evict, use the configured policy
-        if len(self._cache) >= self._max_size:
-            if self._eviction_policy == "lru":
-                # Least Recently Used
-                key_to_evict = min(
-                    self._cache.keys(), key=lambda k: self._cache[k].last_accessed_at
-                )
-            elif self._eviction_policy == "lfu":
-                # Least Frequently Used
-                key_to_evict = min(self._cache.keys(), key=lambda k: self._cache[k].access_count)
-            else:  # 'fifo'
-                # First In First Out
-                key_to_evict = min(self._cache.keys(), key=lambda k: self._cache[k].created_at)
-
-            del self._cache[key_to_evict]
-            self._evictions += 1
+    def _admit_from_window(self) -> None:
+        """Move entries leaving the TinyLFU window into the main region."""
+        window, sketch = self._window, self._sketch
+        while len(window) > self._window_size:
+            candidate = window.victim()
+            window.remove(candidate)
+            if self._over_capacity():
+                # The candidate has to displace the main region's victim
+                victim = self._main.victim()
+                if victim is not None and sketch.frequency(candidate) <= sketch.frequency(victim):
+                    self._discard(candidate)
+                    self._rejections += 1
+                    continue
+                if victim is not None:
+                    self._discard(victim)
+                    self._evictions += 1
+            self._main.add(candidate)
+        self._evict_for(0, 0)
+
+    def _purge_expired(self) -> None:
+        """Drop every entry whose deadline has passed."""
+        now = self._clock()
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] <= now:
+            _expires_at, _sequence, key, entry = heapq.heappop(deadlines)
+            if self._cache.get(key) is entry:
+                self._discard(key)
+                self._expirations += 1
+
+    def _compact_deadlines(self) -> None:
+        """Rebuild the expiry heap without superseded entries."""
+        self._deadlines = [
+            item for item in self._deadlines if self._cache.get(item[2]) is item[3]
+        ]
+        heapq.heapify(self._deadlines)
 
 
 class FileCache(CacheBackend):
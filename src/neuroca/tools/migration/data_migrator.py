@@ -24,6 +24,7 @@ Usage:
     migrator.migrate()
 """
 
+import contextlib
 import datetime
 import importlib
 import json
@@ -34,15 +35,26 @@ import tempfile
 import time
 import traceback
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Any, Optional
 
 import yaml
 
+from neuroca.utils.record_stream import encode_record, iter_records, open_record_stream, write_records
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# File suffixes used by streaming (NDJSON) backups
+_STREAM_BACKUP_SUFFIXES = {"gzip": ".ndjson.gz", "zstd": ".ndjson.zst", "none": ".ndjson"}
+_STREAM_BACKUP_PATTERN = re.compile(r"\.ndjson(?:\.gz|\.zst)?$")
+# How the records of a streaming backup map back onto the backed-up data
+_LAYOUT_RECORDS = "records"
+_LAYOUT_MAPPING = "mapping"
+_LAYOUT_VALUE = "value"
+
 
 class MigrationError(Exception):
     """Base exception for all migration-related errors."""
@@ -456,14 +468,7 @@ class DataMigrator:
             with open(backup_path, 'w') as f:
                 json.dump({
                     'data': data,
-                    'context': {
-                        'source_version': context.source_version,
-                        'target_version': context.target_version,
-                        'migration_type': context.migration_type.name,
-                        'affected_tiers': [tier.name for tier in context.affected_tiers],
-                        'timestamp': context.timestamp.isoformat(),
-                        'metadata': context.metadata
-                    }
+                    'context': self._context_to_dict(context)
                 }, f, indent=2)
             
             logger.info(f"Created backup at {backup_path}")
@@ -472,12 +477,119 @@ class DataMigrator:
             logger.error(f"Failed to create backup: {str(e)}")
             raise MigrationError(f"Backup creation failed: {str(e)}")
     
+    def create_streaming_backup(
+        self,
+        records: Iterable[Any],
+        context: MigrationContext,
+        compression: str = "gzip"
+    ) -> str:
+        """
+        Create a backup by streaming records to a compressed NDJSON file.
+        
+        Unlike create_backup, the records are consumed one at a time, so
+        arbitrarily large datasets can be backed up from a generator without
+        being loaded into memory.
+        
+        Args:
+            records: Iterable of JSON-serializable records to back up
+            context: Migration context
+            compression: "gzip", "zstd" or "none"
+            
+        Returns:
+            Path to the backup file
+        """
+        return self._write_streaming_backup(records, context, compression, _LAYOUT_RECORDS)
+    
+    def create_data_backup(
+        self,
+        data: Any,
+        context: MigrationContext,
+        compression: str = "gzip"
+    ) -> str:
+        """
+        Create a streaming backup of in-memory migration data.
+        
+        Lists and tuples are written one element per record and mappings one
+        key/value pair per record, so neither is serialized as a single
+        document; any other value is written as one record. load_backup
+        restores the original shape.
+        
+        Args:
+            data: The data to back up
+            context: Migration context
+            compression: "gzip", "zstd" or "none"
+            
+        Returns:
+            Path to the backup file
+        """
+        if isinstance(data, Mapping):
+            records = ({'key': key, 'value': value} for key, value in data.items())
+            return self._write_streaming_backup(records, context, compression, _LAYOUT_MAPPING)
+        if isinstance(data, (list, tuple)):
+            return self._write_streaming_backup(data, context, compression, _LAYOUT_RECORDS)
+        return self._write_streaming_backup([data], context, compression, _LAYOUT_VALUE)
+    
+    def _write_streaming_backup(
+        self,
+        records: Iterable[Any],
+        context: MigrationContext,
+        compression: str,
+        layout: str
+    ) -> str:
+        """Write a context header and records to a new streaming backup file."""
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        suffix = _STREAM_BACKUP_SUFFIXES.get(compression, ".ndjson")
+        backup_filename = (
+            f"backup_{context.source_version}_to_{context.target_version}_{timestamp}{suffix}"
+        )
+        backup_path = os.path.join(self.backup_dir, backup_filename)
+        
+        try:
+            with open_record_stream(backup_path, "wb", compression=compression) as stream:
+                stream.write(encode_record({
+                    'context': self._context_to_dict(context),
+                    'layout': layout
+                }))
+                count = write_records(stream, ({'record': record} for record in records))
+            
+            logger.info(f"Created streaming backup of {count} records at {backup_path}")
+            return backup_path
+        except Exception as e:
+            with contextlib.suppress(OSError):
+                os.remove(backup_path)
+            logger.error(f"Failed to create backup: {str(e)}")
+            raise MigrationError(f"Backup creation failed: {str(e)}")
+    
+    def iter_backup_records(self, backup_path: str) -> tuple[MigrationContext, Iterator[Any]]:
+        """
+        Open a streaming backup and lazily iterate over its records.
+        
+        Args:
+            backup_path: Path to a backup written by create_streaming_backup
+                or create_data_backup
+            
+        Returns:
+            Tuple of (context, record iterator). The file is closed once the
+            iterator is exhausted or garbage collected.
+            
+        Raises:
+            MigrationError: If the backup header cannot be read
+        """
+        context, _layout, records = self._open_streaming_backup(backup_path)
+        return context, records
+    
     def load_backup(self, backup_path: str) -> tuple[Any, MigrationContext]:
         """
         Load data from a backup file.
         
+        Streaming backups of record sequences are returned as a lazy iterator
+        over the records, so large backups are never held in memory at once;
+        the file is closed when the iterator is exhausted or garbage
+        collected. Mapping and single-value backups written by
+        create_data_backup are rebuilt in their original shape.
+        
         Args:
-            backup_path: Path to the backup file
+            backup_path: Path to the backup file (JSON or streaming NDJSON)
             
         Returns:
             Tuple of (data, context)
@@ -485,27 +597,93 @@ class DataMigrator:
         Raises:
             MigrationError: If backup cannot be loaded
         """
+        if _STREAM_BACKUP_PATTERN.search(backup_path):
+            context, layout, records = self._open_streaming_backup(backup_path)
+            if layout == _LAYOUT_RECORDS:
+                return self._guard_backup_errors(records), context
+            try:
+                if layout == _LAYOUT_MAPPING:
+                    return {entry['key']: entry['value'] for entry in records}, context
+                return next(records), context
+            except Exception as e:
+                logger.error(f"Failed to load backup: {str(e)}")
+                raise MigrationError(f"Backup loading failed: {str(e)}")
+        
         try:
             with open(backup_path) as f:
                 backup = json.load(f)
             
             data = backup['data']
-            context_dict = backup['context']
-            
-            context = MigrationContext(
-                source_version=context_dict['source_version'],
-                target_version=context_dict['target_version'],
-                migration_type=MigrationType[context_dict['migration_type']],
-                affected_tiers=[MemoryTier[tier] for tier in context_dict['affected_tiers']],
-                timestamp=datetime.datetime.fromisoformat(context_dict['timestamp']),
-                metadata=context_dict.get('metadata', {})
-            )
+            context = self._context_from_dict(backup['context'])
             
             return data, context
         except Exception as e:
             logger.error(f"Failed to load backup: {str(e)}")
             raise MigrationError(f"Backup loading failed: {str(e)}")
     
+    def _open_streaming_backup(self, backup_path: str) -> tuple[MigrationContext, str, Iterator[Any]]:
+        """
+        Read the header of a streaming backup and return its remaining records.
+        
+        Args:
+            backup_path: Path to the streaming backup
+            
+        Returns:
+            Tuple of (context, layout, record iterator)
+            
+        Raises:
+            MigrationError: If the backup header cannot be read
+        """
+        entries = self._stream_backup(backup_path)
+        try:
+            header = next(entries)
+            context = self._context_from_dict(header['context'])
+        except Exception as e:
+            entries.close()
+            logger.error(f"Failed to load backup: {str(e)}")
+            raise MigrationError(f"Backup loading failed: {str(e)}")
+        
+        return context, header.get('layout', _LAYOUT_RECORDS), (entry['record'] for entry in entries)
+    
+    @staticmethod
+    def _guard_backup_errors(records: Iterator[Any]) -> Iterator[Any]:
+        """Re-raise errors hit while lazily reading a backup as MigrationError."""
+        try:
+            yield from records
+        except Exception as e:
+            logger.error(f"Failed to load backup: {str(e)}")
+            raise MigrationError(f"Backup loading failed: {str(e)}")
+    
+    @staticmethod
+    def _stream_backup(backup_path: str) -> Iterator[dict[str, Any]]:
+        """Yield the raw entries of a streaming backup, keeping the file open."""
+        with open_record_stream(backup_path, "rb") as stream:
+            yield from iter_records(stream)
+    
+    @staticmethod
+    def _context_to_dict(context: MigrationContext) -> dict[str, Any]:
+        """Serialize a migration context for a backup file."""
+        return {
+            'source_version': context.source_version,
+            'target_version': context.target_version,
+            'migration_type': context.migration_type.name,
+            'affected_tiers': [tier.name for tier in context.affected_tiers],
+            'timestamp': context.timestamp.isoformat(),
+            'metadata': context.metadata
+        }
+    
+    @staticmethod
+    def _context_from_dict(context_dict: dict[str, Any]) -> MigrationContext:
+        """Rebuild a migration context from its backup representation."""
+        return MigrationContext(
+            source_version=context_dict['source_version'],
+            target_version=context_dict['target_version'],
+            migration_type=MigrationType[context_dict['migration_type']],
+            affected_tiers=[MemoryTier[tier] for tier in context_dict['affected_tiers']],
+            timestamp=datetime.datetime.fromisoformat(context_dict['timestamp']),
+            metadata=context_dict.get('metadata', {})
+        )
+    
     def migrate(self, data: Any = None) -> MigrationResult:
         """
         Perform migration from source version to target version.
@@ -572,7 +750,7 @@ class DataMigrator:
                 
                 # Create backup if enabled
                 if self.auto_backup and not self.dry_run:
-                    self.create_backup(current_data, context)
+                    self.create_data_backup(current_data, context)
                 
                 # Perform migration step
                 logger.info(f"Migrating from {source} to {target}...")
@@ -736,7 +914,9 @@ class DataMigrator:
         """
         backups = []
         
-        backup_pattern = re.compile(r"backup_(.+)_to_(.+)_(\d{8}_\d{6})\.json")
+        backup_pattern = re.compile(
+            r"backup_(.+)_to_(.+)_(\d{8}_\d{6})\.(?:json|ndjson(?:\.gz|\.zst)?)$"
+        )
         
         for filename in os.listdir(self.backup_dir):
             match = backup_pattern.match(filename)
@@ -0,0 +1,188 @@
+"""Streaming record files: NDJSON or length-prefixed JSON, optionally compressed.
+
+Records are JSON objects written one at a time, so producers and consumers
+never need to hold a whole export in memory. Two framings are supported:
+
+* ``ndjson`` - one compact JSON document per line.
+* ``length-prefixed`` - a 4-byte big-endian length followed by the JSON bytes,
+  which tolerates payloads containing raw newlines and allows skipping records
+  without parsing them.
+
+Streams may be gzip compressed (standard library) or zstd compressed when the
+optional ``zstandard`` package is installed.
+"""
+
+from __future__ import annotations
+
+import datetime
+import enum
+import gzip
+import io
+import json
+import os
+import struct
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import ExitStack, contextmanager
+from typing import IO, Any
+
+try:  # pragma: no cover - optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+__all__ = [
+    "RecordStreamError",
+    "RECORD_FORMATS",
+    "COMPRESSIONS",
+    "encode_record",
+    "write_records",
+    "iter_records",
+    "open_record_stream",
+    "resolve_compression",
+]
+
+RECORD_FORMATS = ("ndjson", "length-prefixed")
+COMPRESSIONS = ("none", "gzip", "zstd")
+
+_LENGTH = struct.Struct(">I")
+_SUFFIXES = {".gz": "gzip", ".gzip": "gzip", ".zst": "zstd", ".zstd": "zstd"}
+
+
+class RecordStreamError(ValueError):
+    """Raised when a record stream is misconfigured or malformed."""
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values that :mod:`json` does not handle natively."""
+
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _check_format(fmt: str) -> str:
+    if fmt not in RECORD_FORMATS:
+        raise RecordStreamError(
+            f"Unknown record format {fmt!r}; expected one of {', '.join(RECORD_FORMATS)}"
+        )
+    return fmt
+
+
+def encode_record(record: Mapping[str, Any], fmt: str = "ndjson") -> bytes:
+    """Return the framed byte representation of a single record."""
+
+    payload = json.dumps(record, separators=(",", ":"), default=_json_default).encode("utf-8")
+    if _check_format(fmt) == "ndjson":
+        return payload + b"\n"
+    return _LENGTH.pack(len(payload)) + payload
+
+
+def write_records(
+    stream: IO[bytes],
+    records: Iterable[Mapping[str, Any]],
+    fmt: str = "ndjson",
+) -> int:
+    """Write *records* to a binary *stream* and return how many were written."""
+
+    count = 0
+    for record in records:
+        stream.write(encode_record(record, fmt))
+        count += 1
+    return count
+
+
+def iter_records(stream: IO[bytes], fmt: str = "ndjson") -> Iterator[dict[str, Any]]:
+    """Lazily decode records from a binary *stream*."""
+
+    if _check_format(fmt) == "ndjson":
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise RecordStreamError(f"Invalid JSON on line {line_number}: {exc}") from exc
+        return
+
+    index = 0
+    while True:
+        header = stream.read(_LENGTH.size)
+        if not header:
+            return
+        if len(header) < _LENGTH.size:
+            raise RecordStreamError(f"Truncated length prefix for record {index}")
+        (size,) = _LENGTH.unpack(header)
+        payload = stream.read(size)
+        if len(payload) < size:
+            raise RecordStreamError(f"Truncated payload for record {index}")
+        try:
+            yield json.loads(payload)
+        except json.JSONDecodeError as exc:
+            raise RecordStreamError(f"Invalid JSON in record {index}: {exc}") from exc
+        index += 1
+
+
+def resolve_compression(target: Any, compression: str | None = "auto") -> str:
+    """Resolve ``"auto"`` compression from the file suffix of *target*."""
+
+    if compression is None:
+        return "none"
+    if compression == "auto":
+        if isinstance(target, (str, os.PathLike)):
+            suffix = os.path.splitext(os.fspath(target))[1].lower()
+            return _SUFFIXES.get(suffix, "none")
+        return "none"
+    if compression not in COMPRESSIONS:
+        raise RecordStreamError(
+            f"Unknown compression {compression!r}; expected one of {', '.join(COMPRESSIONS)}"
+        )
+    return compression
+
+
+@contextmanager
+def open_record_stream(
+    target: str | os.PathLike[str] | IO[bytes],
+    mode: str = "rb",
+    *,
+    compression: str | None = "auto",
+) -> Iterator[IO[bytes]]:
+    """Open *target* as a binary stream, applying (de)compression.
+
+    Args:
+        target: File path or an already open binary file object. File objects
+            are left open when the context exits.
+        mode: ``"rb"``, ``"wb"`` or ``"ab"``.
+        compression: ``"none"``, ``"gzip"``, ``"zstd"`` or ``"auto"`` to infer
+            from the path suffix.
+    """
+
+    if mode not in ("rb", "wb", "ab"):
+        raise RecordStreamError(f"Unsupported mode {mode!r}")
+    codec = resolve_compression(target, compression)
+    if codec == "zstd" and zstandard is None:
+        raise RecordStreamError("zstd compression requires the 'zstandard' package")
+
+    reading = mode == "rb"
+    with ExitStack() as stack:
+        if isinstance(target, (str, os.PathLike)):
+            raw: IO[bytes] = stack.enter_context(open(target, mode))
+        else:
+            raw = target
+
+        if codec == "gzip":
+            stream: IO[bytes] = stack.enter_context(gzip.GzipFile(fileobj=raw, mode=mode))
+        elif codec == "zstd":
+            if reading:
+                reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=False)
+                stream = stack.enter_context(io.BufferedReader(reader))
+            else:
+                stream = stack.enter_context(
+                    zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+                )
+        else:
+            stream = raw
+        yield stream
@@ -305,6 +305,21 @@ class InMemoryMemoryService:
         )
         return [MemoryResponse.from_orm(record) for record in records]
 
+    async def list_memories_page(
+        self,
+        search_params: MemorySearchParams,
+        *,
+        cursor: str | None = None,
+        user: Any | None = None,
+        roles: Iterable[str] | None = None,
+        allow_admin: bool | None = None,
+    ) -> tuple[List[MemoryResponse], str | None]:
+        del cursor
+        records = await self.list_memories(
+            search_params, user=user, roles=roles, allow_admin=allow_admin
+        )
+        return records, None
+
     async def update_memory(
         self,
         memory_id: UUID,
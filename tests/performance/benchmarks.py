@@ -50,6 +50,7 @@ import psutil
 
 from neuroca.memory.backends import BackendType
 from neuroca.memory.manager.memory_manager import MemoryManager
+from neuroca.memory.manager.sanitization import MemorySanitizer
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -815,6 +816,133 @@ def run_high_concurrency_stress_scenario(
     )
 
 
+_SANITIZER_WORDS = (
+    "the", "agent", "recalled", "meeting", "notes", "about", "project", "roadmap",
+    "and", "summarised", "context", "for", "retrieval", "memory", "consolidation",
+    "with", "user", "preferences", "schedule", "review", "budget", "design", "draft",
+    "follow", "up", "on", "quarterly", "planning", "experiment", "results", "were",
+)
+
+_SANITIZER_SENSITIVE = (
+    "contact jane.doe@example.com",
+    "call 555-123-4567",
+    "card 4111 1111 1111 1111",
+    "api_key = ABCDEF1234567890",
+    "ssn 123-45-6789",
+)
+
+
+def _generate_sanitizer_prose(length: int, rng: random.Random) -> str:
+    """Generate word-based prose of roughly ``length`` characters."""
+
+    words: list[str] = []
+    size = 0
+    while size < length:
+        word = rng.choice(_SANITIZER_WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)[:length]
+
+
+def _generate_sanitizer_payload(
+    index: int,
+    length: int,
+    rng: random.Random,
+    sensitive_ratio: float,
+) -> Dict[str, Any]:
+    """Build a memory payload resembling what the manager sanitises on ingest."""
+
+    text = _generate_sanitizer_prose(length, rng)
+    if rng.random() < sensitive_ratio:
+        cut = rng.randrange(len(text) + 1)
+        text = f"{text[:cut]} {rng.choice(_SANITIZER_SENSITIVE)} {text[cut:]}"
+
+    return {
+        "content": {
+            "text": text,
+            "summary": _generate_sanitizer_prose(max(16, length // 8), rng),
+        },
+        "metadata": {
+            "source": rng.choice(("chat", "email", "document", "calendar")),
+            "additional_metadata": {
+                "notes": _generate_sanitizer_prose(max(16, length // 4), rng),
+                "sequence": index,
+            },
+            "tags": [rng.choice(("Project Launch", "Follow Up", "Planning", "Review"))],
+        },
+    }
+
+
+def _sanitize_payloads(sanitizer: MemorySanitizer, payloads: Sequence[Mapping[str, Any]]) -> None:
+    """Run every payload through the sanitiser entry points used on ingest."""
+
+    for payload in payloads:
+        sanitizer.sanitize_content(payload["content"])
+        sanitizer.sanitize_metadata(payload["metadata"])
+        sanitizer.sanitize_tag_list(payload["metadata"]["tags"])
+
+
+def run_sanitizer_throughput_baseline(
+    *,
+    payload_count: int = 500,
+    content_length: int = 2048,
+    sensitive_ratio: float = 0.1,
+    passes: int = 3,
+    random_seed: int = 7,
+) -> Dict[str, Any]:
+    """Measure :class:`MemorySanitizer` throughput in MB/s on memory payloads.
+
+    Three modes are reported: ``uncached`` scans every value with the value
+    cache disabled, ``cold`` is a first pass through a fresh sanitiser, and
+    ``cached`` re-sanitises payloads that were already seen, which exercises
+    the fast path for repeated values.
+    """
+
+    if payload_count <= 0:
+        raise ValueError("payload_count must be a positive integer")
+    if passes <= 0:
+        raise ValueError("passes must be a positive integer")
+
+    rng = random.Random(random_seed)
+    payloads = [
+        _generate_sanitizer_payload(index, max(32, int(content_length)), rng, sensitive_ratio)
+        for index in range(payload_count)
+    ]
+    total_bytes = len(json.dumps(payloads).encode("utf-8"))
+    megabytes = total_bytes / (1024 * 1024)
+
+    samples: Dict[str, list[float]] = {"uncached": [], "cold": [], "cached": []}
+    for _ in range(passes):
+        uncached = MemorySanitizer(cache_size=0)
+        started = time.perf_counter()
+        _sanitize_payloads(uncached, payloads)
+        samples["uncached"].append(time.perf_counter() - started)
+
+        sanitizer = MemorySanitizer(cache_size=max(4096, payload_count * 8))
+        started = time.perf_counter()
+        _sanitize_payloads(sanitizer, payloads)
+        samples["cold"].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        _sanitize_payloads(sanitizer, payloads)
+        samples["cached"].append(time.perf_counter() - started)
+
+    modes = {
+        mode: {
+            "samples": len(durations),
+            "best_mb_per_sec": megabytes / max(min(durations), 1e-9),
+            "mean_mb_per_sec": megabytes / max(statistics.mean(durations), 1e-9),
+        }
+        for mode, durations in samples.items()
+    }
+    return {
+        "payloads": payload_count,
+        "bytes_per_pass": total_bytes,
+        "sensitive_ratio": sensitive_ratio,
+        "modes": modes,
+    }
+
+
 def benchmark(func=None, *, iterations=DEFAULT_ITERATIONS, warmup=DEFAULT_WARMUP_ITERATIONS,
               parameters=None, metadata=None):
     """
@@ -0,0 +1,163 @@
+"""Unit tests for the websocket API's per-connection outbox."""
+
+import asyncio
+from importlib import util
+from pathlib import Path
+
+import pytest
+
+_MODULE_PATH = (
+    Path(__file__).resolve().parents[3] / "src" / "neuroca" / "api" / "websockets" / "outbox.py"
+)
+_SPEC = util.spec_from_file_location("_websocket_outbox", _MODULE_PATH)
+assert _SPEC is not None and _SPEC.loader is not None, "outbox module should be loadable"
+_MODULE = util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(_MODULE)
+
+ConnectionOutbox = _MODULE.ConnectionOutbox
+OverflowPolicy = _MODULE.OverflowPolicy
+
+
+class _Clock:
+    def __init__(self, now: float = 100.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _drain(outbox) -> list:
+    frames = []
+    while len(outbox):
+        text, _enqueued_at = await outbox.get()
+        frames.append(text)
+    return frames
+
+
+@pytest.mark.asyncio
+async def test_frames_are_delivered_in_order() -> None:
+    outbox = ConnectionOutbox(max_size=4)
+
+    for text in ("a", "b", "c"):
+        assert outbox.offer(text)
+
+    assert await _drain(outbox) == ["a", "b", "c"]
+
+
+def test_max_size_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        ConnectionOutbox(max_size=0)
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_queue_bounded() -> None:
+    """A full outbox discards its oldest frame and never grows past max_size."""
+
+    outbox = ConnectionOutbox(max_size=2, policy="drop_oldest")
+
+    for text in ("a", "b", "c", "d"):
+        assert outbox.offer(text)
+        assert len(outbox) <= 2
+
+    assert outbox.dropped == 2
+    assert await _drain(outbox) == ["c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_replaces_pending_frame_with_same_key() -> None:
+    """Only the latest payload per key is kept once the outbox is full."""
+
+    outbox = ConnectionOutbox(max_size=2, policy=OverflowPolicy.COALESCE)
+    outbox.offer("state-1", key="state")
+    outbox.offer("log-1", key="log")
+
+    assert outbox.offer("state-2", key="state")
+    assert outbox.coalesced == 1
+    assert outbox.dropped == 0
+    assert await _drain(outbox) == ["state-2", "log-1"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_falls_back_to_dropping_oldest() -> None:
+    outbox = ConnectionOutbox(max_size=2, policy=OverflowPolicy.COALESCE)
+    outbox.offer("a", key="x")
+    outbox.offer("b")
+
+    assert outbox.offer("c", key="y")
+    # "x" left the queue, so a later frame with that key cannot coalesce into it
+    assert outbox.offer("d", key="x")
+
+    assert outbox.dropped == 2
+    assert await _drain(outbox) == ["c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_rejects_and_releases_writer() -> None:
+    """Overflow under the disconnect policy stops the writer and rejects new frames."""
+
+    outbox = ConnectionOutbox(max_size=1, policy=OverflowPolicy.DISCONNECT)
+    assert outbox.offer("a")
+
+    assert not outbox.offer("b")
+    assert outbox.overflowed
+    assert not outbox.offer("c")
+    assert await outbox.get() is None
+
+
+@pytest.mark.asyncio
+async def test_close_discards_pending_frames_and_rejects_offers() -> None:
+    outbox = ConnectionOutbox(max_size=4)
+    outbox.offer("a", key="x")
+    outbox.offer("b")
+
+    outbox.close()
+
+    assert len(outbox) == 0
+    assert not outbox.offer("c")
+    assert await outbox.get() is None
+    assert outbox.metrics()["closed"]
+
+
+@pytest.mark.asyncio
+async def test_close_releases_waiting_writer() -> None:
+    outbox = ConnectionOutbox()
+    waiter = asyncio.create_task(outbox.get())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    outbox.close()
+
+    assert await asyncio.wait_for(waiter, timeout=1.0) is None
+
+
+@pytest.mark.asyncio
+async def test_waiting_writer_wakes_on_offer() -> None:
+    outbox = ConnectionOutbox()
+    waiter = asyncio.create_task(outbox.get())
+    await asyncio.sleep(0)
+
+    outbox.offer("a")
+
+    text, _enqueued_at = await asyncio.wait_for(waiter, timeout=1.0)
+    assert text == "a"
+
+
+@pytest.mark.asyncio
+async def test_lag_metrics() -> None:
+    clock = _Clock()
+    outbox = ConnectionOutbox(max_size=4, clock=clock)
+    outbox.offer("a")
+    outbox.offer("b")
+
+    clock.now += 2.0
+    assert outbox.metrics()["pending_lag_seconds"] == pytest.approx(2.0)
+
+    _text, enqueued_at = await outbox.get()
+    clock.now += 1.0
+    outbox.record_sent(enqueued_at)
+
+    metrics = outbox.metrics()
+    assert metrics["sent"] == 1
+    assert metrics["queued"] == 1
+    assert metrics["last_lag_seconds"] == pytest.approx(3.0)
+    assert metrics["max_lag_seconds"] == pytest.approx(3.0)
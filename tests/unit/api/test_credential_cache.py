@@ -0,0 +1,186 @@
+"""Unit tests for the authentication middleware credential caches."""
+
+from importlib import util
+from pathlib import Path
+from types import SimpleNamespace
+
+_MODULE_PATH = (
+    Path(__file__).resolve().parents[3] / "src" / "neuroca" / "api" / "middleware" / "credential_cache.py"
+)
+_SPEC = util.spec_from_file_location("_credential_cache", _MODULE_PATH)
+assert _SPEC is not None and _SPEC.loader is not None, "credential cache module should be loadable"
+_MODULE = util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(_MODULE)
+
+APIKeyCache = _MODULE.APIKeyCache
+VerifiedTokenCache = _MODULE.VerifiedTokenCache
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _payload(jti: str, exp: float, sub: str = "user-1") -> SimpleNamespace:
+    return SimpleNamespace(sub=sub, exp=int(exp), jti=jti)
+
+
+def test_token_cache_hits_and_misses() -> None:
+    """A verified token is served from the cache until it is evicted."""
+
+    clock = _Clock()
+    cache = VerifiedTokenCache(max_entries=2, clock=clock)
+    payload = _payload("a", clock.now + 60)
+
+    assert cache.get("token-a") is None
+    cache.put("token-a", payload)
+    assert cache.get("token-a") is payload
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_token_cache_evicts_least_recently_used() -> None:
+    """The least recently used token is evicted first."""
+
+    clock = _Clock()
+    cache = VerifiedTokenCache(max_entries=2, clock=clock)
+    cache.put("a", _payload("a", clock.now + 60))
+    cache.put("b", _payload("b", clock.now + 60))
+    assert cache.get("a") is not None
+
+    cache.put("c", _payload("c", clock.now + 60))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert len(cache) == 2
+
+
+def test_token_cache_never_serves_expired_tokens() -> None:
+    """Entries are dropped once the token's exp has passed."""
+
+    clock = _Clock()
+    cache = VerifiedTokenCache(clock=clock)
+    cache.put("token", _payload("a", clock.now + 10))
+
+    clock.now += 11
+
+    assert cache.get("token") is None
+    assert len(cache) == 0
+
+
+def test_cached_user_expires_after_ttl() -> None:
+    """An attached user is reused only for user_ttl seconds."""
+
+    clock = _Clock()
+    cache = VerifiedTokenCache(user_ttl=30, clock=clock)
+    cache.put("token", _payload("a", clock.now + 3600))
+    user = object()
+    cache.attach_user("token", user)
+
+    clock.now += 29
+    assert cache.get_user("token") is user
+    clock.now += 2
+    assert cache.get_user("token") is None
+    assert cache.get("token") is not None
+
+
+def test_invalidating_token_id_drops_entry() -> None:
+    """Revoking a token's jti removes it immediately."""
+
+    clock = _Clock()
+    cache = VerifiedTokenCache(clock=clock)
+    cache.put("token-a", _payload("a", clock.now + 60))
+    cache.put("token-b", _payload("b", clock.now + 60))
+
+    cache.invalidate_token_id("a")
+
+    assert cache.get("token-a") is None
+    assert cache.get("token-b") is not None
+
+
+def test_periodic_sweep_batches_revocation_lookups() -> None:
+    """Revocations from the store are applied in one batched lookup per interval."""
+
+    clock = _Clock()
+    revoked = set()
+    lookups = []
+
+    def lookup(token_ids):
+        lookups.append(sorted(token_ids))
+        return revoked.intersection(token_ids)
+
+    cache = VerifiedTokenCache(revalidate_interval=5, revocation_lookup=lookup, clock=clock)
+    cache.put("token-a", _payload("a", clock.now + 60))
+    cache.put("token-b", _payload("b", clock.now + 60))
+
+    revoked.add("a")
+    assert cache.get("token-a") is not None
+    assert lookups == []
+
+    clock.now += 5
+    assert cache.get("token-a") is None
+    assert cache.get("token-b") is not None
+    assert lookups == [["a", "b"]]
+
+
+def test_api_key_lookup() -> None:
+    """Known keys resolve to their service and unknown keys do not."""
+
+    keys = {"ingest": "key-1", "worker": "key-2", "disabled": ""}
+    cache = APIKeyCache(lambda: keys)
+
+    assert cache.lookup("key-1") == "ingest"
+    assert cache.lookup("key-2") == "worker"
+    assert cache.lookup("key-3") is None
+    assert cache.lookup("") is None
+
+
+def test_api_key_index_is_reused_while_mapping_is_unchanged() -> None:
+    """The digest index is built once per mapping object, not per lookup."""
+
+    keys = {"ingest": "key-1"}
+    cache = APIKeyCache(lambda: keys)
+    cache.lookup("key-1")
+    index = cache._index
+
+    for _ in range(3):
+        assert cache.lookup("key-1") == "ingest"
+    assert cache._index is index
+
+
+def test_api_key_rotation_by_replacing_mapping() -> None:
+    """Replacing the configured mapping rotates keys on the next lookup."""
+
+    settings = SimpleNamespace(api_keys={"ingest": "old-key"})
+    cache = APIKeyCache(lambda: settings.api_keys)
+    assert cache.lookup("old-key") == "ingest"
+
+    settings.api_keys = {"ingest": "new-key"}
+
+    assert cache.lookup("old-key") is None
+    assert cache.lookup("new-key") == "ingest"
+
+
+def test_api_key_rotation_in_place_requires_invalidate() -> None:
+    """In-place edits take effect once the cache is invalidated."""
+
+    keys = {"ingest": "old-key"}
+    cache = APIKeyCache(lambda: keys)
+    assert cache.lookup("old-key") == "ingest"
+
+    keys["ingest"] = "new-key"
+    cache.invalidate()
+
+    assert cache.lookup("old-key") is None
+    assert cache.lookup("new-key") == "ingest"
+
+
+def test_api_key_cache_handles_missing_configuration() -> None:
+    """A source returning None behaves like an empty mapping."""
+
+    cache = APIKeyCache(lambda: None)
+
+    assert cache.lookup("anything") is None
@@ -82,6 +82,11 @@ class DummyMemoryService:
             )
         ]
 
+    async def list_memories_page(
+        self, search_params: MemorySearchParams, **kwargs: Any
+    ) -> tuple[list[MemoryResponse], str | None]:
+        return await self.list_memories(search_params, **kwargs), None
+
     async def update_memory(self, memory_id: UUID, *_: Any, **__: Any) -> MemoryResponse:
         return await self.get_memory(memory_id)
 
@@ -0,0 +1,89 @@
+"""Unit tests for sampled, size-capped request body logging."""
+
+import logging
+from importlib import util
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import neuroca.monitoring.logging  # noqa: F401  - load the real package before the shim runs
+
+_MODULE_PATH = Path(__file__).resolve().parents[3] / "src" / "neuroca" / "api" / "middleware" / "logging.py"
+_SPEC = util.spec_from_file_location("_logging_middleware_sampling", _MODULE_PATH)
+assert _SPEC is not None and _SPEC.loader is not None, "logging middleware module should be loadable"
+_MODULE = util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(_MODULE)
+
+LazyBody = _MODULE.LazyBody
+RequestLoggingMiddleware = _MODULE.RequestLoggingMiddleware
+
+
+def _build_app(**options) -> TestClient:
+    app = FastAPI()
+
+    @app.post("/api/v1/memory/batch")
+    async def batch(payload: dict) -> dict:
+        return {"stored": len(payload.get("items", [])), "token": "abc"}
+
+    @app.post("/api/v1/echo")
+    async def echo(payload: dict) -> dict:
+        return payload
+
+    app.add_middleware(RequestLoggingMiddleware, **options)
+    return TestClient(app)
+
+
+def _records_with(caplog, attribute: str) -> list[dict]:
+    return [record.__dict__[attribute] for record in caplog.records if attribute in record.__dict__]
+
+
+def test_lazy_body_sanitizes_only_when_rendered() -> None:
+    """Parsing and redaction are deferred until the body is rendered."""
+
+    body = LazyBody(b'{"password": "hunter2", "name": "n"}', "application/json", 1024)
+
+    assert body._done is False
+    assert body.render() == {"password": "[REDACTED]", "name": "n"}
+    assert body.render() is body.render()
+
+
+def test_lazy_body_truncates_without_parsing() -> None:
+    """Oversized payloads are cut at the cap and redacted textually."""
+
+    raw = b'{"token": "s3cret", "items": [' + b"1," * 1000 + b"1]}"
+    body = LazyBody(raw, "application/json", 40)
+
+    rendered = body.render()
+
+    assert body.truncated and body.size == len(raw)
+    assert "s3cret" not in rendered
+    assert rendered.startswith('{"token": "[REDACTED]"')
+    assert rendered.endswith(f"<truncated, {len(raw)} bytes>")
+
+
+def test_route_sampling_skips_body_capture(caplog) -> None:
+    """Routes sampled at zero log metadata but no bodies."""
+
+    client = _build_app(route_sample_rates={"/api/v1/memory": 0.0})
+    with caplog.at_level(logging.INFO, logger="neuroca.api.middleware.logging"):
+        client.post("/api/v1/memory/batch", json={"items": [1, 2]})
+        client.post("/api/v1/echo", json={"password": "p", "value": 1})
+
+    requests = _records_with(caplog, "request")
+    assert "body" not in requests[0]
+    assert requests[1]["body"]["value"] == 1
+    assert requests[1]["body"]["password"] != "p"
+
+
+def test_response_body_is_rendered_at_emission(caplog) -> None:
+    """Response bodies reach handlers already sanitized."""
+
+    client = _build_app(max_body_bytes=16)
+    with caplog.at_level(logging.INFO, logger="neuroca.api.middleware.logging"):
+        client.post("/api/v1/memory/batch", json={"items": list(range(50))})
+
+    request_body = _records_with(caplog, "request")[0]["body"]
+    assert isinstance(request_body, str) and "truncated" in request_body
+    for response in _records_with(caplog, "response"):
+        assert not isinstance(response.get("body"), LazyBody)
@@ -0,0 +1,123 @@
+"""Unit tests for the columnar metrics store and MetricsService rollups."""
+
+import math
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from neuroca.core.services.metrics import MetricsService
+from neuroca.core.services.timeseries import TimeSeriesStore
+
+MINUTE = 60 * 1_000_000
+HOUR = 60 * MINUTE
+BASE = 1_700_000_000_000_000 - 1_700_000_000_000_000 % HOUR
+
+
+def _brute_rollup(samples, start, end, interval, aggregation):
+    groups = {}
+    for ts, value in samples:
+        if start <= ts <= end:
+            key = start if interval is None else ts - ts % interval
+            groups.setdefault(key, []).append((ts, value))
+    result = {}
+    for key, rows in groups.items():
+        values = [value for _ts, value in rows]
+        if aggregation == "avg":
+            result[key] = sum(values) / len(values)
+        elif aggregation == "sum":
+            result[key] = sum(values)
+        elif aggregation == "max":
+            result[key] = max(values)
+        elif aggregation == "last":
+            result[key] = max(rows)[1]
+        elif aggregation == "p95":
+            ordered = sorted(values)
+            result[key] = ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)]
+    return result
+
+
+@pytest.mark.parametrize("aggregation", ["avg", "sum", "max", "last", "p95"])
+@pytest.mark.parametrize("interval", [None, MINUTE, 5 * MINUTE, HOUR, 45 * 1_000_000])
+def test_rollups_match_raw_aggregation(aggregation, interval) -> None:
+    """Tier-backed rollups agree with aggregating every raw sample."""
+
+    rng = random.Random(7)
+    store = TimeSeriesStore()
+    samples = []
+    for _ in range(3000):
+        ts = BASE + rng.randrange(0, 6 * HOUR)
+        value = rng.random() * 100
+        store.append("latency", ts, value, {"route": "/memory"})
+        samples.append((ts, value))
+
+    start, end = BASE + 17 * MINUTE + 3, BASE + 5 * HOUR + 11 * MINUTE
+    keys, values = store.rollup("latency", start, end, interval, aggregation)
+
+    expected = _brute_rollup(samples, start, end, interval, aggregation)
+    assert keys.tolist() == sorted(expected)
+    assert values.tolist() == pytest.approx([expected[key] for key in sorted(expected)])
+
+
+def test_label_filters_and_trim() -> None:
+    """Series are selected by label subset and trimmed from the front."""
+
+    store = TimeSeriesStore()
+    for minute in range(120):
+        store.append("calls", BASE + minute * MINUTE, 1.0, {"tenant": "a", "model": "m1"})
+        store.append("calls", BASE + minute * MINUTE, 2.0, {"tenant": "b", "model": "m1"})
+
+    assert store.summarize("calls", BASE, BASE + 2 * HOUR, {"tenant": "b"})["sum"] == 240.0
+    assert store.summarize("calls", BASE, BASE + 2 * HOUR, {"model": "m1"})["count"] == 240
+
+    store.trim("calls", BASE + HOUR + 30 * MINUTE)
+    assert store.sample_count("calls") == 60
+    keys, values = store.rollup("calls", BASE, BASE + 2 * HOUR, HOUR, "count")
+    assert keys.tolist() == [BASE + HOUR]
+    assert values.tolist() == [60.0]
+
+
+def test_out_of_order_samples_stay_sorted() -> None:
+    """Late samples are inserted in time order for binary-search windows."""
+
+    store = TimeSeriesStore()
+    for offset in (5, 1, 3, 2, 4):
+        store.append("gauge", BASE + offset, float(offset))
+
+    stamps, values = store.points("gauge", BASE, BASE + 10)
+    assert stamps.tolist() == [BASE + offset for offset in range(1, 6)]
+    assert store.latest("gauge") == 5.0
+    assert store.points("gauge", BASE, BASE + 10, limit=2)[1].tolist() == [4.0, 5.0]
+
+
+@pytest.mark.asyncio
+async def test_service_applies_interval_and_aggregation() -> None:
+    """get_metric_data buckets samples when an aggregation is requested."""
+
+    service = MetricsService(settings=None)
+    name = "test.timeseries.request_latency"
+    now = datetime.utcnow().replace(second=0, microsecond=0)
+    end = now - timedelta(minutes=now.minute % 5)
+    start = end - timedelta(minutes=10)
+    for index in range(20):
+        await service.record_metric(
+            name=name,
+            value=index,
+            timestamp=start + timedelta(seconds=30 * index),
+            labels={"route": "/api"},
+        )
+
+    raw = await service.get_metric_data(
+        name=name, start_time=start, end_time=end, interval="1m", aggregation=None, limit=0
+    )
+    rolled = await service.get_metric_data(
+        name=name, start_time=start, end_time=end, interval="5m", aggregation="max", limit=0
+    )
+
+    assert len(raw.points) == 20
+    assert [point["value"] for point in rolled.points] == [9.0, 19.0]
+    with pytest.raises(ValueError):
+        await service.get_metric_data(
+            name=name, start_time=start, end_time=end, interval="5x", aggregation="avg", limit=0
+        )
+    await service.delete_metric_definition(name)
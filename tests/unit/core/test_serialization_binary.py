@@ -0,0 +1,220 @@
+"""Unit tests for the binary codec and type registry in core.utils.serialization."""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pydantic import BaseModel
+
+from neuroca.core.utils.serialization import (
+    BINARY_MAGIC,
+    DeserializationError,
+    NCAJSONEncoder,
+    SerializationError,
+    TypeRegistry,
+    _json_object_hook,
+    decode_binary,
+    deserialize,
+    encode_binary,
+    register_type,
+    serialize,
+)
+
+
+class Tier(str, Enum):
+    STM = "stm"
+    LTM = "ltm"
+
+
+@dataclass
+class Note:
+    text: str
+    weight: float = 1.0
+    tags: list = field(default_factory=list)
+    score: float = field(default=0.0, init=False)
+
+
+class Record(BaseModel):
+    id: str
+    tier: Tier
+    embedding: list[float]
+
+
+@dataclass(frozen=True)
+class FrozenNote:
+    text: str
+    length: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "length", len(self.text))
+
+
+for _cls in (Tier, Note, Record, FrozenNote):
+    register_type(_cls)
+
+
+def _memory_item(index: int) -> dict:
+    rng = np.random.default_rng(index)
+    return {
+        "id": f"mem-{index}",
+        "content": "The agent consolidated this memory overnight.",
+        "tier": Tier.LTM,
+        "embedding": rng.random(384).astype(np.float32),
+        "scores": rng.random(8).tolist(),
+        "metadata": {"created_at": datetime(2024, 5, 1, 12, 30), "importance": 0.7, "tags": ["a", "b"]},
+        "access_count": 2 ** 70,
+        "source": Path("/tmp/notes.txt"),
+        "flags": (True, False, None),
+        "labels": {"x", "y"},
+        "raw": b"\x00\x01",
+    }
+
+
+def test_round_trip_memory_items():
+    """Memory items with embeddings round-trip exactly and beat JSON on size."""
+    items = [_memory_item(i) for i in range(5)]
+    payload = encode_binary(items)
+    assert payload.startswith(BINARY_MAGIC)
+
+    restored = decode_binary(payload)
+    for original, result in zip(items, restored):
+        embedding = result.pop("embedding")
+        expected = dict(original)
+        expected_embedding = expected.pop("embedding")
+        assert embedding.dtype == np.float32
+        np.testing.assert_array_equal(embedding, expected_embedding)
+        assert result == expected
+        assert result["tier"] is Tier.LTM
+
+    json_payload = json.dumps(items, cls=NCAJSONEncoder).encode("utf-8")
+    assert len(payload) < len(json_payload) * 0.75
+
+
+def test_arrays_are_zero_copy_views_unless_copied():
+    """Decoded arrays view the payload read-only; copy_arrays gives writable arrays."""
+    matrix = np.arange(12, dtype=np.int16).reshape(3, 4)
+    sliced = np.arange(20.0)[::2]
+    payload = encode_binary({"matrix": matrix, "sliced": sliced, "empty": np.zeros((0, 3)), "scalar": np.float32(2.5)})
+
+    restored = decode_binary(payload)
+    np.testing.assert_array_equal(restored["matrix"], matrix)
+    np.testing.assert_array_equal(restored["sliced"], sliced)
+    assert restored["empty"].shape == (0, 3)
+    assert restored["scalar"] == np.float32(2.5) and restored["scalar"].dtype == np.float32
+    assert not restored["matrix"].flags.writeable
+    assert restored["matrix"].base is not None
+
+    copied = decode_binary(payload, copy_arrays=True)
+    assert copied["matrix"].flags.writeable
+
+
+def test_datetime_and_timedelta_arrays_round_trip():
+    """Arrays whose buffer format memoryview cannot cast are still encoded."""
+    stamps = np.array(["2024-01-01T00:00:00", "2024-02-29T12:30:15"], dtype="datetime64[s]")
+    spans = np.array([[1500, -20], [0, 86_400_000]], dtype="timedelta64[ms]")
+    labels = np.array(["stm", "ltm"])
+
+    restored = decode_binary(encode_binary({"stamps": stamps, "spans": spans.T, "labels": labels}))
+
+    assert restored["stamps"].dtype == stamps.dtype
+    np.testing.assert_array_equal(restored["stamps"], stamps)
+    assert restored["spans"].dtype == spans.dtype
+    np.testing.assert_array_equal(restored["spans"], spans.T)
+    np.testing.assert_array_equal(restored["labels"], labels)
+    assert decode_binary(encode_binary(np.datetime64("2024-03-01", "D"))) == np.datetime64("2024-03-01", "D")
+
+
+def test_structured_dtypes_are_rejected():
+    """Field names would be lost, so structured arrays and scalars are refused."""
+    records = np.array([(1, 0.5), (2, 1.5)], dtype=[("id", "<i4"), ("score", "<f8")])
+    with pytest.raises(SerializationError):
+        encode_binary(records)
+    with pytest.raises(SerializationError):
+        encode_binary(records[0])
+    with pytest.raises(SerializationError):
+        encode_binary(np.zeros(2, dtype=("<f4", (3,))).view(np.dtype([("xyz", "<f4", (3,))])))
+
+
+def test_dataclasses_and_models_round_trip():
+    """Dataclasses (including non-init fields) and pydantic models are restored."""
+    note = Note("remember", tags=["x"])
+    note.score = 3.5
+    record = Record(id="r1", tier=Tier.STM, embedding=[0.1, 0.2])
+
+    restored_note, restored_record = decode_binary(encode_binary([note, record]))
+    assert restored_note == note and restored_note.score == 3.5
+    assert restored_record == record
+
+
+def test_registered_names_and_unknown_types():
+    """Explicit names survive renames; unknown names decode to plain values."""
+    registry = TypeRegistry()
+    registry.register(Note, "notes.Note")
+    payload = encode_binary(Note("a"), registry)
+    assert b"notes.Note" in payload
+    assert decode_binary(payload, registry) == Note("a")
+
+    # A fresh registry cannot resolve the custom name and never imports code
+    assert decode_binary(payload, TypeRegistry()) == {"text": "a", "weight": 1.0, "tags": [], "score": 0.0}
+
+
+def test_unregistered_types_are_not_resolved_by_default():
+    """Only registered classes are instantiated unless loaded-module lookup is enabled."""
+
+    @dataclass
+    class Unlisted:
+        value: int
+
+    payload = encode_binary([Unlisted(1), Tier.STM], TypeRegistry())
+    assert decode_binary(payload, TypeRegistry()) == [{"value": 1}, "stm"]
+
+    payload = encode_binary(Note("b"), TypeRegistry())
+    assert decode_binary(payload, TypeRegistry()) == {"text": "b", "weight": 1.0, "tags": [], "score": 0.0}
+    assert decode_binary(payload, TypeRegistry(allow_loaded_modules=True)) == Note("b")
+
+
+def test_frozen_dataclass_non_init_fields_are_not_overwritten():
+    """Payload values for non-init fields cannot bypass a frozen dataclass."""
+    payload = encode_binary(FrozenNote("four"))
+    tampered = payload.replace(b"\x04\x00\x00\x00\x00\x00\x00\x00", b"\x63\x00\x00\x00\x00\x00\x00\x00")
+    assert tampered != payload
+
+    restored = decode_binary(tampered)
+    assert restored == FrozenNote("four")
+    assert restored.length == 4
+
+
+def test_json_enum_decoding_uses_registry():
+    """The JSON fallback still restores enums by class name."""
+    encoded = json.dumps({"tier": Tier.STM}, cls=NCAJSONEncoder)
+    assert json.loads(encoded, object_hook=_json_object_hook) == {"tier": Tier.STM}
+
+
+def test_serialize_envelope_with_binary_format():
+    """serialize/deserialize accept the binary format, with compression."""
+    item = _memory_item(0)
+    restored = deserialize(serialize(item, format="binary", compress=True))
+    np.testing.assert_array_equal(restored["embedding"], item["embedding"])
+    assert restored["metadata"] == item["metadata"]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [b"", b"JSON{}", BINARY_MAGIC + b"s\xff\x00\x00\x00ab", BINARY_MAGIC + b"?", BINARY_MAGIC + b"NN"],
+)
+def test_malformed_payloads_are_rejected(payload):
+    """Truncated, unknown or trailing data raises DeserializationError."""
+    with pytest.raises(DeserializationError):
+        decode_binary(payload)
+
+
+def test_unsupported_objects_are_rejected():
+    """Objects the codec cannot represent raise SerializationError."""
+    with pytest.raises(SerializationError):
+        encode_binary(object())
+    with pytest.raises(SerializationError):
+        encode_binary(np.array([object()]))
@@ -0,0 +1,183 @@
+"""Unit tests for SystemEventBus dispatch, history and async delivery."""
+
+import threading
+
+import pytest
+
+from neuroca.core.events.system import (
+    ConfigurationChangeEvent,
+    SystemErrorEvent,
+    SystemEvent,
+    SystemEventBus,
+    SystemEventPriority,
+    SystemShutdownEvent,
+    create_error_event,
+)
+
+
+class _ChildErrorEvent(SystemErrorEvent):
+    """Subclass used to check MRO-based dispatch."""
+
+
+@pytest.fixture()
+def bus():
+    """Provide a fresh event bus instead of the process-wide singleton."""
+
+    SystemEventBus._instance = None
+    event_bus = SystemEventBus.get_instance()
+    yield event_bus
+    event_bus.flush(timeout=5)
+    SystemEventBus._instance = None
+
+
+def test_event_subclasses_with_required_fields_can_be_constructed() -> None:
+    """Required fields follow the inherited defaults as keyword-only fields."""
+
+    error = SystemErrorEvent(error_message="boom", error_type="RuntimeError", recoverable=False)
+    assert error.priority is SystemEventPriority.CRITICAL
+    assert "boom" in error.get_description()
+
+    change = ConfigurationChangeEvent(config_key="limits.stm", new_value=10)
+    assert change.get_description().startswith("Configuration changed: limits.stm")
+
+    built = create_error_event(ValueError("bad"), component="memory")
+    assert built.error_type == "ValueError"
+    assert built.component == "memory"
+
+
+def test_dispatch_follows_mro_and_subscription_order(bus) -> None:
+    """Base-type, exact-type and global handlers all receive a subclass event."""
+
+    calls = []
+    bus.subscribe(SystemErrorEvent, lambda e: calls.append("error"))
+    bus.subscribe(_ChildErrorEvent, lambda e: calls.append("child"))
+    bus.subscribe(SystemShutdownEvent, lambda e: calls.append("shutdown"))
+    bus.subscribe_all(lambda e: calls.append("all"))
+
+    bus.publish(_ChildErrorEvent(error_message="x", error_type="y"))
+
+    assert calls == ["error", "child", "all"]
+
+
+def test_dispatch_cache_is_invalidated_by_subscription_changes(bus) -> None:
+    """Subscribing and unsubscribing after a publish takes effect immediately."""
+
+    calls = []
+    bus.subscribe(SystemShutdownEvent, lambda e: calls.append("first"))
+    bus.publish(SystemShutdownEvent())
+    assert SystemShutdownEvent in bus._dispatch_cache
+
+    second = bus.subscribe(SystemEvent, lambda e: calls.append("second"))
+    assert bus._dispatch_cache == {}
+    bus.publish(SystemShutdownEvent())
+    assert calls == ["first", "first", "second"]
+
+    assert bus.unsubscribe(second)
+    bus.publish(SystemShutdownEvent())
+    assert calls == ["first", "first", "second", "first"]
+
+
+def test_filter_runs_once_per_delivery(bus) -> None:
+    """A handler's filter is evaluated once for each published event."""
+
+    seen = []
+
+    def only_graceful(event):
+        seen.append(event.id)
+        return event.graceful
+
+    received = []
+    bus.subscribe(SystemShutdownEvent, received.append, filter_fn=only_graceful)
+    bus.publish(SystemShutdownEvent(graceful=True))
+    bus.publish(SystemShutdownEvent(graceful=False))
+
+    assert len(seen) == 2
+    assert [event.graceful for event in received] == [True]
+
+
+def test_history_is_bounded_and_keeps_newest(bus) -> None:
+    """History drops the oldest events and resizing keeps the newest ones."""
+
+    bus.set_history_size(3)
+    events = [SystemShutdownEvent(reason=str(i)) for i in range(5)]
+    for event in events:
+        bus.publish(event)
+    assert bus.get_history() == events[-3:]
+    assert bus.get_history(limit=1) == events[-1:]
+
+    bus.set_history_size(2)
+    assert bus.get_history() == events[-2:]
+
+    bus.enable_history(False)
+    bus.publish(SystemShutdownEvent())
+    assert bus.get_history() == []
+
+
+def test_history_resize_while_publishing_stays_bounded(bus) -> None:
+    """Concurrent publishers and resizes never exceed the configured bound."""
+
+    bus.set_history_size(50)
+    stop = threading.Event()
+
+    def publish_loop():
+        while not stop.is_set():
+            bus.publish(SystemShutdownEvent())
+
+    publishers = [threading.Thread(target=publish_loop) for _ in range(4)]
+    for thread in publishers:
+        thread.start()
+    try:
+        for size in (10, 40, 5, 25) * 10:
+            bus.set_history_size(size)
+            assert len(bus.get_history()) <= size
+    finally:
+        stop.set()
+        for thread in publishers:
+            thread.join()
+
+    assert len(bus.get_history()) <= 25
+
+
+def test_async_handlers_run_off_thread(bus) -> None:
+    """Coroutine handlers are delivered by the background worker."""
+
+    received = []
+    threads = []
+
+    async def handler(event):
+        threads.append(threading.get_ident())
+        received.append(event)
+
+    bus.subscribe(SystemShutdownEvent, handler)
+    event = SystemShutdownEvent()
+    bus.publish(event)
+
+    assert bus.flush(timeout=5)
+    assert received == [event]
+    assert threads[0] != threading.get_ident()
+
+
+def test_full_async_queue_drops_and_counts(bus) -> None:
+    """Deliveries beyond the queue capacity are dropped without blocking."""
+
+    release = threading.Event()
+    started = threading.Event()
+    delivered = []
+
+    def slow_handler(event):
+        started.set()
+        release.wait(5)
+        delivered.append(event)
+
+    bus.set_async_queue_size(2)
+    bus.subscribe(SystemShutdownEvent, slow_handler, asynchronous=True)
+
+    bus.publish(SystemShutdownEvent())
+    assert started.wait(5)
+    for _ in range(5):
+        bus.publish(SystemShutdownEvent())
+
+    assert bus.dropped_async_events == 3
+    release.set()
+    assert bus.flush(timeout=5)
+    assert len(delivered) == 3
@@ -0,0 +1,146 @@
+"""
+Unit tests for adapter connection pooling, request coalescing and response caching.
+
+The Ollama adapter is exercised against a local aiohttp stub server so the
+tests cover real keep-alive connections and concurrent requests.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from neuroca.integration.adapters.ollama import OllamaAdapter
+from neuroca.integration.adapters.pooling import ResponseCache, SingleFlight, request_fingerprint
+
+
+@pytest_asyncio.fixture()
+async def stub_server():
+    """Serve /api/generate locally, recording calls and client connections."""
+    state = {"calls": 0, "peers": set(), "delay": 0.05}
+
+    async def generate(request):
+        payload = await request.json()
+        state["calls"] += 1
+        state["peers"].add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(state["delay"])
+        return web.json_response({
+            "response": f"echo: {payload['prompt']}",
+            "eval_count": 2,
+            "prompt_eval_count": 1,
+        })
+
+    app = web.Application()
+    app.router.add_post("/api/generate", generate)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    state["url"] = f"http://127.0.0.1:{port}"
+    yield state
+    await runner.cleanup()
+
+
+def _adapter(url, **config):
+    return OllamaAdapter({"base_url": url, "default_model": "stub", **config})
+
+
+def test_adapter_can_be_created_outside_event_loop():
+    """The HTTP session is opened lazily, not in the constructor."""
+    adapter = _adapter("http://127.0.0.1:1")
+    assert adapter._session is None
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_share_one_call(stub_server):
+    """A burst of identical prompts results in a single upstream request."""
+    adapter = _adapter(stub_server["url"])
+    try:
+        responses = await asyncio.gather(*(adapter.generate("hello") for _ in range(20)))
+    finally:
+        await adapter.close()
+
+    assert stub_server["calls"] == 1
+    assert {r.content for r in responses} == {"echo: hello"}
+    assert len({id(r) for r in responses}) == 20
+    assert len({id(r.metadata) for r in responses}) == 20
+    assert adapter.request_stats()["coalesced_calls"] == 19
+
+
+@pytest.mark.asyncio
+async def test_pooled_session_reuses_connections(stub_server):
+    """Sequential requests reuse one keep-alive connection."""
+    stub_server["delay"] = 0
+    adapter = _adapter(stub_server["url"])
+    try:
+        for index in range(5):
+            await adapter.generate(f"prompt {index}")
+    finally:
+        await adapter.close()
+
+    assert stub_server["calls"] == 5
+    assert len(stub_server["peers"]) == 1
+    assert adapter._http.sessions_created == 1
+
+
+@pytest.mark.asyncio
+async def test_response_cache_serves_greedy_requests(stub_server):
+    """Temperature-0 responses are cached; sampled responses are not."""
+    stub_server["delay"] = 0
+    adapter = _adapter(stub_server["url"], response_cache_size=8, response_cache_ttl=60)
+    try:
+        first = await adapter.generate("cached", temperature=0)
+        second = await adapter.generate("cached", temperature=0)
+        await adapter.generate("sampled", temperature=0.7)
+        await adapter.generate("sampled", temperature=0.7)
+    finally:
+        await adapter.close()
+
+    assert stub_server["calls"] == 3
+    assert second.content == first.content
+    assert second.metadata.get("cache_hit") is True
+    assert "cache_hit" not in first.metadata
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_failures():
+    """Waiting callers receive the executing caller's exception."""
+    flights = SingleFlight()
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(
+        *(flights.run("key", failing) for _ in range(3)), return_exceptions=True
+    )
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flights.inflight == 0
+
+
+def test_response_cache_ttl_and_lru():
+    """Entries expire after the TTL and the least recently used is evicted."""
+    now = [0.0]
+    cache = ResponseCache(max_entries=2, ttl=10.0, clock=lambda: now[0])
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    now[0] = 11.0
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+
+def test_request_fingerprint_ignores_parameter_order():
+    """Keys depend on parameter values, not on their order."""
+    assert request_fingerprint("p", "m", {"a": 1, "b": 2}) == request_fingerprint(
+        "p", "m", {"b": 2, "a": 1}
+    )
+    assert request_fingerprint("p", "m", {"a": 1}) != request_fingerprint("p", "m", {"a": 2})
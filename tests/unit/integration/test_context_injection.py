@@ -0,0 +1,182 @@
+"""
+Unit tests for context injection token accounting and selection.
+
+This module covers:
+1. The tiktoken-backed tokenizer, its fallbacks and the per-text token count cache
+2. Budget-optimal selection of context elements
+"""
+
+import base64
+import itertools
+import random
+
+import pytest
+
+from neuroca.integration.context.injection_selection import (
+    element_value,
+    select_context_elements,
+)
+from neuroca.integration.context import tokenization
+from neuroca.integration.context.injection_types import ContextElement, ContextPriority
+from neuroca.integration.context.tokenization import (
+    ApproximateTokenizer,
+    CachedTokenCounter,
+    TiktokenTokenizer,
+    WhitespaceTokenizer,
+    build_tokenizer,
+)
+
+CORPUS = [
+    "The memory manager consolidates short term memories into long term storage.",
+    "Memories are retrieved by relevance and injected into the prompt context.",
+    "Context windows are measured in tokens, not in words.",
+] * 5
+
+WORDS = ["memor", " memor", "Memor", "ies", " term", " into", " context", " the", " and", " are"]
+
+
+def _write_ranks(path, extra):
+    """Write a .tiktoken rank file with every single byte plus ``extra`` merges."""
+    ranks = {bytes([value]): value for value in range(256)}
+    for token in extra:
+        ranks.setdefault(token, len(ranks))
+    path.write_bytes(b"".join(
+        base64.b64encode(token) + b" " + str(rank).encode() + b"\n" for token, rank in ranks.items()
+    ))
+    return path
+
+
+@pytest.fixture(scope="module")
+def rank_file(tmp_path_factory):
+    """A small vocabulary whose merges build common corpus words prefix by prefix."""
+    merges = [word[:end].encode() for word in WORDS for end in range(2, len(word) + 1)]
+    return _write_ranks(tmp_path_factory.mktemp("ranks") / "corpus.tiktoken", merges)
+
+
+@pytest.fixture(scope="module")
+def bpe_tokenizer(rank_file):
+    return TiktokenTokenizer.from_file(rank_file)
+
+
+class TestTokenization:
+    """Test suite for tokenizers."""
+
+    def test_bpe_round_trip_and_compression(self, bpe_tokenizer):
+        """Encoding is lossless and merges shorten common text."""
+        text = "Memories are consolidated into long term storage.\nÜnïcode ✓ 12345"
+        ids = bpe_tokenizer.encode(text)
+        assert bpe_tokenizer.decode(ids) == text
+        assert bpe_tokenizer.count(text) == len(ids)
+        assert bpe_tokenizer.count(CORPUS[1]) < len(CORPUS[1].encode("utf-8"))
+        encoding = bpe_tokenizer._encoding
+        assert bpe_tokenizer.encode(" memories") == [
+            encoding.encode_single_token(b" memor"),
+            encoding.encode_single_token(b"ies"),
+        ]
+
+    def test_bpe_merges_lowest_rank_first(self, tmp_path):
+        """Pairs merge in rank order."""
+        tokenizer = TiktokenTokenizer.from_file(_write_ranks(tmp_path / "order.tiktoken", [b"bc", b"ab"]))
+        # "bc" outranks "ab", and "a" + "bc" is not a vocabulary entry
+        assert tokenizer.encode("abcd") == [ord("a"), 256, ord("d")]
+
+    def test_special_tokens_are_plain_text(self, bpe_tokenizer):
+        """Special-token markers in user text are encoded as ordinary text."""
+        assert bpe_tokenizer.decode(bpe_tokenizer.encode("<|endoftext|>")) == "<|endoftext|>"
+
+    def test_build_tokenizer_loads_rank_file(self, rank_file, bpe_tokenizer):
+        """``auto`` and ``bpe`` load .tiktoken rank files offline."""
+        for name in ("auto", "bpe"):
+            loaded = build_tokenizer(name, str(rank_file))
+            assert isinstance(loaded, TiktokenTokenizer)
+            assert loaded.name == "corpus"
+            assert loaded.encode(CORPUS[1]) == bpe_tokenizer.encode(CORPUS[1])
+
+    def test_build_tokenizer_fallbacks(self):
+        """Without a vocabulary the approximate tokenizer is used."""
+        assert isinstance(build_tokenizer(), ApproximateTokenizer)
+        assert isinstance(build_tokenizer("whitespace"), WhitespaceTokenizer)
+        with pytest.raises(ValueError):
+            build_tokenizer("bpe")
+        with pytest.raises(ValueError):
+            build_tokenizer("unknown")
+
+    def test_rank_files_need_tiktoken(self, rank_file, monkeypatch):
+        """Without tiktoken ``auto`` approximates and ``bpe`` fails loudly."""
+        monkeypatch.setattr(tokenization, "tiktoken", None)
+        assert isinstance(build_tokenizer("auto", str(rank_file)), ApproximateTokenizer)
+        with pytest.raises(ImportError):
+            build_tokenizer("bpe", str(rank_file))
+
+    def test_cached_token_counter(self, bpe_tokenizer):
+        """Repeated texts are counted once and the cache stays bounded."""
+        counter = CachedTokenCounter(bpe_tokenizer, cache_size=2)
+        assert counter(CORPUS[0]) == counter(CORPUS[0]) == bpe_tokenizer.count(CORPUS[0])
+        assert (counter.hits, counter.misses) == (1, 1)
+        counter(CORPUS[1])
+        counter(CORPUS[2])
+        counter(CORPUS[0])
+        assert counter.misses == 4
+
+
+def _element(priority, tokens, relevance=None):
+    metadata = {} if relevance is None else {"relevance_score": relevance}
+    return ContextElement("x", "memory_retrieval", priority, tokens, metadata)
+
+
+class TestSelection:
+    """Test suite for budget-optimal context selection."""
+
+    def test_selection_beats_greedy_packing(self):
+        """Several smaller elements win over one large element of higher priority."""
+        large = _element(ContextPriority.HIGH, 70)
+        small = [_element(ContextPriority.MEDIUM, 33) for _ in range(3)]
+        selected = select_context_elements(
+            context_elements=[large, *small], prompt_tokens=0, max_tokens=100, reserved_tokens=0
+        )
+        assert selected == small
+
+    def test_critical_elements_are_always_kept(self):
+        """CRITICAL elements bypass the budget and reduce what remains."""
+        critical = _element(ContextPriority.CRITICAL, 80)
+        other = _element(ContextPriority.HIGH, 30)
+        selected = select_context_elements(
+            context_elements=[other, critical], prompt_tokens=0, max_tokens=100, reserved_tokens=0
+        )
+        assert selected == [critical]
+
+    def test_selection_is_optimal_and_within_budget(self):
+        """Selection matches exhaustive search on small random instances."""
+        rng = random.Random(7)
+        priorities = [p for p in ContextPriority if p != ContextPriority.CRITICAL]
+        for _ in range(100):
+            elements = [
+                _element(rng.choice(priorities), rng.randint(1, 40), rng.choice([None, rng.random()]))
+                for _ in range(rng.randint(1, 9))
+            ]
+            budget = rng.randint(0, 120)
+            selected = select_context_elements(
+                context_elements=elements, prompt_tokens=0, max_tokens=budget, reserved_tokens=0
+            )
+            best = max(
+                sum(element_value(e) for e in subset)
+                for size in range(len(elements) + 1)
+                for subset in itertools.combinations(elements, size)
+                if sum(e.token_count for e in subset) <= budget
+            )
+            assert sum(e.token_count for e in selected) <= budget
+            assert sum(element_value(e) for e in selected) == pytest.approx(best)
+
+    def test_large_budgets_stay_within_exact_limit(self):
+        """Coarsened large instances never exceed the exact budget."""
+        rng = random.Random(3)
+        elements = [
+            _element(ContextPriority.MEDIUM, rng.randint(10, 3000), rng.random())
+            for _ in range(400)
+        ]
+        selected = select_context_elements(
+            context_elements=elements, prompt_tokens=500, max_tokens=128000, reserved_tokens=4000
+        )
+        used = sum(e.token_count for e in selected)
+        assert 123500 - 3000 < used <= 123500
+
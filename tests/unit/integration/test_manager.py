@@ -10,6 +10,9 @@ of the LLM integration layer. It verifies that the manager correctly handles:
 5. Response processing
 """
 
+import asyncio
+import time
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -421,3 +424,61 @@ class TestLLMIntegrationManager:
         assert metrics["average_response_time"] == 0.2
         assert "test_provider" in metrics["providers"]
         assert "other_provider" in metrics["providers"]
+
+    async def test_memory_retrieval_runs_tiers_concurrently(self, llm_manager, mock_memory_manager):
+        """Tier lookups overlap and a slow tier is cut off at its deadline."""
+        llm_manager.config["memory_retrieval"] = {
+            "tier_timeout_seconds": 0.5,
+            "tier_timeouts": {"ltm": 0.05},
+        }
+
+        async def retrieve(query, tier, limit):
+            await asyncio.sleep({"stm": 0.1, "mtm": 0.1, "ltm": 5.0}[tier])
+            return [SimpleNamespace(id=f"{tier}-1", content=f"from {tier}", relevance=0.5)]
+
+        mock_memory_manager.retrieve.side_effect = retrieve
+
+        started = time.perf_counter()
+        memories = await llm_manager._retrieve_relevant_memories("Test prompt")
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.3
+        assert {call.kwargs["tier"] for call in mock_memory_manager.retrieve.call_args_list} == {
+            "stm", "mtm", "ltm"
+        }
+        assert sorted(m["source"] for m in memories) == ["mtm_memory", "stm_memory"]
+
+    async def test_memory_retrieval_deduplicates_and_limits(self, llm_manager, mock_memory_manager):
+        """Hits are merged by id keeping the best copy, then cut to top_k."""
+        llm_manager.config["memory_retrieval"] = {"top_k": 2}
+        mock_memory_manager.retrieve.side_effect = [
+            [SimpleNamespace(id="a", content="alpha", relevance=0.4)],
+            [SimpleNamespace(id="a", content="alpha", relevance=0.9),
+             {"id": "b", "content": {"text": "beta"}, "_relevance": 0.6}],
+            [SimpleNamespace(id="c", content="gamma", relevance=0.1)],
+        ]
+
+        memories = await llm_manager._retrieve_relevant_memories("Test prompt")
+
+        assert memories == [
+            {"content": "alpha", "source": "mtm_memory", "relevance": 0.9},
+            {"content": "beta", "source": "mtm_memory", "relevance": 0.6},
+        ]
+
+    async def test_memory_retrieval_cache(self, llm_manager, mock_memory_manager):
+        """Repeated prompts reuse cached results until the TTL lapses."""
+        llm_manager.config["memory_retrieval"] = {"cache_ttl_seconds": 60}
+        mock_memory_manager.retrieve.return_value = [
+            SimpleNamespace(id="a", content="alpha", relevance=0.9)
+        ]
+
+        first = await llm_manager._retrieve_relevant_memories("What did I say?")
+        first[0]["content"] = "mutated"
+        second = await llm_manager._retrieve_relevant_memories("  what DID i   say? ")
+
+        assert mock_memory_manager.retrieve.call_count == 3
+        assert second[0]["content"] == "alpha"
+
+        llm_manager._memory_cache["what did i say?"] = (time.monotonic() - 1, [])
+        await llm_manager._retrieve_relevant_memories("What did I say?")
+        assert mock_memory_manager.retrieve.call_count == 6
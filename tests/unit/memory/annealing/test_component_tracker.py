@@ -0,0 +1,175 @@
+"""Unit tests for the annealing optimizer's incremental fragmentation tracking."""
+
+import random
+from importlib import util
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+_MODULE_PATH = (
+    Path(__file__).resolve().parents[4]
+    / "src"
+    / "neuroca"
+    / "memory"
+    / "annealing"
+    / "optimizer"
+    / "components"
+    / "connectivity.py"
+)
+_SPEC = util.spec_from_file_location("_annealing_connectivity", _MODULE_PATH)
+assert _SPEC is not None and _SPEC.loader is not None, "connectivity module should be loadable"
+_MODULE = util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(_MODULE)
+
+ComponentTracker = _MODULE.ComponentTracker
+
+CAPACITY = 64
+
+
+def _full_components(adjacency: np.ndarray, rows: list) -> int:
+    if not rows:
+        return 0
+    count, _labels = connected_components(
+        sparse.csr_matrix(adjacency[np.ix_(rows, rows)]), directed=False
+    )
+    return count
+
+
+def _fragmentation(components: int, n: int) -> float:
+    return 0.0 if n == 0 else (components - 1) / max(1, n)
+
+
+class _Graph:
+    """Row-indexed random graph mirroring IncrementalEnergy's bookkeeping."""
+
+    def __init__(self, rng: random.Random, n: int, density: float):
+        self.rng = rng
+        self.density = density
+        self.adjacency = np.zeros((CAPACITY, CAPACITY), dtype=bool)
+        self.free = list(range(CAPACITY - 1, n - 1, -1))
+        self.rows = list(range(n))
+        for i in range(n):
+            for j in range(i + 1, n):
+                self.adjacency[i, j] = self.adjacency[j, i] = rng.random() < density
+
+    def random_move(self):
+        """Return (kept, dropped, n_new) shaped like merge, split, prune or mixed moves."""
+        kind = self.rng.choice(["merge", "split", "prune", "mixed"])
+        rows = list(self.rows)
+        if kind == "merge" and len(rows) >= 2:
+            first, second = sorted(self.rng.sample(range(len(rows)), 2))
+            dropped = [rows[first], rows[second]]
+            n_new = 1
+        elif kind == "split" and rows:
+            dropped = [rows[self.rng.randrange(len(rows))]]
+            n_new = self.rng.randint(2, 3)
+        elif kind == "prune" and rows:
+            dropped = [rows[self.rng.randrange(len(rows))]]
+            n_new = 0
+        else:
+            dropped = self.rng.sample(rows, min(len(rows), self.rng.randint(0, 3)))
+            n_new = self.rng.randint(0, 3)
+        n_new = min(n_new, len(self.free) + len(dropped))
+        kept = [row for row in rows if row not in dropped]
+        return kept, dropped, n_new
+
+    def random_links(self, kept, n_new):
+        new_to_kept = np.array(
+            [[self.rng.random() < self.density for _ in kept] for _ in range(n_new)], dtype=bool
+        ).reshape(n_new, len(kept))
+        new_to_new = np.zeros((n_new, n_new), dtype=bool)
+        for a in range(n_new):
+            for b in range(a + 1, n_new):
+                new_to_new[a, b] = new_to_new[b, a] = self.rng.random() < self.density
+        return new_to_kept, new_to_new
+
+    def candidate(self, kept, dropped, new_to_kept, new_to_new):
+        """Adjacency and rows of the candidate state, using scratch rows for new memories."""
+        adjacency = self.adjacency.copy()
+        scratch = [row for row in range(CAPACITY) if row not in self.rows][: len(new_to_new)]
+        for row in scratch:
+            adjacency[row, :] = adjacency[:, row] = False
+        adjacency[np.ix_(scratch, kept)] = new_to_kept
+        adjacency[np.ix_(kept, scratch)] = new_to_kept.T
+        adjacency[np.ix_(scratch, scratch)] = new_to_new
+        return adjacency, kept + scratch
+
+    def commit(self, kept, dropped, new_to_kept, new_to_new):
+        for row in dropped:
+            self.adjacency[row, :] = self.adjacency[:, row] = False
+            self.free.append(row)
+        new_rows = [self.free.pop() for _ in range(len(new_to_new))]
+        self.adjacency[np.ix_(new_rows, kept)] = new_to_kept
+        self.adjacency[np.ix_(kept, new_rows)] = new_to_kept.T
+        self.adjacency[np.ix_(new_rows, new_rows)] = new_to_new
+        self.rows = kept + new_rows
+        return new_rows
+
+
+def _assert_labels_match_components(tracker, graph: _Graph) -> None:
+    if not graph.rows:
+        assert tracker.count == 0
+        return
+    _count, expected = connected_components(
+        sparse.csr_matrix(graph.adjacency[np.ix_(graph.rows, graph.rows)]), directed=False
+    )
+    labels = tracker._labels
+    assert set(labels) == set(graph.rows)
+    for i, row_i in enumerate(graph.rows):
+        for j, row_j in enumerate(graph.rows):
+            assert (labels[row_i] == labels[row_j]) == (expected[i] == expected[j])
+
+
+def test_initial_count_matches_full_computation() -> None:
+    rng = random.Random(3)
+    graph = _Graph(rng, 20, 0.08)
+
+    tracker = ComponentTracker(graph.adjacency, graph.rows)
+
+    assert tracker.count == _full_components(graph.adjacency, graph.rows)
+    _assert_labels_match_components(tracker, graph)
+
+
+def test_incremental_fragmentation_matches_full_over_random_moves() -> None:
+    """Every previewed move and every committed state agrees with a full recompute."""
+
+    for seed, density in ((0, 0.05), (1, 0.12), (2, 0.3)):
+        rng = random.Random(seed)
+        graph = _Graph(rng, 24, density)
+        tracker = ComponentTracker(graph.adjacency, graph.rows)
+
+        for _step in range(300):
+            kept, dropped, n_new = graph.random_move()
+            new_to_kept, new_to_new = graph.random_links(kept, n_new)
+
+            change = tracker.preview(graph.adjacency, kept, dropped, new_to_kept, new_to_new)
+            adjacency, rows = graph.candidate(kept, dropped, new_to_kept, new_to_new)
+            expected = _full_components(adjacency, rows)
+            assert change.count == expected
+            assert _fragmentation(change.count, len(rows)) == _fragmentation(expected, len(rows))
+
+            if rng.random() < 0.6:
+                new_rows = graph.commit(kept, dropped, new_to_kept, new_to_new)
+                tracker.apply(change, new_rows)
+                assert tracker.count == expected
+                _assert_labels_match_components(tracker, graph)
+
+            if len(graph.rows) < 4:
+                graph = _Graph(rng, 24, density)
+                tracker = ComponentTracker(graph.adjacency, graph.rows)
+
+
+def test_rejected_preview_leaves_tracker_unchanged() -> None:
+    rng = random.Random(7)
+    graph = _Graph(rng, 10, 0.2)
+    tracker = ComponentTracker(graph.adjacency, graph.rows)
+    labels = dict(tracker._labels)
+
+    kept = graph.rows[1:]
+    new_to_kept = np.ones((1, len(kept)), dtype=bool)
+    tracker.preview(graph.adjacency, kept, graph.rows[:1], new_to_kept, np.zeros((1, 1), dtype=bool))
+
+    assert tracker._labels == labels
+    assert tracker.count == _full_components(graph.adjacency, graph.rows)
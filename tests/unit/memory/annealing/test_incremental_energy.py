@@ -0,0 +1,84 @@
+"""Unit tests for the annealing optimizer's incremental energy model."""
+
+import random
+
+import pytest
+
+energy = pytest.importorskip(
+    "neuroca.memory.annealing.optimizer.components.energy", exc_type=ImportError
+)
+transformations = pytest.importorskip(
+    "neuroca.memory.annealing.optimizer.components.transformations", exc_type=ImportError
+)
+types = pytest.importorskip("neuroca.memory.annealing.optimizer.types", exc_type=ImportError)
+
+IncrementalEnergy = energy.IncrementalEnergy
+accept_energy_delta = energy.accept_energy_delta
+calculate_energy = energy.calculate_energy
+generate_move = transformations.generate_move
+OptimizationStrategy = types.OptimizationStrategy
+
+_WORDS = "alpha beta gamma delta epsilon zeta eta theta iota kappa".split()
+
+
+class _Memory:
+    """Memory fragment exposing the attributes the transformations work with."""
+
+    def __init__(self, content, relevance_score, tags, created_at):
+        self.content = content
+        self.relevance_score = relevance_score
+        self.tags = tags
+        self.created_at = created_at
+
+    def clone(self):
+        return _Memory(self.content, self.relevance_score, list(self.tags), self.created_at)
+
+
+def _memories(rng: random.Random, count: int) -> list:
+    return [
+        _Memory(
+            content=". ".join(" ".join(rng.sample(_WORDS, 3)) for _ in range(rng.randint(1, 5))) + ".",
+            relevance_score=rng.random(),
+            tags=rng.sample(["work", "home", "travel"], rng.randint(0, 2)),
+            created_at=index,
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("strategy", list(OptimizationStrategy))
+def test_committed_moves_track_full_energy(strategy) -> None:
+    """After every committed move the cached energy equals a full re-evaluation."""
+    rng = random.Random(11)
+    random.seed(11)
+    state = _memories(rng, 15)
+    model = IncrementalEnergy(state, strategy)
+    structural = 0
+
+    for _step in range(300):
+        if len(state) < 3:
+            state = _memories(rng, 15)
+            model = IncrementalEnergy(state, strategy)
+        new_state, move = generate_move(state)
+        proposal = model.propose(new_state, move)
+        assert proposal.energy == pytest.approx(calculate_energy(new_state, strategy), abs=1e-9)
+        if rng.random() < 0.7:
+            model.commit(proposal)
+            state = new_state
+            structural += move.structural
+        assert model.energy == pytest.approx(calculate_energy(state, strategy), abs=1e-9)
+
+    assert structural > 0
+
+
+@pytest.mark.parametrize("temperature", [0.0, 1e-6, 1.0, 1e6])
+def test_improvements_are_always_accepted(temperature: float) -> None:
+    random.seed(0)
+    assert all(accept_energy_delta(-delta, temperature) for delta in (1e-12, 0.5, 1e6))
+
+
+def test_zero_temperature_accepts_only_improvements() -> None:
+    random.seed(0)
+    assert accept_energy_delta(-1e-9, 0.0)
+    assert not accept_energy_delta(0.0, 0.0)
+    assert not any(accept_energy_delta(1e-9, 0.0) for _ in range(100))
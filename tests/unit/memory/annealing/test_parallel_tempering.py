@@ -0,0 +1,230 @@
+"""Unit tests for the annealing optimizer's parallel tempering path."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from importlib import util
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_OPTIMIZER_DIR = Path(__file__).resolve().parents[4] / "src" / "neuroca" / "memory" / "annealing" / "optimizer"
+
+
+def _load(name: str, filename: str):
+    spec = util.spec_from_file_location(name, _OPTIMIZER_DIR / filename)
+    assert spec is not None and spec.loader is not None, f"{filename} should be loadable"
+    module = util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_PACKING = _load("_annealing_packing", "packing.py")
+_STATS = _load("_annealing_stats", "stats.py")
+
+PackedFragment = _PACKING.PackedFragment
+PackedMemories = _PACKING.PackedMemories
+rehydrate = _PACKING.rehydrate
+OptimizationStats = _STATS.OptimizationStats
+
+_BASE = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+_WORDS = "alpha beta gamma delta epsilon zeta eta theta iota kappa".split()
+
+
+class _Memory:
+    """Memory fragment exposing the attributes the annealing optimizer works with."""
+
+    def __init__(self, id, content, relevance_score, tags, created_at, embedding=None, metadata=None):
+        self.id = id
+        self.content = content
+        self.relevance_score = relevance_score
+        self.tags = tags
+        self.created_at = created_at
+        self.embedding = embedding
+        self.metadata = metadata or {}
+
+    def clone(self):
+        return _Memory(
+            self.id,
+            self.content,
+            self.relevance_score,
+            list(self.tags),
+            self.created_at,
+            list(self.embedding) if self.embedding is not None else None,
+            dict(self.metadata),
+        )
+
+
+def _memories(seed: int, count: int) -> list:
+    rng = random.Random(seed)
+    memories = []
+    for index in range(count):
+        sentences = [" ".join(rng.sample(_WORDS, 3)) for _ in range(rng.randint(1, 4))]
+        memories.append(_Memory(
+            id=f"mem-{index}",
+            content=". ".join(sentences) + ".",
+            relevance_score=round(rng.random(), 3),
+            tags=rng.sample(["work", "home", "ünïcode", "a b"], rng.randint(0, 3)),
+            created_at=_BASE + timedelta(minutes=index),
+            embedding=[rng.random() for _ in range(4)],
+            metadata={"tier": "ltm", "index": index},
+        ))
+    return memories
+
+
+def test_pack_unpack_round_trip() -> None:
+    memories = _memories(0, 6)
+    memories[2].tags = []
+    memories[3].content = ""
+
+    fragments = PackedMemories.pack(memories).unpack()
+
+    assert len(fragments) == len(memories)
+    for index, (fragment, memory) in enumerate(zip(fragments, memories)):
+        assert isinstance(fragment, PackedFragment)
+        assert fragment.content == memory.content
+        assert fragment.relevance_score == memory.relevance_score
+        assert fragment.tags == memory.tags
+        assert fragment.created_at == memory.created_at.timestamp()
+        assert fragment.source == index
+
+
+def test_rehydrate_preserves_untouched_fields() -> None:
+    """Ids, embeddings and metadata come from the original each fragment derives from."""
+
+    memories = _memories(1, 4)
+    fragments = PackedMemories.pack(memories).unpack()
+    # Mimic an optimized state: reordered, one memory pruned and one edited
+    fragments = [fragments[3], fragments[0], fragments[2]]
+    fragments[1].content = "merged content"
+    fragments[1].relevance_score = 0.99
+    fragments[1].tags.append("merged")
+
+    result = rehydrate(fragments, memories)
+
+    assert [memory.id for memory in result] == ["mem-3", "mem-0", "mem-2"]
+    for memory, fragment in zip(result, fragments):
+        original = memories[fragment.source]
+        assert memory is not original
+        assert memory.embedding == original.embedding
+        assert memory.metadata == original.metadata
+        assert memory.created_at == original.created_at
+        assert memory.created_at.tzinfo == original.created_at.tzinfo
+    assert result[1].content == "merged content"
+    assert result[1].relevance_score == 0.99
+    assert result[1].tags == memories[0].tags + ["merged"]
+    assert memories[0].content != "merged content"
+
+
+def test_packing_fragments_keeps_their_source() -> None:
+    """Workers pack their PackedFragment state, so the source index must survive."""
+
+    memories = _memories(2, 5)
+    fragments = PackedMemories.pack(memories).unpack()
+    split = fragments[4].clone()
+    split.content = "first half."
+    state = [fragments[4], split, fragments[1]]
+
+    repacked = PackedMemories.pack(state)
+
+    assert repacked.source.tolist() == [4, 4, 1]
+    assert [f.content for f in repacked.unpack()] == [f.content for f in state]
+    assert [m.id for m in rehydrate(repacked.unpack(), memories)] == ["mem-4", "mem-4", "mem-1"]
+
+
+def test_fragment_clone_is_independent() -> None:
+    fragment = PackedMemories.pack(_memories(3, 1)).unpack()[0]
+
+    copy = fragment.clone()
+    copy.tags.append("extra")
+
+    assert "extra" not in fragment.tags
+    assert (copy.content, copy.source) == (fragment.content, fragment.source)
+
+
+def test_pack_uses_compact_arrays() -> None:
+    packed = PackedMemories.pack(_memories(4, 3))
+
+    assert len(packed) == 3
+    assert packed.text_offsets.dtype == np.int64 and packed.text_offsets.shape == (4,)
+    assert packed.relevance.dtype == np.float64
+    assert isinstance(packed.text, bytes) and isinstance(packed.tags, bytes)
+
+
+def _stats(**overrides):
+    values = dict(
+        initial_energy=10.0,
+        final_energy=4.0,
+        iterations=100,
+        accepted_moves=40,
+        rejected_moves=60,
+        duration_seconds=2.0,
+        temperature_history=[1.0, 0.5],
+        energy_history=[10.0, 4.0],
+    )
+    values.update(overrides)
+    return OptimizationStats(**values)
+
+
+def test_merge_combines_chain_statistics() -> None:
+    coldest = _stats(exchange_attempts=3, exchange_accepts=1)
+    hot = _stats(
+        initial_energy=10.0,
+        final_energy=3.0,
+        accepted_moves=70,
+        rejected_moves=30,
+        duration_seconds=2.5,
+        temperature_history=[],
+        energy_history=[],
+    )
+
+    merged = OptimizationStats.merge([coldest, hot])
+
+    assert merged.initial_energy == 10.0
+    assert merged.final_energy == 3.0
+    assert merged.iterations == 200
+    assert (merged.accepted_moves, merged.rejected_moves) == (110, 90)
+    assert merged.duration_seconds == 2.5
+    assert merged.temperature_history == coldest.temperature_history
+    assert merged.temperature_history is not coldest.temperature_history
+    assert merged.energy_history == coldest.energy_history
+    assert merged.chains == 2
+    assert (merged.exchange_attempts, merged.exchange_accepts) == (3, 1)
+
+
+def test_merge_requires_a_chain() -> None:
+    with pytest.raises(ValueError):
+        OptimizationStats.merge([])
+
+
+def _run_tempering(parallel, in_process: bool):
+    schedules = pytest.importorskip(
+        "neuroca.memory.annealing.optimizer.schedules.exponential", exc_type=ImportError
+    )
+    tempering = parallel.ParallelTempering(
+        schedules.ExponentialAnnealingSchedule(start_temp=1.0, end_temp=0.01, decay=0.97),
+        num_chains=2,
+        exchange_interval=5,
+        in_process=in_process,
+    )
+    return tempering.run(_memories(5, 12), max_iterations=30, random_seed=7)
+
+
+def test_process_pool_matches_in_process_run() -> None:
+    """Two replicas in worker processes find the same best state as a serial run."""
+
+    parallel = pytest.importorskip("neuroca.memory.annealing.optimizer.parallel", exc_type=ImportError)
+
+    pooled_state, pooled_stats = _run_tempering(parallel, in_process=False)
+    serial_state, serial_stats = _run_tempering(parallel, in_process=True)
+
+    assert [(m.id, m.content, m.relevance_score, m.tags) for m in pooled_state] == [
+        (m.id, m.content, m.relevance_score, m.tags) for m in serial_state
+    ]
+    assert pooled_stats.final_energy == serial_stats.final_energy
+    assert pooled_stats.energy_history == serial_stats.energy_history
+    assert pooled_stats.chains == 2
+    assert (pooled_stats.exchange_attempts, pooled_stats.exchange_accepts) == (
+        serial_stats.exchange_attempts,
+        serial_stats.exchange_accepts,
+    )
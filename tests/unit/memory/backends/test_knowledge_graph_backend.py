@@ -48,3 +48,77 @@ async def test_remove_relationship_and_node_cleanup() -> None:
 
     await backend.remove_node("b")
     assert await backend.get_related("b") == []
+
+
+@pytest.mark.asyncio
+async def test_remove_node_detaches_inbound_edges() -> None:
+    backend = InMemoryKnowledgeGraphBackend()
+
+    await backend.add_relationship("a", "hub", "semantic", strength=0.5)
+    await backend.add_relationship("b", "hub", "causal", strength=0.6)
+    await backend.add_relationship("b", "c", "semantic", strength=0.7)
+    await backend.add_relationship("hub", "c", "semantic", strength=0.9)
+
+    await backend.remove_node("hub")
+
+    assert await backend.get_related("a") == []
+    assert [entry["target_id"] for entry in await backend.get_related("b")] == ["c"]
+    assert await backend.get_related("hub") == []
+    assert "hub" not in backend._inbound
+    assert set(backend._inbound["c"]) == {"b"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_operations_and_strength_ordering() -> None:
+    backend = InMemoryKnowledgeGraphBackend()
+
+    written = await backend.add_relationships(
+        [
+            {"source_id": "s", "target_id": "weak", "relationship_type": "semantic", "strength": 0.2},
+            {"source_id": "s", "target_id": "strong", "relationship_type": "causal", "strength": 0.9},
+            {"source_id": "s", "target_id": "mid", "relationship_type": "semantic", "strength": 0.5},
+        ]
+    )
+    assert written == 3
+
+    related = await backend.get_related("s", limit=10)
+    assert [entry["target_id"] for entry in related] == ["strong", "mid", "weak"]
+
+    # Updating a relationship re-ranks it
+    await backend.add_relationship("s", "weak", "semantic", strength=1.0)
+    related = await backend.get_related("s", min_strength=0.4, limit=2)
+    assert [entry["target_id"] for entry in related] == ["weak", "strong"]
+
+    related = await backend.get_related("s", relationship_type="semantic")
+    assert [entry["target_id"] for entry in related] == ["weak", "mid"]
+
+    await backend.remove_nodes(["weak", "strong"])
+    related = await backend.get_related("s")
+    assert [entry["target_id"] for entry in related] == ["mid"]
+
+
+@pytest.mark.asyncio
+async def test_traversal_neighborhood_path_and_expansion() -> None:
+    backend = InMemoryKnowledgeGraphBackend()
+    await backend.add_relationships(
+        [
+            {"source_id": "a", "target_id": "b", "relationship_type": "semantic", "strength": 0.9},
+            {"source_id": "b", "target_id": "c", "relationship_type": "semantic", "strength": 0.8},
+            {"source_id": "a", "target_id": "d", "relationship_type": "causal", "strength": 0.3},
+            {"source_id": "d", "target_id": "c", "relationship_type": "causal", "strength": 0.3},
+            {"source_id": "c", "target_id": "e", "relationship_type": "semantic", "strength": 0.7},
+        ]
+    )
+
+    neighborhood = await backend.neighborhood("a", max_depth=2)
+    assert {entry["node_id"]: entry["depth"] for entry in neighborhood} == {"b": 1, "d": 1, "c": 2}
+
+    assert await backend.shortest_path("a", "e", max_depth=3) in (["a", "b", "c", "e"], ["a", "d", "c", "e"])
+    assert await backend.shortest_path("a", "e", max_depth=2) is None
+    assert await backend.shortest_path("a", "e", max_depth=3, min_strength=0.5) == ["a", "b", "c", "e"]
+    assert await backend.shortest_path("a", "c", relationship_type="causal") == ["a", "d", "c"]
+
+    expanded = await backend.expand("a", max_depth=3, limit=3)
+    assert [entry["node_id"] for entry in expanded] == ["b", "c", "e"]
+    assert expanded[1]["score"] == pytest.approx(0.72)
+    assert expanded[1]["depth"] == 2
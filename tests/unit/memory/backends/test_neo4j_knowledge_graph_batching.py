@@ -0,0 +1,87 @@
+"""Tests for batched writes in the Neo4j knowledge graph backend using a stand-in pool."""
+
+import asyncio
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+from neuroca.memory.backends.knowledge_graph import Neo4jKnowledgeGraphBackend
+
+
+class _RecordingConnection:
+    """Connection stand-in that records every query it receives."""
+
+    def __init__(self, log: list, lock: threading.Lock) -> None:
+        self._log = log
+        self._lock = lock
+
+    def query(self, query, parameters=None, read_only=False):
+        with self._lock:
+            self._log.append((query, parameters or {}))
+        return []
+
+
+class _StandInPool:
+    """Minimal pool exposing the ``get_connection`` context manager."""
+
+    def __init__(self) -> None:
+        self.queries: list = []
+        self.checkouts = 0
+        self.returns = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def get_connection(self):
+        with self._lock:
+            self.checkouts += 1
+        try:
+            yield _RecordingConnection(self.queries, self._lock)
+        finally:
+            with self._lock:
+                self.returns += 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_relationship_writes_are_coalesced_into_unwind_batches() -> None:
+    pool = _StandInPool()
+    backend = Neo4jKnowledgeGraphBackend(pool, batch_size=100, coalesce_window=0.05, max_sessions=2)
+
+    results = await asyncio.gather(
+        *(
+            backend.add_relationship(f"s{i}", f"t{i}", "semantic", strength=0.5)
+            for i in range(250)
+        )
+    )
+
+    assert all(results)
+    writes = [entry for entry in pool.queries if entry[0].startswith("UNWIND $rows")]
+    assert [len(parameters["rows"]) for _query, parameters in writes] == [100, 100, 50]
+    assert backend.write_stats["rows"] == 250
+    assert pool.checkouts <= 2
+
+    await backend.shutdown()
+    assert pool.returns == pool.checkouts
+
+
+@pytest.mark.asyncio
+async def test_bulk_writes_chunk_and_node_removal_flushes_pending_rows() -> None:
+    pool = _StandInPool()
+    backend = Neo4jKnowledgeGraphBackend(pool, batch_size=2, coalesce_window=0.0)
+
+    written = await backend.add_relationships(
+        [
+            {"source_id": "a", "target_id": "b", "relationship_type": "semantic", "strength": 0.9},
+            {"source_id": "a", "target_id": "c", "relationship_type": "causal", "strength": 0.4},
+            {"source_id": "b", "target_id": "c", "relationship_type": "semantic", "strength": 0.7},
+        ]
+    )
+    assert written == 3
+
+    await backend.remove_nodes(["a", "b", "c"])
+
+    kinds = [query.split(" ", 2)[1] for query, _parameters in pool.queries]
+    assert kinds == ["$rows", "$rows", "$ids", "$ids"]
+    assert pool.queries[-1][1] == {"ids": ["c"]}
+
+    await backend.shutdown()
@@ -0,0 +1,122 @@
+"""Keyset pagination tests for the SQLite backend."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+
+from neuroca.memory.backends.keyset import row_seek_key
+from neuroca.memory.backends.sqlite.core import SQLiteBackend
+from neuroca.memory.models.memory_item import MemoryContent, MemoryItem, MemoryMetadata
+
+_BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _memory(index: int, *, tier: str = "stm", tags: dict | None = None, offset: int | None = None) -> MemoryItem:
+    return MemoryItem(
+        id=f"mem-{index:03d}",
+        content=MemoryContent(text=f"note {index}"),
+        metadata=MemoryMetadata(
+            tier=tier,
+            tags=tags or {},
+            created_at=_BASE + timedelta(seconds=index if offset is None else offset),
+        ),
+    )
+
+
+@pytest_asyncio.fixture()
+async def backend(tmp_path):
+    instance = SQLiteBackend(db_path=str(tmp_path / "keyset.db"))
+    await instance.initialize()
+    try:
+        yield instance
+    finally:
+        await instance.shutdown()
+
+
+async def _collect(backend, limit, filters=None):
+    pages = []
+    after = None
+    while True:
+        page = await backend.seek(filters=filters, after=after, limit=limit)
+        if not page:
+            return pages
+        pages.append([row["id"] for row in page])
+        after = row_seek_key(page[-1])
+
+
+@pytest.mark.asyncio
+async def test_seek_pages_cover_every_item_once_in_key_order(backend):
+    # Two items share a timestamp so the id breaks the tie.
+    for index in (4, 0, 3, 1, 2):
+        await backend.store(_memory(index, offset=min(index, 3)))
+
+    pages = await _collect(backend, 2)
+
+    assert pages == [["mem-000", "mem-001"], ["mem-002", "mem-003"], ["mem-004"]]
+
+
+@pytest.mark.asyncio
+async def test_seek_applies_sql_and_residual_filters(backend):
+    for index in range(6):
+        tier = "ltm" if index % 2 else "stm"
+        tags = {"pinned": True} if index in (1, 5) else {}
+        await backend.store(_memory(index, tier=tier, tags=tags))
+
+    ltm = await _collect(backend, 2, {"metadata.tier": "ltm"})
+    pinned = await _collect(backend, 5, {"metadata.tags.pinned": True, "metadata.tier": "ltm"})
+    residual = await _collect(backend, 1, {"content.text": "note 4"})
+
+    assert ltm == [["mem-001", "mem-003"], ["mem-005"]]
+    assert pinned == [["mem-001", "mem-005"]]
+    assert residual == [["mem-004"]]
+
+
+@pytest.mark.asyncio
+async def test_seek_applies_membership_filters_in_sql(backend):
+    for index, tier in enumerate(["stm", "mtm", "ltm", "stm", "ltm"]):
+        await backend.store(_memory(index, tier=tier))
+
+    _clauses, _params, residual = backend.search._keyset_filter_clauses(
+        {"metadata.tier": {"$in": ["mtm", "ltm"]}}
+    )
+    pages = await _collect(backend, 2, {"metadata.tier": {"$in": ["mtm", "ltm"]}})
+    empty = await _collect(backend, 2, {"metadata.tier": {"$in": []}})
+
+    assert residual == {}
+    assert pages == [["mem-001", "mem-002"], ["mem-004"]]
+    assert empty == []
+
+
+@pytest.mark.asyncio
+async def test_seek_key_follows_updates(backend):
+    await backend.store(_memory(0))
+    await backend.store(_memory(1))
+
+    moved = _memory(0, offset=10)
+    await backend.update(moved.id, moved.model_dump())
+
+    assert await _collect(backend, 5) == [["mem-001", "mem-000"]]
+
+
+@pytest.mark.asyncio
+async def test_existing_database_is_backfilled(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    first = SQLiteBackend(db_path=path)
+    await first.initialize()
+    await first.store(_memory(1))
+    await first.store(_memory(0))
+    await first.shutdown()
+
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE memory_items SET seek_ts = NULL")
+
+    second = SQLiteBackend(db_path=path)
+    await second.initialize()
+    try:
+        assert await _collect(second, 5) == [["mem-000", "mem-001"]]
+    finally:
+        await second.shutdown()
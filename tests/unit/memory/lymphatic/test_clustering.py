@@ -0,0 +1,156 @@
+"""Unit tests for the lymphatic Abstractor's vectorized clustering backend."""
+
+import random
+from importlib import util
+from pathlib import Path
+
+import pytest
+
+_MODULE_PATH = (
+    Path(__file__).resolve().parents[4] / "src" / "neuroca" / "memory" / "lymphatic" / "clustering.py"
+)
+_SPEC = util.spec_from_file_location("_lymphatic_clustering", _MODULE_PATH)
+assert _SPEC is not None and _SPEC.loader is not None, "clustering module should be loadable"
+_MODULE = util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(_MODULE)
+
+VectorizedClusteringBackend = _MODULE.VectorizedClusteringBackend
+build_feature_matrix = _MODULE.build_feature_matrix
+similarity_block = _MODULE.similarity_block
+
+
+# Reference copy of the greedy pass and similarity in Abstractor (abstractor.py), which
+# cannot be imported in this tree.
+def _jaccard_similarity(set1, set2):
+    if not set1 and not set2:
+        return 1.0
+    intersection = len(set1.intersection(set2))
+    union = len(set1.union(set2))
+    return intersection / union if union > 0 else 0.0
+
+
+def _cosine_similarity(vec1, vec2):
+    if len(vec1) != len(vec2):
+        return 0.0
+    dot_product = sum(a * b for a, b in zip(vec1, vec2))
+    magnitude1 = sum(a * a for a in vec1) ** 0.5
+    magnitude2 = sum(b * b for b in vec2) ** 0.5
+    if magnitude1 == 0 or magnitude2 == 0:
+        return 0.0
+    return dot_product / (magnitude1 * magnitude2)
+
+
+def _calculate_similarity(item1, item2):
+    if "embedding" in item1 and "embedding" in item2 and item1["embedding"] and item2["embedding"]:
+        return _cosine_similarity(item1["embedding"], item2["embedding"])
+    score = 0.0
+    total_weight = 0.0
+    score += _jaccard_similarity(set(item1.get("keywords", [])), set(item2.get("keywords", []))) * 0.4
+    total_weight += 0.4
+    score += _jaccard_similarity(set(item1.get("entities", [])), set(item2.get("entities", []))) * 0.4
+    total_weight += 0.4
+    if item1.get("content_type") == item2.get("content_type"):
+        score += 0.1
+    total_weight += 0.1
+    sentiment_diff = abs(item1.get("sentiment", 0) - item2.get("sentiment", 0))
+    score += max(0, 1 - sentiment_diff) * 0.1
+    total_weight += 0.1
+    return score / total_weight if total_weight > 0 else 0.0
+
+
+def _greedy_clusters(features, threshold):
+    clusters = []
+    unassigned = features.copy()
+    while unassigned:
+        current = unassigned.pop(0)
+        current_cluster = [current]
+        i = 0
+        while i < len(unassigned):
+            item = unassigned[i]
+            if _calculate_similarity(current, item) >= threshold:
+                current_cluster.append(item)
+                unassigned.pop(i)
+            else:
+                i += 1
+        clusters.append(current_cluster)
+    return clusters
+
+
+def _features(seed, count, embedding_share=0.3):
+    rng = random.Random(seed)
+    vocabulary = [f"kw{i}" for i in range(12)]
+    names = [f"ent{i}" for i in range(6)]
+    features = []
+    for index in range(count):
+        feature = {
+            "id": index,
+            "keywords": rng.sample(vocabulary, rng.randint(0, 4)),
+            "entities": rng.sample(names, rng.randint(0, 2)),
+            "content_type": rng.choice(["text", "event", "fact"]),
+            "sentiment": round(rng.uniform(-1, 1), 2),
+        }
+        if rng.random() < embedding_share:
+            dim = rng.choice([3, 4])
+            feature["embedding"] = [rng.choice([0.0, 1.0, 2.0, -1.0]) for _ in range(dim)]
+        features.append(feature)
+    return features
+
+
+def _ids(clusters):
+    return [[feature["id"] for feature in cluster] for cluster in clusters]
+
+
+@pytest.mark.parametrize("threshold", [0.3, 0.5, 0.65, 0.8])
+@pytest.mark.parametrize("block_size", [1, 7, 256])
+def test_clusters_match_greedy_pass(threshold, block_size) -> None:
+    """Clusters, their order and member order equal the legacy greedy pass."""
+
+    backend = VectorizedClusteringBackend(block_size=block_size)
+    for seed in range(5):
+        features = _features(seed, 60)
+        assert _ids(backend.cluster(features, threshold)) == _ids(_greedy_clusters(features, threshold))
+
+
+def test_seed_assignment_does_not_chain() -> None:
+    """An item similar only to a non-seed member starts its own cluster."""
+
+    features = [
+        {"id": 0, "keywords": [], "entities": [], "embedding": [1.0, 0.0]},
+        {"id": 1, "keywords": [], "entities": [], "embedding": [1.0, 1.0]},
+        {"id": 2, "keywords": [], "entities": [], "embedding": [0.0, 1.0]},
+    ]
+
+    clusters = VectorizedClusteringBackend().cluster(features, threshold=0.7)
+
+    assert _ids(clusters) == [[0, 1], [2]]
+
+
+def test_similarity_block_matches_reference() -> None:
+    features = _features(11, 40, embedding_share=0.5)
+    matrix = build_feature_matrix(features)
+
+    block = similarity_block(matrix, 5, 25)
+
+    for local, row in enumerate(range(5, 25)):
+        for col, other in enumerate(features):
+            assert block[local, col] == pytest.approx(_calculate_similarity(features[row], other), abs=1e-12)
+
+
+def test_mean_pairwise_similarity_matches_reference() -> None:
+    features = _features(5, 23)
+    backend = VectorizedClusteringBackend(block_size=4)
+
+    expected = [
+        _calculate_similarity(features[i], features[j])
+        for i in range(len(features))
+        for j in range(i + 1, len(features))
+    ]
+
+    assert backend.mean_pairwise_similarity(features) == pytest.approx(sum(expected) / len(expected))
+    assert backend.mean_pairwise_similarity(features[:1]) is None
+
+
+def test_empty_input_and_invalid_block_size() -> None:
+    assert VectorizedClusteringBackend().cluster([], threshold=0.5) == []
+    with pytest.raises(ValueError):
+        VectorizedClusteringBackend(block_size=0)
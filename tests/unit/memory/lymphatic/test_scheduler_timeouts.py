@@ -0,0 +1,119 @@
+"""Unit tests for how the lymphatic scheduler handles timed-out synchronous tasks."""
+
+import threading
+import time
+from importlib import util
+from pathlib import Path
+
+import pytest
+
+_MODULE_PATH = (
+    Path(__file__).resolve().parents[4] / "src" / "neuroca" / "memory" / "lymphatic" / "scheduler.py"
+)
+_SPEC = util.spec_from_file_location("_lymphatic_scheduler", _MODULE_PATH)
+assert _SPEC is not None and _SPEC.loader is not None, "scheduler module should be loadable"
+_MODULE = util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(_MODULE)
+
+LymphaticScheduler = _MODULE.LymphaticScheduler
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+class _BlockingTask:
+    """Synchronous callback that blocks until released and records overlapping runs."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> None:
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            self.release.wait(timeout=10.0)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture()
+def scheduler():
+    instance = LymphaticScheduler(max_concurrent_tasks=1)
+    instance.start()
+    try:
+        yield instance
+    finally:
+        instance.stop()
+
+
+def test_timed_out_worker_keeps_its_slot_until_it_returns(scheduler) -> None:
+    """A timeout is reported at once, but no new task starts until the worker is free."""
+
+    blocking = _BlockingTask()
+    scheduler.register_task(blocking, name="slow", timeout=0.1, max_retries=0)
+    assert _wait_for(lambda: scheduler.get_statistics()["tasks_failed"] == 1)
+
+    follow_up = threading.Event()
+    scheduler.register_task(follow_up.set, name="follow-up")
+    time.sleep(0.3)
+
+    assert scheduler.get_statistics()["tasks_abandoned"] == 1
+    assert not follow_up.is_set()
+
+    blocking.release.set()
+    assert follow_up.wait(timeout=5.0)
+    assert _wait_for(lambda: scheduler.get_statistics()["tasks_abandoned"] == 0)
+
+
+def test_timed_out_task_is_not_dispatched_over_its_abandoned_run() -> None:
+    """A recurring task waits for its abandoned run instead of overlapping it."""
+
+    scheduler = LymphaticScheduler(max_concurrent_tasks=3)
+    scheduler.start()
+    blocking = _BlockingTask()
+    try:
+        scheduler.register_task(
+            blocking, name="recurring", recurring=True, interval=0.05, timeout=0.1, max_retries=0
+        )
+        assert _wait_for(lambda: scheduler.get_statistics()["tasks_failed"] >= 1)
+        time.sleep(0.3)
+        assert blocking.calls == 1
+
+        blocking.release.set()
+        assert _wait_for(lambda: blocking.calls >= 2)
+        assert blocking.max_active == 1
+    finally:
+        blocking.release.set()
+        scheduler.stop()
+
+
+def test_cancelling_a_held_task_drops_it(scheduler) -> None:
+    """A task cancelled while held behind its abandoned run is not dispatched again."""
+
+    blocking = _BlockingTask()
+    task_id = scheduler.register_task(
+        blocking, name="recurring", recurring=True, interval=0.05, timeout=0.1, max_retries=0
+    )
+    assert _wait_for(lambda: scheduler.get_statistics()["tasks_failed"] >= 1)
+    time.sleep(0.1)
+
+    assert scheduler.cancel_task(task_id)
+    blocking.release.set()
+    assert _wait_for(lambda: scheduler.get_statistics()["tasks_abandoned"] == 0)
+    time.sleep(0.2)
+
+    assert blocking.calls == 1
+    assert scheduler.get_task_status(task_id) is None
@@ -0,0 +1,148 @@
+import asyncio
+import math
+from typing import Any, Dict, List, Sequence
+
+import pytest
+
+from neuroca.memory.manager.embedding import EmbeddingPipeline, HashingEmbedder
+from neuroca.memory.manager.memory_manager import MemoryManager
+
+
+class DummyTier:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._items: Dict[str, Dict[str, Any]] = {}
+
+    async def initialize(self) -> None:
+        return None
+
+    async def shutdown(self) -> None:
+        return None
+
+    async def count(self, _filters: Any | None = None) -> int:
+        return len(self._items)
+
+    async def cleanup(self) -> int:
+        return 0
+
+    async def store(self, payload: Dict[str, Any], memory_id: str | None = None) -> str:
+        memory_id = memory_id or f"{self.name}-{len(self._items) + 1}"
+        self._items[memory_id] = dict(payload)
+        return memory_id
+
+    async def retrieve(self, memory_id: str) -> Dict[str, Any] | None:
+        item = self._items.get(memory_id)
+        return dict(item) if item is not None else None
+
+
+class CountingEmbedder:
+    model_name = "counting"
+
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+        self._inner = HashingEmbedder(16)
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        return self._inner.embed(texts).tolist()
+
+
+class FailingEmbedder:
+    model_name = "failing"
+
+    async def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        raise RuntimeError("model unavailable")
+
+
+def _cosine(left: Sequence[float], right: Sequence[float]) -> float:
+    return sum(a * b for a, b in zip(left, right))
+
+
+def test_hashing_embedder_is_deterministic_and_normalised() -> None:
+    texts = [
+        "the quarterly review covered hiring plans",
+        "the quarterly review covered hiring and budget plans",
+        "penguins live in the southern hemisphere",
+        "",
+    ]
+    first = HashingEmbedder(256).embed(texts)
+    second = HashingEmbedder(256).embed(texts)
+
+    assert first.shape == (4, 256)
+    assert (first == second).all()
+    assert math.isclose(float((first[0] ** 2).sum()), 1.0)
+    assert not first[3].any()
+    assert _cosine(first[0], first[1]) > _cosine(first[0], first[2])
+
+
+@pytest.mark.asyncio
+async def test_pipeline_batches_concurrent_requests() -> None:
+    embedder = CountingEmbedder()
+    pipeline = EmbeddingPipeline(embedder, max_batch_size=8, max_batch_delay=0.01)
+
+    vectors = await asyncio.gather(*(pipeline.embed(f"memory {index}") for index in range(20)))
+
+    assert [len(batch) for batch in embedder.calls] == [8, 8, 4]
+    assert all(len(vector) == 16 for vector in vectors)
+    assert pipeline.stats()["batches"] == 3
+
+
+@pytest.mark.asyncio
+async def test_pipeline_caches_and_shares_identical_texts() -> None:
+    embedder = CountingEmbedder()
+    pipeline = EmbeddingPipeline(embedder, max_batch_delay=0.0)
+
+    first, second = await asyncio.gather(pipeline.embed("same text"), pipeline.embed("same text"))
+    third = await pipeline.embed("same text")
+
+    assert embedder.calls == [["same text"]]
+    assert first == second == third
+    stats = pipeline.stats()
+    assert stats["shared_requests"] == 1
+    assert stats["cache_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_propagates_embedder_failures() -> None:
+    pipeline = EmbeddingPipeline(FailingEmbedder(), max_batch_delay=0.0)
+
+    with pytest.raises(RuntimeError):
+        await pipeline.embed("anything")
+    assert pipeline.stats()["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_add_memory_embeds_content_and_keeps_caller_vectors() -> None:
+    stm = DummyTier("stm")
+    manager = MemoryManager(
+        config={"embedding": {"enabled": True, "dimension": 32}},
+        stm=stm,
+        mtm=DummyTier("mtm"),
+        ltm=DummyTier("ltm"),
+    )
+    await manager.initialize()
+
+    computed_id, provided_id = await asyncio.gather(
+        manager.add_memory("Quarterly planning notes"),
+        manager.add_memory("Caller embedded", embedding=[0.5, 0.5, 0.0]),
+    )
+
+    computed = stm._items[computed_id]
+    assert len(computed["embedding"]) == 32
+    assert computed["metadata"]["embedding_model"] == "hashing-32"
+    assert stm._items[provided_id]["embedding"] == [0.5, 0.5, 0.0]
+    assert stm._items[provided_id]["metadata"]["embedding_dimensions"] == 3
+
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_add_memory_skips_embedding_when_pipeline_disabled() -> None:
+    stm = DummyTier("stm")
+    manager = MemoryManager(stm=stm, mtm=DummyTier("mtm"), ltm=DummyTier("ltm"))
+    await manager.initialize()
+
+    memory_id = await manager.add_memory("No vectors here")
+
+    assert stm._items[memory_id].get("embedding") is None
+    await manager.shutdown()
@@ -0,0 +1,92 @@
+"""Keyset pagination tests for ``MemoryManager.list_memories_page``."""
+
+import pytest
+import pytest_asyncio
+
+from neuroca.memory.backends.factory import BackendType
+from neuroca.memory.exceptions import InvalidCursorError
+from neuroca.memory.manager import MemoryManager
+from neuroca.memory.manager.scoping import MemoryRetrievalScope
+
+
+@pytest_asyncio.fixture()
+async def manager():
+    instance = MemoryManager(
+        stm_storage_type=BackendType.MEMORY,
+        mtm_storage_type=BackendType.MEMORY,
+        ltm_storage_type=BackendType.MEMORY,
+    )
+    await instance.initialize()
+    try:
+        yield instance
+    finally:
+        await instance.shutdown()
+
+
+async def _collect(manager, limit, **kwargs):
+    pages = []
+    cursor = None
+    while True:
+        page, cursor = await manager.list_memories_page(limit=limit, cursor=cursor, **kwargs)
+        pages.append([item["id"] for item in page])
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_cover_every_memory_once(manager):
+    created = [
+        await manager.add_memory(content=f"note {index}", metadata={"user_id": "alice"})
+        for index in range(7)
+    ]
+
+    pages = await _collect(
+        manager,
+        3,
+        metadata_filters={"metadata.user_id": "alice"},
+        scope=MemoryRetrievalScope.for_user("alice"),
+    )
+
+    flattened = [memory_id for page in pages for memory_id in page]
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert sorted(flattened) == sorted(created)
+    assert len(set(flattened)) == len(flattened)
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_skip_out_of_scope_memories(manager):
+    for index in range(4):
+        await manager.add_memory(content=f"alice {index}", metadata={"user_id": "alice"})
+        await manager.add_memory(content=f"bob {index}", metadata={"user_id": "bob"})
+
+    pages = await _collect(manager, 3, scope=MemoryRetrievalScope.for_user("bob"))
+
+    assert [len(page) for page in pages] == [3, 1]
+
+
+@pytest.mark.asyncio
+async def test_cursor_is_bound_to_its_listing(manager):
+    for index in range(3):
+        await manager.add_memory(content=f"note {index}", metadata={"user_id": "alice"})
+
+    _page, cursor = await manager.list_memories_page(
+        limit=1, metadata_filters={"metadata.user_id": "alice"}
+    )
+    assert cursor is not None
+
+    with pytest.raises(InvalidCursorError):
+        await manager.list_memories_page(limit=1, cursor=cursor)
+    with pytest.raises(InvalidCursorError):
+        await manager.list_memories_page(limit=1, cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_listing_orders_by_tier_then_creation(manager):
+    ltm_first = await manager.add_memory(content="ltm 0", initial_tier="ltm")
+    stm_first = await manager.add_memory(content="stm 0", initial_tier="stm")
+    ltm_second = await manager.add_memory(content="ltm 1", initial_tier="ltm")
+    stm_second = await manager.add_memory(content="stm 1", initial_tier="stm")
+
+    pages = await _collect(manager, 3, tiers=["stm", "ltm"])
+
+    assert pages == [[stm_first, stm_second, ltm_first], [ltm_second]]
@@ -22,6 +22,7 @@ class FakeTier:
         self._cleanup_removes = cleanup_removes
         self.store_delay = store_delay
         self.cleanup_calls = 0
+        self.count_calls = 0
         self.initialized = False
         self.stored_payloads: list[Any] = []
 
@@ -32,6 +33,7 @@ class FakeTier:
         self.initialized = False
 
     async def count(self, _filters: Any | None = None) -> int:
+        self.count_calls += 1
         return self._count
 
     async def cleanup(self) -> int:
@@ -150,3 +152,118 @@ async def test_memory_manager_runs_cleanup_to_make_room() -> None:
     assert stm._count == 2  # noqa: SLF001
 
     await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_watchdog_admits_from_tracked_occupancy_without_recounting() -> None:
+    limit = TierResourceLimit.from_config("stm", {"max_items": 100})
+    watchdog = ResourceLimitWatchdog({"stm": limit})
+    tier = FakeTier("stm", count=10)
+
+    for index in range(20):
+        await watchdog.ensure_capacity("stm", tier)
+        await watchdog.store("stm", tier, {"id": index, "content": "x" * 50})
+
+    occupancy = watchdog.occupancy("stm")
+    assert tier.count_calls == 1
+    assert occupancy.items == 30
+    assert occupancy.nbytes > 0
+
+
+@pytest.mark.asyncio
+async def test_watchdog_counts_in_flight_stores_against_the_limit() -> None:
+    limit = TierResourceLimit.from_config("stm", {"max_items": 3, "overflow_policy": "reject"})
+    watchdog = ResourceLimitWatchdog({"stm": limit})
+    tier = FakeTier("stm", store_delay=0.01)
+
+    async def add(index: int) -> bool:
+        try:
+            await watchdog.ensure_capacity("stm", tier)
+        except MemoryCapacityError:
+            return False
+        await watchdog.store("stm", tier, {"id": index})
+        return True
+
+    await watchdog.ensure_capacity("stm", tier)
+    results = await asyncio.gather(*(add(index) for index in range(8)))
+
+    assert sum(results) == 3
+    assert tier._count == 3  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_watchdog_releases_reservation_when_store_fails() -> None:
+    limit = TierResourceLimit.from_config("stm", {"max_items": 1, "ingest_timeout_seconds": 0.01})
+    watchdog = ResourceLimitWatchdog({"stm": limit})
+    tier = FakeTier("stm", store_delay=0.05)
+
+    await watchdog.ensure_capacity("stm", tier)
+    with pytest.raises(asyncio.TimeoutError):
+        await watchdog.store("stm", tier, {"id": "slow"})
+
+    assert watchdog.occupancy("stm").items == 0
+    await watchdog.ensure_capacity("stm", tier)
+
+
+@pytest.mark.asyncio
+async def test_watchdog_sweeps_to_low_watermark_in_background() -> None:
+    limit = TierResourceLimit.from_config(
+        "stm",
+        {
+            "max_items": 10,
+            "overflow_policy": "evict",
+            "soft_limit_ratio": 0.8,
+            "low_watermark_ratio": 0.5,
+            "max_eviction_attempts": 5,
+        },
+    )
+    watchdog = ResourceLimitWatchdog({"stm": limit})
+    tier = FakeTier("stm", count=8, cleanup_removes=2)
+
+    await watchdog.ensure_capacity("stm", tier)
+    assert tier.cleanup_calls == 0
+
+    await asyncio.sleep(0.01)
+    assert tier.cleanup_calls == 2
+    assert tier._count == 4  # noqa: SLF001
+    assert watchdog.occupancy("stm").items == 4
+    await watchdog.close()
+
+
+@pytest.mark.asyncio
+async def test_watchdog_reconciles_stale_occupancy_in_background() -> None:
+    now = [0.0]
+    limit = TierResourceLimit.from_config(
+        "stm", {"max_items": 10, "reconcile_interval_seconds": 30}
+    )
+    watchdog = ResourceLimitWatchdog({"stm": limit}, clock=lambda: now[0])
+    tier = FakeTier("stm", count=2)
+
+    await watchdog.ensure_capacity("stm", tier)
+    tier._count = 7  # noqa: SLF001 - changed behind the manager's back
+
+    await watchdog.ensure_capacity("stm", tier)
+    assert watchdog.occupancy("stm").items == 2
+
+    now[0] = 31.0
+    await watchdog.ensure_capacity("stm", tier)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert tier.count_calls == 2
+    assert watchdog.occupancy("stm").items == 7
+
+
+@pytest.mark.asyncio
+async def test_watchdog_tracks_removals_and_transfers() -> None:
+    limits = {name: TierResourceLimit.from_config(name, {"max_items": 10}) for name in ("stm", "mtm")}
+    watchdog = ResourceLimitWatchdog(limits)
+    stm = FakeTier("stm", count=3)
+    mtm = FakeTier("mtm", count=1)
+    await watchdog.ensure_capacity("stm", stm)
+    await watchdog.ensure_capacity("mtm", mtm)
+
+    watchdog.record_removed("stm")
+    watchdog.record_transfer("stm", "mtm", {"content": "moved"})
+
+    assert watchdog.occupancy("stm").items == 1
+    assert watchdog.occupancy("mtm").items == 2
@@ -144,3 +144,47 @@ async def test_create_memory_initializes_manager_if_needed():
     _, kwargs = service.memory_manager.retrieve_memory.await_args
     assert isinstance(kwargs["scope"], MemoryRetrievalScope)
     assert response.tier == MemoryTier.STM.storage_key
+
+
+@pytest.mark.asyncio
+async def test_iter_memories_follows_cursors():
+    service = MemoryService()
+    service.memory_manager = AsyncMock()
+    service._initialized = True
+
+    def _record(memory_id):
+        return {"id": memory_id, "content": {"text": memory_id}, "metadata": {"user_id": "user-1"}}
+
+    service.memory_manager.list_memories_page.side_effect = [
+        ([_record("a"), _record("b")], "cursor-1"),
+        ([_record("c")], None),
+    ]
+
+    params = MemorySearchParams(user_id="user-1", tenant_id="tenant-1")
+    streamed = [memory.id async for memory in service.iter_memories(params, page_size=2)]
+
+    assert streamed == ["a", "b", "c"]
+    calls = service.memory_manager.list_memories_page.await_args_list
+    assert [call.kwargs["cursor"] for call in calls] == [None, "cursor-1"]
+    assert calls[0].kwargs["limit"] == 2
+    assert calls[0].kwargs["metadata_filters"] == {
+        "metadata.user_id": "user-1",
+        "metadata.tenant_id": "tenant-1",
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_memories_applies_offset():
+    service = MemoryService()
+    service.memory_manager = AsyncMock()
+    service._initialized = True
+    service.memory_manager.search_memories.return_value = [
+        {"id": str(index), "content": {"text": "x"}, "metadata": {"user_id": "user-1"}}
+        for index in range(5)
+    ]
+
+    params = MemorySearchParams(user_id="user-1", query="x", limit=3, offset=2)
+    results = await service.list_memories(params)
+
+    assert [result.id for result in results] == ["2", "3", "4"]
+    assert service.memory_manager.search_memories.await_args.kwargs["limit"] == 5
@@ -60,6 +60,7 @@ class _StubGraphBackend:
         self.removed: list[tuple[str, str, Optional[str]]] = []
         self.removed_nodes: list[str] = []
         self.related_results: list[Dict[str, Any]] = []
+        self.bulk_calls = 0
 
     async def upsert_node(self, node_id: str, *, properties: Dict[str, Any] | None = None) -> None:
         self.upserted.append(node_id)
@@ -79,6 +80,18 @@ class _StubGraphBackend:
         self.added.append((source_id, target_id, relationship_type, strength, dict(metadata or {})))
         return True
 
+    async def add_relationships(self, relationships: list[Dict[str, Any]]) -> int:
+        self.bulk_calls += 1
+        for entry in relationships:
+            await self.add_relationship(
+                entry["source_id"],
+                entry["target_id"],
+                entry["relationship_type"],
+                strength=entry["strength"],
+                metadata=entry.get("metadata"),
+            )
+        return len(relationships)
+
     async def remove_relationship(
         self,
         source_id: str,
@@ -147,6 +160,7 @@ async def test_add_relationship_persists_metadata_on_both_memories() -> None:
         ("source", "target", "semantic", 0.8, metadata_payload),
         ("target", "source", "semantic", 0.8, metadata_payload),
     ]
+    assert graph_backend.bulk_calls == 1
 
     source_relationships = backend_data[source.id]["metadata"]["tags"]["relationships"]
     target_relationships = backend_data[target.id]["metadata"]["tags"]["relationships"]
@@ -270,3 +284,53 @@ async def test_register_and_cleanup_delegate_to_graph_backend() -> None:
 
     assert graph_backend.upserted == [memory.id]
     assert graph_backend.removed_nodes == [memory.id]
+
+
+class _BatchBackend(_StubBackend):
+    """Backend stub exposing batch reads and counting storage round trips."""
+
+    def __init__(self, data: Dict[str, Dict[str, Any]]) -> None:
+        super().__init__(data)
+        self.batch_calls: list[list[str]] = []
+
+    async def retrieve(self, memory_id: str) -> Dict[str, Any] | None:  # pragma: no cover - must not be used
+        raise AssertionError("relationship traversal should use batch_read")
+
+    async def batch_read(self, item_ids: list[str]) -> Dict[str, Dict[str, Any] | None]:
+        self.batch_calls.append(list(item_ids))
+        return {item_id: deepcopy(self._data.get(item_id)) for item_id in item_ids}
+
+
+@pytest.mark.asyncio
+async def test_find_path_and_expansion_use_graph_traversal_and_batch_reads() -> None:
+    from neuroca.memory.backends import InMemoryKnowledgeGraphBackend
+
+    memories = {
+        memory_id: MemoryItem(
+            id=memory_id, content=MemoryContent(text=memory_id), metadata=MemoryMetadata(tags={})
+        ).model_dump()
+        for memory_id in ("a", "b", "c")
+    }
+    backend = _BatchBackend(memories)
+    graph_backend = InMemoryKnowledgeGraphBackend()
+    await graph_backend.add_relationship("a", "b", "semantic", strength=0.9)
+    await graph_backend.add_relationship("b", "c", "semantic", strength=0.5)
+
+    relationship = LTMRelationship("ltm")
+    relationship.configure(
+        lifecycle=_StubLifecycle(),
+        backend=backend,
+        update_func=_StubUpdater(memories),
+        config={},
+        graph_backend=graph_backend,
+    )
+
+    path = await relationship.find_path("a", "c", max_depth=3)
+    assert [memory["id"] for memory in path] == ["a", "b", "c"]
+    assert backend.batch_calls == [["a", "b", "c"]]
+    assert await relationship.find_path("a", "c", max_depth=2) is None
+
+    expanded = await relationship.expand_related_memories("a", max_depth=2)
+    assert [memory["id"] for memory in expanded] == ["b", "c"]
+    assert expanded[1]["_expansion"] == {"score": pytest.approx(0.45), "depth": 2}
+    assert backend.batch_calls[-1] == ["b", "c"]
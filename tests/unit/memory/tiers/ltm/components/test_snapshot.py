@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 
+from neuroca.memory.backends.keyset import is_after, row_seek_key
+from neuroca.memory.backends.sqlite.core import SQLiteBackend
 from neuroca.memory.models.memory_item import (
     MemoryContent,
     MemoryItem,
@@ -31,11 +34,19 @@ def snapshot_exporter():
     return exporter, backend, lifecycle
 
 
-def _memory_item(memory_id: str, *, status: MemoryStatus = MemoryStatus.ACTIVE) -> MemoryItem:
+def _memory_item(
+    memory_id: str,
+    *,
+    status: MemoryStatus = MemoryStatus.ACTIVE,
+    created_at: datetime | None = None,
+) -> MemoryItem:
+    metadata = MemoryMetadata(status=status, tags={"relationships": {}, "categories": ["general"]})
+    if created_at is not None:
+        metadata.created_at = created_at
     return MemoryItem(
         id=memory_id,
         content=MemoryContent(text=f"memory {memory_id}"),
-        metadata=MemoryMetadata(status=status, tags={"relationships": {}, "categories": ["general"]}),
+        metadata=metadata,
     )
 
 
@@ -49,7 +60,7 @@ async def test_export_snapshot_collects_batches(snapshot_exporter):
     second = _memory_item("m2", status=MemoryStatus.ARCHIVED).model_dump()
 
     backend.count.return_value = 2
-    backend.query.side_effect = [[first], [second], []]
+    backend.seek.side_effect = [[first], [second], []]
 
     snapshot = await exporter.export_snapshot()
 
@@ -61,14 +72,16 @@ async def test_export_snapshot_collects_batches(snapshot_exporter):
     assert snapshot["relationships"] == {"m1": {"m2": 0.8}}
 
     # Ensure filters only include the expected default statuses
-    filters = backend.query.call_args.kwargs["filters"]
+    filters = backend.seek.call_args.kwargs["filters"]
     assert sorted(filters["metadata.status"]["$in"]) == sorted(
         [MemoryStatus.ACTIVE.value, MemoryStatus.ARCHIVED.value, MemoryStatus.CONSOLIDATED.value]
     )
 
-    # Ensure batching advanced offsets
-    assert backend.query.call_args_list[0].kwargs["offset"] == 0
-    assert backend.query.call_args_list[1].kwargs["offset"] == 1
+    # Ensure each batch resumes after the key of the previous one
+    backend.query.assert_not_called()
+    assert backend.seek.call_args_list[0].kwargs["after"] is None
+    assert backend.seek.call_args_list[1].kwargs["after"] == row_seek_key(first)
+    assert backend.seek.call_args_list[2].kwargs["after"] == row_seek_key(second)
 
 
 @pytest.mark.asyncio
@@ -78,7 +91,7 @@ async def test_export_snapshot_skips_invalid_items(snapshot_exporter):
     lifecycle.get_relationship_map.return_value = {}
 
     backend.count.return_value = 1
-    backend.query.side_effect = [[{"id": "missing-metadata"}], []]
+    backend.seek.side_effect = [[{"id": "missing-metadata"}], []]
 
     snapshot = await exporter.export_snapshot()
 
@@ -137,3 +150,152 @@ async def test_restore_snapshot_skips_without_overwrite(snapshot_exporter):
     backend.create.assert_not_called()
     backend.update.assert_not_called()
     lifecycle.apply_snapshot_state.assert_called_once()
+
+
+class _DictBackend:
+    """Minimal keyset-paged backend used to exercise streamed snapshots."""
+
+    def __init__(self, items=None, *, fail_after_batches=None):
+        self.items = dict(items or {})
+        self.batch_calls = []
+        self.seek_calls = 0
+        self.fail_after_batches = fail_after_batches
+
+    async def count(self, filters=None):
+        return len(self.items)
+
+    async def seek(self, *, filters=None, after=None, limit=50):
+        self.seek_calls += 1
+        rows = sorted(self.items.values(), key=row_seek_key)
+        return [row for row in rows if is_after(row_seek_key(row), after)][:limit]
+
+    async def batch_read(self, item_ids):
+        return {item_id: self.items.get(item_id) for item_id in item_ids}
+
+    async def batch_create(self, items):
+        if self.fail_after_batches is not None and len(self.batch_calls) >= self.fail_after_batches:
+            raise RuntimeError("backend unavailable")
+        self.batch_calls.append(("create", sorted(items)))
+        self.items.update(items)
+        return {item_id: True for item_id in items}
+
+    async def batch_update(self, items):
+        self.batch_calls.append(("update", sorted(items)))
+        self.items.update(items)
+        return {item_id: True for item_id in items}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_stream_round_trip_with_gzip(tmp_path):
+    source = _DictBackend({f"m{i}": _memory_item(f"m{i}").model_dump() for i in range(5)})
+    exporter = LTMSnapshotExporter("ltm")
+    lifecycle = LTMLifecycle("ltm")
+    lifecycle.apply_snapshot_state(categories={"general": ["m0", "m1"]}, relationships={})
+    exporter.configure(backend=source, lifecycle=lifecycle, batch_size=2)
+
+    path = tmp_path / "ltm.ndjson.gz"
+    summary = await exporter.export_snapshot_stream(path)
+
+    assert summary == {"records": 8, "count": 5, "invalid": 0}
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+
+    target = _DictBackend({"m0": _memory_item("m0").model_dump()})
+    restored_lifecycle = LTMLifecycle("ltm")
+    restorer = LTMSnapshotExporter("ltm")
+    restorer.configure(backend=target, lifecycle=restored_lifecycle, batch_size=2)
+
+    result = await restorer.restore_snapshot_stream(path)
+
+    assert result == {"restored": 4, "created": 4, "updated": 0, "skipped": 1, "invalid": 0}
+    assert sorted(target.items) == [f"m{i}" for i in range(5)]
+    assert all(kind == "create" for kind, _ids in target.batch_calls)
+    assert len(target.batch_calls) == 3
+    assert restored_lifecycle.get_category_map() == {"general": {"m0", "m1"}}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_stream_restore_resumes_from_checkpoint(tmp_path):
+    source = _DictBackend({f"m{i}": _memory_item(f"m{i}").model_dump() for i in range(6)})
+    exporter = LTMSnapshotExporter("ltm")
+    exporter.configure(backend=source)
+    path = tmp_path / "ltm.snapshot"
+    await exporter.export_snapshot_stream(path, fmt="length-prefixed")
+
+    checkpoint = tmp_path / "restore.checkpoint"
+    target = _DictBackend(fail_after_batches=1)
+    restorer = LTMSnapshotExporter("ltm")
+    restorer.configure(backend=target, batch_size=2)
+
+    with pytest.raises(RuntimeError):
+        await restorer.restore_snapshot_stream(
+            path, fmt="length-prefixed", checkpoint_path=checkpoint
+        )
+    assert checkpoint.exists()
+    assert sorted(target.items) == ["m0", "m1"]
+
+    target.fail_after_batches = None
+    result = await restorer.restore_snapshot_stream(
+        path, fmt="length-prefixed", checkpoint_path=checkpoint
+    )
+
+    assert result["created"] == 6
+    assert [ids for _kind, ids in target.batch_calls] == [["m0", "m1"], ["m2", "m3"], ["m4", "m5"]]
+    assert not checkpoint.exists()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_stream_pages_by_key_not_insertion_order(tmp_path):
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    items = {
+        f"m{i}": _memory_item(f"m{i}", created_at=base + timedelta(seconds=9 - i)).model_dump()
+        for i in range(7)
+    }
+    source = _DictBackend(items)
+    exporter = LTMSnapshotExporter("ltm")
+    exporter.configure(backend=source, batch_size=3)
+
+    exported = [
+        record["memory"]["id"]
+        async for record in exporter.iter_snapshot_records()
+        if record["kind"] == "memory"
+    ]
+
+    assert exported == [f"m{i}" for i in reversed(range(7))]
+    assert source.seek_calls == 3
+
+
+@pytest_asyncio.fixture()
+async def sqlite_backend(tmp_path):
+    backend = SQLiteBackend(db_path=str(tmp_path / "ltm.db"))
+    await backend.initialize()
+    try:
+        yield backend
+    finally:
+        await backend.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_export_seeks_sqlite_backend_with_status_filter(sqlite_backend):
+    """The default status filter is applied by the SQLite keyset query."""
+
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    statuses = [
+        MemoryStatus.ACTIVE,
+        MemoryStatus.FORGOTTEN,
+        MemoryStatus.ARCHIVED,
+        MemoryStatus.EXPIRED,
+        MemoryStatus.CONSOLIDATED,
+        MemoryStatus.ACTIVE,
+    ]
+    for index, status in enumerate(statuses):
+        await sqlite_backend.store(
+            _memory_item(f"m{index}", status=status, created_at=base + timedelta(seconds=index))
+        )
+
+    exporter = LTMSnapshotExporter("ltm")
+    exporter.configure(backend=sqlite_backend, batch_size=2)
+
+    snapshot = await exporter.export_snapshot()
+
+    assert [memory["id"] for memory in snapshot["memories"]] == ["m0", "m2", "m4", "m5"]
+    assert snapshot["count"] == 4
@@ -0,0 +1,103 @@
+"""Unit tests for spreading activation over the compiled pathway graph."""
+
+import random
+
+import pytest
+
+pathways = pytest.importorskip("neuroca.memory.tubules.pathways", exc_type=ImportError)
+
+Pathway = pathways.Pathway
+PathwayManager = pathways.PathwayManager
+PathwayType = pathways.PathwayType
+
+
+def _random_pathways(seed: int, tubules: int = 8, count: int = 20) -> list:
+    rng = random.Random(seed)
+    names = [f"tubule-{index}" for index in range(tubules)]
+    created = []
+    for index in range(count):
+        source, target = rng.sample(names, 2)
+        created.append(Pathway(
+            source_id=source,
+            target_id=target,
+            pathway_type=PathwayType.ASSOCIATIVE,
+            strength=round(rng.uniform(0.05, 1.0), 3),
+            bidirectional=rng.random() < 0.3,
+            id=f"pathway-{index}",
+        ))
+    return created
+
+
+def _copy(pathway):
+    return Pathway(
+        source_id=pathway.source_id,
+        target_id=pathway.target_id,
+        pathway_type=pathway.pathway_type,
+        strength=pathway.strength,
+        bidirectional=pathway.bidirectional,
+        id=pathway.id,
+    )
+
+
+def _reference_spread(network, initial, max_depth, decay_factor, threshold):
+    """Level-by-level dictionary walk calling Pathway.activate on every visited edge."""
+    outgoing = {}
+    for pathway in network:
+        outgoing.setdefault(pathway.source_id, []).append((pathway, pathway.target_id))
+        if pathway.bidirectional:
+            outgoing.setdefault(pathway.target_id, []).append((pathway, pathway.source_id))
+
+    result = dict(initial)
+    current = dict(initial)
+    for _depth in range(max_depth):
+        following = {}
+        for tubule_id, activation in current.items():
+            if activation < threshold:
+                continue
+            for pathway, target_id in outgoing.get(tubule_id, []):
+                output = pathway.activate(activation) * decay_factor
+                if output < threshold:
+                    continue
+                following[target_id] = max(following.get(target_id, output), output)
+                result[target_id] = max(result.get(target_id, output), output)
+        if not following:
+            break
+        current = following
+    return result
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_spread_activation_matches_reference_traversal(seed: int) -> None:
+    reference = _random_pathways(seed)
+    manager = PathwayManager()
+    for pathway in reference:
+        manager.register_pathway(_copy(pathway))
+    initial = {"tubule-0": 1.0, "tubule-3": 0.6, "tubule-5": 0.05}
+
+    expected = _reference_spread(reference, initial, max_depth=4, decay_factor=0.8, threshold=0.1)
+    activations = manager.spread_activation(
+        initial, max_depth=4, decay_factor=0.8, activation_threshold=0.1
+    )
+
+    assert activations == expected
+    assert any(pathway.metrics.activation_count for pathway in reference)
+    for pathway in reference:
+        metrics = manager.get_pathway(pathway.id).metrics
+        assert metrics.activation_count == pathway.metrics.activation_count, pathway.id
+        assert metrics.success_rate == pytest.approx(pathway.metrics.success_rate)
+        assert (metrics.last_activation is None) == (pathway.metrics.last_activation is None)
+
+
+def test_batched_metrics_match_individual_records() -> None:
+    individual = pathways.PathwayMetrics()
+    batched = pathways.PathwayMetrics()
+    individual.record_activation(True, 2.0)
+    batched.record_activation(True, 2.0)
+
+    for success in (False, True, False):
+        individual.record_activation(success, 1.0)
+    batched.record_activations(3, 1, 1.0)
+
+    assert batched.activation_count == individual.activation_count == 4
+    assert batched.success_rate == pytest.approx(individual.success_rate)
+    assert batched.average_activation_time == pytest.approx(individual.average_activation_time)
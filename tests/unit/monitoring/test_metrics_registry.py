@@ -0,0 +1,136 @@
+"""Tests for the sharded counter and log-linear histogram metric primitives."""
+
+from __future__ import annotations
+
+import threading
+import timeit
+
+import numpy as np
+import pytest
+
+from neuroca.monitoring.metrics.registry import (
+    Histogram,
+    LogLinearHistogram,
+    MetricsRegistry,
+    MetricType,
+    MetricValidationError,
+    ShardedCounter,
+)
+
+
+def _run_threads(target, count: int = 8) -> None:
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_sharded_counter_merges_thread_shards() -> None:
+    counter = ShardedCounter("ops_total", "Operations")
+
+    def work() -> None:
+        for _ in range(10_000):
+            counter.increment()
+
+    _run_threads(work)
+    counter.increment(5)
+
+    assert counter.get_value() == 80_005
+    assert counter.get_type() is MetricType.COUNTER
+    # Shards of finished threads are folded into the retired shard on scrape
+    assert len(counter._shards._shards) == 1
+
+
+def test_sharded_counter_reset_and_validation() -> None:
+    counter = ShardedCounter("ops_total", "Operations")
+    counter.increment(3)
+    counter.reset()
+    assert counter.get_value() == 0
+
+    with pytest.raises(ValueError):
+        counter.increment(0)
+
+
+def test_log_linear_histogram_quantiles_are_accurate() -> None:
+    histogram = LogLinearHistogram("latency_seconds", "Latency")
+    data = np.random.default_rng(7).lognormal(-5.0, 1.5, 50_000)
+    chunks = iter(np.array_split(data, 4))
+    lock = threading.Lock()
+
+    def work() -> None:
+        with lock:
+            chunk = next(chunks)
+        for value in chunk.tolist():
+            histogram.observe(value)
+
+    _run_threads(work, count=4)
+
+    value = histogram.get_value()
+    assert value["count"] == data.size
+    assert value["sum"] == pytest.approx(data.sum())
+    assert value["min"] == pytest.approx(data.min())
+    assert value["max"] == pytest.approx(data.max())
+    for key, q in (("p50", 0.5), ("p99", 0.99), ("p999", 0.999)):
+        exact = np.quantile(data, q, method="inverted_cdf")
+        assert value[key] == pytest.approx(exact, rel=0.01)
+        assert histogram.quantile(q) == pytest.approx(value[key])
+
+
+def test_log_linear_histogram_edges() -> None:
+    histogram = LogLinearHistogram("size", "Size", lowest=1.0, highest=1000.0)
+    assert histogram.get_value()["p99"] == 0.0
+
+    histogram.observe(0.25)
+    histogram.observe(5_000.0)
+    assert histogram.quantile(0.0) == pytest.approx(0.5)
+    assert histogram.quantile(1.0) == 5_000.0
+
+    with pytest.raises(ValueError):
+        histogram.observe(-1.0)
+    with pytest.raises(ValueError):
+        histogram.observe(float("nan"))
+    with pytest.raises(ValueError):
+        histogram.quantile(1.5)
+    with pytest.raises(MetricValidationError):
+        LogLinearHistogram("bad", "Bad", lowest=10.0, highest=1.0)
+
+    histogram.reset()
+    assert histogram.get_value()["count"] == 0
+
+
+def test_fixed_bucket_histogram_uses_upper_inclusive_buckets() -> None:
+    histogram = Histogram("legacy", "Legacy", buckets=[1, 5, 10])
+    for value in (0.5, 1, 3, 10, 11):
+        histogram.observe(value)
+    assert histogram.get_value()["buckets"] == {"1": 2, "5": 1, "10": 1, "inf": 1}
+
+
+def test_registry_creates_high_throughput_metrics() -> None:
+    registry = MetricsRegistry.get_instance()
+    registry.clear_registry()
+    try:
+        counter = registry.create_sharded_counter("memory_ops_total", "Memory operations")
+        histogram = registry.create_log_linear_histogram("memory_op_seconds", "Memory op latency")
+        counter.increment()
+        histogram.observe(0.002)
+        assert registry.get_metric_by_name("memory_ops_total").get_value() == 1
+        assert registry.get_metrics_by_type(MetricType.HISTOGRAM) == [histogram]
+        assert "p999" in registry.export_metrics()
+    finally:
+        registry.clear_registry()
+
+
+def test_hot_path_observations_stay_cheap() -> None:
+    counter = ShardedCounter("ops_total", "Operations")
+    histogram = LogLinearHistogram("latency_seconds", "Latency")
+    number = 20_000
+
+    increment = min(timeit.repeat(counter.increment, number=number, repeat=5)) / number
+    observe = min(
+        timeit.repeat(lambda: histogram.observe(0.0042), number=number, repeat=5)
+    ) / number
+
+    # Generous ceilings that still catch regressions such as per-call logging or locking
+    assert increment < 5e-6
+    assert observe < 5e-6
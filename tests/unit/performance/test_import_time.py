@@ -0,0 +1,80 @@
+"""Import-time budgets for the common entry points.
+
+Each entry point is imported in a fresh interpreter with ``python -X importtime``.
+The cumulative cost is recorded as a test property, and the test fails if the
+import exceeds its budget or pulls in modules that should load lazily.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[3] / "src"
+
+# Heavy optional stacks that no entry point below should import eagerly
+HEAVY_MODULES = (
+    "qdrant_client",
+    "sqlalchemy",
+    "redis",
+    "httpx",
+    "aiohttp",
+    "neuroca.memory.backends",
+    "neuroca.integration.manager",
+    "neuroca.cli.commands.memory",
+    "neuroca.cli.commands.llm",
+)
+
+# entry point -> (budget in milliseconds, additional modules it must not import)
+ENTRY_POINTS = {
+    "neuroca": (50, ("neuroca.memory", "neuroca.integration", "neuroca.cli")),
+    "neuroca.memory": (300, ("neuroca.memory.memory_decay", "neuroca.memory.working_memory")),
+    "neuroca.integration": (400, ("neuroca.integration.adapters.ollama",)),
+    "neuroca.integration.adapters": (500, ("neuroca.integration.adapters.ollama",)),
+    "neuroca.cli.main": (600, ("neuroca.memory", "neuroca.integration")),
+}
+
+
+def _import_profile(module: str) -> dict[str, int]:
+    """Return cumulative import time in microseconds for every module loaded by ``module``."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    profile: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+@pytest.mark.parametrize("module", sorted(ENTRY_POINTS))
+def test_entry_point_import_budget(module, record_property):
+    """Entry points import within budget and defer heavy dependencies."""
+    budget_ms, lazy_modules = ENTRY_POINTS[module]
+    profile = _import_profile(module)
+    elapsed_ms = profile[module] / 1000
+    record_property("import_time_ms", round(elapsed_ms, 1))
+
+    eager = sorted(
+        name
+        for name in profile
+        for lazy in (*HEAVY_MODULES, *lazy_modules)
+        if name == lazy or name.startswith(f"{lazy}.")
+    )
+    assert not eager, f"{module} eagerly imports {eager}"
+    assert elapsed_ms < budget_ms, f"{module} took {elapsed_ms:.1f} ms to import (budget {budget_ms} ms)"
@@ -4,6 +4,7 @@ from tests.performance.benchmarks import (
     run_consolidation_throughput_baseline,
     run_retrieval_latency_baseline,
     run_high_concurrency_stress_scenario,
+    run_sanitizer_throughput_baseline,
 )
 
 
@@ -90,3 +91,20 @@ def test_high_concurrency_stress_reports_operations() -> None:
 
         assert metrics["samples"] == counts[op_name]
         assert metrics["max_ms"] >= metrics["min_ms"] >= 0.0
+
+
+def test_sanitizer_throughput_baseline_reports_modes() -> None:
+    result = run_sanitizer_throughput_baseline(
+        payload_count=20,
+        content_length=256,
+        sensitive_ratio=0.25,
+        passes=2,
+        random_seed=5,
+    )
+
+    assert result["payloads"] == 20
+    assert result["bytes_per_pass"] > 0
+    assert set(result["modes"].keys()) == {"uncached", "cold", "cached"}
+    for metrics in result["modes"].values():
+        assert metrics["samples"] == 2
+        assert metrics["best_mb_per_sec"] >= metrics["mean_mb_per_sec"] > 0.0
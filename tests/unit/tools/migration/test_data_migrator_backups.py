@@ -0,0 +1,106 @@
+"""Streaming backup tests for the data migrator."""
+
+from __future__ import annotations
+
+import gzip
+
+import pytest
+
+from neuroca.tools.migration.data_migrator import (
+    DataMigrator,
+    MemoryTier,
+    MigrationContext,
+    MigrationError,
+    MigrationType,
+    SchemaMigrationHandler,
+)
+
+
+@pytest.fixture
+def migrator(tmp_path):
+    return DataMigrator(backup_dir=str(tmp_path))
+
+
+@pytest.fixture
+def context():
+    return MigrationContext(
+        source_version="1.0.0",
+        target_version="2.0.0",
+        migration_type=MigrationType.DATA,
+        affected_tiers=[MemoryTier.EPISODIC],
+        metadata={"reason": "test"},
+    )
+
+
+def test_streaming_backup_round_trip(migrator, context):
+    path = migrator.create_streaming_backup(({"id": n} for n in range(250)), context)
+
+    assert path.endswith(".ndjson.gz")
+    restored_context, records = migrator.iter_backup_records(path)
+    assert restored_context.affected_tiers == [MemoryTier.EPISODIC]
+    assert restored_context.metadata == {"reason": "test"}
+    assert [record["id"] for record in records] == list(range(250))
+
+    data, _ = migrator.load_backup(path)
+    assert not isinstance(data, list)
+    assert next(data) == {"id": 0}
+    assert sum(1 for _ in data) == 249
+    assert migrator.list_backups()[0]["path"] == path
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"version": "1.0.0", "memories": [{"id": 1}, {"id": 2}]},
+        [{"id": 1}, {"id": 2}, {"id": 3}],
+        "plain value",
+    ],
+)
+def test_data_backup_restores_original_shape(migrator, context, data):
+    path = migrator.create_data_backup(data, context)
+
+    loaded, restored_context = migrator.load_backup(path)
+
+    assert path.endswith(".ndjson.gz")
+    assert (list(loaded) if isinstance(data, list) else loaded) == data
+    assert restored_context.metadata == {"reason": "test"}
+
+
+def test_mapping_backup_writes_one_record_per_key(migrator, context):
+    path = migrator.create_data_backup({"a": 1, "b": [2, 3]}, context)
+
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        lines = handle.read().splitlines()
+
+    assert len(lines) == 3
+    _restored_context, records = migrator.iter_backup_records(path)
+    assert list(records) == [{"key": "a", "value": 1}, {"key": "b", "value": [2, 3]}]
+
+
+def test_migrate_writes_streaming_backup(tmp_path):
+    migrator = DataMigrator(source_version="1.0.0", target_version="2.0.0", backup_dir=str(tmp_path))
+    migrator.register_migration_handler("1.0.0", "2.0.0", SchemaMigrationHandler("1.0.0", "2.0.0"))
+
+    result = migrator.migrate({"version": "1.0.0", "memories": [1, 2]})
+
+    assert result.success
+    backups = migrator.list_backups()
+    assert len(backups) == 1
+    assert backups[0]["filename"].endswith(".ndjson.gz")
+    data, restored_context = migrator.load_backup(backups[0]["path"])
+    assert data == {"version": "1.0.0", "memories": [1, 2]}
+    assert (restored_context.source_version, restored_context.target_version) == ("1.0.0", "2.0.0")
+
+
+def test_json_backup_still_supported(migrator, context):
+    path = migrator.create_backup({"memories": [1, 2]}, context)
+
+    data, restored_context = migrator.load_backup(path)
+
+    assert data == {"memories": [1, 2]}
+    assert restored_context.source_version == "1.0.0"
+
+
+def test_missing_streaming_backup_raises(migrator, tmp_path):
+    with pytest.raises(MigrationError):
+        migrator.iter_backup_records(str(tmp_path / "backup_1_to_2_20240101_000000.ndjson"))
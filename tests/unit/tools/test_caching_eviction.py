@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import pytest
+
+from neuroca.tools.caching import InMemoryCache
+
+
+def test_lru_evicts_least_recently_used_entry() -> None:
+    cache = InMemoryCache(max_size=3, eviction_policy="lru")
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+
+    assert cache.get("a") == "a"
+    cache.set("d", "d")
+
+    assert cache.get("b") is None
+    assert {key: cache.get(key) for key in ("a", "c", "d")} == {"a": "a", "c": "c", "d": "d"}
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_fifo_ignores_accesses() -> None:
+    cache = InMemoryCache(max_size=2, eviction_policy="fifo")
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_lfu_evicts_least_frequently_used_entry() -> None:
+    cache = InMemoryCache(max_size=3, eviction_policy="lfu")
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+    for _ in range(3):
+        cache.get("a")
+    cache.get("c")
+
+    cache.set("d", "d")
+    assert cache.get("b") is None
+
+    # Ties are broken by recency: "d" was touched before "c" got its second hit
+    cache.get("d")
+    cache.get("c")
+    cache.set("e", "e")
+    assert cache.get("d") is None
+    assert cache.get("a") == "a"
+
+
+def test_ttl_expiry_is_driven_by_deadline_heap() -> None:
+    now = [100.0]
+    cache = InMemoryCache(max_size=10, clock=lambda: now[0])
+    cache.set("short", 1, ttl=5)
+    cache.set("long", 2, ttl=50)
+    cache.set("forever", 3)
+    cache.set("short", 4, ttl=60)
+
+    now[0] = 110.0
+    assert cache.get("short") == 4
+
+    now[0] = 200.0
+    assert cache.get("long") is None
+    assert cache.get("short") is None
+    assert cache.get("forever") == 3
+    assert cache.get_stats()["expirations"] == 2
+
+
+def test_byte_budget_limits_memory_and_rejects_oversized_values() -> None:
+    cache = InMemoryCache(max_size=100, max_bytes=100, size_estimator=len)
+    for index in range(10):
+        cache.set(f"k{index}", "x" * 30)
+
+    stats = cache.get_stats()
+    assert stats["size"] == 3
+    assert stats["memory_usage_bytes"] == 90
+
+    cache.set("huge", "x" * 101)
+    assert cache.get("huge") is None
+    assert cache.get_stats()["rejections"] == 1
+
+    cache.set("k9", "y")
+    assert cache.get_stats()["memory_usage_bytes"] == 61
+
+
+def test_tinylfu_admission_protects_popular_entries_from_scans() -> None:
+    cache = InMemoryCache(max_size=50, admission="tinylfu")
+    hot = [f"hot{index}" for index in range(20)]
+    for round_number in range(20):
+        for key in hot:
+            if cache.get(key) is None:
+                cache.set(key, key)
+        for index in range(50):
+            key = f"scan{round_number}-{index}"
+            if cache.get(key) is None:
+                cache.set(key, key)
+
+    assert sum(cache.get(key) is not None for key in hot) == len(hot)
+    stats = cache.get_stats()
+    assert stats["size"] <= 50
+    assert stats["rejections"] > 0
+
+
+def test_stats_report_hit_rate_and_latency() -> None:
+    cache = InMemoryCache(max_size=4)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("missing")
+
+    stats = cache.get_stats()
+    assert stats["hit_rate"] == pytest.approx(0.5)
+    assert stats["avg_get_latency_us"] > 0.0
+    assert stats["avg_set_latency_us"] > 0.0
+
+
+def test_unknown_admission_policy_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        InMemoryCache(admission="arc")
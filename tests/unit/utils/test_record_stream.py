@@ -0,0 +1,56 @@
+"""Tests for streaming record file helpers."""
+
+from __future__ import annotations
+
+import io
+from datetime import datetime, timezone
+
+import pytest
+
+from neuroca.utils.record_stream import (
+    RecordStreamError,
+    encode_record,
+    iter_records,
+    open_record_stream,
+    resolve_compression,
+    write_records,
+)
+
+
+@pytest.mark.parametrize("fmt", ["ndjson", "length-prefixed"])
+def test_records_round_trip(fmt):
+    records = [{"id": 1, "text": "line\nbreak"}, {"id": 2, "at": datetime(2024, 1, 1, tzinfo=timezone.utc)}]
+    buffer = io.BytesIO()
+
+    assert write_records(buffer, records, fmt) == 2
+
+    buffer.seek(0)
+    decoded = list(iter_records(buffer, fmt))
+    assert decoded == [records[0], {"id": 2, "at": "2024-01-01T00:00:00+00:00"}]
+
+
+def test_ndjson_is_one_line_per_record():
+    assert encode_record({"a": [1, 2]}) == b'{"a":[1,2]}\n'
+
+
+def test_truncated_length_prefixed_stream_is_rejected():
+    payload = encode_record({"id": 1}, "length-prefixed")
+    with pytest.raises(RecordStreamError):
+        list(iter_records(io.BytesIO(payload[:-2]), "length-prefixed"))
+
+
+def test_gzip_stream_inferred_from_suffix(tmp_path):
+    path = tmp_path / "records.ndjson.gz"
+    with open_record_stream(path, "wb") as stream:
+        write_records(stream, ({"n": n} for n in range(100)))
+
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+    with open_record_stream(path, "rb") as stream:
+        assert [record["n"] for record in iter_records(stream)] == list(range(100))
+
+
+def test_unknown_compression_is_rejected():
+    assert resolve_compression("snapshot.zst") == "zstd"
+    assert resolve_compression(io.BytesIO()) == "none"
+    with pytest.raises(RecordStreamError):
+        resolve_compression("snapshot", "lz4")